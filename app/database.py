@@ -24,6 +24,7 @@ from sqlalchemy import AsyncAdaptedQueuePool, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.utils import metrics_utils
 from config import ASYNC_DATABASE_URL, DATABASE_SCHEMA, DATABASE_URL, DB_ECHO
 
 
@@ -66,6 +67,11 @@ engine = get_engine(DATABASE_URL)
 async_engine = get_async_engine(ASYNC_DATABASE_URL)
 batch_async_engine = get_batch_async_engine(ASYNC_DATABASE_URL)
 
+# Count and time queries for metrics
+metrics_utils.instrument_engine(engine)
+metrics_utils.instrument_engine(async_engine.sync_engine)
+metrics_utils.instrument_engine(batch_async_engine.sync_engine)
+
 # Create Session Maker
 SessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=engine)
 AsyncSessionLocal = async_sessionmaker(
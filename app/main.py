@@ -25,7 +25,7 @@ from datetime import UTC, datetime
 from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 from pydantic_core import ArgsKwargs, ErrorDetails
 from starlette import status
@@ -60,7 +60,7 @@ from app.routers.misc import (
     sealed_tx,
     settlement_agent,
 )
-from app.utils import o11y_utils
+from app.utils import metrics_utils, o11y_utils
 from app.utils.docs_utils import custom_openapi
 from config import (
     BC_EXPLORER_ENABLED,
@@ -69,6 +69,7 @@ from config import (
     DVP_AGENT_FEATURE_ENABLED,
     FREEZE_LOG_FEATURE_ENABLED,
     IBET_WST_FEATURE_ENABLED,
+    METRICS_ENABLED,
     PROFILING_MODE,
     SERVER_NAME,
 )
@@ -153,7 +154,20 @@ app = FastAPI(
 @app.middleware("http")
 async def api_call_handler(request: Request, call_next):
     request_start_time = datetime.now(UTC).replace(tzinfo=None)
-    response = await call_next(request)
+    request_metrics = metrics_utils.start_request()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        # NOTE: The route is resolved by the router, so it is read after the call.
+        route = request.scope.get("route")
+        metrics_utils.finish_request(
+            request_metrics,
+            method=request.method,
+            route=route.path if route is not None else "",
+            status_code=status_code,
+        )
     output_access_log(request, response, request_start_time)
     return response
 
@@ -180,6 +194,13 @@ async def root(db: DBAsyncSession):
     return {"server": SERVER_NAME}
 
 
+if METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(metrics_utils.render(), media_type=metrics_utils.CONTENT_TYPE)
+
+
 if DEDICATED_OFFCHAIN_TX_MODE:
     app.include_router(sealed_tx.router)
 
@@ -80,6 +80,8 @@ from .ibet_wst import (
     IbetWSTTxStatus,
     IbetWSTTxType,
     IbetWSTVersion,
+    IDXEthIbetWSTBalance,
+    IDXEthIbetWSTBalanceBlockNumber,
     IDXEthIbetWSTTrade,
     IDXEthIbetWSTTradeBlockNumber,
     IDXEthIbetWSTTradeState,
@@ -107,6 +109,7 @@ from .idx_position import (
     IDXPosition,
     IDXPositionBondBlockNumber,
     IDXPositionShareBlockNumber,
+    IDXPositionSummary,
 )
 from .idx_transfer import (
     DataMessage,
@@ -127,6 +130,7 @@ from .ledger import (
     LedgerCreationStatus,
     LedgerDataType,
     LedgerDetailsData,
+    LedgerDetailsRow,
     LedgerDetailsTemplate,
     LedgerTemplate,
 )
@@ -158,4 +162,4 @@ from .transfer_appoval_history import (
 from .tx_management import TransactionLock
 from .update_token import UpdateToken, UpdateTokenTrigger
 from .upload_file import UploadFile
-from .utxo import UTXO, UTXOBlockNumber
+from .utxo import UTXO, UTXOBlockNumber, UTXOTokenBlockNumber
@@ -95,7 +95,12 @@ class BatchRegisterPersonalInfo(Base):
 
     @personal_info.inplace.setter
     def _personal_info_setter(self, personal_info_dict: dict):
-        self._personal_info = {
+        self._personal_info = self.format_personal_info(personal_info_dict)
+
+    @staticmethod
+    def format_personal_info(personal_info_dict: dict) -> dict:
+        """Format personal information to the stored structure"""
+        return {
             "key_manager": personal_info_dict.get("key_manager", None),
             "name": personal_info_dict.get("name", None),
             "address": personal_info_dict.get("address", None),
@@ -17,7 +17,9 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from sqlalchemy import BigInteger, Integer, String
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -38,6 +40,10 @@ class BulkTransferUpload(Base):
     token_address: Mapped[str | None] = mapped_column(String(42), nullable=True)
     # processing status (pending:0, succeeded:1, failed:2)
     status: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    # worker that claimed the upload
+    claimed_by: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    # lease expiration datetime(UTC) of the claim
+    lease_expires: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
 class BulkTransfer(Base):
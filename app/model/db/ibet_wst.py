@@ -389,6 +389,37 @@ class IDXEthIbetWSTTrade(Base):
     memo: Mapped[str] = mapped_column(Text)
 
 
+############################################################
+# Balance
+############################################################
+class IDXEthIbetWSTBalanceBlockNumber(Base):
+    """Synchronized blockNumber of IDXEthIbetWSTBalance"""
+
+    __tablename__ = "idx_eth_ibet_wst_balance_block_number"
+
+    # Record ID
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Synchronized block number (finalized)
+    latest_block_number: Mapped[int | None] = mapped_column(BigInteger)
+
+
+class IDXEthIbetWSTBalance(Base):
+    """INDEX IbetWST Balance (Ethereum)"""
+
+    __tablename__ = "idx_eth_ibet_wst_balance"
+
+    # IbetWST contract address
+    ibet_wst_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Account address
+    account_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Balance as of the finalized block
+    finalized_balance: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # Balance as of the latest block (including unfinalized blocks)
+    balance: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
 ############################################################
 # Bridge Management
 ############################################################
@@ -17,7 +17,7 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from sqlalchemy import JSON, BigInteger, Integer, String, Text
+from sqlalchemy import DDL, JSON, BigInteger, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -42,7 +42,7 @@ class IDXBlockData(Base):
     difficulty: Mapped[int | None] = mapped_column(BigInteger)
     gas_limit: Mapped[int | None] = mapped_column(Integer)
     gas_used: Mapped[int | None] = mapped_column(Integer)
-    timestamp: Mapped[int | None] = mapped_column(Integer, nullable=False, index=True)
+    timestamp: Mapped[int | None] = mapped_column(Integer, nullable=False)
     proof_of_authority_data: Mapped[str | None] = mapped_column(Text)
     mix_hash: Mapped[str | None] = mapped_column(String(66))
     nonce: Mapped[str | None] = mapped_column(String(18))
@@ -52,6 +52,23 @@ class IDXBlockData(Base):
     size: Mapped[int | None] = mapped_column(Integer)
     transactions: Mapped[dict | None] = mapped_column(JSON)
 
+    __table_args__ = (
+        Index("block_data_timestamp_brin", timestamp, postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (number)"},
+    )
+
+
+# NOTE: Range partitions are created by the block/tx data indexer.
+#       The default partition receives rows outside of those ranges.
+event.listen(
+    IDXBlockData.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS %(fullname)s_default "
+        "PARTITION OF %(fullname)s DEFAULT"
+    ),
+)
+
 
 class IDXBlockDataBlockNumber(Base):
     """Synchronized blockNumber of IDXBlockData"""
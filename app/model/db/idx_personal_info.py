@@ -21,7 +21,7 @@ from datetime import datetime
 from enum import StrEnum
 
 import pytz
-from sqlalchemy import JSON, BigInteger, DateTime, Index, String
+from sqlalchemy import JSON, BigInteger, Computed, DateTime, Index, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -63,6 +63,14 @@ class IDXPersonalInfo(Base):
     data_source: Mapped[PersonalInfoDataSource] = mapped_column(
         String(10), nullable=False
     )
+    # name (generated from personal_info for searching)
+    name: Mapped[str | None] = mapped_column(
+        String, Computed("personal_info ->> 'name'", persisted=True)
+    )
+    # key manager (generated from personal_info for searching)
+    key_manager: Mapped[str | None] = mapped_column(
+        String, Computed("personal_info ->> 'key_manager'", persisted=True)
+    )
 
     __table_args__ = (
         Index(
@@ -71,6 +79,18 @@ class IDXPersonalInfo(Base):
             account_address,
             postgresql_include=["personal_info", "data_source", "created", "modified"],
         ),
+        Index(
+            "idx_personal_info_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_personal_info_key_manager_trgm",
+            key_manager,
+            postgresql_using="gin",
+            postgresql_ops={"key_manager": "gin_trgm_ops"},
+        ),
     )
 
     @hybrid_property
@@ -64,6 +64,12 @@ class IDXPosition(Base):
                 "modified",
             ],
         ),
+        Index(
+            "idx_position_account_address_trgm",
+            account_address,
+            postgresql_using="gin",
+            postgresql_ops={"account_address": "gin_trgm_ops"},
+        ),
     )
 
     def json(self):
@@ -129,3 +135,31 @@ class IDXLockedPosition(Base):
             "account_address": self.account_address,
             "value": self.value,
         }
+
+
+class IDXPositionSummary(Base):
+    """INDEX Position Summary (aggregated per token)"""
+
+    __tablename__ = "idx_position_summary"
+
+    # token address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # number of holders
+    # - accounts with a non-zero position or a non-zero locked amount
+    holder_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # total balance
+    total_balance: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # total exchange balance
+    total_exchange_balance: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # total exchange commitment
+    total_exchange_commitment: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # total pendingTransfer
+    total_pending_transfer: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # total locked amount
+    total_locked: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -17,7 +17,7 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from sqlalchemy import BigInteger, Integer, String, Text
+from sqlalchemy import DDL, BigInteger, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -30,7 +30,9 @@ class IDXTxData(Base):
 
     hash: Mapped[str] = mapped_column(String(66), primary_key=True)
     block_hash: Mapped[str | None] = mapped_column(String(66))
-    block_number: Mapped[int | None] = mapped_column(BigInteger, index=True)
+    block_number: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=False
+    )
     transaction_index: Mapped[int | None] = mapped_column(Integer)
     from_address: Mapped[str | None] = mapped_column(String(42), index=True)
     to_address: Mapped[str | None] = mapped_column(String(42), index=True)
@@ -39,3 +41,24 @@ class IDXTxData(Base):
     gas_price: Mapped[int | None] = mapped_column(BigInteger)
     value: Mapped[int | None] = mapped_column(BigInteger)
     nonce: Mapped[int | None] = mapped_column(Integer)
+
+    __table_args__ = (
+        Index(
+            "tx_data_block_number_transaction_index",
+            block_number,
+            transaction_index,
+        ),
+        {"postgresql_partition_by": "RANGE (block_number)"},
+    )
+
+
+# NOTE: Range partitions are created by the block/tx data indexer.
+#       The default partition receives rows outside of those ranges.
+event.listen(
+    IDXTxData.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS %(fullname)s_default "
+        "PARTITION OF %(fullname)s DEFAULT"
+    ),
+)
@@ -20,7 +20,7 @@ SPDX-License-Identifier: Apache-2.0
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import JSON, BigInteger, DateTime, Integer, String
+from sqlalchemy import JSON, BigInteger, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.model.db.base import Base, naive_utcnow
@@ -167,7 +167,7 @@ NOTE: Ledger.ledger's JSON structures
           "balance": 0,
           "acquisition_date": "string(YYYY/MM/DD)"
         }
-      ],
+      ],  // Since v25.12, "data" is not set and the rows are stored in LedgerDetailsRow.
       "footers": [],
       "some_personal_info_not_registered": "boolean",
     },
@@ -177,6 +177,52 @@ NOTE: Ledger.ledger's JSON structures
 """
 
 
+class LedgerDetailsRow(Base):
+    """Ledger details data
+
+    - Rows of Ledger.ledger["details"][detail_index]["data"]
+    - The order of the rows is the order of the id.
+    """
+
+    __tablename__ = "ledger_details_row"
+
+    # sequence id
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # ledger id
+    ledger_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # index of details
+    detail_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    # account address
+    account_address: Mapped[str | None] = mapped_column(String(42))
+    # name
+    name: Mapped[str | None] = mapped_column(String(200))
+    # address
+    address: Mapped[str | None] = mapped_column(String(200))
+    # amount
+    amount: Mapped[int | None] = mapped_column(BigInteger)
+    # price
+    price: Mapped[int | None] = mapped_column(BigInteger)
+    # balance
+    balance: Mapped[int | None] = mapped_column(BigInteger)
+    # acquisition date (format: YYYY/MM/DD)
+    acquisition_date: Mapped[str | None] = mapped_column(String(10))
+
+    __table_args__ = (
+        Index("ledger_details_row_ledger_detail", ledger_id, detail_index, id),
+    )
+
+    def json(self):
+        return {
+            "account_address": self.account_address,
+            "name": self.name,
+            "address": self.address,
+            "amount": self.amount,
+            "price": self.price,
+            "balance": self.balance,
+            "acquisition_date": self.acquisition_date,
+        }
+
+
 class LedgerDetailsData(Base):
     """Holder data outside of Blockchain"""
 
@@ -17,7 +17,7 @@
 from datetime import datetime
 from enum import IntEnum, StrEnum
 
-from sqlalchemy import JSON, Boolean, DateTime, Integer, String
+from sqlalchemy import JSON, Boolean, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -62,3 +62,11 @@ class ScheduledEvents(Base):
     is_soft_deleted: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False
     )
+    # worker id that claimed the event
+    claimed_by: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    # datetime when the lease of the claimed event expires (UTC)
+    lease_expires: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("scheduled_events_status_datetime", status, scheduled_datetime),
+    )
@@ -55,3 +55,14 @@ class UTXOBlockNumber(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     # latest blockNumber
     latest_block_number: Mapped[int | None] = mapped_column(BigInteger)
+
+
+class UTXOTokenBlockNumber(Base):
+    """Synchronized blockNumber of UTXO for each token"""
+
+    __tablename__ = "utxo_token_block_number"
+
+    # token address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # latest blockNumber
+    latest_block_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
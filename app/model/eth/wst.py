@@ -17,10 +17,14 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import asyncio
+import math
 from typing import Literal
 
 from eth_abi import encode
 from eth_abi.packed import encode_packed
+from eth_account import Account
+from eth_account.datastructures import SignedMessage
 from eth_utils import keccak, to_checksum_address
 from pydantic import BaseModel, Field
 from web3.contract import AsyncContract
@@ -29,7 +33,7 @@ from web3.types import Nonce
 from app.exceptions import SendTransactionError
 from app.model import EthereumAddress
 from app.utils.eth_contract_utils import EthAsyncContractUtils
-from config import ZERO_ADDRESS
+from config import IBET_WST_SIGN_MAX_WORKERS, ZERO_ADDRESS
 from eth_config import ETH_CHAIN_ID
 
 
@@ -149,6 +153,44 @@ class IbetWSTDigestHelper:
     Helper class for generating EIP-712 digests for IbetWST contract operations.
     """
 
+    # EIP-712 type hashes (computed once at import)
+    EIP712_DOMAIN_TYPEHASH = keccak(
+        text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+    )
+    MINT_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="MintWithAuthorization(address to,uint256 value,bytes32 nonce)"
+    )
+    BURN_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="BurnWithAuthorization(address from,uint256 value,bytes32 nonce)"
+    )
+    FORCE_BURN_FROM_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="ForceBurnFromWithAuthorization(address account,uint256 value,bytes32 nonce)"
+    )
+    ADD_ACCOUNT_WHITELIST_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="AddAccountWhiteListWithAuthorization(address STAccountAddress,address SCAccountAddressIn,address SCAccountAddressOut,bytes32 nonce)"
+    )
+    DELETE_ACCOUNT_WHITELIST_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="DeleteAccountWhiteListWithAuthorization(address STAccountAddress,bytes32 nonce)"
+    )
+    TRANSFER_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="TransferWithAuthorization(address from,address to,uint256 value,uint256 validAfter,uint256 validBefore,bytes32 nonce)"
+    )
+    RECEIVE_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="ReceiveWithAuthorization(address from,address to,uint256 value,uint256 validAfter,uint256 validBefore,bytes32 nonce)"
+    )
+    REQUEST_TRADE_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="RequestTradeWithAuthorization(address sellerSTAccountAddress,address buyerSTAccountAddress,address SCTokenAddress,uint256 STValue,uint256 SCValue,string memory memo,bytes32 nonce)"
+    )
+    CANCEL_TRADE_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="CancelTradeWithAuthorization(uint256 index,bytes32 nonce)"
+    )
+    ACCEPT_TRADE_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="AcceptTradeWithAuthorization(uint256 index,bytes32 nonce)"
+    )
+    REJECT_TRADE_WITH_AUTHORIZATION_TYPEHASH = keccak(
+        text="RejectTradeWithAuthorization(uint256 index,bytes32 nonce)"
+    )
+
     @staticmethod
     def generate_mint_digest(
         domain_separator: bytes,
@@ -166,10 +208,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the mint operation
         """
 
-        type_hash = keccak(
-            text="MintWithAuthorization(address to,uint256 value,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -179,7 +217,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.MINT_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(to_address),
                     value,
                     nonce,
@@ -219,10 +257,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the burn operation
         """
 
-        type_hash = keccak(
-            text="BurnWithAuthorization(address from,uint256 value,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -232,7 +266,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.BURN_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(from_address),
                     value,
                     nonce,
@@ -272,10 +306,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the force burn operation
         """
 
-        type_hash = keccak(
-            text="ForceBurnFromWithAuthorization(address account,uint256 value,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -285,7 +315,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.FORCE_BURN_FROM_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(account_address),
                     value,
                     nonce,
@@ -327,10 +357,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the add whitelist operation
         """
 
-        type_hash = keccak(
-            text="AddAccountWhiteListWithAuthorization(address STAccountAddress,address SCAccountAddressIn,address SCAccountAddressOut,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -341,7 +367,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.ADD_ACCOUNT_WHITELIST_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(st_account),
                     to_checksum_address(sc_account_in),
                     to_checksum_address(sc_account_out),
@@ -380,10 +406,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the delete whitelist operation
         """
 
-        type_hash = keccak(
-            text="DeleteAccountWhiteListWithAuthorization(address STAccountAddress,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -392,7 +414,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.DELETE_ACCOUNT_WHITELIST_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(st_account),
                     nonce,
                 ],
@@ -437,10 +459,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the transfer
         """
 
-        type_hash = keccak(
-            text="TransferWithAuthorization(address from,address to,uint256 value,uint256 validAfter,uint256 validBefore,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -453,7 +471,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.TRANSFER_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(from_address),
                     to_checksum_address(to_address),
                     value,
@@ -502,10 +520,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the transfer
         """
 
-        type_hash = keccak(
-            text="ReceiveWithAuthorization(address from,address to,uint256 value,uint256 validAfter,uint256 validBefore,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -518,7 +532,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.RECEIVE_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(from_address),
                     to_checksum_address(to_address),
                     value,
@@ -569,10 +583,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the trade request
         """
 
-        type_hash = keccak(
-            text="RequestTradeWithAuthorization(address sellerSTAccountAddress,address buyerSTAccountAddress,address SCTokenAddress,uint256 STValue,uint256 SCValue,string memory memo,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -586,7 +596,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.REQUEST_TRADE_WITH_AUTHORIZATION_TYPEHASH,
                     to_checksum_address(seller_st_account),
                     to_checksum_address(buyer_st_account),
                     to_checksum_address(sc_token_address),
@@ -628,10 +638,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the trade cancellation
         """
 
-        type_hash = keccak(
-            text="CancelTradeWithAuthorization(uint256 index,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -640,7 +646,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.CANCEL_TRADE_WITH_AUTHORIZATION_TYPEHASH,
                     index,
                     nonce,
                 ],
@@ -677,10 +683,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the trade acceptance
         """
 
-        type_hash = keccak(
-            text="AcceptTradeWithAuthorization(uint256 index,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -689,7 +691,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.ACCEPT_TRADE_WITH_AUTHORIZATION_TYPEHASH,
                     index,
                     nonce,
                 ],
@@ -726,10 +728,6 @@ class IbetWSTDigestHelper:
         :return: EIP-712 digest for the trade cancellation
         """
 
-        type_hash = keccak(
-            text="RejectTradeWithAuthorization(uint256 index,bytes32 nonce)"
-        )
-
         struct_hash = keccak(
             encode(
                 [
@@ -738,7 +736,7 @@ class IbetWSTDigestHelper:
                     "bytes32",  # nonce
                 ],
                 [
-                    type_hash,
+                    IbetWSTDigestHelper.REJECT_TRADE_WITH_AUTHORIZATION_TYPEHASH,
                     index,
                     nonce,
                 ],
@@ -760,6 +758,35 @@ class IbetWSTDigestHelper:
         )
         return digest
 
+    @staticmethod
+    async def sign_digests(
+        digests: list[bytes],
+        private_key: bytes,
+        max_workers: int = IBET_WST_SIGN_MAX_WORKERS,
+    ) -> list[SignedMessage]:
+        """
+        Sign a batch of EIP-712 digests in a worker pool.
+
+        :param digests: List of EIP-712 digests
+        :param private_key: Private key of the authorizer
+        :param max_workers: Maximum number of concurrent signing workers
+        :return: List of signatures, in the same order as the digests
+        """
+        if len(digests) == 0:
+            return []
+
+        def _sign(chunk: list[bytes]) -> list[SignedMessage]:
+            return [Account.unsafe_sign_hash(digest, private_key) for digest in chunk]
+
+        chunk_size = math.ceil(len(digests) / max(max_workers, 1))
+        chunks = [
+            digests[i : i + chunk_size] for i in range(0, len(digests), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *[asyncio.to_thread(_sign, chunk) for chunk in chunks]
+        )
+        return [signature for result in results for signature in result]
+
 
 class IbetWST(ERC20):
     """
@@ -768,6 +795,12 @@ class IbetWST(ERC20):
 
     contract_name = "AuthIbetWST"
 
+    # Cache of EIP-712 domain separators
+    #   key: (chain_id, contract_address)
+    #   - The token name and version are fixed at deployment,
+    #     so a cached value only becomes stale when the contract is redeployed at a new address.
+    domain_separator_cache: dict[tuple[int, str], bytes] = {}
+
     def __init__(self, contract_address: str = ZERO_ADDRESS):
         super().__init__(contract_address)
 
@@ -777,10 +810,14 @@ class IbetWST(ERC20):
 
         :return: Domain separator
         """
+        cache_key = (ETH_CHAIN_ID, to_checksum_address(self.contract.address))
+        if cache_key in IbetWST.domain_separator_cache:
+            return IbetWST.domain_separator_cache[cache_key]
+
         name = await EthAsyncContractUtils.call_function(
             contract=self.contract, function_name="name", args=(), default_returns=""
         )
-        return keccak(
+        domain_separator = keccak(
             encode(
                 [
                     "bytes32",  # EIP712Domain type
@@ -790,9 +827,7 @@ class IbetWST(ERC20):
                     "address",  # verifyingContract type
                 ],
                 [
-                    keccak(
-                        text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
-                    ),
+                    IbetWSTDigestHelper.EIP712_DOMAIN_TYPEHASH,
                     keccak(name.encode()),
                     keccak("1".encode()),
                     ETH_CHAIN_ID,
@@ -800,6 +835,11 @@ class IbetWST(ERC20):
                 ],
             )
         )
+        # NOTE: An empty name means that the contract could not be read
+        #       (e.g. not yet deployed), so the result is not cached.
+        if name != "":
+            IbetWST.domain_separator_cache[cache_key] = domain_separator
+        return domain_separator
 
     async def account_white_list(self, account: EthereumAddress) -> IbetWSTWhiteList:
         """
@@ -834,6 +874,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Add account to white list with authorization
@@ -844,6 +885,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -864,7 +906,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -874,6 +918,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Delete account from white list with authorization
@@ -882,6 +927,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -900,7 +946,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -911,6 +959,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Mint tokens with authorization
@@ -920,6 +969,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -939,7 +989,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -950,6 +1002,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Burn tokens with authorization
@@ -959,6 +1012,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -978,7 +1032,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -989,6 +1045,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Force burn tokens from an account with authorization
@@ -998,6 +1055,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1017,7 +1075,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1031,6 +1091,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Transfer tokens with authorization
@@ -1043,6 +1104,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1065,7 +1127,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1079,6 +1143,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Receive tokens with authorization
@@ -1091,6 +1156,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1113,7 +1179,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1164,6 +1232,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Request a trade with authorization
@@ -1177,6 +1246,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1200,7 +1270,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1210,6 +1282,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Cancel a trade with authorization
@@ -1218,6 +1291,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1236,7 +1310,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1246,6 +1322,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Accept a trade with authorization
@@ -1254,6 +1331,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1272,7 +1350,9 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
 
@@ -1282,6 +1362,7 @@ class IbetWST(ERC20):
         authorization: IbetWSTAuthorization,
         tx_sender: EthereumAddress,
         tx_sender_key: bytes,
+        tx_nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """
         Reject a trade with authorization
@@ -1290,6 +1371,7 @@ class IbetWST(ERC20):
         :param authorization: Authorization data containing nonce, v, r, s
         :param tx_sender: Address of the transaction sender
         :param tx_sender_key: Private key of the transaction sender
+        :param tx_nonce: Nonce to use for the transaction (fetched from the node if not specified)
         :return: Transaction hash and nonce
         """
         try:
@@ -1308,6 +1390,8 @@ class IbetWST(ERC20):
                 }
             )
             # Send the transaction
-            return await EthAsyncContractUtils.send_transaction(tx, tx_sender_key)
+            return await EthAsyncContractUtils.send_transaction(
+                tx, tx_sender_key, tx_nonce
+            )
         except Exception as err:
             raise SendTransactionError(err)
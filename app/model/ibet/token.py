@@ -58,6 +58,7 @@ from app.model.ibet.tx_params.ibet_share import (
 from app.model.ibet.tx_params.ibet_straight_bond import (
     UpdateParams as IbetStraightBondUpdateParams,
 )
+from app.utils import metrics_utils
 from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.ibet_contract_utils import AsyncContractUtils
 from app.utils.ibet_web3_utils import Web3Wrapper
@@ -825,12 +826,15 @@ class IbetStraightBondContract(IbetSecurityTokenInterface):
 
     T = TypeVar("T")
 
-    async def get(self) -> T:
-        """Get token attributes"""
+    async def get(self, refresh_cache: bool = False) -> T:
+        """Get token attributes
+
+        :param refresh_cache: If True, the cached data is not used and the cache is refreshed
+        """
         db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
         try:
             # When using the cache
-            if TOKEN_CACHE:
+            if TOKEN_CACHE and not refresh_cache:
                 token_cache: TokenCache | None = (
                     await db_session.scalars(
                         select(TokenCache)
@@ -851,7 +855,9 @@ class IbetStraightBondContract(IbetSecurityTokenInterface):
                         for k, v in token_cache.attributes.items():
                             setattr(self, k, v)
                         await db_session.close()
+                        metrics_utils.record_token_cache(hit=True)
                         return AttributeDict(self.__dict__)
+                metrics_utils.record_token_cache(hit=False)
 
             # When cache is not used
             # Or, if there is no data in the cache
@@ -1521,12 +1527,15 @@ class IbetShareContract(IbetSecurityTokenInterface):
 
     T = TypeVar("T")
 
-    async def get(self) -> T:
-        """Get token attributes"""
+    async def get(self, refresh_cache: bool = False) -> T:
+        """Get token attributes
+
+        :param refresh_cache: If True, the cached data is not used and the cache is refreshed
+        """
         db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
         try:
             # When using the cache
-            if TOKEN_CACHE:
+            if TOKEN_CACHE and not refresh_cache:
                 token_cache: TokenCache | None = (
                     await db_session.scalars(
                         select(TokenCache)
@@ -1547,7 +1556,9 @@ class IbetShareContract(IbetSecurityTokenInterface):
                         for k, v in token_cache.attributes.items():
                             setattr(self, k, v)
                         await db_session.close()
+                        metrics_utils.record_token_cache(hit=True)
                         return AttributeDict(self.__dict__)
+                metrics_utils.record_token_cache(hit=False)
 
             # When cache is not used
             # Or, if there is no data in the cache
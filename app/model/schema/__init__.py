@@ -105,6 +105,7 @@ from .ibet_wst import (
     GetERC20AllowanceResponse,
     GetERC20BalanceQuery,
     GetERC20BalanceResponse,
+    GetIbetWSTBalanceQuery,
     GetIbetWSTBalanceResponse,
     GetIbetWSTTradeResponse,
     GetIbetWSTTransactionResponse,
@@ -133,6 +134,7 @@ from .ledger import (
     LedgerDetailsDataResponse,
     LedgerTemplateResponse,
     ListAllLedgerDetailsDataResponse,
+    ListAllLedgerHistoryDetailsDataResponse,
     ListAllLedgerHistoryResponse,
     RetrieveLedgerDetailsDataResponse,
     RetrieveLedgerHistoryResponse,
@@ -226,6 +228,8 @@ from .token import (
 from .token_holders import (
     CreateTokenHoldersListRequest,
     CreateTokenHoldersListResponse,
+    ExportTokenHoldersPersonalInfoFormat,
+    ExportTokenHoldersPersonalInfoQuery,
     ListAllTokenHolderCollectionsResponse,
     ListTokenHoldersPersonalInfoHistoryQuery,
     ListTokenHoldersPersonalInfoHistoryResponse,
@@ -17,9 +17,9 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Optional
+from typing import Optional, Self
 
-from pydantic import BaseModel, Field, NonNegativeInt, RootModel
+from pydantic import BaseModel, Field, NonNegativeInt, RootModel, model_validator
 
 from app.model import EthereumAddress
 
@@ -95,12 +95,36 @@ class ListBlockDataQuery(BasePaginationQuery):
     sort_order: Optional[SortOrder] = Field(
         SortOrder.ASC, description=SortOrder.__doc__
     )
+    cursor: Optional[NonNegativeInt] = Field(
+        None,
+        description="Block number of the last item on the previous page "
+        "(keyset pagination, `count` is not returned)",
+    )
 
 
 class ListTxDataQuery(BasePaginationQuery):
     block_number: Optional[NonNegativeInt] = Field(None, description="block number")
     from_address: Optional[EthereumAddress] = Field(None, description="tx from")
     to_address: Optional[EthereumAddress] = Field(None, description="tx to")
+    cursor_block_number: Optional[NonNegativeInt] = Field(
+        None,
+        description="Block number of the last item on the previous page "
+        "(keyset pagination, `count` and `total` are not returned)",
+    )
+    cursor_transaction_index: Optional[NonNegativeInt] = Field(
+        None,
+        description="Transaction index of the last item on the previous page "
+        "(keyset pagination)",
+    )
+
+    @model_validator(mode="after")
+    @classmethod
+    def cursor_is_pair(cls, v: Self):
+        if (v.cursor_block_number is None) != (v.cursor_transaction_index is None):
+            raise ValueError(
+                "cursor_block_number and cursor_transaction_index must be specified together"
+            )
+        return v
 
 
 ############################
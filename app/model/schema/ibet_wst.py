@@ -299,6 +299,15 @@ class ListIbetWSTTradesQuery(BasePaginationQuery):
     )
 
 
+class GetIbetWSTBalanceQuery(BaseModel):
+    """GetIbetWSTBalance request query schema"""
+
+    from_chain: bool = Field(
+        False,
+        description="If True, get the balance from the Ethereum node instead of the index",
+    )
+
+
 class GetERC20BalanceQuery(BaseModel):
     """GetERC20Balance request query schema"""
 
@@ -343,7 +352,13 @@ class ListAllIbetWSTTokensResponse(BaseModel):
 class GetIbetWSTBalanceResponse(BaseModel):
     """GetIbetWSTBalance response schema"""
 
-    balance: int = Field(..., description="IbetWST balance")
+    balance: int = Field(
+        ..., description="IbetWST balance (including unfinalized blocks)"
+    )
+    finalized_balance: Optional[int] = Field(
+        ...,
+        description="IbetWST balance as of the finalized block (null if from_chain is True)",
+    )
 
 
 class IbetWSTEventLogMint(BaseModel):
@@ -145,6 +145,13 @@ class RetrieveLedgerHistoryResponse(BaseModel):
     footers: Optional[List[dict]] = None
 
 
+class ListAllLedgerHistoryDetailsDataResponse(BaseModel):
+    """List All Ledger History Details Data schema (Response)"""
+
+    result_set: ResultSet
+    data: List[RetrieveLedgerDetailsDataHistoryResponse]
+
+
 class LedgerDetailsDataTemplateResponse(BaseModel):
     """Ledger Details Data Template schema (Response)"""
 
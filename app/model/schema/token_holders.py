@@ -75,6 +75,22 @@ class ListTokenHoldersPersonalInfoQuery(BasePaginationQuery):
     )
 
 
+class ExportTokenHoldersPersonalInfoFormat(StrEnum):
+    """Export format"""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ExportTokenHoldersPersonalInfoQuery(BaseModel):
+    format: ExportTokenHoldersPersonalInfoFormat = Field(
+        ExportTokenHoldersPersonalInfoFormat.CSV, description="Export format"
+    )
+    include_former_holder: bool = Field(
+        False, description="Whether to include holders whose balance is zero"
+    )
+
+
 class ListTokenHoldersPersonalInfoHistoryQuery(BasePaginationQuery):
     key_manager_type: Optional[KeyManagerType] = Field(
         None, description="Key manager type (**this affects total number**)"
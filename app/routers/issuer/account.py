@@ -828,11 +828,7 @@ async def list_all_child_account(
             )
         )
     if get_query.name is not None:
-        stmt = stmt.where(
-            IDXPersonalInfo._personal_info["name"]
-            .as_string()
-            .like("%" + get_query.name + "%")
-        )
+        stmt = stmt.where(IDXPersonalInfo.name.like("%" + get_query.name + "%"))
     if get_query.created_from:
         _created_from = datetime.strptime(
             get_query.created_from + ".000000", "%Y-%m-%d %H:%M:%S.%f"
@@ -886,9 +882,7 @@ async def list_all_child_account(
                 _order(_sort_order)(ChildAccount.child_account_address)
             )
         case ListAllChildAccountSortItem.name:
-            stmt = stmt.order_by(
-                _order(_sort_order)(IDXPersonalInfo._personal_info["name"].as_string())
-            )
+            stmt = stmt.order_by(_order(_sort_order)(IDXPersonalInfo.name))
         case ListAllChildAccountSortItem.created:
             stmt = stmt.order_by(_order(_sort_order)(IDXPersonalInfo.created))
         case ListAllChildAccountSortItem.modified:
@@ -21,22 +21,29 @@ import uuid
 from datetime import datetime
 from typing import List, Optional, Sequence
 
+import orjson
 import pytz
 from fastapi import APIRouter, Header, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, delete, desc, func, select
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import log
 from app.database import DBAsyncSession
-from app.exceptions import Integer64bitLimitExceededError, InvalidParameterError
+from app.exceptions import (
+    Integer64bitLimitExceededError,
+    InvalidParameterError,
+    ServiceUnavailableError,
+)
 from app.model.db import (
     Account,
     IDXPersonalInfo,
     Ledger,
     LedgerDataType,
     LedgerDetailsData,
+    LedgerDetailsRow,
     LedgerDetailsTemplate,
     LedgerTemplate,
     Token,
@@ -55,15 +62,17 @@ from app.model.schema import (
     LedgerDetailsDataResponse,
     LedgerTemplateResponse,
     ListAllLedgerDetailsDataResponse,
+    ListAllLedgerHistoryDetailsDataResponse,
     ListAllLedgerHistoryResponse,
     RetrieveLedgerDetailsDataResponse,
     RetrieveLedgerHistoryResponse,
 )
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.check_utils import address_is_valid_address, validate_headers
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
 from app.utils.ibet_ledger_utils import request_ledger_creation
-from config import TZ
+from config import LEDGER_PERSONAL_INFO_MAX_CONCURRENCY, TZ
 
 router = APIRouter(
     prefix="/ledger",
@@ -73,6 +82,11 @@ LOG = log.get_logger()
 local_tz = pytz.timezone(TZ)
 utc_tz = pytz.timezone("UTC")
 
+# Maximum number of account addresses in a single IN query
+PERSONAL_INFO_QUERY_CHUNK_SIZE = 1000
+# Number of ledger details rows read at a time when streaming ledger history
+LEDGER_HISTORY_DATA_CHUNK_SIZE = 1000
+
 
 # GET: /ledger/{token_address}/history
 @router.get(
@@ -244,46 +258,156 @@ async def retrieve_ledger_history(
     if resp.get("currency") is None:
         resp["currency"] = ""
 
-    if latest_flg == 1:  # Get the latest personal info
-        # Get ibet fin token_detail_type
-        _ibet_fin_details_list: Sequence[LedgerDetailsTemplate] = (
-            await db.scalars(
-                select(LedgerDetailsTemplate)
-                .where(
-                    and_(
-                        LedgerDetailsTemplate.token_address == token_address,
-                        LedgerDetailsTemplate.data_type == LedgerDataType.IBET_FIN,
+    if _has_details_rows(resp):
+        # Details data is stored in LedgerDetailsRow: stream the ledger by chunks
+        async def get_rows(detail_index: int, last_id: int):
+            return (
+                await db.scalars(
+                    select(LedgerDetailsRow)
+                    .where(
+                        and_(
+                            LedgerDetailsRow.ledger_id == _ledger.id,
+                            LedgerDetailsRow.detail_index == detail_index,
+                            LedgerDetailsRow.id > last_id,
+                        )
                     )
+                    .order_by(LedgerDetailsRow.id)
+                    .limit(LEDGER_HISTORY_DATA_CHUNK_SIZE)
+                )
+            ).all()
+
+        if latest_flg == 1:  # Get the latest personal info
+            _ibet_fin_token_detail_type_list = (
+                await __get_ibet_fin_token_detail_type_list(
+                    token_address=token_address, db=db
                 )
-                .order_by(LedgerDetailsTemplate.id)
             )
-        ).all()
-        _ibet_fin_token_detail_type_list = [
-            _details.token_detail_type for _details in _ibet_fin_details_list
-        ]
+        else:
+            _ibet_fin_token_detail_type_list = []
+        personal_info_map: dict[str, tuple[dict, bool]] = {}
+
+        # NOTE: Errors after the response headers are sent cannot change the status code.
+        #       Resolve the first chunk of personal info before streaming,
+        #       so that an unavailable data source results in an error response.
+        first_chunk: tuple[int, Sequence[LedgerDetailsRow], list[dict]] | None = None
+        first_chunk_not_registered = False
+        for detail_index, details in enumerate(resp["details"]):
+            if details["token_detail_type"] in _ibet_fin_token_detail_type_list:
+                _rows = await get_rows(detail_index=detail_index, last_id=0)
+                data_list = [_row.json() for _row in _rows]
+                first_chunk_not_registered = await __overlay_latest_personal_info(
+                    token=_token,
+                    data_list=data_list,
+                    personal_info_map=personal_info_map,
+                    db=db,
+                )
+                first_chunk = (detail_index, _rows, data_list)
+                break
+
+        async def stream_ledger():
+            some_personal_info_not_registered = False
+
+            yield (
+                b"{"
+                + b",".join(
+                    _json_member(key, resp.get(key))
+                    for key in ("created", "token_name", "currency", "headers")
+                )
+                + b',"details":['
+            )
+            for detail_index, details in enumerate(resp["details"]):
+                yield (
+                    (b"," if detail_index > 0 else b"")
+                    + b"{"
+                    + b",".join(
+                        _json_member(key, details.get(key))
+                        for key in ("token_detail_type", "headers", "footers")
+                    )
+                    + b',"data":['
+                )
+                last_id = 0
+                while True:
+                    if (
+                        first_chunk is not None
+                        and first_chunk[0] == detail_index
+                        and last_id == 0
+                    ):
+                        _, _rows, data_list = first_chunk
+                        if first_chunk_not_registered:
+                            some_personal_info_not_registered = True
+                    else:
+                        _rows = await get_rows(
+                            detail_index=detail_index, last_id=last_id
+                        )
+                        if len(_rows) == 0:
+                            break
+                        data_list = [_row.json() for _row in _rows]
+                        if (
+                            details["token_detail_type"]
+                            in _ibet_fin_token_detail_type_list
+                        ):
+                            # NOTE: A savepoint is used so that a failure does not
+                            #       expire the rows and the token loaded above.
+                            try:
+                                async with db.begin_nested():
+                                    chunk_not_registered = (
+                                        await __overlay_latest_personal_info(
+                                            token=_token,
+                                            data_list=data_list,
+                                            personal_info_map=personal_info_map,
+                                            db=db,
+                                        )
+                                    )
+                            except Exception:
+                                # Fall back to the stored name and address
+                                # rather than truncating the response,
+                                # and flag the detail so that the client can tell.
+                                LOG.exception("Failed to get the latest personal info")
+                                chunk_not_registered = True
+                            if chunk_not_registered:
+                                some_personal_info_not_registered = True
+                    if len(_rows) == 0:
+                        break
+                    yield (b"," if last_id > 0 else b"") + b",".join(
+                        orjson.dumps(data) for data in data_list
+                    )
+                    last_id = _rows[-1].id
+                    if len(_rows) < LEDGER_HISTORY_DATA_CHUNK_SIZE:
+                        break
+                if latest_flg == 1:
+                    details_personal_info_not_registered = (
+                        some_personal_info_not_registered
+                    )
+                else:
+                    details_personal_info_not_registered = details.get(
+                        "some_personal_info_not_registered", False
+                    )
+                yield (
+                    b'],"some_personal_info_not_registered":'
+                    + orjson.dumps(details_personal_info_not_registered)
+                    + b"}"
+                )
+            yield b'],"footers":' + orjson.dumps(resp.get("footers")) + b"}"
+
+        return StreamingResponse(stream_ledger(), media_type="application/json")
+
+    if latest_flg == 1:  # Get the latest personal info
+        _ibet_fin_token_detail_type_list = await __get_ibet_fin_token_detail_type_list(
+            token_address=token_address, db=db
+        )
+
         # Update PersonalInfo
+        personal_info_map: dict[str, tuple[dict, bool]] = {}
         some_personal_info_not_registered = False
         for details in resp["details"]:
             if details["token_detail_type"] in _ibet_fin_token_detail_type_list:
-                for data in details["data"]:
-                    if data["account_address"] == "":
-                        # For data whose data source is DB, the account_address is set to "".
-                        # Here, control logic is implemented assuming that
-                        # an inconsistency has occurred in the data_type of LedgerDetailsTemplate,
-                        # resulting in a value other than "DB".
-                        # In this case, personal information will not be updated.
-                        continue
-                    else:
-                        personal_info, _pi_not_registered = await __get_personal_info(
-                            token_address=token_address,
-                            token_type=_token.type,
-                            account_address=data["account_address"],
-                            db=db,
-                        )
-                        data["name"] = personal_info.get("name", None)
-                        data["address"] = personal_info.get("address", None)
-                        if _pi_not_registered:
-                            some_personal_info_not_registered = True
+                if await __overlay_latest_personal_info(
+                    token=_token,
+                    data_list=details["data"],
+                    personal_info_map=personal_info_map,
+                    db=db,
+                ):
+                    some_personal_info_not_registered = True
             details["some_personal_info_not_registered"] = (
                 some_personal_info_not_registered
             )
@@ -298,6 +422,132 @@ async def retrieve_ledger_history(
     return json_response(resp)
 
 
+# GET: /ledger/{token_address}/history/{ledger_id}/details/{detail_index}/data
+@router.get(
+    "/{token_address}/history/{ledger_id}/details/{detail_index}/data",
+    operation_id="ListAllLedgerHistoryDetailsData",
+    response_model=ListAllLedgerHistoryDetailsDataResponse,
+    responses=get_routers_responses(
+        422, 404, InvalidParameterError, Integer64bitLimitExceededError
+    ),
+)
+async def list_all_ledger_history_details_data(
+    db: DBAsyncSession,
+    token_address: str,
+    ledger_id: int,
+    detail_index: int,
+    issuer_address: Optional[str] = Header(None),
+    latest_flg: int = Query(0, ge=0, le=1),
+    offset: int = Query(None),
+    limit: int = Query(None),
+):
+    """List all details data of ledger history"""
+
+    # Validate Headers
+    validate_headers(issuer_address=(issuer_address, address_is_valid_address))
+
+    # Token Exist Check
+    if issuer_address is None:
+        _token: Token | None = (
+            await db.scalars(
+                select(Token)
+                .where(
+                    and_(
+                        Token.token_address == token_address,
+                        Token.token_status != TokenStatus.FAILED,
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+    else:
+        _token: Token | None = (
+            await db.scalars(
+                select(Token)
+                .where(
+                    and_(
+                        Token.token_address == token_address,
+                        Token.issuer_address == issuer_address,
+                        Token.token_status != TokenStatus.FAILED,
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+    if _token is None:
+        raise HTTPException(status_code=404, detail="token does not exist")
+    if _token.token_status == TokenStatus.PENDING:
+        raise InvalidParameterError("this token is temporarily unavailable")
+
+    # Ledger Exist Check
+    _ledger: Ledger | None = (
+        await db.scalars(
+            select(Ledger)
+            .where(and_(Ledger.id == ledger_id, Ledger.token_address == token_address))
+            .limit(1)
+        )
+    ).first()
+    if _ledger is None:
+        raise HTTPException(status_code=404, detail="ledger does not exist")
+    if detail_index < 0 or detail_index >= len(_ledger.ledger["details"]):
+        raise HTTPException(status_code=404, detail="ledger details does not exist")
+    details: dict = _ledger.ledger["details"][detail_index]
+
+    if _has_details_rows(_ledger.ledger):
+        stmt = (
+            select(LedgerDetailsRow)
+            .where(
+                and_(
+                    LedgerDetailsRow.ledger_id == _ledger.id,
+                    LedgerDetailsRow.detail_index == detail_index,
+                )
+            )
+            .order_by(LedgerDetailsRow.id)
+        )
+        total = await db.scalar(
+            stmt.with_only_columns(func.count())
+            .select_from(LedgerDetailsRow)
+            .order_by(None)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        _rows: Sequence[LedgerDetailsRow] = (await db.scalars(stmt)).all()
+        data_list = [_row.json() for _row in _rows]
+    else:
+        # NOTE: Implementation for backward compatibility
+        #   Ledgers created before v25.12 have details data in Ledger.ledger.
+        total = len(details["data"])
+        start = offset if offset is not None else 0
+        stop = start + limit if limit is not None else None
+        data_list = details["data"][start:stop]
+
+    # NOTE: Because it don`t filter, `total` and `count` will be the same.
+    count = total
+
+    if latest_flg == 1:  # Get the latest personal info
+        _ibet_fin_token_detail_type_list = await __get_ibet_fin_token_detail_type_list(
+            token_address=token_address, db=db
+        )
+        if details["token_detail_type"] in _ibet_fin_token_detail_type_list:
+            await __overlay_latest_personal_info(
+                token=_token, data_list=data_list, personal_info_map={}, db=db
+            )
+
+    resp = {
+        "result_set": {
+            "count": count,
+            "offset": offset,
+            "limit": limit,
+            "total": total,
+        },
+        "data": data_list,
+    }
+
+    return json_response(resp)
+
+
 # GET: /ledger/{token_address}/template
 @router.get(
     "/{token_address}/template",
@@ -936,26 +1186,93 @@ async def delete_ledger_details_data(
     return
 
 
-async def __get_personal_info(
-    token_address: str, token_type: str, account_address: str, db: AsyncSession
-) -> tuple[dict, bool]:
-    # NOTE:
-    # For tokens with require_personal_info_registered = False, search only indexed data.
-    # If indexed data does not exist, return the default value.
+def _json_member(key: str, value) -> bytes:
+    """Serialize a member of a JSON object"""
+    return orjson.dumps(key) + b":" + orjson.dumps(value)
+
+
+def _has_details_rows(ledger: dict) -> bool:
+    """Whether the details data of the ledger is stored in LedgerDetailsRow"""
+    return any("data" not in details for details in ledger["details"])
+
 
-    token: Token | None = (
+async def __get_ibet_fin_token_detail_type_list(
+    token_address: str, db: AsyncSession
+) -> list[str]:
+    """Get token_detail_type whose data type is ibetfin"""
+    _ibet_fin_details_list: Sequence[LedgerDetailsTemplate] = (
         await db.scalars(
-            select(Token).where(Token.token_address == token_address).limit(1)
+            select(LedgerDetailsTemplate)
+            .where(
+                and_(
+                    LedgerDetailsTemplate.token_address == token_address,
+                    LedgerDetailsTemplate.data_type == LedgerDataType.IBET_FIN,
+                )
+            )
+            .order_by(LedgerDetailsTemplate.id)
         )
-    ).first()
-    if token is None:
-        personal_info_not_registered = True
-        return ContractPersonalInfoType().model_dump(), personal_info_not_registered
+    ).all()
+    return [_details.token_detail_type for _details in _ibet_fin_details_list]
+
+
+async def __overlay_latest_personal_info(
+    token: Token,
+    data_list: list[dict],
+    personal_info_map: dict[str, tuple[dict, bool]],
+    db: AsyncSession,
+) -> bool:
+    """Overwrite name and address of details data with the latest personal info
+
+    :param personal_info_map: personal info already retrieved (updated in place)
+    :return: whether some personal info is not registered
+    """
+    # NOTE:
+    # For data whose data source is DB, the account_address is set to "".
+    # Here, control logic is implemented assuming that
+    # an inconsistency has occurred in the data_type of LedgerDetailsTemplate,
+    # resulting in a value other than "DB".
+    # In this case, personal information will not be updated.
+    account_address_list = [
+        account_address
+        for account_address in dict.fromkeys(
+            data["account_address"] for data in data_list
+        )
+        if account_address != "" and account_address not in personal_info_map
+    ]
+    personal_info_map.update(
+        await __get_personal_info_map(
+            token=token, account_address_list=account_address_list, db=db
+        )
+    )
+
+    some_personal_info_not_registered = False
+    for data in data_list:
+        if data["account_address"] == "":
+            continue
+        personal_info, _pi_not_registered = personal_info_map[data["account_address"]]
+        data["name"] = personal_info.get("name", None)
+        data["address"] = personal_info.get("address", None)
+        if _pi_not_registered:
+            some_personal_info_not_registered = True
+    return some_personal_info_not_registered
+
+
+async def __get_personal_info_map(
+    token: Token, account_address_list: list[str], db: AsyncSession
+) -> dict[str, tuple[dict, bool]]:
+    """Get the latest personal info of accounts
+
+    :return: account_address -> (personal_info, personal_info_not_registered)
+    """
+    # NOTE:
+    # For tokens with require_personal_info_registered = False, search only indexed data.
+    # If indexed data does not exist, return the default value.
+    personal_info_map: dict[str, tuple[dict, bool]] = {}
 
     # Issuer cannot have any personal info
-    if account_address == token.issuer_address:
+    if token.issuer_address in account_address_list:
         personal_info_not_registered = False
-        return (
+        personal_info_map[token.issuer_address] = (
             ContractPersonalInfoType(
                 key_manager=None,
                 name=None,
@@ -968,32 +1285,47 @@ async def __get_personal_info(
         )
 
     # Search indexed data
-    _idx_personal_info: IDXPersonalInfo | None = (
-        await db.scalars(
-            select(IDXPersonalInfo)
-            .where(
-                and_(
-                    IDXPersonalInfo.account_address == account_address,
-                    IDXPersonalInfo.issuer_address == token.issuer_address,
+    target_address_list = [
+        account_address
+        for account_address in account_address_list
+        if account_address not in personal_info_map
+    ]
+    for i in range(0, len(target_address_list), PERSONAL_INFO_QUERY_CHUNK_SIZE):
+        _idx_personal_info_list: Sequence[IDXPersonalInfo] = (
+            await db.scalars(
+                select(IDXPersonalInfo).where(
+                    and_(
+                        IDXPersonalInfo.issuer_address == token.issuer_address,
+                        IDXPersonalInfo.account_address.in_(
+                            target_address_list[i : i + PERSONAL_INFO_QUERY_CHUNK_SIZE]
+                        ),
+                    )
                 )
             )
-            .limit(1)
-        )
-    ).first()
-    if (
-        _idx_personal_info is not None
-        and any(_idx_personal_info.personal_info.values()) is not False
-    ):
-        # Get personal info from DB
-        personal_info_not_registered = False
-        return _idx_personal_info.personal_info, personal_info_not_registered
+        ).all()
+        for _idx_personal_info in _idx_personal_info_list:
+            if any(_idx_personal_info.personal_info.values()) is not False:
+                # Get personal info from DB
+                personal_info_not_registered = False
+                personal_info_map[_idx_personal_info.account_address] = (
+                    _idx_personal_info.personal_info,
+                    personal_info_not_registered,
+                )
+
+    missing_address_list = [
+        account_address
+        for account_address in target_address_list
+        if account_address not in personal_info_map
+    ]
+    if len(missing_address_list) == 0:
+        return personal_info_map
 
     # Get token attributes
     token_contract = None
-    if token_type == TokenType.IBET_SHARE.value:
-        token_contract = await IbetShareContract(token_address).get()
-    elif token_type == TokenType.IBET_STRAIGHT_BOND.value:
-        token_contract = await IbetStraightBondContract(token_address).get()
+    if token.type == TokenType.IBET_SHARE.value:
+        token_contract = await IbetShareContract(token.token_address).get()
+    elif token.type == TokenType.IBET_STRAIGHT_BOND.value:
+        token_contract = await IbetStraightBondContract(token.token_address).get()
 
     if token_contract.require_personal_info_registered is True:
         # Get issuer account
@@ -1011,16 +1343,35 @@ async def __get_personal_info(
             issuer=issuer_account,
             contract_address=token_contract.personal_info_contract_address,
         )
-        personal_info = await personal_info_contract.get_info(
-            account_address=account_address, default_value=None
-        )
-        if any(personal_info.values()) is False:
-            personal_info_not_registered = True
-        else:
-            personal_info_not_registered = False
+        try:
+            tasks = await SemaphoreTaskGroup.run(
+                *[
+                    personal_info_contract.get_info(
+                        account_address=account_address, default_value=None
+                    )
+                    for account_address in missing_address_list
+                ],
+                max_concurrency=LEDGER_PERSONAL_INFO_MAX_CONCURRENCY,
+            )
+        except ExceptionGroup:
+            raise ServiceUnavailableError
+        for account_address, task in zip(missing_address_list, tasks):
+            personal_info = task.result()
+            if any(personal_info.values()) is False:
+                personal_info_not_registered = True
+            else:
+                personal_info_not_registered = False
+            personal_info_map[account_address] = (
+                personal_info,
+                personal_info_not_registered,
+            )
     else:
         # Do not retrieve contract data and return the default value
-        personal_info = ContractPersonalInfoType().model_dump()
         personal_info_not_registered = True
+        for account_address in missing_address_list:
+            personal_info_map[account_address] = (
+                ContractPersonalInfoType().model_dump(),
+                personal_info_not_registered,
+            )
 
-    return personal_info, personal_info_not_registered
+    return personal_info_map
@@ -38,6 +38,7 @@ from sqlalchemy import (
     desc,
     distinct,
     func,
+    insert,
     literal,
     literal_column,
     null,
@@ -89,6 +90,7 @@ from app.model.db import (
     IDXPersonalInfo,
     IDXPersonalInfoHistory,
     IDXPosition,
+    IDXPositionSummary,
     IDXTransfer,
     IDXTransferApproval,
     IDXTransferApprovalsSortItem,
@@ -327,6 +329,17 @@ async def issue_share_token(
         _position.pending_transfer = 0
         db.add(_position)
 
+        # Insert initial position summary
+        _position_summary = IDXPositionSummary()
+        _position_summary.token_address = contract_address
+        _position_summary.holder_count = 1 if _position.balance else 0
+        _position_summary.total_balance = _position.balance or 0
+        _position_summary.total_exchange_balance = 0
+        _position_summary.total_exchange_commitment = 0
+        _position_summary.total_pending_transfer = 0
+        _position_summary.total_locked = 0
+        db.add(_position_summary)
+
         # Insert issuer's UTXO data
         block = await AsyncContractUtils.get_block_by_transaction_hash(tx_hash)
         _utxo = UTXO()
@@ -1057,13 +1070,18 @@ async def issue_additional_shares_in_batch(
     _batch_upload.status = 0
     db.add(_batch_upload)
 
-    for _item in data:
-        _batch_issue = BatchIssueRedeem()
-        _batch_issue.upload_id = upload_id
-        _batch_issue.account_address = _item.account_address
-        _batch_issue.amount = _item.amount
-        _batch_issue.status = 0
-        db.add(_batch_issue)
+    await db.execute(
+        insert(BatchIssueRedeem),
+        [
+            {
+                "upload_id": upload_id,
+                "account_address": _item.account_address,
+                "amount": _item.amount,
+                "status": 0,
+            }
+            for _item in data
+        ],
+    )
 
     await db.commit()
 
@@ -1540,13 +1558,18 @@ async def redeem_shares_in_batch(
     _batch_upload.status = 0
     db.add(_batch_upload)
 
-    for _item in data:
-        _batch_issue = BatchIssueRedeem()
-        _batch_issue.upload_id = upload_id
-        _batch_issue.account_address = _item.account_address
-        _batch_issue.amount = _item.amount
-        _batch_issue.status = 0
-        db.add(_batch_issue)
+    await db.execute(
+        insert(BatchIssueRedeem),
+        [
+            {
+                "upload_id": upload_id,
+                "account_address": _item.account_address,
+                "amount": _item.amount,
+                "status": 0,
+            }
+            for _item in data
+        ],
+    )
 
     await db.commit()
 
@@ -2119,13 +2142,9 @@ async def list_all_share_token_holders(
     )
     match get_query.key_manager_type:
         case KeyManagerType.SELF:
-            stmt = stmt.where(
-                IDXPersonalInfo._personal_info["key_manager"].as_string() == "SELF"
-            )
+            stmt = stmt.where(IDXPersonalInfo.key_manager == "SELF")
         case KeyManagerType.OTHERS:
-            stmt = stmt.where(
-                IDXPersonalInfo._personal_info["key_manager"].as_string() != "SELF"
-            )
+            stmt = stmt.where(IDXPersonalInfo.key_manager != "SELF")
 
     total = await db.scalar(
         select(func.count()).select_from(
@@ -2208,17 +2227,11 @@ async def list_all_share_token_holders(
         )
 
     if get_query.holder_name is not None:
-        stmt = stmt.where(
-            IDXPersonalInfo._personal_info["name"]
-            .as_string()
-            .like("%" + get_query.holder_name + "%")
-        )
+        stmt = stmt.where(IDXPersonalInfo.name.like("%" + get_query.holder_name + "%"))
 
     if get_query.key_manager is not None:
         stmt = stmt.where(
-            IDXPersonalInfo._personal_info["key_manager"]
-            .as_string()
-            .like("%" + get_query.key_manager + "%")
+            IDXPersonalInfo.key_manager.like("%" + get_query.key_manager + "%")
         )
 
     count = await db.scalar(
@@ -2229,9 +2242,9 @@ async def list_all_share_token_holders(
 
     # Sort
     if get_query.sort_item == ListAllHoldersSortItem.holder_name:
-        sort_attr = IDXPersonalInfo._personal_info["name"].as_string()
+        sort_attr = IDXPersonalInfo.name
     elif get_query.sort_item == ListAllHoldersSortItem.key_manager:
-        sort_attr = IDXPersonalInfo._personal_info["key_manager"].as_string()
+        sort_attr = IDXPersonalInfo.key_manager
     elif get_query.sort_item == ListAllHoldersSortItem.locked:
         sort_attr = locked_value
     elif get_query.sort_item == ListAllHoldersSortItem.balance_and_pending_transfer:
@@ -2374,6 +2387,18 @@ async def count_share_token_holders(
         raise InvalidParameterError("this token is temporarily unavailable")
 
     # Get Holders
+    # - Read the precomputed summary maintained by the position indexer
+    _summary: IDXPositionSummary | None = (
+        await db.scalars(
+            select(IDXPositionSummary)
+            .where(IDXPositionSummary.token_address == token_address)
+            .limit(1)
+        )
+    ).first()
+    if _summary is not None:
+        return json_response({"count": _summary.holder_count})
+
+    # - Aggregate positions if the summary has not been created yet
     stmt = (
         select(IDXPosition, func.sum(IDXLockedPosition.value))
         .outerjoin(
@@ -2925,6 +2950,27 @@ async def initiate_share_token_batch_personal_info_registration(
     if len(personal_info_list) == 0:
         raise InvalidParameterError("personal information list must not be empty")
 
+    # Check the length of personal info content
+    _personal_info_list = [
+        BatchRegisterPersonalInfo.format_personal_info(personal_info.model_dump())
+        for personal_info in personal_info_list
+    ]
+    errs = [
+        RecordErrorDetail(
+            row_num=i,
+            error_reason="PersonalInfoExceedsSizeLimit",
+        )
+        for i, (personal_info, _personal_info) in enumerate(
+            zip(personal_info_list, _personal_info_list)
+        )
+        if len(json.dumps(_personal_info).encode("utf-8"))
+        > config.PERSONAL_INFO_MESSAGE_SIZE_LIMIT
+    ]
+    if len(errs) > 0:
+        raise BatchPersonalInfoRegistrationValidationError(
+            detail=InvalidUploadErrorDetail(record_error_details=errs)
+        )
+
     batch_id = str(uuid.uuid4())
     batch = BatchRegisterPersonalInfoUpload()
     batch.upload_id = batch_id
@@ -2933,38 +2979,21 @@ async def initiate_share_token_batch_personal_info_registration(
     batch.status = BatchRegisterPersonalInfoUploadStatus.PENDING
     db.add(batch)
 
-    errs = []
-    bulk_register_record_list = []
-
-    for i, personal_info in enumerate(personal_info_list):
-        bulk_register_record = BatchRegisterPersonalInfo()
-        bulk_register_record.upload_id = batch_id
-        bulk_register_record.token_address = token_address
-        bulk_register_record.account_address = personal_info.account_address
-        bulk_register_record.status = 0
-        bulk_register_record.personal_info = personal_info.model_dump()
-
-        # Check the length of personal info content
-        if (
-            len(json.dumps(bulk_register_record.personal_info).encode("utf-8"))
-            > config.PERSONAL_INFO_MESSAGE_SIZE_LIMIT
-        ):
-            errs.append(
-                RecordErrorDetail(
-                    row_num=i,
-                    error_reason="PersonalInfoExceedsSizeLimit",
-                )
+    await db.execute(
+        insert(BatchRegisterPersonalInfo),
+        [
+            {
+                "upload_id": batch_id,
+                "token_address": token_address,
+                "account_address": personal_info.account_address,
+                "status": 0,
+                "_personal_info": _personal_info,
+            }
+            for personal_info, _personal_info in zip(
+                personal_info_list, _personal_info_list
             )
-
-        if not errs:
-            bulk_register_record_list.append(bulk_register_record)
-
-    if len(errs) > 0:
-        raise BatchPersonalInfoRegistrationValidationError(
-            detail=InvalidUploadErrorDetail(record_error_details=errs)
-        )
-
-    db.add_all(bulk_register_record_list)
+        ],
+    )
 
     await db.commit()
 
@@ -3408,15 +3437,11 @@ async def list_share_token_transfer_history(
         stmt = stmt.where(IDXTransfer.to_address == query.to_address)
     if query.from_address_name:
         stmt = stmt.where(
-            from_address_personal_info._personal_info["name"]
-            .as_string()
-            .like("%" + query.from_address_name + "%")
+            from_address_personal_info.name.like("%" + query.from_address_name + "%")
         )
     if query.to_address_name:
         stmt = stmt.where(
-            to_address_personal_info._personal_info["name"]
-            .as_string()
-            .like("%" + query.to_address_name + "%")
+            to_address_personal_info.name.like("%" + query.to_address_name + "%")
         )
     if query.amount is not None and query.amount_operator is not None:
         match query.amount_operator:
@@ -3439,9 +3464,9 @@ async def list_share_token_transfer_history(
     # Sort
     match query.sort_item:
         case ListTransferHistorySortItem.FROM_ADDRESS_NAME:
-            sort_attr = from_address_personal_info._personal_info["name"].as_string()
+            sort_attr = from_address_personal_info.name
         case ListTransferHistorySortItem.TO_ADDRESS_NAME:
-            sort_attr = to_address_personal_info._personal_info["name"].as_string()
+            sort_attr = to_address_personal_info.name
         case _:
             sort_attr = getattr(IDXTransfer, query.sort_item.value, None)
 
@@ -4487,17 +4512,22 @@ async def bulk_transfer_share_token_ownership(
     db.add(_bulk_transfer_upload)
 
     # Add bulk transfer records
-    for _transfer in transfer_req.transfer_list:
-        _bulk_transfer = BulkTransfer()
-        _bulk_transfer.issuer_address = issuer_address
-        _bulk_transfer.upload_id = upload_id
-        _bulk_transfer.token_address = _transfer.token_address
-        _bulk_transfer.token_type = TokenType.IBET_SHARE
-        _bulk_transfer.from_address = _transfer.from_address
-        _bulk_transfer.to_address = _transfer.to_address
-        _bulk_transfer.amount = _transfer.amount
-        _bulk_transfer.status = 0
-        db.add(_bulk_transfer)
+    await db.execute(
+        insert(BulkTransfer),
+        [
+            {
+                "issuer_address": issuer_address,
+                "upload_id": upload_id,
+                "token_address": _transfer.token_address,
+                "token_type": TokenType.IBET_SHARE,
+                "from_address": _transfer.from_address,
+                "to_address": _transfer.to_address,
+                "amount": _transfer.amount,
+                "status": 0,
+            }
+            for _transfer in transfer_req.transfer_list
+        ],
+    )
 
     await db.commit()
 
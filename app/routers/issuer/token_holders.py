@@ -17,21 +17,28 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import csv
+import io
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Annotated, Optional, Sequence
 
+import orjson
 import pytz
 from fastapi import APIRouter, Header, Path, Query
 from fastapi.exceptions import HTTPException
-from sqlalchemy import and_, asc, desc, func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, asc, desc, exists, func, or_, select
 
 import config
 from app.database import DBAsyncSession
 from app.exceptions import InvalidParameterError
 from app.model.db import (
+    IDXLockedPosition,
     IDXPersonalInfo,
     IDXPersonalInfoHistory,
+    IDXPosition,
     Token,
     TokenHolder,
     TokenHolderBatchStatus,
@@ -41,6 +48,8 @@ from app.model.db import (
 from app.model.schema import (
     CreateTokenHoldersListRequest,
     CreateTokenHoldersListResponse,
+    ExportTokenHoldersPersonalInfoFormat,
+    ExportTokenHoldersPersonalInfoQuery,
     ListAllTokenHolderCollectionsResponse,
     ListTokenHoldersPersonalInfoHistoryQuery,
     ListTokenHoldersPersonalInfoHistoryResponse,
@@ -65,6 +74,24 @@ router = APIRouter(
 local_tz = pytz.timezone(config.TZ)
 utc_tz = pytz.timezone("UTC")
 
+EXPORT_PERSONAL_INFO_CHUNK_SIZE = 1000
+EXPORT_PERSONAL_INFO_COLUMNS = (
+    "account_address",
+    "key_manager",
+    "name",
+    "postal_code",
+    "address",
+    "email",
+    "birth",
+    "is_corporate",
+    "tax_category",
+    "balance",
+    "exchange_balance",
+    "exchange_commitment",
+    "pending_transfer",
+    "modified",
+)
+
 
 # GET: /token/holders/personal_info
 @router.get(
@@ -89,13 +116,9 @@ async def list_all_token_holders_personal_info(
     )
     match get_query.key_manager_type:
         case KeyManagerType.SELF:
-            stmt = stmt.where(
-                IDXPersonalInfo._personal_info["key_manager"].as_string() == "SELF"
-            )
+            stmt = stmt.where(IDXPersonalInfo.key_manager == "SELF")
         case KeyManagerType.OTHERS:
-            stmt = stmt.where(
-                IDXPersonalInfo._personal_info["key_manager"].as_string() != "SELF"
-            )
+            stmt = stmt.where(IDXPersonalInfo.key_manager != "SELF")
     total = await db.scalar(
         stmt.with_only_columns(func.count()).select_from(IDXPersonalInfo).order_by(None)
     )
@@ -288,6 +311,187 @@ async def list_all_token_holders_personal_info_history(
     )
 
 
+# GET: /token/holders/{token_address}/personal_info/export
+@router.get(
+    "/holders/{token_address}/personal_info/export",
+    operation_id="ExportTokenHoldersPersonalInfo",
+    response_class=StreamingResponse,
+    responses=get_routers_responses(422, 404, InvalidParameterError),
+)
+async def export_token_holders_personal_info(
+    db: DBAsyncSession,
+    token_address: Annotated[str, Path()],
+    issuer_address: Annotated[str, Header()],
+    get_query: Annotated[ExportTokenHoldersPersonalInfoQuery, Query()],
+    if_modified_since: Annotated[Optional[str], Header()] = None,
+):
+    """Export the personal information of all holders of the token
+
+    - Rows are streamed from a server-side cursor in CSV or NDJSON format.
+    - If `If-Modified-Since` is set, only holders whose position or personal information
+      has been modified since then are exported.
+      The `Last-Modified` response header can be used as the value for the next export.
+    """
+
+    # Validate Headers
+    validate_headers(issuer_address=(issuer_address, address_is_valid_address))
+
+    # Parse If-Modified-Since
+    modified_since = None
+    if if_modified_since is not None:
+        try:
+            _modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            raise InvalidParameterError("If-Modified-Since must be an HTTP-date")
+        if _modified_since.tzinfo is None:
+            _modified_since = _modified_since.replace(tzinfo=UTC)
+        modified_since = _modified_since.astimezone(UTC).replace(tzinfo=None)
+
+    # Get Token
+    _token: Token | None = (
+        await db.scalars(
+            select(Token)
+            .where(
+                and_(
+                    Token.token_address == token_address,
+                    Token.issuer_address == issuer_address,
+                    Token.token_status != 2,
+                )
+            )
+            .limit(1)
+        )
+    ).first()
+    if _token is None:
+        raise HTTPException(status_code=404, detail="token not found")
+    if _token.token_status == TokenStatus.PENDING:
+        raise InvalidParameterError("this token is temporarily unavailable")
+
+    # NOTE: Records modified within the same second as the export start are
+    #       exported again in the next incremental export rather than missed.
+    last_modified = datetime.now(UTC).replace(microsecond=0)
+
+    # Base query
+    stmt = (
+        select(
+            IDXPosition.account_address,
+            IDXPersonalInfo._personal_info,
+            IDXPosition.balance,
+            IDXPosition.exchange_balance,
+            IDXPosition.exchange_commitment,
+            IDXPosition.pending_transfer,
+            func.greatest(IDXPosition.modified, IDXPersonalInfo.modified),
+        )
+        .outerjoin(
+            IDXPersonalInfo,
+            and_(
+                IDXPersonalInfo.issuer_address == issuer_address,
+                IDXPersonalInfo.account_address == IDXPosition.account_address,
+            ),
+        )
+        .where(IDXPosition.token_address == token_address)
+        .order_by(IDXPosition.account_address)
+    )
+
+    # Filter
+    if not get_query.include_former_holder:
+        stmt = stmt.where(
+            or_(
+                IDXPosition.balance != 0,
+                IDXPosition.exchange_balance != 0,
+                IDXPosition.pending_transfer != 0,
+                IDXPosition.exchange_commitment != 0,
+                exists().where(
+                    and_(
+                        IDXLockedPosition.token_address == token_address,
+                        IDXLockedPosition.account_address
+                        == IDXPosition.account_address,
+                        IDXLockedPosition.value != 0,
+                    )
+                ),
+            )
+        )
+    if modified_since is not None:
+        stmt = stmt.where(
+            or_(
+                IDXPosition.modified > modified_since,
+                IDXPersonalInfo.modified > modified_since,
+            )
+        )
+
+    if get_query.format == ExportTokenHoldersPersonalInfoFormat.CSV:
+        media_type = "text/csv"
+    else:
+        media_type = "application/x-ndjson"
+
+    async def stream_rows():
+        result = await db.stream(
+            stmt.execution_options(yield_per=EXPORT_PERSONAL_INFO_CHUNK_SIZE)
+        )
+        if get_query.format == ExportTokenHoldersPersonalInfoFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_PERSONAL_INFO_COLUMNS)
+            async for partition in result.partitions():
+                for row in partition:
+                    record = _export_personal_info_record(row)
+                    writer.writerow(
+                        [record[column] for column in EXPORT_PERSONAL_INFO_COLUMNS]
+                    )
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell() > 0:
+                yield buffer.getvalue().encode()
+        else:
+            async for partition in result.partitions():
+                yield b"".join(
+                    orjson.dumps(_export_personal_info_record(row)) + b"\n"
+                    for row in partition
+                )
+
+    return StreamingResponse(
+        stream_rows(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{token_address}_personal_info.{get_query.format}"',
+            "Last-Modified": format_datetime(last_modified, usegmt=True),
+        },
+    )
+
+
+def _export_personal_info_record(row: Sequence) -> dict:
+    (
+        account_address,
+        personal_info,
+        balance,
+        exchange_balance,
+        exchange_commitment,
+        pending_transfer,
+        modified,
+    ) = row
+    personal_info = personal_info or {}
+    return {
+        "account_address": account_address,
+        "key_manager": personal_info.get("key_manager"),
+        "name": personal_info.get("name"),
+        "postal_code": personal_info.get("postal_code"),
+        "address": personal_info.get("address"),
+        "email": personal_info.get("email"),
+        "birth": personal_info.get("birth"),
+        "is_corporate": personal_info.get("is_corporate"),
+        "tax_category": personal_info.get("tax_category"),
+        "balance": balance,
+        "exchange_balance": exchange_balance,
+        "exchange_commitment": exchange_commitment,
+        "pending_transfer": pending_transfer,
+        "modified": (
+            utc_tz.localize(modified).astimezone(local_tz).isoformat()
+            if modified is not None
+            else None
+        ),
+    }
+
+
 # POST: /token/holders/{token_address}/collection
 @router.post(
     "/holders/{token_address}/collection",
@@ -622,9 +826,7 @@ async def retrieve_token_holders_collection(
 
     if get_query.key_manager is not None:
         stmt = stmt.where(
-            IDXPersonalInfo._personal_info["key_manager"]
-            .as_string()
-            .like("%" + get_query.key_manager + "%")
+            IDXPersonalInfo.key_manager.like("%" + get_query.key_manager + "%")
         )
 
     count = await db.scalar(
@@ -635,7 +837,7 @@ async def retrieve_token_holders_collection(
     if get_query.sort_item == RetrieveTokenHoldersCollectionSortItem.tax_category:
         sort_attr = IDXPersonalInfo._personal_info["tax_category"].as_integer()
     elif get_query.sort_item == RetrieveTokenHoldersCollectionSortItem.key_manager:
-        sort_attr = IDXPersonalInfo._personal_info["key_manager"].as_string()
+        sort_attr = IDXPersonalInfo.key_manager
     else:
         sort_attr = getattr(TokenHolder, get_query.sort_item)
 
@@ -20,8 +20,8 @@ SPDX-License-Identifier: Apache-2.0
 from typing import Annotated, Any, Dict, Sequence, Tuple
 
 from eth_utils import to_checksum_address
-from fastapi import APIRouter, HTTPException, Path, Query
-from sqlalchemy import desc, func, select
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from sqlalchemy import desc, func, select, tuple_
 from web3.contract.contract import ContractFunction
 
 import config
@@ -37,17 +37,27 @@ from app.model.schema import (
     TxDataListResponse,
     TxDataResponse,
 )
+from app.utils.cache_utils import LRUCacheBackend
 from app.utils.docs_utils import get_routers_responses
-from app.utils.fastapi_utils import json_response
+from app.utils.fastapi_utils import (
+    generate_etag,
+    immutable_json_response,
+    json_response,
+    render_json,
+)
 from app.utils.ibet_contract_utils import AsyncContractUtils
 from app.utils.ibet_web3_utils import Web3Wrapper
-from config import BC_EXPLORER_ENABLED
+from config import BC_EXPLORER_ENABLED, BC_EXPLORER_RESPONSE_CACHE_MAX_ENTRIES
 
 LOG = log.get_logger()
 web3 = Web3Wrapper()
 BLOCK_RESPONSE_LIMIT = 1000
 TX_RESPONSE_LIMIT = 10000
 
+# NOTE: Indexed block and tx data never change (ibet finalizes blocks immediately),
+#       so rendered responses are cached as (body, etag) without expiration.
+response_cache = LRUCacheBackend(max_entries=BC_EXPLORER_RESPONSE_CACHE_MAX_ENTRIES)
+
 router = APIRouter(prefix="/blockchain_explorer", tags=["[misc] blockchain_explorer"])
 
 
@@ -68,6 +78,7 @@ async def list_block_data(
     """
     Returns a list of block data within the specified block number range.
     The maximum number of search results is 1000.
+    - Specify `cursor` to page through the results by block number (keyset pagination).
     """
     if BC_EXPLORER_ENABLED is False:
         raise HTTPException(
@@ -114,9 +125,21 @@ async def list_block_data(
     elif get_query.to_block_number is not None:
         stmt = stmt.where(IDXBlockData.number <= get_query.to_block_number)
 
-    count = await db.scalar(
-        stmt.with_only_columns(func.count()).select_from(IDXBlockData).order_by(None)
-    )
+    if get_query.cursor is not None:
+        # Keyset pagination
+        # NOTE: Counting rows gets slower as the table grows,
+        #       so count is not calculated when the cursor is specified.
+        count = None
+        if get_query.sort_order == 0:
+            stmt = stmt.where(IDXBlockData.number > get_query.cursor)
+        else:
+            stmt = stmt.where(IDXBlockData.number < get_query.cursor)
+    else:
+        count = await db.scalar(
+            stmt.with_only_columns(func.count())
+            .select_from(IDXBlockData)
+            .order_by(None)
+        )
 
     # Sort
     if get_query.sort_order == 0:
@@ -125,13 +148,18 @@ async def list_block_data(
         stmt = stmt.order_by(desc(IDXBlockData.number))
 
     # Pagination
-    if get_query.limit is not None:
-        stmt = stmt.limit(get_query.limit)
-    if get_query.offset is not None:
-        stmt = stmt.offset(get_query.offset)
+    if get_query.cursor is not None:
+        if (get_query.limit or 0) > BLOCK_RESPONSE_LIMIT:
+            raise ResponseLimitExceededError("Search results exceed the limit")
+        stmt = stmt.limit(get_query.limit or BLOCK_RESPONSE_LIMIT)
+    else:
+        if get_query.limit is not None:
+            stmt = stmt.limit(get_query.limit)
+        if get_query.offset is not None:
+            stmt = stmt.offset(get_query.offset)
 
-    if max(total, get_query.limit or 0) > BLOCK_RESPONSE_LIMIT:
-        raise ResponseLimitExceededError("Search results exceed the limit")
+        if max(total, get_query.limit or 0) > BLOCK_RESPONSE_LIMIT:
+            raise ResponseLimitExceededError("Search results exceed the limit")
 
     block_data_tmp: Sequence[IDXBlockData] = (await db.scalars(stmt)).all()
     block_data = []
@@ -173,16 +201,23 @@ async def list_block_data(
 )
 async def get_block_data(
     db: DBAsyncSession,
+    request: Request,
     block_number: Annotated[int, Path(description="Block number", ge=0)],
 ):
     """
     Returns block data in the specified block number.
+    - Block data never changes once indexed, so the response has a strong ETag and is cacheable as immutable.
     """
     if BC_EXPLORER_ENABLED is False:
         raise HTTPException(
             status_code=404, detail="This URL is not available in the current settings"
         )
 
+    cached = response_cache.get("block_data", str(block_number))
+    if cached is not None:
+        body, etag = cached
+        return immutable_json_response(request, body, etag)
+
     block_data = (
         await db.scalars(
             select(IDXBlockData).where(IDXBlockData.number == block_number).limit(1)
@@ -191,7 +226,7 @@ async def get_block_data(
     if block_data is None:
         raise HTTPException(status_code=404, detail="block data not found")
 
-    return json_response(
+    body = render_json(
         {
             "number": block_data.number,
             "parent_hash": block_data.parent_hash,
@@ -213,6 +248,10 @@ async def get_block_data(
             "transactions": block_data.transactions,
         }
     )
+    etag = generate_etag(body)
+    response_cache.set("block_data", str(block_number), (body, etag))
+
+    return immutable_json_response(request, body, etag)
 
 
 # ------------------------------
@@ -232,16 +271,25 @@ async def list_tx_data(
     """
     Returns a list of transactions by various search parameters.
     The maximum number of search results is 10000.
+    - Transactions are returned in descending order of block number and transaction index.
+    - Specify `cursor_block_number` and `cursor_transaction_index` to page through the results (keyset pagination).
     """
     if BC_EXPLORER_ENABLED is False:
         raise HTTPException(
             status_code=404, detail="This URL is not available in the current settings"
         )
 
+    keyset_pagination = get_query.cursor_block_number is not None
+
     stmt = select(IDXTxData)
-    total = await db.scalar(
-        stmt.with_only_columns(func.count()).select_from(IDXTxData).order_by(None)
-    )
+    if keyset_pagination:
+        # NOTE: Counting rows gets slower as the table grows,
+        #       so count and total are not calculated when the cursor is specified.
+        total = None
+    else:
+        total = await db.scalar(
+            stmt.with_only_columns(func.count()).select_from(IDXTxData).order_by(None)
+        )
 
     # Search Filter
     if get_query.block_number is not None:
@@ -255,21 +303,35 @@ async def list_tx_data(
             IDXTxData.to_address == to_checksum_address(get_query.to_address)
         )
 
-    count = await db.scalar(
-        stmt.with_only_columns(func.count()).select_from(IDXTxData).order_by(None)
-    )
+    if keyset_pagination:
+        count = None
+        stmt = stmt.where(
+            tuple_(IDXTxData.block_number, IDXTxData.transaction_index)
+            < tuple_(get_query.cursor_block_number, get_query.cursor_transaction_index)
+        )
+    else:
+        count = await db.scalar(
+            stmt.with_only_columns(func.count()).select_from(IDXTxData).order_by(None)
+        )
 
     # Sort
-    stmt = stmt.order_by(desc(IDXTxData.created))
+    stmt = stmt.order_by(
+        desc(IDXTxData.block_number), desc(IDXTxData.transaction_index)
+    )
 
     # Pagination
-    if get_query.limit is not None:
-        stmt = stmt.limit(get_query.limit)
-    if get_query.offset is not None:
-        stmt = stmt.offset(get_query.offset)
+    if keyset_pagination:
+        if (get_query.limit or 0) > TX_RESPONSE_LIMIT:
+            raise ResponseLimitExceededError("Search results exceed the limit")
+        stmt = stmt.limit(get_query.limit or TX_RESPONSE_LIMIT)
+    else:
+        if get_query.limit is not None:
+            stmt = stmt.limit(get_query.limit)
+        if get_query.offset is not None:
+            stmt = stmt.offset(get_query.offset)
 
-    if max(total, get_query.limit or 0) > TX_RESPONSE_LIMIT:
-        raise ResponseLimitExceededError("Search results exceed the limit")
+        if max(total, get_query.limit or 0) > TX_RESPONSE_LIMIT:
+            raise ResponseLimitExceededError("Search results exceed the limit")
 
     tx_data_tmp: Sequence[IDXTxData] = (await db.scalars(stmt)).all()
     tx_data = []
@@ -309,16 +371,24 @@ async def list_tx_data(
     responses=get_routers_responses(404),
 )
 async def get_tx_data(
-    db: DBAsyncSession, hash: Annotated[str, Path(description="Transaction hash")]
+    db: DBAsyncSession,
+    request: Request,
+    hash: Annotated[str, Path(description="Transaction hash")],
 ):
     """
     Searching for the transaction by transaction hash
+    - Tx data never changes once indexed, so the response has a strong ETag and is cacheable as immutable.
     """
     if BC_EXPLORER_ENABLED is False:
         raise HTTPException(
             status_code=404, detail="This URL is not available in the current settings"
         )
 
+    cached = response_cache.get("tx_data", hash)
+    if cached is not None:
+        body, etag = cached
+        return immutable_json_response(request, body, etag)
+
     # Search tx data
     tx_data = (
         await db.scalars(select(IDXTxData).where(IDXTxData.hash == hash).limit(1))
@@ -346,7 +416,7 @@ async def get_tx_data(
         contract_function = decoded_input[0].fn_name
         contract_parameters = decoded_input[1]
 
-    return json_response(
+    body = render_json(
         {
             "hash": tx_data.hash,
             "block_hash": tx_data.block_hash,
@@ -363,3 +433,7 @@ async def get_tx_data(
             "nonce": tx_data.nonce,
         }
     )
+    etag = generate_etag(body)
+    response_cache.set("tx_data", hash, (body, etag))
+
+    return immutable_json_response(request, body, etag)
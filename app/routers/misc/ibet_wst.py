@@ -46,6 +46,7 @@ from app.model.db import (
     IbetWSTTxStatus,
     IbetWSTTxType,
     IbetWSTVersion,
+    IDXEthIbetWSTBalance,
     IDXEthIbetWSTTrade,
     IDXEthIbetWSTWhitelist,
     Token,
@@ -62,6 +63,7 @@ from app.model.schema import (
     GetERC20AllowanceResponse,
     GetERC20BalanceQuery,
     GetERC20BalanceResponse,
+    GetIbetWSTBalanceQuery,
     GetIbetWSTBalanceResponse,
     GetIbetWSTTradeResponse,
     GetIbetWSTTransactionResponse,
@@ -200,11 +202,13 @@ async def get_ibet_wst_balance(
     ibet_wst_address: Annotated[
         EthereumAddress, Path(description="IbetWST contract address")
     ],
+    get_query: Annotated[GetIbetWSTBalanceQuery, Query()],
 ):
     """
     Get IbetWST balance for a specific account address
 
     - This endpoint retrieves the IbetWST balance for the specified account address.
+    - The balance is read from the index. If `from_chain` is set, it is read from the Ethereum node.
     """
     # Check if ibet-WST exists
     _token = (
@@ -218,10 +222,22 @@ async def get_ibet_wst_balance(
         raise HTTPException(status_code=404, detail="IbetWST token not found")
 
     # Get balance amount
-    wst_contract = IbetWST(to_checksum_address(ibet_wst_address))
-    balance = await wst_contract.balance_of(to_checksum_address(account_address))
-
-    return json_response({"balance": balance})
+    if get_query.from_chain:
+        wst_contract = IbetWST(to_checksum_address(ibet_wst_address))
+        balance = await wst_contract.balance_of(to_checksum_address(account_address))
+        return json_response({"balance": balance, "finalized_balance": None})
+
+    idx_balance = await get_indexed_wst_balance(
+        db=db,
+        ibet_wst_address=to_checksum_address(ibet_wst_address),
+        account_address=to_checksum_address(account_address),
+    )
+    return json_response(
+        {
+            "balance": idx_balance.balance if idx_balance else 0,
+            "finalized_balance": idx_balance.finalized_balance if idx_balance else 0,
+        }
+    )
 
 
 # POST: /ibet_wst/balances/{account_address}/{ibet_wst_address}/burn
@@ -256,8 +272,13 @@ async def burn_ibet_wst_balance(
         raise HTTPException(status_code=404, detail="IbetWST token not found")
 
     # Pre-transaction check: Ensure ST token balance is sufficient
-    wst_contract = IbetWST(to_checksum_address(ibet_wst_address))
-    wst_balance = await wst_contract.balance_of(to_checksum_address(account_address))
+    # NOTE: The indexed balance including unfinalized blocks is used.
+    idx_balance = await get_indexed_wst_balance(
+        db=db,
+        ibet_wst_address=to_checksum_address(ibet_wst_address),
+        account_address=to_checksum_address(account_address),
+    )
+    wst_balance = idx_balance.balance if idx_balance else 0
     if wst_balance < req_params.value:
         raise IbetWSTInsufficientBalanceError
 
@@ -1144,3 +1165,21 @@ def get_client_ip(request: Request):
     else:
         client_ip = request.client.host
     return client_ip
+
+
+async def get_indexed_wst_balance(
+    db: DBAsyncSession, ibet_wst_address: str, account_address: str
+) -> IDXEthIbetWSTBalance | None:
+    """Get the indexed IbetWST balance of the account"""
+    return (
+        await db.scalars(
+            select(IDXEthIbetWSTBalance)
+            .where(
+                and_(
+                    IDXEthIbetWSTBalance.ibet_wst_address == ibet_wst_address,
+                    IDXEthIbetWSTBalance.account_address == account_address,
+                )
+            )
+            .limit(1)
+        )
+    ).first()
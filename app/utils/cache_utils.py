@@ -20,15 +20,161 @@ SPDX-License-Identifier: Apache-2.0
 import inspect
 import os
 import pickle
+import socket
+import struct
 import sys
 import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from multiprocessing.shared_memory import SharedMemory
-from typing import Any, ItemsView, Iterator, KeysView, Optional, ValuesView
+from typing import (
+    Any,
+    Generator,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Optional,
+    ValuesView,
+)
+from urllib.parse import unquote, urlparse
 
 from shared_memory_dict import SharedMemoryDict
-from shared_memory_dict.lock import lock
+from shared_memory_dict.lock import _lock as shm_lock, lock
 from shared_memory_dict.templates import MEMORY_NAME
 
+from config import (
+    CACHE_BACKEND,
+    CACHE_KEY_PREFIX,
+    CACHE_MAX_ENTRIES,
+    CACHE_REDIS_URL,
+)
+
+
+class VersionedSharedMemoryDict(SharedMemoryDict):
+    """SharedMemoryDict with a seqlock header
+
+    The shared memory object starts with a header (sequence number, data length, moved flag)
+    followed by the pickled dict.
+
+    - Writers (serialized by the shared memory lock) make the sequence number odd
+      while writing and even again when finished.
+    - Readers never take the lock. They keep the last deserialized dict with its
+      sequence number and deserialize again only when the sequence number changes.
+      If a write is in progress or the sequence number changes during the read, the read is retried.
+    - When a writer re-creates the object with a larger size, the moved flag is set
+      on the old object so that readers re-open it.
+    """
+
+    HEADER = struct.Struct("<QQQ")  # sequence number, data length, moved flag
+    HEADER_SIZE = 32
+    READ_RETRY_COUNT = 10000
+
+    def __init__(self, name: str, size: int) -> None:
+        self._name = name
+        self._snapshot_seq: Optional[int] = None
+        self._snapshot: dict = {}
+        super().__init__(name=name, size=size)
+
+    def _ensure_memory_initialization(self):
+        seq, length, _ = self.HEADER.unpack_from(self._memory_block.buf, 0)
+        if seq == 0 and length == 0:
+            self._save_memory({})
+
+    @contextmanager
+    def _modify_db(self) -> Generator:
+        # NOTE: SharedMemoryDict's _modify_db releases the lock before yielding,
+        #       so writers are serialized here explicitly.
+        shm_lock.acquire()
+        try:
+            self.remap_if_moved()
+            db = dict(self.snapshot())
+            yield db
+            self._save_memory(db)
+        finally:
+            shm_lock.release()
+
+    def _save_memory(self, db: dict) -> None:
+        data = self._serializer.dumps(db)
+        if self.HEADER_SIZE + len(data) > self._memory_block.size:
+            raise ValueError("exceeds available storage")
+
+        buf = self._memory_block.buf
+        seq = self.HEADER.unpack_from(buf, 0)[0]
+        if seq % 2 == 1:  # Interrupted write
+            seq += 1
+        struct.pack_into("<Q", buf, 0, seq + 1)  # Write in progress
+        buf[self.HEADER_SIZE : self.HEADER_SIZE + len(data)] = data
+        struct.pack_into("<Q", buf, 8, len(data))
+        struct.pack_into("<Q", buf, 0, seq + 2)  # Write completed
+
+    def _read_memory(self) -> dict:
+        return self.snapshot()
+
+    def snapshot(self) -> dict:
+        """Get the latest dict (must not be modified by the caller)"""
+        for _ in range(self.READ_RETRY_COUNT):
+            if self.remap_if_moved():
+                continue
+            buf = self._memory_block.buf
+            seq, length, _ = self.HEADER.unpack_from(buf, 0)
+            if seq % 2 == 1:  # Write in progress
+                time.sleep(0)
+                continue
+            if seq == self._snapshot_seq:
+                return self._snapshot
+
+            data = bytes(buf[self.HEADER_SIZE : self.HEADER_SIZE + length])
+            if self.HEADER.unpack_from(buf, 0)[0] != seq:  # Updated while reading
+                continue
+            try:
+                db = self._serializer.loads(data)
+            except Exception:
+                continue
+            self._snapshot_seq, self._snapshot = seq, db
+            return db
+        raise TimeoutError(f"Could not read shared memory: {self._name}")
+
+    def remap_if_moved(self) -> bool:
+        """Re-open the shared memory object if it has been re-created by another process
+
+        :return: True if re-opened
+        """
+        if self.HEADER.unpack_from(self._memory_block.buf, 0)[2] == 0:
+            return False
+        try:
+            new_shared_memory = SharedMemory(name=MEMORY_NAME.format(name=self._name))
+        except FileNotFoundError:
+            # NOTE: Being re-created by another process
+            time.sleep(0)
+            return True
+        self._memory_block.close()
+        self._memory_block = new_shared_memory
+        self._snapshot_seq, self._snapshot = None, {}
+        return True
+
+    def recreate(self, size: int, db: dict) -> None:
+        """Re-create the shared memory object with the given size and write the dict
+
+        NOTE: The caller must hold the shared memory lock.
+        """
+        old_shared_memory = self._memory_block
+        seq = self.HEADER.unpack_from(old_shared_memory.buf, 0)[0]
+
+        old_shared_memory.unlink()
+        new_shared_memory = SharedMemory(
+            name=MEMORY_NAME.format(name=self._name), create=True, size=size
+        )
+        # NOTE: Continue the sequence number so that snapshots of the old object are not reused.
+        struct.pack_into("<Q", new_shared_memory.buf, 0, seq + seq % 2)
+        self._memory_block = new_shared_memory
+        self._save_memory(db)
+
+        # Notify readers in other processes that the object has been re-created
+        struct.pack_into("<Q", old_shared_memory.buf, 16, 1)
+        old_shared_memory.close()
+
 
 class DictCache:
     """Cache Utilities
@@ -47,6 +193,12 @@ class DictCache:
             "is_extend_size": False,
             "extend_incremental": 0,
         },
+        # NOTE: Used by SharedMemoryCacheBackend.
+        "cache_backend": {
+            "default_size": 65536,
+            "is_extend_size": True,
+            "extend_incremental": 65536,
+        },
     }
     MEMORY_CACHE = False
     caches = {}
@@ -73,13 +225,15 @@ class DictCache:
                 if v["is_extend_size"] is True:
                     if is_first_init is True:
                         DictCache.cache_sizes[k] = v["default_size"]
-                        shm_dict = SharedMemoryDict(name=k, size=v["default_size"])
+                        shm_dict = VersionedSharedMemoryDict(
+                            name=k, size=v["default_size"]
+                        )
                     else:
-                        shm_dict = SharedMemoryDict(
+                        shm_dict = VersionedSharedMemoryDict(
                             name=k, size=DictCache.cache_sizes[k]
                         )
                 else:
-                    shm_dict = SharedMemoryDict(name=k, size=v["default_size"])
+                    shm_dict = VersionedSharedMemoryDict(name=k, size=v["default_size"])
                 if is_first_init is True:
                     shm_dict.clear()
                 DictCache.caches[k] = {"data": shm_dict, "lock": None}
@@ -93,38 +247,15 @@ class DictCache:
         self.cache = DictCache.caches[name]
 
     def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
-        if key in self.cache["data"]:
-            return self.cache["data"][key]
-        else:
-            return default
+        return self.cache["data"].get(key, default)
 
     def keys(self) -> KeysView[Any]:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"].keys()
 
     def values(self) -> ValuesView[Any]:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"].values()
 
     def items(self) -> ItemsView:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"].items()
 
     def pop(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
@@ -153,11 +284,6 @@ class DictCache:
             self._thread_safe(_func)
 
     def __getitem__(self, key: str) -> Any:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"][key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -174,11 +300,6 @@ class DictCache:
             self._thread_safe(_func)
 
     def __len__(self) -> int:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return len(self.cache["data"])
 
     def __delitem__(self, key: str) -> None:
@@ -194,59 +315,24 @@ class DictCache:
             return self._thread_safe(_func)
 
     def __iter__(self) -> Iterator:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return iter(self.cache["data"])
 
     def __reversed__(self):
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return reversed(self.cache["data"])
 
     def __contains__(self, key: str) -> bool:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return key in self.cache["data"]
 
     def __eq__(self, other: Any) -> bool:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"] == other
 
     def __ne__(self, other: Any) -> bool:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return self.cache["data"] != other
 
     def __str__(self) -> str:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return str(self.cache["data"])
 
     def __repr__(self) -> str:
-        if (
-            DictCache.MEMORY_CACHE is False
-            and DictCache.USE_CACHE[self.name]["is_extend_size"] is True
-        ):
-            self._extend_size_and_write()
         return repr(self.cache["data"])
 
     def _thread_safe(self, func):
@@ -259,38 +345,30 @@ class DictCache:
         self, *, key: str = None, value: Any = None, other=(), **kwargs
     ):
         """
-        If the cache size becomes large due to updating by another process, reading or writing may fail,
-        so extends the size when accessing the shared memory.
+        If the update data exceeds the size of the shared memory object,
+        re-create the shared memory object with extended size and write the data.
+        Other processes re-open the re-created shared memory object when reading.
         """
-
-        # Check Need Extend
-        shm_cache_size = DictCache.cache_sizes[self.name]
-        mapped_size = self.cache["data"]._memory_block.size
-        if mapped_size != shm_cache_size:
-            # Extend Shared Memory Object Mapping Size When READ
-            old_shared_memory = self.cache["data"]._memory_block
-            # NOTE: Re-open shared memory object and extend mapping memory size.
-            old_shared_memory.close()
-            new_shared_memory = SharedMemory(name=MEMORY_NAME.format(name=self.name))
-            self.cache["data"]._memory_block = new_shared_memory
+        shm_dict: VersionedSharedMemoryDict = self.cache["data"]
+        shm_dict.remap_if_moved()
 
         if key is None and other == () and kwargs == {}:  # When READ
             return
 
         # Get Update Data Size
-        update_data = {}
-        update_data.update(**self.cache["data"])
+        update_data = dict(shm_dict.snapshot())
         if key is not None:
             update_data[key] = value
         else:
             update_data.update(other, **kwargs)
         bin_update_data = pickle.dumps(update_data, pickle.HIGHEST_PROTOCOL)
-        update_size = len(bin_update_data)
+        update_size = len(bin_update_data) + VersionedSharedMemoryDict.HEADER_SIZE
 
         # Check Need Extend
+        shm_cache_size = shm_dict.shm.size
         if shm_cache_size >= update_size:
             # NOTE: Save update data independent of @lock decorator.(Avoid deadlock)
-            self.cache["data"]._save_memory(update_data)
+            shm_dict._save_memory(update_data)
             return
 
         # Get Extend Size
@@ -299,16 +377,8 @@ class DictCache:
             mod_size += DictCache.USE_CACHE[self.name]["extend_incremental"]
 
         # Extend Shared Memory Object Mapping Size When WRITE
-        old_shared_memory = self.cache["data"]._memory_block
-        # NOTE: Re-create shared memory object.
-        old_shared_memory.close()
-        old_shared_memory.unlink()
-        new_shared_memory = SharedMemory(
-            name=MEMORY_NAME.format(name=self.name), create=True, size=mod_size
-        )
-        self.cache["data"]._memory_block = new_shared_memory
         # NOTE: Save update data independent of @lock decorator.(Avoid deadlock)
-        self.cache["data"]._save_memory(update_data)
+        shm_dict.recreate(size=mod_size, db=update_data)
 
         # Update Cache Sizes
         tmp_cache_sizes = {}
@@ -319,3 +389,300 @@ class DictCache:
 
 
 DictCache.initialize()
+
+
+class CacheBackend(ABC):
+    """Cache Backend
+
+    Common interface of key-value caches shared by API and batch processes.
+    Keys are grouped by namespace, and each entry can have its own TTL.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, default: Optional[Any] = None) -> Any:
+        """Get a cached value
+
+        :param namespace: Namespace
+        :param key: Key
+        :param default: Value returned when the key does not exist or has expired
+        :return: Cached value
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        """Set a value
+
+        :param namespace: Namespace
+        :param key: Key
+        :param value: Value (must be picklable)
+        :param ttl: Time to live in seconds (no expiration if None)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Delete a value
+
+        :param namespace: Namespace
+        :param key: Key
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """Delete all values in the namespace
+
+        :param namespace: Namespace
+        """
+        pass
+
+    @staticmethod
+    def _expiration(ttl: Optional[int]) -> Optional[float]:
+        return time.time() + ttl if ttl is not None else None
+
+    @staticmethod
+    def _is_expired(expiration: Optional[float]) -> bool:
+        return expiration is not None and expiration <= time.time()
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU Cache Backend
+
+    Entries are held in the memory of each process.
+    When the number of entries in a namespace exceeds `max_entries`,
+    the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: dict[str, OrderedDict[str, tuple[Optional[float], Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entries = self._data.get(namespace)
+            if entries is None or key not in entries:
+                return default
+            expiration, value = entries[key]
+            if self._is_expired(expiration):
+                del entries[key]
+                return default
+            entries.move_to_end(key)
+            return value
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        with self._lock:
+            entries = self._data.setdefault(namespace, OrderedDict())
+            entries[key] = (self._expiration(ttl), value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            entries = self._data.get(namespace)
+            if entries is not None:
+                entries.pop(key, None)
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            self._data.pop(namespace, None)
+
+
+class SharedMemoryCacheBackend(CacheBackend):
+    """Shared Memory Cache Backend
+
+    Entries are stored in the "cache_backend" DictCache, so they are shared
+    between API worker processes in the same way as the E2EE cache.
+    Batch processes hold the entries in their own memory (see DictCache).
+    When the number of entries in a namespace exceeds `max_entries`,
+    expired entries and then the entries closest to expiration are evicted.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.cache = DictCache("cache_backend")
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{namespace}:{key}"
+
+    def get(self, namespace: str, key: str, default: Optional[Any] = None) -> Any:
+        entry = self.cache.get(self._key(namespace, key))
+        if entry is None:
+            return default
+        expiration, value = entry
+        if self._is_expired(expiration):
+            self.cache.pop(self._key(namespace, key), None)
+            return default
+        return value
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        self.cache[self._key(namespace, key)] = (self._expiration(ttl), value)
+        self._evict(namespace)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.cache.pop(self._key(namespace, key), None)
+
+    def clear(self, namespace: str) -> None:
+        prefix = self._key(namespace, "")
+        for _key in [k for k in self.cache.keys() if k.startswith(prefix)]:
+            self.cache.pop(_key, None)
+
+    def _evict(self, namespace: str) -> None:
+        prefix = self._key(namespace, "")
+        entries = [(k, v[0]) for k, v in self.cache.items() if k.startswith(prefix)]
+        if len(entries) <= self.max_entries:
+            return
+        # NOTE: Entries without expiration are evicted last.
+        entries.sort(key=lambda e: e[1] if e[1] is not None else float("inf"))
+        for _key, _ in entries[: len(entries) - self.max_entries]:
+            self.cache.pop(_key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis Cache Backend
+
+    Entries are stored in a Redis-compatible server (Redis, Valkey, etc.),
+    so they are shared between all API and batch processes.
+    Only the basic commands (GET/SET/DEL/SCAN) are used, so any server that speaks
+    the RESP protocol can be used in place of Redis.
+    Eviction is delegated to the server (e.g. `maxmemory-policy allkeys-lru`).
+    """
+
+    def __init__(self, url: str = CACHE_REDIS_URL, key_prefix: str = CACHE_KEY_PREFIX):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.key_prefix = key_prefix
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.key_prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str, default: Optional[Any] = None) -> Any:
+        value = self._execute("GET", self._key(namespace, key))
+        if value is None:
+            return default
+        return pickle.loads(value)
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if ttl is not None:
+            self._execute("SET", self._key(namespace, key), data, "EX", max(ttl, 1))
+        else:
+            self._execute("SET", self._key(namespace, key), data)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._execute("DEL", self._key(namespace, key))
+
+    def clear(self, namespace: str) -> None:
+        cursor = b"0"
+        match = f"{self.key_prefix}:{namespace}:*"
+        while True:
+            cursor, keys = self._execute("SCAN", cursor, "MATCH", match, "COUNT", 1000)
+            if keys:
+                self._execute("DEL", *keys)
+            if cursor == b"0":
+                break
+
+    def _execute(self, *args):
+        """Send a command and read the reply (reconnect once on connection failure)"""
+        with self._lock:
+            try:
+                return self._send_command(*args)
+            except (ConnectionError, OSError):
+                self._close()
+                return self._send_command(*args)
+
+    def _send_command(self, *args):
+        if self._sock is None:
+            self._connect()
+        self._sock.sendall(self._encode(args))
+        return self._read_reply()
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=5)
+        self._reader = self._sock.makefile("rb")
+        if self.password is not None:
+            self._sock.sendall(self._encode(("AUTH", self.password)))
+            self._read_reply()
+        if self.db != 0:
+            self._sock.sendall(self._encode(("SELECT", self.db)))
+            self._read_reply()
+
+    def _close(self):
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        buf = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode("utf-8")
+            buf.append(f"${len(data)}\r\n".encode())
+            buf.append(data)
+            buf.append(b"\r\n")
+        return b"".join(buf)
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by cache server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body
+        elif prefix == b"-":
+            raise ValueError(body.decode())
+        elif prefix == b":":
+            return int(body)
+        elif prefix == b"$":
+            length = int(body)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        elif prefix == b"*":
+            length = int(body)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+
+_cache_backend: Optional[CacheBackend] = None
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the cache backend selected by CACHE_BACKEND"""
+    global _cache_backend
+    if _cache_backend is None:
+        if CACHE_BACKEND == "redis":
+            _cache_backend = RedisCacheBackend()
+        elif CACHE_BACKEND == "shared_memory":
+            _cache_backend = SharedMemoryCacheBackend()
+        else:
+            _cache_backend = LRUCacheBackend()
+    return _cache_backend
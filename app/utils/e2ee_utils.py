@@ -25,6 +25,7 @@ import boto3
 from Crypto.Cipher import PKCS1_OAEP
 from Crypto.PublicKey import RSA
 
+from app.utils import metrics_utils
 from app.utils.cache_utils import DictCache
 from config import (
     AWS_REGION_NAME,
@@ -94,6 +95,7 @@ class E2EEUtils:
             encrypt_data = base64.b16decode(hex_fixed.upper())
 
         decrypt_data = cipher.decrypt(encrypt_data)
+        metrics_utils.record_e2ee_decrypt()
         return decrypt_data.decode()
 
     @staticmethod
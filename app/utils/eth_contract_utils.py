@@ -21,6 +21,7 @@ import asyncio
 import json
 import sys
 import threading
+import time
 from json import JSONDecodeError
 from typing import Any, Type, TypeVar
 
@@ -46,6 +47,7 @@ from app.database import async_engine
 from app.exceptions import SendTransactionError, ServiceUnavailableError
 from app.model import EthereumAddress
 from app.model.db import EthereumNode
+from app.utils import metrics_utils
 from eth_config import (
     ETH_CHAIN_ID,
     ETH_WEB3_HTTP_PROVIDER,
@@ -65,7 +67,15 @@ class EthFailOverHTTPProvider(AsyncHTTPProvider):
 
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         """Make an HTTP request to the Ethereum node."""
+        start_time = time.perf_counter()
+        try:
+            return await self._make_request(method, params)
+        finally:
+            metrics_utils.record_web3_request(
+                "ethereum", method, time.perf_counter() - start_time
+            )
 
+    async def _make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
         try:
             if self.fail_over_mode:
@@ -171,7 +181,11 @@ class EthAsyncContractUtils:
 
     @staticmethod
     async def deploy_contract(
-        contract_name: str, args: list, deployer: EthereumAddress, private_key: bytes
+        contract_name: str,
+        args: list,
+        deployer: EthereumAddress,
+        private_key: bytes,
+        nonce: Nonce | None = None,
     ) -> tuple[str, Nonce]:
         """Deploy contract
 
@@ -179,6 +193,7 @@ class EthAsyncContractUtils:
         :param args: arguments given to constructor
         :param deployer: contract deployer
         :param private_key: private key
+        :param nonce: nonce to use (fetched from the node if not specified)
         :return: contract address, ABI, transaction hash
         """
         contract_file = f"contracts/eth/{contract_name}.json"
@@ -204,7 +219,7 @@ class EthAsyncContractUtils:
             )
             # Send transaction
             tx_hash, nonce = await EthAsyncContractUtils.send_transaction(
-                transaction=tx, private_key=private_key
+                transaction=tx, private_key=private_key, nonce=nonce
             )
         except TimeExhausted as timeout_error:
             # NOTE: Time-out occurred because sending transaction stays in pending, etc.
@@ -265,22 +280,33 @@ class EthAsyncContractUtils:
         return result
 
     @staticmethod
-    async def send_transaction(transaction: dict, private_key: bytes):
+    async def send_transaction(
+        transaction: dict, private_key: bytes, nonce: Nonce | None = None
+    ):
         """Send transaction
 
         :param transaction: Transaction parameters
         :param private_key: Private key of the sender
+        :param nonce: Nonce to use (fetched from the node if not specified)
         :return: Tuple of transaction hash and nonce
         """
         _tx_from = transaction["from"]
 
         # Get nonce
-        nonce = await EthWeb3.eth.get_transaction_count(
-            _tx_from, block_identifier="pending"
-        )
+        # NOTE: Callers that send several transactions in a row from the same
+        #       sender can manage the nonce locally and skip this round trip.
+        if nonce is None:
+            nonce = await EthWeb3.eth.get_transaction_count(
+                _tx_from, block_identifier="pending"
+            )
         transaction["nonce"] = nonce
-        signed_tx = EthWeb3.eth.account.sign_transaction(
-            transaction_dict=transaction, private_key=private_key
+
+        # Sign transaction
+        # NOTE: Signing is CPU-bound, so it is offloaded from the event loop.
+        signed_tx = await asyncio.to_thread(
+            EthWeb3.eth.account.sign_transaction,
+            transaction_dict=transaction,
+            private_key=private_key,
         )
         # Send Transaction
         tx_hash = await EthWeb3.eth.send_raw_transaction(
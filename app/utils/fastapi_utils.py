@@ -18,9 +18,11 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import decimal
+import hashlib
 from typing import Any
 
 import orjson
+from fastapi import Request, Response
 from fastapi.responses import ORJSONResponse
 
 from app.exceptions import Integer64bitLimitExceededError
@@ -57,3 +59,40 @@ def json_response(content: dict | list):
         return content
     else:
         return CustomORJSONResponse(content=content)
+
+
+# NOTE: One year, which is the conventional maximum for immutable resources.
+IMMUTABLE_RESPONSE_MAX_AGE = 31536000
+
+
+def render_json(content: dict | list) -> bytes:
+    """Render content in the same way as json_response"""
+    return CustomORJSONResponse(content=content).body
+
+
+def generate_etag(body: bytes) -> str:
+    """Generate a strong ETag from the rendered response body"""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def immutable_json_response(request: Request, body: bytes, etag: str):
+    """Response for a resource that never changes once it exists
+
+    - Responses are sent with a strong ETag and `Cache-Control: immutable`.
+    - If the request has a matching `If-None-Match` header,
+      304 Not Modified is returned without a body.
+    """
+    if RESPONSE_VALIDATION_MODE:
+        return orjson.loads(body)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={IMMUTABLE_RESPONSE_MAX_AGE}, immutable",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # NOTE: If-None-Match uses the weak comparison (RFC 9110 13.1.2).
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -18,7 +18,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import json
-from typing import Tuple, Type, TypeVar
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
 
 from eth_typing import HexStr
 from eth_utils import to_checksum_address
@@ -26,6 +26,7 @@ from sqlalchemy import AsyncAdaptedQueuePool, create_engine, select
 from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from web3 import AsyncWeb3
 from web3.contract import AsyncContract, Contract
 from web3.contract.async_contract import AsyncContractEvents
 from web3.exceptions import (
@@ -34,13 +35,21 @@ from web3.exceptions import (
     BadFunctionCallOutput,
     ContractLogicError,
     TimeExhausted,
+    Web3RPCError,
 )
-from web3.types import TxData, TxReceipt
+from web3.types import LogReceipt, TxData, TxReceipt
 
 from app.exceptions import ContractRevertError, SendTransactionError
 from app.model.db import TransactionLock
 from app.utils.ibet_web3_utils import AsyncWeb3Wrapper, Web3Wrapper
-from config import ASYNC_DATABASE_URL, CHAIN_ID, DATABASE_URL, TX_GAS_LIMIT
+from config import (
+    ASYNC_DATABASE_URL,
+    CHAIN_ID,
+    DATABASE_URL,
+    INDEXER_BLOCK_LOT_MAX_SIZE,
+    INDEXER_EVENT_LOG_TARGET_COUNT,
+    TX_GAS_LIMIT,
+)
 
 web3 = Web3Wrapper()
 async_web3 = AsyncWeb3Wrapper()
@@ -317,6 +326,8 @@ class AsyncContractEventsView:
 
 class AsyncContractUtils:
     factory_map: dict[str, Type[AsyncContract]] = {}
+    # Tuned block range size of get_event_logs for each (contract address, event)
+    event_log_block_range: dict[tuple[str, str], int] = {}
 
     @staticmethod
     def get_contract_code(contract_name: str):
@@ -629,6 +640,11 @@ class AsyncContractUtils:
     ):
         """Get contract event logs
 
+        The block range is split adaptively when both block_from and block_to
+        are specified. The range is bisected when the node times out or rejects
+        the request, and is grown while the logs are sparse. The tuned size is
+        remembered for each contract event.
+
         :param contract: Contract
         :param event: Event
         :param block_from: from_block
@@ -638,12 +654,111 @@ class AsyncContractUtils:
         """
         try:
             _event = getattr(contract.events, event)
-            result = await _event.get_logs(
+        except ABIEventNotFound:
+            return []
+
+        if not isinstance(block_from, int) or not isinstance(block_to, int):
+            return await _event.get_logs(
                 from_block=block_from,
                 to_block=block_to,
                 argument_filters=argument_filters,
             )
-        except ABIEventNotFound:
+
+        return await AsyncContractUtils.__get_logs_by_adaptive_range(
+            get_logs=lambda _from, _to: _event.get_logs(
+                from_block=_from,
+                to_block=_to,
+                argument_filters=argument_filters,
+            ),
+            range_key=(contract.address, event),
+            block_from=block_from,
+            block_to=block_to,
+        )
+
+    @staticmethod
+    async def get_logs(
+        web3: AsyncWeb3,
+        address_list: list[str],
+        event_topics: list[str],
+        block_from: int,
+        block_to: int,
+        max_range_size: int | None = None,
+    ) -> list[LogReceipt]:
+        """Get raw event logs of multiple contracts with a single address-list request
+
+        The block range is split adaptively in the same way as get_event_logs.
+        The tuned size is remembered for each set of event topics.
+
+        :param web3: AsyncWeb3 instance of the network
+        :param address_list: Contract addresses
+        :param event_topics: Event signature topics (any of them matches)
+        :param block_from: from_block
+        :param block_to: to_block
+        :param max_range_size: Maximum block range size of a request
+                               (INDEXER_BLOCK_LOT_MAX_SIZE if None)
+        :return: Raw event logs
+        """
+        if len(address_list) == 0 or len(event_topics) == 0:
             return []
+        return await AsyncContractUtils.__get_logs_by_adaptive_range(
+            get_logs=lambda _from, _to: web3.eth.get_logs(
+                {
+                    "fromBlock": _from,
+                    "toBlock": _to,
+                    "address": address_list,
+                    "topics": [event_topics],
+                }
+            ),
+            range_key=("*", ",".join(sorted(event_topics))),
+            block_from=block_from,
+            block_to=block_to,
+            max_range_size=max_range_size,
+        )
 
+    @staticmethod
+    async def __get_logs_by_adaptive_range(
+        get_logs: Callable[[int, int], Awaitable[list]],
+        range_key: tuple[str, str],
+        block_from: int,
+        block_to: int,
+        max_range_size: int | None = None,
+    ) -> list:
+        """Get logs while adjusting the block range size of each request
+
+        The range is bisected when the node times out or rejects the request,
+        and is grown while the logs are sparse.
+        """
+        if max_range_size is None:
+            max_range_size = INDEXER_BLOCK_LOT_MAX_SIZE
+        range_size = min(
+            AsyncContractUtils.event_log_block_range.get(range_key, max_range_size),
+            max_range_size,
+        )
+        result = []
+        is_limited = False  # Whether the node has rejected a larger range
+        _from = block_from
+        while _from <= block_to:
+            _to = min(_from + range_size - 1, block_to)
+            try:
+                logs = await get_logs(_from, _to)
+            except (TimeoutError, Web3RPCError):
+                if _to == _from:  # Cannot be split any further
+                    raise
+                range_size = max(1, (_to - _from + 1) // 2)
+                is_limited = True
+                continue
+            result.extend(logs)
+
+            # Adjust the range size according to the number of logs
+            if len(logs) > INDEXER_EVENT_LOG_TARGET_COUNT:
+                range_size = max(1, range_size // 2)
+            elif (
+                not is_limited
+                and len(logs) < INDEXER_EVENT_LOG_TARGET_COUNT // 2
+                and _to - _from + 1 == range_size
+            ):
+                range_size = min(range_size * 2, max_range_size)
+            _from = _to + 1
+
+        AsyncContractUtils.event_log_block_range[range_key] = range_size
         return result
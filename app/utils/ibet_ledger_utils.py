@@ -22,7 +22,25 @@ from datetime import UTC, datetime
 from typing import Sequence
 
 import pytz
-from sqlalchemy import and_, delete, func, select, tuple_
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import log
@@ -35,6 +53,7 @@ from app.model.db import (
     LedgerCreationStatus,
     LedgerDataType,
     LedgerDetailsData,
+    LedgerDetailsRow,
     LedgerDetailsTemplate,
     LedgerTemplate,
     Notification,
@@ -43,6 +62,7 @@ from app.model.db import (
     TokenStatus,
     TokenType,
 )
+from app.model.db.base import naive_utcnow
 from app.model.ibet import (
     IbetShareContract,
     IbetStraightBondContract,
@@ -128,35 +148,37 @@ async def sync_request_with_registered_personal_info(
 
     # Search for data with unset personal information fields.
     # NOTE: Excluding issuer address
-    unset_data_list = (
-        await db.scalars(
-            select(LedgerCreationRequestData).where(
-                and_(
-                    LedgerCreationRequestData.request_id == request_id,
-                    LedgerCreationRequestData.data_type == LedgerDataType.IBET_FIN,
-                    LedgerCreationRequestData.account_address != issuer_address,
-                    LedgerCreationRequestData.name == None,
-                )
+    unset_data_filter = and_(
+        LedgerCreationRequestData.request_id == request_id,
+        LedgerCreationRequestData.data_type == LedgerDataType.IBET_FIN,
+        LedgerCreationRequestData.account_address != issuer_address,
+        LedgerCreationRequestData.name == None,
+    )
+    initial_unset_count = await db.scalar(
+        select(func.count())
+        .select_from(LedgerCreationRequestData)
+        .where(unset_data_filter)
+    )
+
+    # Update personal information fields with registered personal information
+    result = await db.execute(
+        update(LedgerCreationRequestData)
+        .where(
+            and_(
+                unset_data_filter,
+                IDXPersonalInfo.account_address
+                == LedgerCreationRequestData.account_address,
+                IDXPersonalInfo.issuer_address == issuer_address,
+                __personal_info_is_registered(),
             )
         )
-    ).all()
-
-    # Update personal information fields
-    initial_unset_count = len(unset_data_list)
-    final_set_count = 0
-    for unset_data in unset_data_list:
-        personal_info = await __get_personal_info(
-            db=db,
-            account_address=unset_data.account_address,
-            issuer_address=issuer_address,
+        .values(
+            name=IDXPersonalInfo._personal_info["name"].as_string(),
+            address=IDXPersonalInfo._personal_info["address"].as_string(),
         )
-        if personal_info is None:
-            continue
-        else:
-            unset_data.name = personal_info.get("name")
-            unset_data.address = personal_info.get("address")
-            await db.merge(unset_data)
-            final_set_count += 1
+        .execution_options(synchronize_session="fetch")
+    )
+    final_set_count = result.rowcount
 
     return initial_unset_count, final_set_count
 
@@ -199,43 +221,17 @@ async def finalize_ledger(
         )
     ).all()
 
-    ledger_details = []
-    for _details_template in _details_template_list:
-        _details_data_list: Sequence[LedgerCreationRequestData] = (
-            await db.scalars(
-                select(LedgerCreationRequestData).where(
-                    and_(
-                        LedgerCreationRequestData.request_id == request_id,
-                        LedgerCreationRequestData.data_type
-                        == _details_template.data_type,
-                        LedgerCreationRequestData.data_source
-                        == _details_template.data_source,
-                    )
-                )
-            )
-        ).all()
-        data_list = [
-            {
-                "account_address": _details_data.account_address,
-                "name": _details_data.name,
-                "address": _details_data.address,
-                "amount": _details_data.amount,
-                "price": _details_data.price,
-                "balance": _details_data.balance,
-                "acquisition_date": _details_data.acquisition_date,
-            }
-            for _details_data in _details_data_list
-        ]
-        details = {
+    ledger_details = [
+        {
             "token_detail_type": _details_template.token_detail_type,
             "headers": _details_template.headers,
-            "data": data_list,
             "footers": _details_template.footers,
             "some_personal_info_not_registered": False
             if _details_template.data_type == LedgerDataType.DB
             else some_personal_info_not_registered,  # Always False for LedgerDataType.DB
         }
-        ledger_details.append(details)
+        for _details_template in _details_template_list
+    ]
 
     created_ymd = (
         utc_tz.localize(datetime.now(UTC).replace(tzinfo=None))
@@ -264,6 +260,51 @@ async def finalize_ledger(
     # Execute flush here to get ledger id which is auto incremented.
     await db.flush()
 
+    # Register ledger details data to the DB
+    # NOTE: Details data is not embedded in Ledger.ledger but stored row by row.
+    now = naive_utcnow()
+    for detail_index, _details_template in enumerate(_details_template_list):
+        await db.execute(
+            insert(LedgerDetailsRow).from_select(
+                [
+                    LedgerDetailsRow.ledger_id,
+                    LedgerDetailsRow.detail_index,
+                    LedgerDetailsRow.account_address,
+                    LedgerDetailsRow.name,
+                    LedgerDetailsRow.address,
+                    LedgerDetailsRow.amount,
+                    LedgerDetailsRow.price,
+                    LedgerDetailsRow.balance,
+                    LedgerDetailsRow.acquisition_date,
+                    LedgerDetailsRow.created,
+                    LedgerDetailsRow.modified,
+                ],
+                select(
+                    literal(_ledger.id, Integer),
+                    literal(detail_index, Integer),
+                    LedgerCreationRequestData.account_address,
+                    LedgerCreationRequestData.name,
+                    LedgerCreationRequestData.address,
+                    LedgerCreationRequestData.amount,
+                    LedgerCreationRequestData.price,
+                    LedgerCreationRequestData.balance,
+                    LedgerCreationRequestData.acquisition_date,
+                    literal(now, DateTime),
+                    literal(now, DateTime),
+                )
+                .where(
+                    and_(
+                        LedgerCreationRequestData.request_id == request_id,
+                        LedgerCreationRequestData.data_type
+                        == _details_template.data_type,
+                        LedgerCreationRequestData.data_source
+                        == _details_template.data_source,
+                    )
+                )
+                .order_by(LedgerCreationRequestData.id),
+            )
+        )
+
     # Delete ledger request data
     await db.execute(
         delete(LedgerCreationRequestData).where(
@@ -356,76 +397,79 @@ async def __create_dataset_from_ibetfin(
     else:
         return
 
-    # Get token holders from UTXO
-    _utxo_list: Sequence[UTXO] = (
-        await db.scalars(
-            select(UTXO)
+    # Insert token holders aggregated from UTXO
+    # NOTE: UTXO grouping
+    #       account_address
+    #       - block_timestamp(YYYY/MM/DD in local timezone)
+    #         - sum(amount)
+    acquisition_date = func.to_char(
+        func.timezone(TZ, func.timezone("UTC", UTXO.block_timestamp)),
+        "YYYY/MM/DD",
+    )
+    amount = cast(func.sum(UTXO.amount), BigInteger)
+    now = naive_utcnow()
+    await db.execute(
+        insert(LedgerCreationRequestData).from_select(
+            [
+                LedgerCreationRequestData.request_id,
+                LedgerCreationRequestData.data_type,
+                LedgerCreationRequestData.data_source,
+                LedgerCreationRequestData.account_address,
+                LedgerCreationRequestData.acquisition_date,
+                LedgerCreationRequestData.name,
+                LedgerCreationRequestData.address,
+                LedgerCreationRequestData.amount,
+                LedgerCreationRequestData.price,
+                LedgerCreationRequestData.balance,
+                LedgerCreationRequestData.created,
+                LedgerCreationRequestData.modified,
+            ],
+            select(
+                literal(request_id, String),
+                literal(LedgerDataType.IBET_FIN.value, String),
+                literal(data_source, String),
+                UTXO.account_address,
+                acquisition_date,
+                null(),
+                null(),
+                amount,
+                literal(price, BigInteger),
+                amount * literal(price, BigInteger),
+                literal(now, DateTime),
+                literal(now, DateTime),
+            )
             .where(
                 and_(
                     UTXO.token_address == token_contract.token_address, UTXO.amount > 0
                 )
             )
-            .order_by(UTXO.account_address, UTXO.block_timestamp)
+            .group_by(UTXO.account_address, acquisition_date)
+            .order_by(UTXO.account_address, acquisition_date),
         )
-    ).all()
+    )
 
-    # NOTE: UTXO grouping
-    #       account_address
-    #       - block_timestamp(YYYY/MM/DD)
-    #         - sum(amount)
-    utxo_grouped = {}
-    for _utxo in _utxo_list:
-        date_ymd = (
-            utc_tz.localize(_utxo.block_timestamp)
-            .astimezone(local_tz)
-            .strftime("%Y/%m/%d")
-        )
-        if _utxo.account_address not in utxo_grouped:
-            utxo_grouped[_utxo.account_address] = {date_ymd: _utxo.amount}
-        else:
-            if date_ymd not in utxo_grouped[_utxo.account_address]:
-                utxo_grouped[_utxo.account_address][date_ymd] = _utxo.amount
-            else:
-                utxo_grouped[_utxo.account_address][date_ymd] += _utxo.amount
-
-    for account_address, date_ymd_amount in utxo_grouped.items():
-        for date_ymd, amount in date_ymd_amount.items():
-            ledger_req_data = LedgerCreationRequestData()
-            ledger_req_data.request_id = request_id
-            ledger_req_data.data_type = LedgerDataType.IBET_FIN
-            ledger_req_data.data_source = data_source
-            ledger_req_data.account_address = account_address
-            ledger_req_data.acquisition_date = date_ymd
-            ledger_req_data.name = None
-            ledger_req_data.address = None
-            ledger_req_data.amount = amount
-            ledger_req_data.price = price
-            ledger_req_data.balance = price * amount
-            db.add(ledger_req_data)
-
-
-async def __get_personal_info(
-    db: AsyncSession,
-    account_address: str,
-    issuer_address: str,
-) -> dict | None:
-    # Search indexed personal information
-    _idx_personal_info: IDXPersonalInfo | None = (
-        await db.scalars(
-            select(IDXPersonalInfo)
-            .where(
-                and_(
-                    IDXPersonalInfo.account_address == account_address,
-                    IDXPersonalInfo.issuer_address == issuer_address,
-                )
+
+def __personal_info_is_registered():
+    """SQL condition equivalent to `any(IDXPersonalInfo.personal_info.values())`"""
+    conditions = []
+    for key in [
+        "key_manager",
+        "name",
+        "address",
+        "postal_code",
+        "email",
+        "birth",
+        "is_corporate",
+        "tax_category",
+    ]:
+        value = IDXPersonalInfo._personal_info[key]
+        json_type = func.json_typeof(value)
+        conditions.append(
+            case(
+                (json_type == "string", value.as_string() != ""),
+                (json_type == "boolean", value.as_string() == "true"),
+                (json_type == "number", cast(value.as_string(), Numeric) != 0),
+                else_=False,
             )
-            .limit(1)
         )
-    ).first()
-    if (
-        _idx_personal_info is not None
-        and any(_idx_personal_info.personal_info.values()) is not False
-    ):
-        return _idx_personal_info.personal_info
-    else:
-        return None
+    return or_(*conditions)
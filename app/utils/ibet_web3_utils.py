@@ -40,6 +40,7 @@ from web3.types import RPCEndpoint, RPCResponse
 from app.database import async_engine, engine
 from app.exceptions import ServiceUnavailableError
 from app.model.db import Node
+from app.utils import metrics_utils
 from config import WEB3_HTTP_PROVIDER, WEB3_REQUEST_RETRY_COUNT, WEB3_REQUEST_WAIT_TIME
 
 thread_local = threading.local()
@@ -129,6 +130,15 @@ class FailOverHTTPProvider(HTTPProvider):
         self.endpoint_uri = None
 
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start_time = time.perf_counter()
+        try:
+            return self._make_request(method, params)
+        finally:
+            metrics_utils.record_web3_request(
+                "ibet", method, time.perf_counter() - start_time
+            )
+
+    def _make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         db_session = Session(autocommit=False, autoflush=True, bind=engine)
         try:
             if FailOverHTTPProvider.fail_over_mode is True:
@@ -188,6 +198,15 @@ class AsyncFailOverHTTPProvider(AsyncHTTPProvider):
         self.endpoint_uri = None
 
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start_time = time.perf_counter()
+        try:
+            return await self._make_request(method, params)
+        finally:
+            metrics_utils.record_web3_request(
+                "ibet", method, time.perf_counter() - start_time
+            )
+
+    async def _make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
         try:
             if AsyncFailOverHTTPProvider.fail_over_mode is True:
@@ -0,0 +1,341 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app import log
+from config import (
+    METRICS_BATCH_TEXTFILE_DIR,
+    METRICS_BATCH_WRITE_INTERVAL,
+    METRICS_ENABLED,
+)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LOG = log.get_logger()
+
+
+class Metrics:
+    """Metrics exported to Prometheus
+
+    NOTE:
+      When PROMETHEUS_MULTIPROC_DIR is set (see bin/run_server.sh), prometheus_client
+      stores the values in files shared by all gunicorn workers,
+      so that the counters survive worker recycling and are aggregated on scrape.
+    """
+
+    def __init__(self):
+        from prometheus_client import Counter, Histogram
+
+        self.http_request_duration = Histogram(
+            "ibet_prime_http_request_duration_seconds",
+            "HTTP request latency",
+            ("method", "route", "status"),
+        )
+        self.db_queries = Counter(
+            "ibet_prime_db_queries",
+            "Number of executed DB queries",
+            ("route",),
+        )
+        self.db_query_duration = Counter(
+            "ibet_prime_db_query_duration_seconds",
+            "Total time spent executing DB queries",
+            ("route",),
+        )
+        self.web3_requests = Counter(
+            "ibet_prime_web3_requests",
+            "Number of JSON-RPC requests sent to blockchain nodes",
+            ("route", "network", "method"),
+        )
+        self.web3_request_duration = Counter(
+            "ibet_prime_web3_request_duration_seconds",
+            "Total time spent on JSON-RPC requests sent to blockchain nodes",
+            ("route", "network", "method"),
+        )
+        self.token_cache_requests = Counter(
+            "ibet_prime_token_cache_requests",
+            "Number of token attribute lookups by cache result",
+            ("route", "result"),
+        )
+        self.e2ee_decrypts = Counter(
+            "ibet_prime_e2ee_decrypt",
+            "Number of E2EE decryptions",
+            ("route",),
+        )
+
+
+# NOTE:
+#  prometheus_client is imported only when metrics are enabled.
+_metrics: Metrics | None = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = Metrics()
+    return _metrics
+
+
+def render() -> bytes:
+    """Render the metrics in the Prometheus text exposition format
+
+    In multiprocess mode, the values written by all workers are aggregated.
+    """
+    from prometheus_client import (
+        REGISTRY,
+        CollectorRegistry,
+        generate_latest,
+        multiprocess,
+    )
+
+    get_metrics()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+###############################################################
+# Per-request accumulation
+###############################################################
+
+
+class RequestMetrics:
+    """Counts accumulated during a single HTTP request
+
+    The counts are flushed to the metrics once the route is resolved,
+    so that the hot path only increments plain attributes.
+    """
+
+    __slots__ = (
+        "start_time",
+        "db_queries",
+        "db_seconds",
+        "web3_requests",
+        "token_cache_hits",
+        "token_cache_misses",
+        "e2ee_decrypts",
+        "token",
+    )
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        # (network, method) -> [count, seconds]
+        self.web3_requests: dict[tuple[str, str], list[Any]] = {}
+        self.token_cache_hits = 0
+        self.token_cache_misses = 0
+        self.e2ee_decrypts = 0
+        self.token: Token | None = None
+
+
+_request_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def start_request() -> RequestMetrics | None:
+    """Start accumulating metrics for the current request"""
+    if not METRICS_ENABLED:
+        return None
+    request_metrics = RequestMetrics()
+    request_metrics.token = _request_metrics.set(request_metrics)
+    return request_metrics
+
+
+def finish_request(
+    request_metrics: RequestMetrics | None,
+    method: str,
+    route: str,
+    status_code: int,
+):
+    """Flush the metrics accumulated during the request to the registry
+
+    :param request_metrics: Value returned from start_request
+    :param method: HTTP method
+    :param route: Route path template (e.g. "/token/{token_address}")
+    :param status_code: Response status code
+    """
+    if request_metrics is None:
+        return
+    _request_metrics.reset(request_metrics.token)
+
+    metrics = get_metrics()
+    metrics.http_request_duration.labels(
+        method=method, route=route, status=str(status_code)
+    ).observe(time.perf_counter() - request_metrics.start_time)
+    if request_metrics.db_queries:
+        metrics.db_queries.labels(route=route).inc(request_metrics.db_queries)
+        metrics.db_query_duration.labels(route=route).inc(request_metrics.db_seconds)
+    for (network, rpc_method), (
+        count,
+        seconds,
+    ) in request_metrics.web3_requests.items():
+        metrics.web3_requests.labels(
+            route=route, network=network, method=rpc_method
+        ).inc(count)
+        metrics.web3_request_duration.labels(
+            route=route, network=network, method=rpc_method
+        ).inc(seconds)
+    if request_metrics.token_cache_hits:
+        metrics.token_cache_requests.labels(route=route, result="hit").inc(
+            request_metrics.token_cache_hits
+        )
+    if request_metrics.token_cache_misses:
+        metrics.token_cache_requests.labels(route=route, result="miss").inc(
+            request_metrics.token_cache_misses
+        )
+    if request_metrics.e2ee_decrypts:
+        metrics.e2ee_decrypts.labels(route=route).inc(request_metrics.e2ee_decrypts)
+
+
+# NOTE:
+#  Outside an HTTP request (e.g. batch processes), the following functions
+#  record directly to the registry with an empty route label.
+
+
+def record_db_query(seconds: float):
+    if not METRICS_ENABLED:
+        return
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.db_queries += 1
+        request_metrics.db_seconds += seconds
+    else:
+        metrics = get_metrics()
+        metrics.db_queries.labels(route="").inc()
+        metrics.db_query_duration.labels(route="").inc(seconds)
+
+
+def record_web3_request(network: str, method: str, seconds: float):
+    if not METRICS_ENABLED:
+        return
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        state = request_metrics.web3_requests.get((network, method))
+        if state is None:
+            request_metrics.web3_requests[(network, method)] = [1, seconds]
+        else:
+            state[0] += 1
+            state[1] += seconds
+    else:
+        metrics = get_metrics()
+        metrics.web3_requests.labels(route="", network=network, method=method).inc()
+        metrics.web3_request_duration.labels(
+            route="", network=network, method=method
+        ).inc(seconds)
+
+
+def record_token_cache(hit: bool):
+    if not METRICS_ENABLED:
+        return
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        if hit:
+            request_metrics.token_cache_hits += 1
+        else:
+            request_metrics.token_cache_misses += 1
+    else:
+        get_metrics().token_cache_requests.labels(
+            route="", result="hit" if hit else "miss"
+        ).inc()
+
+
+def record_e2ee_decrypt():
+    if not METRICS_ENABLED:
+        return
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.e2ee_decrypts += 1
+    else:
+        get_metrics().e2ee_decrypts.labels(route="").inc()
+
+
+###############################################################
+# DB instrumentation
+###############################################################
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, "_metrics_start_time", None)
+    if start_time is not None:
+        record_db_query(time.perf_counter() - start_time)
+
+
+def instrument_engine(engine: Engine):
+    """Count and time the queries executed on the engine
+
+    For an AsyncEngine, pass its sync_engine.
+    """
+    if not METRICS_ENABLED:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+###############################################################
+# Batch process exporter
+###############################################################
+
+
+def start_textfile_exporter():
+    """Periodically write the metrics of the batch process to METRICS_BATCH_TEXTFILE_DIR
+
+    The file is read by the node_exporter textfile collector.
+    """
+    if not METRICS_ENABLED or METRICS_BATCH_TEXTFILE_DIR is None:
+        return
+
+    from prometheus_client import REGISTRY, write_to_textfile
+
+    get_metrics()
+
+    process_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+    path = os.path.join(METRICS_BATCH_TEXTFILE_DIR, f"{process_name}.prom")
+
+    def run():
+        while True:
+            try:
+                # NOTE: write_to_textfile writes to a temporary file and renames it,
+                #       so that the collector never reads a partially written file.
+                write_to_textfile(path, REGISTRY)
+            except OSError:
+                LOG.exception(f"Failed to write metrics: path={path}")
+            time.sleep(METRICS_BATCH_WRITE_INTERVAL)
+
+    threading.Thread(target=run, name="metrics-exporter", daemon=True).start()
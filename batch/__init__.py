@@ -20,10 +20,11 @@ SPDX-License-Identifier: Apache-2.0
 import ctypes
 from ctypes.util import find_library
 
-from app.utils import o11y_utils
+from app.utils import metrics_utils, o11y_utils
 
 o11y_utils.setup_pyroscope()
 o11y_utils.setup_otel()
+metrics_utils.start_textfile_exporter()
 
 libc = ctypes.CDLL(find_library("c"))
 
@@ -18,29 +18,38 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import asyncio
+import re
 import sys
 from typing import Sequence
 
 import uvloop
 from eth_utils import to_checksum_address
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3.types import BlockData, TxData
 
-from app.database import BatchAsyncSessionLocal
+from app.database import BatchAsyncSessionLocal, get_db_schema
 from app.exceptions import ServiceUnavailableError
 from app.model.db import IDXBlockData, IDXBlockDataBlockNumber, IDXTxData
 from app.utils.ibet_web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc
 from batch.utils import batch_log
-from config import CHAIN_ID, INDEXER_SYNC_INTERVAL
+from config import (
+    CHAIN_ID,
+    INDEXER_BLOCK_TX_DATA_PARTITION_SIZE,
+    INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS,
+    INDEXER_SYNC_INTERVAL,
+)
 
 process_name = "INDEXER-BLOCK_TX_DATA"
 LOG = batch_log.get_logger(process_name=process_name)
 
 web3 = AsyncWeb3Wrapper()
 
+PARTITIONED_TABLES = (IDXBlockData.__tablename__, IDXTxData.__tablename__)
+PARTITION_BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
 
 class Processor:
     """Processor for indexing Block and Transaction data"""
@@ -59,6 +68,10 @@ class Processor:
                 LOG.info("skip process: from_block > latest_block")
                 return
 
+            # Create range partitions in advance
+            await self.__create_partitions(local_session, from_block, latest_block)
+            await local_session.commit()
+
             LOG.info("syncing from={}, to={}".format(from_block, latest_block))
             for block_number in range(from_block, latest_block + 1):
                 block_data: BlockData = await web3.eth.get_block(
@@ -119,6 +132,10 @@ class Processor:
                 await self.__set_indexed_block_number(local_session, block_number)
 
                 await local_session.commit()
+
+            # Drop partitions that are out of the retention range
+            await self.__drop_expired_partitions(local_session, latest_block)
+            await local_session.commit()
         except Exception:
             await local_session.rollback()
             raise
@@ -147,6 +164,89 @@ class Processor:
         indexed_block_number.latest_block_number = block_number
         await db_session.merge(indexed_block_number)
 
+    async def __create_partitions(
+        self, db_session: AsyncSession, from_block: int, to_block: int
+    ):
+        """Create range partitions covering the blocks to be synchronized"""
+        schema = f"{get_db_schema()}." if get_db_schema() else ""
+        for table_name in PARTITIONED_TABLES:
+            partitions = await self.__get_partitions(db_session, table_name)
+            covered_to = max(
+                (upper for _, _, upper in partitions if upper is not None), default=0
+            )
+            start = max(
+                covered_to,
+                from_block
+                // INDEXER_BLOCK_TX_DATA_PARTITION_SIZE
+                * INDEXER_BLOCK_TX_DATA_PARTITION_SIZE,
+            )
+            while start <= to_block:
+                end = (
+                    start // INDEXER_BLOCK_TX_DATA_PARTITION_SIZE + 1
+                ) * INDEXER_BLOCK_TX_DATA_PARTITION_SIZE
+                await db_session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {schema}{table_name}_p{start} "
+                        f"PARTITION OF {schema}{table_name} "
+                        f"FOR VALUES FROM ({start}) TO ({end})"
+                    )
+                )
+                LOG.info(f"Partition created: {table_name}_p{start}")
+                start = end
+
+    async def __drop_expired_partitions(
+        self, db_session: AsyncSession, latest_block: int
+    ):
+        """Drop partitions that are entirely older than the retention range"""
+        if INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS <= 0:
+            return
+
+        schema = f"{get_db_schema()}." if get_db_schema() else ""
+        retain_from = latest_block - INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS + 1
+        for table_name in PARTITIONED_TABLES:
+            partitions = await self.__get_partitions(db_session, table_name)
+            for partition_name, _, upper in partitions:
+                if upper is not None and upper <= retain_from:
+                    await db_session.execute(
+                        text(f"DROP TABLE IF EXISTS {schema}{partition_name}")
+                    )
+                    LOG.info(f"Partition dropped: {partition_name}")
+
+    @staticmethod
+    async def __get_partitions(
+        db_session: AsyncSession, table_name: str
+    ) -> list[tuple[str, int | None, int | None]]:
+        """Get range partitions of the table
+
+        :return: List of (partition name, lower bound, upper bound).
+            Unbounded (MINVALUE/MAXVALUE) bounds are returned as None.
+        """
+        schema = f"{get_db_schema()}." if get_db_schema() else ""
+        rows = (
+            await db_session.execute(
+                text(
+                    "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                    "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = CAST(:parent AS regclass)"
+                ),
+                {"parent": f"{schema}{table_name}"},
+            )
+        ).all()
+
+        def to_bound(value: str) -> int | None:
+            value = value.strip("'")
+            return int(value) if value.isdigit() else None
+
+        partitions = []
+        for partition_name, bound in rows:
+            matched = PARTITION_BOUND_PATTERN.search(bound or "")
+            if matched is None:  # DEFAULT partition
+                continue
+            partitions.append(
+                (partition_name, to_bound(matched[1]), to_bound(matched[2]))
+            )
+        return partitions
+
 
 async def main():
     LOG.info("Service started successfully")
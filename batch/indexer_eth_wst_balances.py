@@ -0,0 +1,343 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import sys
+from typing import Sequence
+
+import uvloop
+from sqlalchemy import and_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import BatchAsyncSessionLocal
+from app.model.db import (
+    Account,
+    IDXEthIbetWSTBalance,
+    IDXEthIbetWSTBalanceBlockNumber,
+    Token,
+)
+from app.model.eth import IbetWST
+from app.utils.eth_contract_utils import (
+    EthAsyncContractEventsView,
+    EthAsyncContractUtils,
+    EthWeb3,
+)
+from batch import free_malloc
+from batch.utils import batch_log
+from config import (
+    INDEXER_BLOCK_LOT_MAX_SIZE,
+    INDEXER_SYNC_INTERVAL,
+    ZERO_ADDRESS,
+)
+
+"""
+[INDEXER-Eth-WST-Balances]
+
+Indexer for IbetWST account balances
+
+- Balances are calculated from Transfer events (including mint and burn).
+- finalized_balance is updated from finalized blocks only.
+- balance also includes unfinalized blocks. It is recalculated from
+  finalized_balance in each cycle, so chain reorganizations are reflected.
+"""
+
+process_name = "INDEXER-Eth-WST-Balances"
+LOG = batch_log.get_logger(process_name=process_name)
+
+
+class Processor:
+    def __init__(self):
+        self.wst_list: dict[str, EthAsyncContractEventsView] = {}
+
+    async def sync_events(self):
+        db_session = BatchAsyncSessionLocal()
+        try:
+            await self.load_wst_list(db_session=db_session)
+
+            # Get the latest block numbers
+            latest_finalized_block = await self.get_finalized_block_number()
+            latest_block = await self.get_latest_block_number()
+            _block_from = await self.get_from_block_number(db_session)
+
+            # Calculate the block range to monitor
+            _block_to = _block_from + INDEXER_BLOCK_LOT_MAX_SIZE
+
+            if _block_from < latest_finalized_block:
+                if latest_finalized_block > _block_to:
+                    # If the range exceeds the latest block, process in chunks
+                    while _block_to < latest_finalized_block:
+                        await self.sync_finalized_balances(
+                            db_session=db_session,
+                            block_from=_block_from + 1,
+                            block_to=_block_to,
+                        )
+                        _block_to += INDEXER_BLOCK_LOT_MAX_SIZE
+                        _block_from += INDEXER_BLOCK_LOT_MAX_SIZE
+                # Process the remaining blocks
+                await self.sync_finalized_balances(
+                    db_session=db_session,
+                    block_from=_block_from + 1,
+                    block_to=latest_finalized_block,
+                )
+                # Set the latest block number to be monitored
+                await self.set_synced_block_number(db_session, latest_finalized_block)
+                _block_from = latest_finalized_block
+
+            # Recalculate the balances including unfinalized blocks
+            await self.sync_unfinalized_balances(
+                db_session=db_session,
+                block_from=_block_from + 1,
+                block_to=latest_block,
+            )
+
+            # Commit the changes to the database
+            await db_session.commit()
+            LOG.info("Sync completed successfully")
+        except Exception:
+            await db_session.rollback()
+            raise
+        finally:
+            await db_session.close()
+
+    async def load_wst_list(self, db_session: AsyncSession):
+        """
+        Load the list of WST tokens from the database and initialize their contract events.
+        """
+        # Get the list of all WST tokens that have been deployed
+        wst_address_all: tuple[str, ...] = tuple(
+            [
+                record[0]
+                for record in (
+                    await db_session.execute(
+                        select(Token.ibet_wst_address)
+                        .join(
+                            Account,
+                            and_(
+                                Account.issuer_address == Token.issuer_address,
+                                Account.is_deleted == False,
+                            ),
+                        )
+                        .where(Token.ibet_wst_deployed.is_(True))
+                    )
+                )
+                .tuples()
+                .all()
+            ]
+        )
+
+        # Get the list of all WST tokens that have been loaded
+        loaded_address_list: tuple[str, ...] = tuple(self.wst_list.keys())
+
+        # Get the list of WST addresses that need to be loaded
+        load_required_address_list = list(
+            set(wst_address_all) ^ set(loaded_address_list)
+        )
+
+        if not load_required_address_list:
+            # If there are no additional tokens to load, skip process
+            return
+
+        # Get the list of WST tokens that need to be loaded
+        load_required_token_list: Sequence[Token] = (
+            await db_session.scalars(
+                select(Token).where(
+                    Token.ibet_wst_address.in_(load_required_address_list),
+                )
+            )
+        ).all()
+        for _token in load_required_token_list:
+            wst = IbetWST(_token.ibet_wst_address)
+            self.wst_list[_token.ibet_wst_address] = EthAsyncContractEventsView(
+                _token.ibet_wst_address, wst.contract.events
+            )
+
+    @staticmethod
+    async def get_finalized_block_number():
+        """Get the finalized block number
+
+        :return: finalized block number
+        """
+        block = await EthWeb3.eth.get_block("finalized")
+        block_number = block.get("number")
+        return block_number
+
+    @staticmethod
+    async def get_latest_block_number():
+        """Get the latest block number (including unfinalized blocks)
+
+        :return: latest block number
+        """
+        return await EthWeb3.eth.block_number
+
+    @staticmethod
+    async def get_from_block_number(db_session: AsyncSession) -> int:
+        """
+        Get the starting block number for monitoring transfer events.
+        """
+        _idx_balance_block_number = (
+            await db_session.scalars(select(IDXEthIbetWSTBalanceBlockNumber).limit(1))
+        ).first()
+        if _idx_balance_block_number is None:
+            return 0
+        else:
+            return _idx_balance_block_number.latest_block_number
+
+    @staticmethod
+    async def set_synced_block_number(
+        db_session: AsyncSession, block_number: int
+    ) -> None:
+        """
+        Set the latest synchronized block number for IDXEthIbetWSTBalanceBlockNumber.
+        """
+        idx_synced = (
+            await db_session.scalars(select(IDXEthIbetWSTBalanceBlockNumber).limit(1))
+        ).first()
+        if idx_synced is None:
+            idx_synced = IDXEthIbetWSTBalanceBlockNumber()
+
+        idx_synced.latest_block_number = block_number
+        await db_session.merge(idx_synced)
+
+    async def sync_finalized_balances(
+        self, db_session: AsyncSession, block_from: int, block_to: int
+    ):
+        """
+        Apply the transfer events in finalized blocks to finalized_balance.
+        """
+        LOG.info(f"Syncing IbetWST balances from={block_from}, to={block_to}")
+        for wst_address, wst_events in self.wst_list.items():
+            balance_changes = await self.__get_balance_changes(
+                wst_events=wst_events, block_from=block_from, block_to=block_to
+            )
+            for account_address, value in balance_changes.items():
+                idx_balance = await self.__get_or_create_balance(
+                    db_session=db_session,
+                    wst_address=wst_address,
+                    account_address=account_address,
+                )
+                idx_balance.finalized_balance += value
+                idx_balance.balance = idx_balance.finalized_balance
+
+    async def sync_unfinalized_balances(
+        self, db_session: AsyncSession, block_from: int, block_to: int
+    ):
+        """
+        Recalculate balance from finalized_balance and the transfer events in unfinalized blocks.
+        """
+        # Reset the balances to the finalized balances
+        await db_session.execute(
+            update(IDXEthIbetWSTBalance)
+            .where(
+                IDXEthIbetWSTBalance.balance != IDXEthIbetWSTBalance.finalized_balance
+            )
+            .values(balance=IDXEthIbetWSTBalance.finalized_balance)
+            .execution_options(synchronize_session="fetch")
+        )
+        if block_from > block_to:
+            return
+
+        for wst_address, wst_events in self.wst_list.items():
+            balance_changes = await self.__get_balance_changes(
+                wst_events=wst_events, block_from=block_from, block_to=block_to
+            )
+            for account_address, value in balance_changes.items():
+                idx_balance = await self.__get_or_create_balance(
+                    db_session=db_session,
+                    wst_address=wst_address,
+                    account_address=account_address,
+                )
+                idx_balance.balance = idx_balance.finalized_balance + value
+
+    @staticmethod
+    async def __get_balance_changes(
+        wst_events: EthAsyncContractEventsView, block_from: int, block_to: int
+    ) -> dict[str, int]:
+        """
+        Aggregate the balance changes of each account from Transfer events.
+
+        NOTE: Mint and burn are emitted as Transfer events from/to the zero address.
+        """
+        events = await EthAsyncContractUtils.get_event_logs(
+            contract=wst_events,
+            event="Transfer",
+            block_from=block_from,
+            block_to=block_to,
+        )
+        balance_changes: dict[str, int] = {}
+        for event in events:
+            args = event["args"]
+            if args["from"] != ZERO_ADDRESS:
+                balance_changes[args["from"]] = (
+                    balance_changes.get(args["from"], 0) - args["value"]
+                )
+            if args["to"] != ZERO_ADDRESS:
+                balance_changes[args["to"]] = (
+                    balance_changes.get(args["to"], 0) + args["value"]
+                )
+        return balance_changes
+
+    @staticmethod
+    async def __get_or_create_balance(
+        db_session: AsyncSession, wst_address: str, account_address: str
+    ) -> IDXEthIbetWSTBalance:
+        idx_balance: IDXEthIbetWSTBalance | None = (
+            await db_session.scalars(
+                select(IDXEthIbetWSTBalance)
+                .where(
+                    and_(
+                        IDXEthIbetWSTBalance.ibet_wst_address == wst_address,
+                        IDXEthIbetWSTBalance.account_address == account_address,
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        if idx_balance is None:
+            idx_balance = IDXEthIbetWSTBalance(
+                ibet_wst_address=wst_address,
+                account_address=account_address,
+                finalized_balance=0,
+                balance=0,
+            )
+            db_session.add(idx_balance)
+        return idx_balance
+
+
+async def main():
+    LOG.info("Service started successfully")
+    processor = Processor()
+
+    while True:
+        try:
+            await processor.sync_events()
+        except SQLAlchemyError as sa_err:
+            LOG.error(f"A database error has occurred: code={sa_err.code}\n{sa_err}")
+        except Exception:
+            LOG.exception("An exception occurred during processing")
+
+        await asyncio.sleep(INDEXER_SYNC_INTERVAL)
+        free_malloc()
+
+
+if __name__ == "__main__":
+    try:
+        uvloop.run(main())
+    except KeyboardInterrupt:
+        sys.exit(1)
@@ -42,6 +42,7 @@ from app.model.db import (
     IDXLockedPosition,
     IDXPosition,
     IDXPositionBondBlockNumber,
+    IDXPositionSummary,
     IDXUnlock,
     Notification,
     NotificationType,
@@ -1623,7 +1624,7 @@ class Processor:
         :param pending_transfer: pending transfer
         :return: None
         """
-        position = (
+        position: IDXPosition | None = (
             await db_session.scalars(
                 select(IDXPosition)
                 .where(
@@ -1636,6 +1637,7 @@ class Processor:
             )
         ).first()
         if position is not None:
+            before = Processor.__position_values(position)
             if balance is not None:
                 position.balance = balance
             if pending_transfer is not None:
@@ -1657,6 +1659,7 @@ class Processor:
             LOG.debug(
                 f"Position created (Bond): token_address={token_address}, account_address={account_address}"
             )
+            before = None
             position = IDXPosition()
             position.token_address = token_address
             position.account_address = account_address
@@ -1665,6 +1668,30 @@ class Processor:
             position.exchange_balance = exchange_balance or 0
             position.exchange_commitment = exchange_commitment or 0
             db_session.add(position)
+        else:
+            return
+
+        # Update position summary
+        after = Processor.__position_values(position)
+        holder_before = before is not None and any(v != 0 for v in before)
+        holder_after = any(v != 0 for v in after)
+        if before is None or holder_before != holder_after:
+            # A non-zero locked amount keeps the account as a holder
+            has_locked = await Processor.__has_locked_position(
+                db_session, token_address, account_address
+            )
+            holder_before = before is not None and (holder_before or has_locked)
+            holder_after = holder_after or has_locked
+        before = before or (0, 0, 0, 0)
+        await Processor.__sink_on_position_summary(
+            db_session=db_session,
+            token_address=token_address,
+            holder_count=int(holder_after) - int(holder_before),
+            balance=after[0] - before[0],
+            exchange_balance=after[1] - before[1],
+            exchange_commitment=after[2] - before[2],
+            pending_transfer=after[3] - before[3],
+        )
 
     @staticmethod
     async def __sink_on_locked_position(
@@ -1696,7 +1723,9 @@ class Processor:
                 .limit(1)
             )
         ).first()
+        value_before = 0
         if locked is not None:
+            value_before = locked.value
             locked.value = value
             await db_session.merge(locked)
         else:
@@ -1707,6 +1736,129 @@ class Processor:
             locked.value = value
             db_session.add(locked)
 
+        # Update position summary
+        holder_count = 0
+        if (value_before != 0) != (value != 0):
+            # The holder status changes only for accounts whose position is zero
+            # and who have no other non-zero locked amount.
+            position: IDXPosition | None = (
+                await db_session.scalars(
+                    select(IDXPosition)
+                    .where(
+                        and_(
+                            IDXPosition.token_address == token_address,
+                            IDXPosition.account_address == account_address,
+                        )
+                    )
+                    .limit(1)
+                )
+            ).first()
+            if (
+                position is not None
+                and not any(v != 0 for v in Processor.__position_values(position))
+                and not await Processor.__has_locked_position(
+                    db_session,
+                    token_address,
+                    account_address,
+                    exclude_lock_address=lock_address,
+                )
+            ):
+                holder_count = 1 if value != 0 else -1
+        await Processor.__sink_on_position_summary(
+            db_session=db_session,
+            token_address=token_address,
+            holder_count=holder_count,
+            locked=value - value_before,
+        )
+
+    @staticmethod
+    async def __sink_on_position_summary(
+        db_session: AsyncSession,
+        token_address: str,
+        holder_count: int = 0,
+        balance: int = 0,
+        exchange_balance: int = 0,
+        exchange_commitment: int = 0,
+        pending_transfer: int = 0,
+        locked: int = 0,
+    ):
+        """Apply differences to the position summary of the token
+
+        :param db_session: ORM session
+        :param token_address: token address
+        :param holder_count: difference of the number of holders
+        :param balance: difference of the total balance
+        :param exchange_balance: difference of the total exchange balance
+        :param exchange_commitment: difference of the total exchange commitment
+        :param pending_transfer: difference of the total pending transfer
+        :param locked: difference of the total locked amount
+        :return: None
+        """
+        if not any(
+            [
+                holder_count,
+                balance,
+                exchange_balance,
+                exchange_commitment,
+                pending_transfer,
+                locked,
+            ]
+        ):
+            return
+
+        summary: IDXPositionSummary | None = (
+            await db_session.scalars(
+                select(IDXPositionSummary)
+                .where(IDXPositionSummary.token_address == token_address)
+                .limit(1)
+            )
+        ).first()
+        if summary is None:
+            summary = IDXPositionSummary()
+            summary.token_address = token_address
+            summary.holder_count = 0
+            summary.total_balance = 0
+            summary.total_exchange_balance = 0
+            summary.total_exchange_commitment = 0
+            summary.total_pending_transfer = 0
+            summary.total_locked = 0
+            db_session.add(summary)
+        summary.holder_count += holder_count
+        summary.total_balance += balance
+        summary.total_exchange_balance += exchange_balance
+        summary.total_exchange_commitment += exchange_commitment
+        summary.total_pending_transfer += pending_transfer
+        summary.total_locked += locked
+
+    @staticmethod
+    async def __has_locked_position(
+        db_session: AsyncSession,
+        token_address: str,
+        account_address: str,
+        exclude_lock_address: Optional[str] = None,
+    ) -> bool:
+        """Check if the account has a non-zero locked amount"""
+        stmt = select(IDXLockedPosition.lock_address).where(
+            and_(
+                IDXLockedPosition.token_address == token_address,
+                IDXLockedPosition.account_address == account_address,
+                IDXLockedPosition.value != 0,
+            )
+        )
+        if exclude_lock_address is not None:
+            stmt = stmt.where(IDXLockedPosition.lock_address != exclude_lock_address)
+        return (await db_session.scalars(stmt.limit(1))).first() is not None
+
+    @staticmethod
+    def __position_values(position: IDXPosition) -> tuple[int, int, int, int]:
+        """Get (balance, exchange_balance, exchange_commitment, pending_transfer)"""
+        return (
+            position.balance or 0,
+            position.exchange_balance or 0,
+            position.exchange_commitment or 0,
+            position.pending_transfer or 0,
+        )
+
     @staticmethod
     async def __get_account_balance_all(token_contract, account_address: str):
         """Get balance"""
@@ -18,21 +18,48 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import asyncio
+import heapq
 import sys
-from datetime import timedelta, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Sequence
 
 import uvloop
 from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import BatchAsyncSessionLocal
 from app.exceptions import ServiceUnavailableError
-from app.model.db import Account, Token, TokenStatus, TokenType
+from app.model.db import (
+    Account,
+    Token,
+    TokenAttrUpdate,
+    TokenCache,
+    TokenStatus,
+    TokenType,
+)
+from app.model.db.base import naive_utcnow
 from app.model.ibet import IbetShareContract, IbetStraightBondContract
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from batch import free_malloc
 from batch.utils import batch_log
-from config import INDEXER_SYNC_INTERVAL
+from config import (
+    INDEXER_SYNC_INTERVAL,
+    TOKEN_CACHE,
+    TOKEN_CACHE_REFRESH_MARGIN,
+    TOKEN_CACHE_REFRESH_MAX_CONCURRENCY,
+)
+
+"""
+[INDEXER-Token-Cache]
+
+Keep the token attribute cache (token_cache) warm
+
+- Tokens without a cache, or whose attributes have been updated
+  (token_attr_update) since they were cached, are refreshed immediately.
+- Other tokens are refreshed TOKEN_CACHE_REFRESH_MARGIN seconds before the
+  cache expires, in order of expiration.
+"""
 
 process_name = "INDEXER-Token-Cache"
 LOG = batch_log.get_logger(process_name=process_name)
@@ -41,14 +68,28 @@ UTC = timezone(timedelta(hours=0), "UTC")
 
 
 class Processor:
-    @staticmethod
-    async def process():
+    def __init__(self):
+        # Latest processed TokenAttrUpdate.id
+        self.latest_attr_update_id = 0
+        # Latest attribute update datetime of each token
+        self.attr_updated_datetime: dict[str, datetime] = {}
+
+    async def process(self):
+        if not TOKEN_CACHE:
+            LOG.debug("Token cache is disabled")
+            return
+
         db_session = BatchAsyncSessionLocal()
         try:
-            token_list: Sequence[tuple[str, str]] = (
+            token_list: Sequence[tuple[str, str, datetime | None, datetime | None]] = (
                 (
                     await db_session.execute(
-                        select(Token.type, Token.token_address)
+                        select(
+                            Token.type,
+                            Token.token_address,
+                            TokenCache.cached_datetime,
+                            TokenCache.expiration_datetime,
+                        )
                         .join(
                             Account,
                             and_(
@@ -56,6 +97,10 @@ class Processor:
                                 Account.is_deleted == False,
                             ),
                         )
+                        .outerjoin(
+                            TokenCache,
+                            TokenCache.token_address == Token.token_address,
+                        )
                         .where(Token.token_status == TokenStatus.SUCCEEDED)
                         .order_by(Token.created)
                     )
@@ -63,23 +108,82 @@ class Processor:
                 .tuples()
                 .all()
             )
-            for token_type, token_address in token_list:
-                if token_type == TokenType.IBET_STRAIGHT_BOND:
-                    await IbetStraightBondContract(token_address).get()
-                elif token_type == TokenType.IBET_SHARE:
-                    await IbetShareContract(token_address).get()
-                await db_session.commit()
-                LOG.debug(
-                    f"token refreshed: token_type={token_type}, token_address={token_address}"
-                )
-                await asyncio.sleep(60)
-        except Exception as e:
-            await db_session.rollback()
-            raise e
+            await self.__sync_attr_update(db_session=db_session)
         finally:
             await db_session.close()
+
+        # Build the priority queue ordered by the datetime when the cache should be refreshed
+        refresh_queue: list[tuple[datetime, int, str, str]] = []
+        for i, (
+            token_type,
+            token_address,
+            cached_datetime,
+            expiration_datetime,
+        ) in enumerate(token_list):
+            attr_updated_datetime = self.attr_updated_datetime.get(token_address)
+            if (
+                cached_datetime is None
+                or expiration_datetime is None
+                or (
+                    attr_updated_datetime is not None
+                    and attr_updated_datetime > cached_datetime
+                )
+            ):
+                # No cache or attributes have been updated: refresh immediately
+                refresh_at = datetime.min
+            else:
+                refresh_at = expiration_datetime - timedelta(
+                    seconds=TOKEN_CACHE_REFRESH_MARGIN
+                )
+            heapq.heappush(refresh_queue, (refresh_at, i, token_type, token_address))
+
+        # Refresh the tokens that are due
+        now = naive_utcnow()
+        target_list: list[tuple[str, str]] = []
+        while len(refresh_queue) > 0 and refresh_queue[0][0] <= now:
+            _, _, token_type, token_address = heapq.heappop(refresh_queue)
+            target_list.append((token_type, token_address))
+
+        try:
+            await SemaphoreTaskGroup.run(
+                *[
+                    self.__refresh_cache(
+                        token_type=token_type, token_address=token_address
+                    )
+                    for token_type, token_address in target_list
+                ],
+                max_concurrency=TOKEN_CACHE_REFRESH_MAX_CONCURRENCY,
+            )
+        except ExceptionGroup:
+            raise ServiceUnavailableError from None
+
         LOG.info("Sync job has been completed")
 
+    async def __sync_attr_update(self, db_session: AsyncSession):
+        """Load token attribute updates that have been recorded since the last sync"""
+        attr_update_list: Sequence[TokenAttrUpdate] = (
+            await db_session.scalars(
+                select(TokenAttrUpdate)
+                .where(TokenAttrUpdate.id > self.latest_attr_update_id)
+                .order_by(TokenAttrUpdate.id)
+            )
+        ).all()
+        for _attr_update in attr_update_list:
+            self.attr_updated_datetime[_attr_update.token_address] = (
+                _attr_update.updated_datetime
+            )
+            self.latest_attr_update_id = _attr_update.id
+
+    @staticmethod
+    async def __refresh_cache(token_type: str, token_address: str):
+        if token_type == TokenType.IBET_STRAIGHT_BOND:
+            await IbetStraightBondContract(token_address).get(refresh_cache=True)
+        elif token_type == TokenType.IBET_SHARE:
+            await IbetShareContract(token_address).get(refresh_cache=True)
+        LOG.debug(
+            f"token refreshed: token_type={token_type}, token_address={token_address}"
+        )
+
 
 async def main():
     LOG.info("Service started successfully")
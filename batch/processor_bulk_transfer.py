@@ -45,15 +45,18 @@ from app.model.db import (
     TokenType,
     TokenVersion,
 )
+from app.model.db.base import naive_utcnow
 from app.model.ibet import IbetShareContract, IbetStraightBondContract
 from app.model.ibet.tx_params.ibet_security_token import ForcedTransferParams
 from app.utils.e2ee_utils import E2EEUtils
 from app.utils.ibet_web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc
 from batch.utils import batch_log
+from batch.utils.lease import Lease
 from batch.utils.signal_handler import setup_signal_handler
 from config import (
     BULK_TRANSFER_INTERVAL,
+    BULK_TRANSFER_LEASE_DURATION,
     BULK_TRANSFER_WORKER_COUNT,
     BULK_TRANSFER_WORKER_LOT_SIZE,
     BULK_TX_LOT_SIZE,
@@ -63,6 +66,9 @@ from config import (
 [PROCESSOR-Bulk-Transfer]
 
 Asynchronous batch processing for token bulk transfers
+
+- Uploads are claimed through the database (claimed_by, lease_expires),
+  so the processor can be scaled out across multiple processes.
 """
 
 process_name = "PROCESSOR-Bulk-Transfer"
@@ -73,10 +79,15 @@ web3 = AsyncWeb3Wrapper()
 
 class Processor:
     worker_num: int
+    worker_id: str
     is_shutdown: Event
 
     def __init__(self, worker_num, is_shutdown: Event):
         self.worker_num: int = worker_num
+        self.lease = Lease(
+            model=BulkTransferUpload, duration=BULK_TRANSFER_LEASE_DURATION
+        )
+        self.worker_id: str = self.lease.worker_id
         self.is_shutdown = is_shutdown
 
     async def process(self):
@@ -125,7 +136,6 @@ class Processor:
                             error_transfer_id=[],
                         )
                         await db_session.commit()
-                        await self.__release_processing_issuer(_upload.upload_id)
                         continue
 
                     keyfile_json = _account.keyfile
@@ -151,7 +161,6 @@ class Processor:
                         error_transfer_id=[],
                     )
                     await db_session.commit()
-                    await self.__release_processing_issuer(_upload.upload_id)
                     continue
 
                 # Transfer
@@ -220,6 +229,7 @@ class Processor:
                                     record_id=_transfer.id,
                                     status=2,
                                 )
+                        await self.lease.renew(db_session=db_session)
                         await db_session.commit()
                 else:
                     for _transfer in transfer_list:
@@ -261,6 +271,7 @@ class Processor:
                             await self.__sink_on_finish_transfer_process(
                                 db_session=db_session, record_id=_transfer.id, status=2
                             )
+                        await self.lease.renew(db_session=db_session)
                         await db_session.commit()
 
                 # Register upload results
@@ -294,140 +305,119 @@ class Processor:
 
                 await db_session.commit()
 
-                # Pop from the list of processing issuers
-                await self.__release_processing_issuer(_upload.upload_id)
-
                 LOG.info(
                     f"<{self.worker_num}> Process end: upload_id={_upload.upload_id}"
                 )
         finally:
+            # Release the uploads that have not been completed
+            # NOTE: e.g. graceful shutdown, unexpected errors
+            if self.lease.has_claims:
+                await db_session.rollback()
+                await self.lease.release(db_session=db_session)
+                await db_session.commit()
             await db_session.close()
 
     async def __get_uploads(
         self, db_session: AsyncSession
-    ) -> list[tuple[BulkTransferUpload, TokenVersion]]:
+    ) -> list[tuple[BulkTransferUpload, TokenVersion | None]]:
         # NOTE:
-        # - Only one issuer can be processed in the same thread.
+        # - Only one issuer can be processed in the same worker.
         # - The maximum number of uploads that can be processed in one batch cycle is the number defined by BULK_TRANSFER_WORKER_LOT_SIZE.
-        # - Issuers that are not being processed by other threads are processed first.
-        # - Exclusion control is performed to eliminate duplication of data to be acquired.
-
-        async with lock:  # Exclusion control
-            locked_update_id = []
-            exclude_issuer = []
-            for threads_processing in processing_issuer.values():
-                for upload_id, issuer_address in threads_processing.items():
-                    locked_update_id.append(upload_id)
-                    exclude_issuer.append(issuer_address)
-            exclude_issuer = list(set(exclude_issuer))
-
-            # Retrieve one target data
-            # NOTE: Priority is given to issuers that are not being processed by other threads.
-            upload_1: tuple[BulkTransferUpload, TokenVersion | None] | None = (
-                (
-                    await db_session.execute(
-                        select(BulkTransferUpload, Token.version)
-                        .outerjoin(
-                            Token,
-                            and_(
-                                BulkTransferUpload.issuer_address
-                                == Token.issuer_address,
-                                BulkTransferUpload.token_address == Token.token_address,
-                            ),
-                        )
-                        .where(
-                            and_(
-                                BulkTransferUpload.upload_id.notin_(locked_update_id),
-                                BulkTransferUpload.status == 0,
-                                BulkTransferUpload.issuer_address.notin_(
-                                    exclude_issuer
-                                ),
-                                BulkTransferUpload.token_address != None,
-                            )
+        # - Issuers that are not being processed by other workers are processed first.
+        #   Claims of such an issuer are serialized with an advisory lock.
+        # - Uploads are claimed with a lease (see batch.utils.lease).
+        now = naive_utcnow()
+        claimable = and_(
+            self.lease.claimable(now),
+            BulkTransferUpload.token_address != None,
+        )
+
+        # Retrieve the issuer to be processed
+        # NOTE: Priority is given to issuers that are not being processed by other workers.
+        #       Issuers being claimed by other workers are skipped.
+        issuer_address: str | None = None
+        skipped_issuers: list[str] = []
+        while True:
+            _issuer_address: str | None = (
+                await db_session.scalars(
+                    select(BulkTransferUpload.issuer_address)
+                    .where(
+                        and_(
+                            claimable,
+                            self.lease.issuer_not_leased(now),
+                            BulkTransferUpload.issuer_address.notin_(skipped_issuers),
                         )
-                        .order_by(BulkTransferUpload.created)
-                        .limit(1)
                     )
+                    .order_by(BulkTransferUpload.created)
+                    .limit(1)
                 )
-                .tuples()
-                .first()
-            )
-            if upload_1 is None:
-                # If there are no targets, then all issuers will be retrieved.
-                upload_1: tuple[BulkTransferUpload, TokenVersion | None] | None = (
-                    (
-                        await db_session.execute(
-                            select(BulkTransferUpload, Token.version)
-                            .outerjoin(
-                                Token,
-                                and_(
-                                    BulkTransferUpload.issuer_address
-                                    == Token.issuer_address,
-                                    BulkTransferUpload.token_address
-                                    == Token.token_address,
-                                ),
-                            )
-                            .where(
-                                and_(
-                                    BulkTransferUpload.upload_id.notin_(
-                                        locked_update_id
-                                    ),
-                                    BulkTransferUpload.status == 0,
-                                    BulkTransferUpload.token_address != None,
-                                )
-                            )
-                            .order_by(BulkTransferUpload.created)
-                            .limit(1)
+            ).first()
+            if _issuer_address is None:
+                break
+            if await self.lease.lock_issuer(
+                db_session=db_session, issuer_address=_issuer_address, now=now
+            ):
+                issuer_address = _issuer_address
+                break
+            skipped_issuers.append(_issuer_address)
+        if issuer_address is None:
+            # If there are no targets, then all issuers will be retrieved.
+            issuer_address = (
+                await db_session.scalars(
+                    select(BulkTransferUpload.issuer_address)
+                    .where(claimable)
+                    .order_by(BulkTransferUpload.created)
+                    .limit(1)
+                )
+            ).first()
+        if issuer_address is None:
+            await db_session.rollback()
+            return []
+
+        # Retrieve the data of the Issuer to be processed
+        _upload_list: list[BulkTransferUpload] = list(
+            (
+                await db_session.scalars(
+                    select(BulkTransferUpload)
+                    .where(
+                        and_(
+                            claimable,
+                            BulkTransferUpload.issuer_address == issuer_address,
                         )
                     )
-                    .tuples()
-                    .first()
+                    .order_by(BulkTransferUpload.created)
+                    .limit(BULK_TRANSFER_WORKER_LOT_SIZE)
+                    .with_for_update(skip_locked=True)
                 )
+            ).all()
+        )
+        if len(_upload_list) < 1:
+            await db_session.rollback()
+            return []
+
+        # Claim the uploads
+        await self.lease.claim(
+            db_session=db_session,
+            id_column=BulkTransferUpload.upload_id,
+            id_list=[_upload.upload_id for _upload in _upload_list],
+            now=now,
+        )
 
-            # Issuer to be processed => upload_1.issuer_address
-            # Retrieve the data of the Issuer to be processed
-            upload_list: list[tuple[BulkTransferUpload, TokenVersion | None]] = []
-            if upload_1 is not None:
-                upload_list = [upload_1]
-                if BULK_TRANSFER_WORKER_LOT_SIZE > 1:
-                    upload_list += (
-                        (
-                            await db_session.execute(
-                                select(BulkTransferUpload, Token.version)
-                                .outerjoin(
-                                    Token,
-                                    and_(
-                                        BulkTransferUpload.issuer_address
-                                        == Token.issuer_address,
-                                        BulkTransferUpload.token_address
-                                        == Token.token_address,
-                                    ),
-                                )
-                                .where(
-                                    and_(
-                                        BulkTransferUpload.upload_id.notin_(
-                                            locked_update_id
-                                        ),
-                                        BulkTransferUpload.status == 0,
-                                        BulkTransferUpload.issuer_address
-                                        == upload_1[0].issuer_address,
-                                        BulkTransferUpload.token_address != None,
-                                    )
-                                )
-                                .order_by(BulkTransferUpload.created)
-                                .offset(1)
-                                .limit(BULK_TRANSFER_WORKER_LOT_SIZE - 1)
-                            )
+        upload_list: list[tuple[BulkTransferUpload, TokenVersion | None]] = []
+        for _upload in _upload_list:
+            _token_version: TokenVersion | None = (
+                await db_session.scalars(
+                    select(Token.version)
+                    .where(
+                        and_(
+                            Token.issuer_address == _upload.issuer_address,
+                            Token.token_address == _upload.token_address,
                         )
-                        .tuples()
-                        .all()
                     )
-
-            processing_issuer[self.worker_num] = {}
-            for upload in upload_list:
-                processing_issuer[self.worker_num][upload[0].upload_id] = upload[
-                    0
-                ].issuer_address
+                    .limit(1)
+                )
+            ).first()
+            upload_list.append((_upload, _token_version))
         return upload_list
 
     @staticmethod
@@ -452,11 +442,6 @@ class Processor:
         for idx in range(0, len(raw_list), size):
             yield raw_list[idx : idx + size]
 
-    async def __release_processing_issuer(self, upload_id):
-        """Pop from the list of processing issuers"""
-        async with lock:
-            processing_issuer[self.worker_num].pop(upload_id, None)
-
     @staticmethod
     async def __bulk_forced_transfer(
         token_address: str,
@@ -513,7 +498,7 @@ class Processor:
         await db_session.execute(
             update(BulkTransferUpload)
             .where(BulkTransferUpload.upload_id == upload_id)
-            .values(status=status)
+            .values(status=status, lease_expires=None)
         )
 
     @staticmethod
@@ -559,12 +544,6 @@ class Processor:
         db_session.add(notification)
 
 
-# Lock object for exclusion control
-lock = asyncio.Lock()
-# Issuer being processed in workers
-processing_issuer = {}
-
-
 class Worker:
     def __init__(self, worker_num: int, is_shutdown: Event):
         processor = Processor(worker_num=worker_num, is_shutdown=is_shutdown)
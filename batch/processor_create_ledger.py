@@ -19,12 +19,13 @@ SPDX-License-Identifier: Apache-2.0
 
 import asyncio
 import sys
+import time
 from asyncio import Event
 from datetime import UTC, datetime, timedelta
 from typing import Sequence
 
 import uvloop
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,6 +40,7 @@ from app.model.ibet import (
     IbetShareContract,
     IbetStraightBondContract,
 )
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.ibet_ledger_utils import (
     finalize_ledger,
     sync_request_with_registered_personal_info,
@@ -46,6 +48,7 @@ from app.utils.ibet_ledger_utils import (
 from batch import free_malloc
 from batch.utils import batch_log
 from batch.utils.signal_handler import setup_signal_handler
+from config import CREATE_LEDGER_MAX_CONCURRENCY
 
 """
 [PROCESSOR-Create-Ledger]
@@ -53,6 +56,8 @@ from batch.utils.signal_handler import setup_signal_handler
 - The processor creates the ledger as instructed in the creation request.
 - Once all the holder's personal information has been registered (up to a maximum of 6 hours), 
   it finalizes the record as the official ledger.
+- Requests are processed concurrently, each in its own session.
+  A request is claimed with SKIP LOCKED, so that multiple processes can share the queue.
 """
 
 process_name = "PROCESSOR-Create-Ledger"
@@ -64,84 +69,139 @@ class Processor:
         self.is_shutdown = is_shutdown
 
     async def process(self):
-        db: AsyncSession = BatchAsyncSessionLocal()
+        LOG.info("Process Start")
 
+        db: AsyncSession = BatchAsyncSessionLocal()
         try:
-            LOG.info("Process Start")
-
-            req_list: Sequence[LedgerCreationRequest] = (
+            request_id_list: Sequence[str] = (
                 await db.scalars(
-                    select(LedgerCreationRequest).where(
+                    select(LedgerCreationRequest.request_id)
+                    .where(
                         LedgerCreationRequest.status == LedgerCreationStatus.PROCESSING
                     )
+                    .order_by(LedgerCreationRequest.created)
                 )
             ).all()
-            for req in req_list:
-                # Graceful shutdown
-                if self.is_shutdown.is_set():
-                    return
-
-                # Get token attributes
-                if req.token_type == TokenType.IBET_SHARE:
-                    token_contract: IbetShareContract = await IbetShareContract(
-                        req.token_address
-                    ).get()
-                elif req.token_type == TokenType.IBET_STRAIGHT_BOND:
-                    token_contract: IbetStraightBondContract = (
-                        await IbetStraightBondContract(req.token_address).get()
-                    )
+        finally:
+            await db.close()
+
+        if len(request_id_list) > 0:
+            await SemaphoreTaskGroup.run(
+                *[self.__process_request(request_id) for request_id in request_id_list],
+                max_concurrency=CREATE_LEDGER_MAX_CONCURRENCY,
+            )
 
-                # Sync ledger creation request data with registered personal info
-                (
-                    initial_unset_count,
-                    final_set_count,
-                ) = await sync_request_with_registered_personal_info(
+        LOG.info("Process End")
+
+    async def __process_request(self, request_id: str):
+        """Process a single ledger creation request in its own session"""
+
+        # Graceful shutdown
+        if self.is_shutdown.is_set():
+            return
+
+        db: AsyncSession = BatchAsyncSessionLocal()
+        try:
+            start_time = time.monotonic()
+
+            # Claim the request
+            # NOTE: The row lock is held until commit,
+            #       so other processes skip the request in the meantime.
+            req: LedgerCreationRequest | None = (
+                await db.scalars(
+                    select(LedgerCreationRequest)
+                    .where(
+                        and_(
+                            LedgerCreationRequest.request_id == request_id,
+                            LedgerCreationRequest.status
+                            == LedgerCreationStatus.PROCESSING,
+                        )
+                    )
+                    .with_for_update(skip_locked=True)
+                )
+            ).first()
+            if req is None:
+                # Already processed or claimed by another process
+                return
+
+            # Get token attributes
+            if req.token_type == TokenType.IBET_SHARE:
+                token_contract: IbetShareContract = await IbetShareContract(
+                    req.token_address
+                ).get()
+            elif req.token_type == TokenType.IBET_STRAIGHT_BOND:
+                token_contract: IbetStraightBondContract = (
+                    await IbetStraightBondContract(req.token_address).get()
+                )
+            token_time = time.monotonic()
+
+            # Sync ledger creation request data with registered personal info
+            (
+                initial_unset_count,
+                final_set_count,
+            ) = await sync_request_with_registered_personal_info(
+                db=db,
+                request_id=req.request_id,
+                issuer_address=token_contract.issuer_address,
+            )
+            LOG.info(
+                f"Personal information fields have been updated: {req.request_id} {final_set_count}/{initial_unset_count}"
+            )
+            sync_time = time.monotonic()
+
+            # Finalize the creation of the ledger
+            # - 1) If all the holder's personal information has been set.
+            # - 2) If more than 6 hours have passed since the creation request.
+            if initial_unset_count == final_set_count:
+                await finalize_ledger(
                     db=db,
                     request_id=req.request_id,
-                    issuer_address=token_contract.issuer_address,
+                    token_address=token_contract.token_address,
+                    currency_code=token_contract.face_value_currency
+                    if req.token_type == TokenType.IBET_STRAIGHT_BOND
+                    else None,
                 )
+                req.status = LedgerCreationStatus.COMPLETED
+                await db.merge(req)
                 LOG.info(
-                    f"Personal information fields have been updated: {req.request_id} {final_set_count}/{initial_unset_count}"
+                    f"The ledger has been created: {req.request_id} {token_contract.token_address}"
+                )
+            elif req.created + timedelta(hours=6) < datetime.now(UTC).replace(
+                tzinfo=None
+            ):
+                await finalize_ledger(
+                    db=db,
+                    request_id=req.request_id,
+                    token_address=token_contract.token_address,
+                    currency_code=token_contract.face_value_currency
+                    if type(token_contract) is IbetStraightBondContract
+                    else None,
+                    some_personal_info_not_registered=True,
+                )
+                req.status = LedgerCreationStatus.COMPLETED
+                await db.merge(req)
+                LOG.info(
+                    f"The ledger has been created (time limit exceeded): {req.request_id} {token_contract.token_address}"
                 )
 
-                # Finalize the creation of the ledger
-                # - 1) If all the holder's personal information has been set.
-                # - 2) If more than 6 hours have passed since the creation request.
-                if initial_unset_count == final_set_count:
-                    await finalize_ledger(
-                        db=db,
-                        request_id=req.request_id,
-                        token_address=token_contract.token_address,
-                        currency_code=token_contract.face_value_currency
-                        if req.token_type == TokenType.IBET_STRAIGHT_BOND
-                        else None,
-                    )
-                    req.status = LedgerCreationStatus.COMPLETED
-                    await db.merge(req)
-                    LOG.info(
-                        f"The ledger has been created: {req.request_id} {token_contract.token_address}"
-                    )
-                elif req.created + timedelta(hours=6) < datetime.now(UTC).replace(
-                    tzinfo=None
-                ):
-                    await finalize_ledger(
-                        db=db,
-                        request_id=req.request_id,
-                        token_address=token_contract.token_address,
-                        currency_code=token_contract.face_value_currency
-                        if type(token_contract) is IbetStraightBondContract
-                        else None,
-                        some_personal_info_not_registered=True,
-                    )
-                    req.status = LedgerCreationStatus.COMPLETED
-                    await db.merge(req)
-                    LOG.info(
-                        f"The ledger has been created (time limit exceeded): {req.request_id} {token_contract.token_address}"
-                    )
-
-                await db.commit()
-
-            LOG.info("Process End")
+            await db.commit()
+            end_time = time.monotonic()
+
+            LOG.info(
+                f"Ledger creation request processed: {request_id} "
+                f"elapsed={end_time - start_time:.3f}s "
+                f"(token={token_time - start_time:.3f}s, "
+                f"sync={sync_time - token_time:.3f}s, "
+                f"finalize={end_time - sync_time:.3f}s)"
+            )
+        except ServiceUnavailableError:
+            LOG.warning(f"An external service was unavailable: {request_id}")
+        except SQLAlchemyError as sa_err:
+            LOG.error(
+                f"A database error has occurred: {request_id} code={sa_err.code}\n{sa_err}"
+            )
+        except Exception:
+            LOG.exception(f"Failed to process ledger creation request: {request_id}")
         finally:
             await db.close()
 
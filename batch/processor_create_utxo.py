@@ -18,22 +18,33 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import sys
 import time
-from datetime import UTC, datetime
-from typing import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Iterable, Sequence
 
 import uvloop
 from hexbytes import HexBytes
-from sqlalchemy import and_, select
+from sqlalchemy import Row, and_, insert, select, tuple_, update
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import BatchAsyncSessionLocal
 from app.exceptions import ServiceUnavailableError
-from app.model.db import UTXO, Account, Token, TokenStatus, TokenType, UTXOBlockNumber
-from app.model.ibet import IbetShareContract, IbetStraightBondContract
+from app.model.db import (
+    UTXO,
+    Account,
+    Token,
+    TokenStatus,
+    TokenType,
+    UTXOBlockNumber,
+    UTXOTokenBlockNumber,
+)
+from app.model.db.base import naive_utcnow
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.ibet_contract_utils import AsyncContractEventsView, AsyncContractUtils
 from app.utils.ibet_ledger_utils import request_ledger_creation
 from app.utils.ibet_web3_utils import AsyncWeb3Wrapper
@@ -41,7 +52,9 @@ from batch import free_malloc
 from batch.utils import batch_log
 from config import (
     CREATE_UTXO_BLOCK_LOT_MAX_SIZE,
+    CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL,
     CREATE_UTXO_INTERVAL,
+    CREATE_UTXO_MAX_CONCURRENCY,
     ZERO_ADDRESS,
 )
 
@@ -57,55 +70,385 @@ LOG = batch_log.get_logger(process_name=process_name)
 web3 = AsyncWeb3Wrapper()
 
 
+class UTXOBook:
+    """In-memory FIFO book of UTXOs for a token
+
+    - Positive UTXOs of the accounts involved in a block lot are loaded once
+      and spent or reallocated in memory in order of block timestamp.
+    - Changes are written back by `flush` with bulk INSERT and UPDATE.
+    """
+
+    # Maximum number of bind parameter sets in a single IN clause
+    LOAD_CHUNK_SIZE = 1000
+
+    def __init__(self, token_address: str):
+        self.token_address = token_address
+        # (transaction_hash, account_address) -> UTXO attributes
+        self.utxos: dict[tuple[str, str], dict] = {}
+        # Primary keys confirmed not to exist in the database
+        self.missing_keys: set[tuple[str, str]] = set()
+        # account_address -> heap of (block_timestamp, sequence, primary key)
+        #   of UTXOs of the token whose amount is greater than 0
+        self.lots: dict[str, list[tuple[datetime, int, tuple[str, str]]]] = {}
+        # Primary keys of UTXOs to be inserted (in order of creation) or updated
+        self.new_keys: dict[tuple[str, str], None] = {}
+        self.updated_keys: set[tuple[str, str]] = set()
+        self.sequence = itertools.count()
+        self.last_created: datetime | None = None
+
+    async def load(self, db_session: AsyncSession, utxo_operations: list[dict]):
+        """Load UTXOs referenced by the operations
+
+        :param db_session: database session
+        :param utxo_operations: UTXO operations to be applied
+        """
+        accounts = set()
+        receive_keys = set()
+        for utxo_operation in utxo_operations:
+            accounts.add(utxo_operation["account_address"])
+            if utxo_operation.get("reallocation_from") is not None:
+                accounts.add(utxo_operation["reallocation_from"])
+            elif utxo_operation["spent"] is False:
+                receive_keys.add(
+                    (
+                        utxo_operation["transaction_hash"],
+                        utxo_operation["account_address"],
+                    )
+                )
+        await self.__load_accounts(db_session=db_session, accounts=accounts)
+        await self.__load_keys(db_session=db_session, keys=receive_keys)
+
+    async def apply(
+        self,
+        db_session: AsyncSession,
+        spent: bool,
+        transaction_hash: str,
+        account_address: str,
+        amount: int,
+        block_number: int,
+        block_timestamp: datetime,
+        reallocation_from: str | None = None,
+    ):
+        """Apply UTXO operation
+
+        :param db_session: database session
+        :param spent: Whether the UTXO is spent or not
+        :param transaction_hash: Transaction hash
+        :param account_address: Account address
+        :param amount: Amount of the token
+        :param block_number: Block number
+        :param block_timestamp: Block timestamp
+        :param reallocation_from: Source address of reallocation (Set when UTXOs are reallocated)
+        """
+        if not spent:
+            if reallocation_from is None:
+                # Create or update the UTXO record of the new holder address
+                await self.__load_keys(
+                    db_session=db_session, keys=[(transaction_hash, account_address)]
+                )
+                self.__receive(
+                    transaction_hash=transaction_hash,
+                    account_address=account_address,
+                    token_address=self.token_address,
+                    amount=amount,
+                    block_number=block_number,
+                    block_timestamp=block_timestamp,
+                )
+            else:
+                # Reallocation
+                # - Replace UTXOs of the source address with the new holder address
+                await self.__load_accounts(
+                    db_session=db_session, accounts=[reallocation_from]
+                )
+                source_utxos = [
+                    self.utxos[key]
+                    for _, _, key in sorted(self.lots[reallocation_from])
+                ]
+                await self.__load_keys(
+                    db_session=db_session,
+                    keys=[
+                        (_source_utxo["transaction_hash"], account_address)
+                        for _source_utxo in source_utxos
+                    ],
+                )
+                remaining = amount
+                for _source_utxo in source_utxos:
+                    if remaining <= 0:
+                        # If the remaining amount is less than or equal to 0, break the loop.
+                        break
+                    # Move the source UTXO amount up to the remaining amount
+                    reallocation_amount = min(_source_utxo["amount"], remaining)
+                    self.__receive(
+                        transaction_hash=_source_utxo["transaction_hash"],
+                        account_address=account_address,  # New holder address
+                        token_address=_source_utxo["token_address"],
+                        amount=reallocation_amount,
+                        block_number=_source_utxo["block_number"],
+                        block_timestamp=_source_utxo["block_timestamp"],
+                    )
+                    remaining = remaining - reallocation_amount
+        else:
+            await self.__load_accounts(
+                db_session=db_session, accounts=[account_address]
+            )
+            lots = self.lots[account_address]
+            remaining = amount
+            while remaining > 0 and len(lots) > 0:
+                _utxo = self.utxos[lots[0][2]]
+                if _utxo["amount"] <= remaining:
+                    # If the UTXO amount is less than or equal to the spent amount,
+                    # set the UTXO amount to 0 and update the remaining amount.
+                    remaining = remaining - _utxo["amount"]
+                    _utxo["amount"] = 0
+                    heapq.heappop(lots)
+                else:
+                    # If the UTXO amount is greater than the spent amount,
+                    # update the UTXO amount and set the remaining amount to 0.
+                    _utxo["amount"] = _utxo["amount"] - remaining
+                    remaining = 0
+                self.__mark_updated(_utxo)
+
+    async def flush(self, db_session: AsyncSession):
+        """Write changed UTXOs to the database
+
+        :param db_session: database session
+        """
+        if len(self.new_keys) > 0:
+            await db_session.execute(
+                insert(UTXO), [self.utxos[key] for key in self.new_keys]
+            )
+        if len(self.updated_keys) > 0:
+            modified = naive_utcnow()
+            await db_session.execute(
+                update(UTXO),
+                [
+                    {
+                        "transaction_hash": key[0],
+                        "account_address": key[1],
+                        "amount": self.utxos[key]["amount"],
+                        "modified": modified,
+                    }
+                    for key in self.updated_keys
+                ],
+            )
+        self.new_keys = {}
+        self.updated_keys = set()
+
+    def __receive(
+        self,
+        transaction_hash: str,
+        account_address: str,
+        token_address: str,
+        amount: int,
+        block_number: int,
+        block_timestamp: datetime,
+    ):
+        key = (transaction_hash, account_address)
+        _utxo = self.utxos.get(key)
+        if _utxo is None:
+            # Create new UTXO
+            # NOTE: "created" is kept strictly increasing to preserve the order of creation.
+            created = naive_utcnow()
+            if self.last_created is not None and created <= self.last_created:
+                created = self.last_created + timedelta(microseconds=1)
+            self.last_created = created
+            _utxo = {
+                "transaction_hash": transaction_hash,
+                "account_address": account_address,
+                "token_address": token_address,
+                "amount": amount,
+                "block_number": block_number,
+                "block_timestamp": block_timestamp,
+                "created": created,
+            }
+            self.utxos[key] = _utxo
+            self.missing_keys.discard(key)
+            self.new_keys[key] = None
+            self.__push_lot(_utxo)
+        else:
+            # Update existing UTXO
+            utxo_amount = _utxo["amount"]
+            _utxo["amount"] = utxo_amount + amount
+            self.__mark_updated(_utxo)
+            if utxo_amount <= 0:
+                self.__push_lot(_utxo)
+
+    def __push_lot(self, utxo: dict):
+        if utxo["token_address"] != self.token_address or utxo["amount"] <= 0:
+            return
+        lots = self.lots.get(utxo["account_address"])
+        if lots is not None:
+            heapq.heappush(
+                lots,
+                (
+                    utxo["block_timestamp"],
+                    next(self.sequence),
+                    (utxo["transaction_hash"], utxo["account_address"]),
+                ),
+            )
+
+    def __mark_updated(self, utxo: dict):
+        key = (utxo["transaction_hash"], utxo["account_address"])
+        if key not in self.new_keys:
+            self.updated_keys.add(key)
+
+    async def __load_accounts(self, db_session: AsyncSession, accounts: Iterable[str]):
+        """Load UTXOs of the token whose amount is greater than 0 for each account"""
+        accounts = [account for account in set(accounts) if account not in self.lots]
+        if len(accounts) == 0:
+            return
+
+        for i in range(0, len(accounts), self.LOAD_CHUNK_SIZE):
+            _utxo_list = (
+                await db_session.execute(
+                    select(*self.__columns()).where(
+                        and_(
+                            UTXO.token_address == self.token_address,
+                            UTXO.account_address.in_(
+                                accounts[i : i + self.LOAD_CHUNK_SIZE]
+                            ),
+                            UTXO.amount > 0,
+                        )
+                    )
+                )
+            ).all()
+            for _utxo in _utxo_list:
+                key = (_utxo.transaction_hash, _utxo.account_address)
+                if key not in self.utxos:
+                    # NOTE: UTXOs already in memory may be newer than the database.
+                    self.utxos[key] = _utxo._asdict()
+
+        loaded_accounts = set(accounts)
+        for account in loaded_accounts:
+            self.lots[account] = []
+        for _utxo in self.utxos.values():
+            if _utxo["account_address"] in loaded_accounts:
+                self.__push_lot(_utxo)
+
+    async def __load_keys(
+        self, db_session: AsyncSession, keys: Iterable[tuple[str, str]]
+    ):
+        """Load UTXOs by primary key"""
+        keys = [
+            key
+            for key in set(keys)
+            if key not in self.utxos and key not in self.missing_keys
+        ]
+        if len(keys) == 0:
+            return
+
+        for i in range(0, len(keys), self.LOAD_CHUNK_SIZE):
+            _utxo_list = (
+                await db_session.execute(
+                    select(*self.__columns()).where(
+                        tuple_(UTXO.transaction_hash, UTXO.account_address).in_(
+                            keys[i : i + self.LOAD_CHUNK_SIZE]
+                        )
+                    )
+                )
+            ).all()
+            for _utxo in _utxo_list:
+                self.utxos[(_utxo.transaction_hash, _utxo.account_address)] = (
+                    _utxo._asdict()
+                )
+        for key in keys:
+            if key not in self.utxos:
+                self.missing_keys.add(key)
+
+    @staticmethod
+    def __columns():
+        return (
+            UTXO.transaction_hash,
+            UTXO.account_address,
+            UTXO.token_address,
+            UTXO.amount,
+            UTXO.block_number,
+            UTXO.block_timestamp,
+        )
+
+
 class Processor:
     def __init__(self):
         self.token_contract_list: list[AsyncContractEventsView] = []
+        self.token_contract_map: dict[str, AsyncContractEventsView] = {}
         self.token_type_map: dict[str, TokenType] = {}
+        # token address -> (exchange address, expiration)
+        self.exchange_address_cache: dict[str, tuple[str, float]] = {}
+        # Caches valid within a single process
+        self.block_timestamp_cache: dict[int, datetime] = {}
+        self.is_contract_cache: dict[str, bool] = {}
 
     async def process(self):
         db_session: AsyncSession = BatchAsyncSessionLocal()
         latest_synced = True
+        self.block_timestamp_cache = {}
+        self.is_contract_cache = {}
         try:
             await self.__refresh_token_contract_list(db_session=db_session)
 
-            # Get from_block_number and to_block_number for contract event filter
+            # Get from_block_number and to_block_number for each token
             utxo_block_number = await self.__get_utxo_block_number(
                 db_session=db_session
             )
+            token_block_numbers = await self.__get_utxo_token_block_numbers(
+                db_session=db_session
+            )
             latest_block = await web3.eth.block_number
 
-            if utxo_block_number >= latest_block:
-                LOG.debug("skip process")
-                pass
-            else:
-                block_from = utxo_block_number + 1
+            sync_targets: list[tuple[AsyncContractEventsView, int, int]] = []
+            for token_contract in self.token_contract_list:
+                # NOTE: Tokens without their own cursor start from the block number
+                #       up to which all tokens have been synchronized.
+                synced_block_number = token_block_numbers.get(
+                    token_contract.address, utxo_block_number
+                )
+                if synced_block_number >= latest_block:
+                    continue
+                block_from = synced_block_number + 1
                 block_to = latest_block
                 if block_to - block_from > CREATE_UTXO_BLOCK_LOT_MAX_SIZE - 1:
                     block_to = block_from + CREATE_UTXO_BLOCK_LOT_MAX_SIZE - 1
                     latest_synced = False
-                LOG.info(f"Syncing from={block_from}, to={block_to}")
+                sync_targets.append((token_contract, block_from, block_to))
 
-                for token_contract in self.token_contract_list:
-                    event_triggered = False
-                    event_triggered = event_triggered | await self.__process_issue(
-                        db_session=db_session,
-                        token_contract=token_contract,
-                        block_from=block_from,
-                        block_to=block_to,
-                    )
-                    event_triggered = event_triggered | await self.__process_transfer(
-                        db_session=db_session,
-                        token_contract=token_contract,
-                        block_from=block_from,
-                        block_to=block_to,
+            if len(sync_targets) == 0:
+                LOG.debug("skip process")
+            else:
+                # Retrieve events of each token concurrently
+                try:
+                    tasks = await SemaphoreTaskGroup.run(
+                        *[
+                            self.__get_utxo_operations(
+                                token_contract=token_contract,
+                                block_from=block_from,
+                                block_to=block_to,
+                            )
+                            for token_contract, block_from, block_to in sync_targets
+                        ],
+                        max_concurrency=CREATE_UTXO_MAX_CONCURRENCY,
                     )
-                    event_triggered = event_triggered | await self.__process_redeem(
-                        db_session=db_session,
-                        token_contract=token_contract,
-                        block_from=block_from,
-                        block_to=block_to,
+                except ExceptionGroup:
+                    raise ServiceUnavailableError
+
+                # Sink in the order of tokens
+                for (token_contract, block_from, block_to), task in zip(
+                    sync_targets, tasks
+                ):
+                    LOG.info(
+                        f"Syncing token={token_contract.address}, from={block_from}, to={block_to}"
                     )
-                    if event_triggered is True:
+                    utxo_operations = task.result()
+                    if len(utxo_operations) > 0:
+                        utxo_book = UTXOBook(token_address=token_contract.address)
+                        await utxo_book.load(
+                            db_session=db_session, utxo_operations=utxo_operations
+                        )
+                        for utxo_operation in utxo_operations:
+                            await utxo_book.apply(
+                                db_session=db_session, **utxo_operation
+                            )
+                        await utxo_book.flush(db_session=db_session)
+
                         # If an event is triggered, initiate the ledger creation request.
                         try:
                             async with db_session.begin_nested():
@@ -117,8 +460,25 @@ class Processor:
                             LOG.error(
                                 f"Invalid record detected. Ledger creation request has been discarded and not saved: token_address={token_contract.address}"
                             )
+                    await self.__set_utxo_token_block_number(
+                        db_session=db_session,
+                        token_address=token_contract.address,
+                        block_number=block_to,
+                    )
+                    await db_session.commit()
+                    token_block_numbers[token_contract.address] = block_to
+
+            # Update the block number up to which all tokens have been synchronized
+            all_synced_block_number = min(
+                [
+                    token_block_numbers.get(token_contract.address, utxo_block_number)
+                    for token_contract in self.token_contract_list
+                ],
+                default=latest_block,
+            )
+            if all_synced_block_number != utxo_block_number:
                 await self.__set_utxo_block_number(
-                    db_session=db_session, block_number=block_to
+                    db_session=db_session, block_number=all_synced_block_number
                 )
                 await db_session.commit()
         finally:
@@ -129,12 +489,10 @@ class Processor:
         return latest_synced
 
     async def __refresh_token_contract_list(self, db_session: AsyncSession):
-        self.token_contract_list = []
-
         # Update token_contract_list to recent
-        _token_list: Sequence[Token] = (
-            await db_session.scalars(
-                select(Token)
+        _token_list: Sequence[Row[tuple[str, TokenType]]] = (
+            await db_session.execute(
+                select(Token.token_address, Token.type)
                 .join(
                     Account,
                     and_(
@@ -146,17 +504,22 @@ class Processor:
                 .order_by(Token.id)
             )
         ).all()
-        for _token in _token_list:
-            token_contract = AsyncContractUtils.get_contract(
-                contract_name=_token.type, contract_address=_token.token_address
-            )
-            self.token_contract_list.append(
-                AsyncContractEventsView(
-                    token_contract.address,
-                    token_contract.events,
+
+        # NOTE: Contract objects are reused across processes.
+        self.token_contract_list = []
+        for _token_address, _token_type in _token_list:
+            token_contract = self.token_contract_map.get(_token_address)
+            if token_contract is None:
+                _contract = AsyncContractUtils.get_contract(
+                    contract_name=_token_type, contract_address=_token_address
                 )
-            )
-            self.token_type_map[_token.token_address] = _token.type
+                token_contract = AsyncContractEventsView(
+                    _contract.address,
+                    _contract.events,
+                )
+                self.token_contract_map[_token_address] = token_contract
+            self.token_contract_list.append(token_contract)
+            self.token_type_map[_token_address] = _token_type
 
     @staticmethod
     async def __get_utxo_block_number(db_session: AsyncSession):
@@ -178,58 +541,197 @@ class Processor:
         _utxo_block_number.latest_block_number = block_number
         await db_session.merge(_utxo_block_number)
 
-    async def __process_transfer(
+    @staticmethod
+    async def __get_utxo_token_block_numbers(db_session: AsyncSession):
+        _token_block_numbers: Sequence[Row[tuple[str, int]]] = (
+            await db_session.execute(
+                select(
+                    UTXOTokenBlockNumber.token_address,
+                    UTXOTokenBlockNumber.latest_block_number,
+                )
+            )
+        ).all()
+        return {
+            token_address: latest_block_number
+            for token_address, latest_block_number in _token_block_numbers
+        }
+
+    @staticmethod
+    async def __set_utxo_token_block_number(
+        db_session: AsyncSession, token_address: str, block_number: int
+    ):
+        _token_block_number = UTXOTokenBlockNumber()
+        _token_block_number.token_address = token_address
+        _token_block_number.latest_block_number = block_number
+        await db_session.merge(_token_block_number)
+
+    async def __get_exchange_contract_address(
+        self, token_contract: AsyncContractEventsView
+    ) -> str:
+        """Get tradable exchange contract address of the token
+
+        - The address is cached for CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL seconds.
+
+        :param token_contract: Token contract
+        :return: Exchange contract address
+        """
+        cached = self.exchange_address_cache.get(token_contract.address)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        exchange_contract_address = ZERO_ADDRESS
+        token_type = self.token_type_map.get(token_contract.address)
+        if token_type in [TokenType.IBET_STRAIGHT_BOND, TokenType.IBET_SHARE]:
+            exchange_contract_address = await AsyncContractUtils.call_function(
+                contract=AsyncContractUtils.get_contract(
+                    contract_name=token_type, contract_address=token_contract.address
+                ),
+                function_name="tradableExchange",
+                args=(),
+                default_returns=ZERO_ADDRESS,
+            )
+        self.exchange_address_cache[token_contract.address] = (
+            exchange_contract_address,
+            time.monotonic() + CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL,
+        )
+        return exchange_contract_address
+
+    async def __get_block_timestamp(self, block_number: int) -> datetime:
+        """Get block timestamp(UTC)"""
+        block_timestamp = self.block_timestamp_cache.get(block_number)
+        if block_timestamp is None:
+            block_timestamp = datetime.fromtimestamp(
+                (await web3.eth.get_block(block_number))["timestamp"], UTC
+            ).replace(tzinfo=None)
+            self.block_timestamp_cache[block_number] = block_timestamp
+        return block_timestamp
+
+    async def __is_contract(self, address: str) -> bool:
+        """Whether the address is a contract account"""
+        is_contract = self.is_contract_cache.get(address)
+        if is_contract is None:
+            is_contract = (await web3.eth.get_code(address)).to_0x_hex() != "0x"
+            self.is_contract_cache[address] = is_contract
+        return is_contract
+
+    async def __get_utxo_operations(
         self,
-        db_session: AsyncSession,
         token_contract: AsyncContractEventsView,
         block_from: int,
         block_to: int,
-    ):
-        """Process Transfer Event
+    ) -> list[dict]:
+        """Get UTXO operations of the token
 
-        - The process of updating UTXO data by capturing the following events
-        - `Transfer` event on Token contracts
-        - `Unlock` event on Token contracts
-        - `ForceUnlock` event on Token contracts
-        - `HolderChanged` event on Exchange contracts
+        - Retrieves all events used for UTXO concurrently
+          and converts them into UTXO operations in the order they should be applied.
+        - This method does not access the database.
 
-        :param db_session: database session
         :param token_contract: Token contract
         :param block_from: Block from
         :param block_to: Block to
-        :return: Whether events have occurred or not
+        :return: UTXO operations (keyword arguments of `UTXOBook.apply`)
         """
-        # Get exchange contract address
-        exchange_contract_address = ZERO_ADDRESS
-        if (
-            self.token_type_map.get(token_contract.address)
-            == TokenType.IBET_STRAIGHT_BOND.value
-        ):
-            bond_token = IbetStraightBondContract(token_contract.address)
-            await bond_token.get()
-            exchange_contract_address = bond_token.tradable_exchange_contract_address
-        elif (
-            self.token_type_map.get(token_contract.address)
-            == TokenType.IBET_SHARE.value
-        ):
-            share_token = IbetShareContract(token_contract.address)
-            await share_token.get()
-            exchange_contract_address = share_token.tradable_exchange_contract_address
-
-        # Get "HolderChanged" events from exchange contract
         exchange_contract = AsyncContractUtils.get_contract(
             contract_name="IbetExchangeInterface",
-            contract_address=exchange_contract_address,
+            contract_address=await self.__get_exchange_contract_address(token_contract),
         )
-        exchange_contract_events = await AsyncContractUtils.get_event_logs(
-            contract=exchange_contract,
-            event="HolderChanged",
-            block_from=block_from,
-            block_to=block_to,
-            argument_filters={"token": token_contract.address},
+        tasks = await SemaphoreTaskGroup.run(
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="Issue",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=exchange_contract,
+                event="HolderChanged",
+                block_from=block_from,
+                block_to=block_to,
+                argument_filters={"token": token_contract.address},
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="Transfer",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="Unlock",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="ForceUnlock",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="ForceChangeLockedAccount",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            AsyncContractUtils.get_event_logs(
+                contract=token_contract,
+                event="Redeem",
+                block_from=block_from,
+                block_to=block_to,
+            ),
+            max_concurrency=7,
         )
+        (
+            issue_events,
+            holder_changed_events,
+            transfer_events,
+            unlock_events,
+            force_unlock_events,
+            force_change_locked_account_events,
+            redeem_events,
+        ) = [task.result() for task in tasks]
+
+        utxo_operations = []
+        utxo_operations += await self.__process_issue(events=issue_events)
+        utxo_operations += await self.__process_transfer(
+            token_contract=token_contract,
+            holder_changed_events=holder_changed_events,
+            transfer_events=transfer_events,
+            unlock_events=unlock_events,
+            force_unlock_events=force_unlock_events,
+            force_change_locked_account_events=force_change_locked_account_events,
+        )
+        utxo_operations += await self.__process_redeem(events=redeem_events)
+        return utxo_operations
+
+    async def __process_transfer(
+        self,
+        token_contract: AsyncContractEventsView,
+        holder_changed_events: list,
+        transfer_events: list,
+        unlock_events: list,
+        force_unlock_events: list,
+        force_change_locked_account_events: list,
+    ) -> list[dict]:
+        """Process Transfer Event
+
+        - The process of updating UTXO data by capturing the following events
+        - `Transfer` event on Token contracts
+        - `Unlock` event on Token contracts
+        - `ForceUnlock` event on Token contracts
+        - `ForceChangeLockedAccount` event on Token contracts
+        - `HolderChanged` event on Exchange contracts
+
+        :param token_contract: Token contract
+        :param holder_changed_events: `HolderChanged` events
+        :param transfer_events: `Transfer` events
+        :param unlock_events: `Unlock` events
+        :param force_unlock_events: `ForceUnlock` events
+        :param force_change_locked_account_events: `ForceChangeLockedAccount` events
+        :return: UTXO operations
+        """
         tmp_events = []
-        for _event in exchange_contract_events:
+        for _event in holder_changed_events:
             if token_contract.address == _event["args"]["token"]:
                 tmp_events.append(
                     {
@@ -241,14 +743,7 @@ class Processor:
                     }
                 )
 
-        # Get "Transfer" events from token contract
-        token_transfer_events = await AsyncContractUtils.get_event_logs(
-            contract=token_contract,
-            event="Transfer",
-            block_from=block_from,
-            block_to=block_to,
-        )
-        for _event in token_transfer_events:
+        for _event in transfer_events:
             tmp_events.append(
                 {
                     "event": _event["event"],
@@ -259,14 +754,7 @@ class Processor:
                 }
             )
 
-        # Get "Unlock" events from token contract
-        token_unlock_events = await AsyncContractUtils.get_event_logs(
-            contract=token_contract,
-            event="Unlock",
-            block_from=block_from,
-            block_to=block_to,
-        )
-        for _event in token_unlock_events:
+        for _event in unlock_events + force_unlock_events:
             if _event["args"]["accountAddress"] != _event["args"]["recipientAddress"]:
                 tmp_events.append(
                     {
@@ -278,35 +766,7 @@ class Processor:
                     }
                 )
 
-        # Get "ForceUnlock" events from token contract
-        token_force_unlock_events = await AsyncContractUtils.get_event_logs(
-            contract=token_contract,
-            event="ForceUnlock",
-            block_from=block_from,
-            block_to=block_to,
-        )
-        for _event in token_force_unlock_events:
-            if _event["args"]["accountAddress"] != _event["args"]["recipientAddress"]:
-                tmp_events.append(
-                    {
-                        "event": _event["event"],
-                        "args": dict(_event["args"]),
-                        "transaction_hash": _event["transactionHash"].to_0x_hex(),
-                        "block_number": _event["blockNumber"],
-                        "log_index": _event["logIndex"],
-                    }
-                )
-
-        # Get "ForceChangeLockedAccount" events from token contract
-        token_force_change_locked_account_events = (
-            await AsyncContractUtils.get_event_logs(
-                contract=token_contract,
-                event="ForceChangeLockedAccount",
-                block_from=block_from,
-                block_to=block_to,
-            )
-        )
-        for _event in token_force_change_locked_account_events:
+        for _event in force_change_locked_account_events:
             if (
                 _event["args"]["beforeAccountAddress"]
                 != _event["args"]["afterAccountAddress"]
@@ -324,8 +784,7 @@ class Processor:
         # Marge & Sort: block_number > log_index
         events = sorted(tmp_events, key=lambda x: (x["block_number"], x["log_index"]))
 
-        # Sink
-        event_triggered = False
+        utxo_operations = []
         for event in events:
             args = event["args"]
             transaction_hash = event["transaction_hash"]
@@ -348,10 +807,10 @@ class Processor:
             # Skip create UTXO if met the following conditions:
             # - If the from_account or to_account is a contract, it is considered a deposit or withdrawal to/from the exchange.
             # - If the from_account and to_account are the same, it is considered a self-transfer.
-            if (await web3.eth.get_code(from_account)).to_0x_hex() != "0x":
+            if await self.__is_contract(from_account):
                 # If the from_account is a contract, it is considered a deposit to the exchange.
                 continue
-            elif (await web3.eth.get_code(to_account)).to_0x_hex() != "0x":
+            elif await self.__is_contract(to_account):
                 # If the to_account is a contract, it is considered a withdrawal from the exchange.
                 continue
             elif from_account == to_account:
@@ -375,66 +834,45 @@ class Processor:
                         pass
 
             # Retrieve block timestamp
-            block_timestamp = datetime.fromtimestamp(
-                (await web3.eth.get_block(block_number))["timestamp"], UTC
-            ).replace(tzinfo=None)  # UTC
+            block_timestamp = await self.__get_block_timestamp(block_number)
 
             if amount is not None and amount <= sys.maxsize:
-                event_triggered = True
                 # Update UTXO（to account）
-                await self.__sink_on_utxo(
-                    db_session=db_session,
-                    spent=False,
-                    transaction_hash=transaction_hash,
-                    token_address=token_contract.address,
-                    account_address=to_account,
-                    amount=amount,
-                    block_number=block_number,
-                    block_timestamp=block_timestamp,
-                    reallocation_from=reallocation_from,
+                utxo_operations.append(
+                    {
+                        "spent": False,
+                        "transaction_hash": transaction_hash,
+                        "account_address": to_account,
+                        "amount": amount,
+                        "block_number": block_number,
+                        "block_timestamp": block_timestamp,
+                        "reallocation_from": reallocation_from,
+                    }
                 )
                 # Update UTXO（from account）
-                await self.__sink_on_utxo(
-                    db_session=db_session,
-                    spent=True,
-                    transaction_hash=transaction_hash,
-                    token_address=token_contract.address,
-                    account_address=from_account,
-                    amount=amount,
-                    block_number=block_number,
-                    block_timestamp=block_timestamp,
+                utxo_operations.append(
+                    {
+                        "spent": True,
+                        "transaction_hash": transaction_hash,
+                        "account_address": from_account,
+                        "amount": amount,
+                        "block_number": block_number,
+                        "block_timestamp": block_timestamp,
+                    }
                 )
 
-        return event_triggered
+        return utxo_operations
 
-    async def __process_issue(
-        self,
-        db_session: AsyncSession,
-        token_contract: AsyncContractEventsView,
-        block_from: int,
-        block_to: int,
-    ):
+    async def __process_issue(self, events: list) -> list[dict]:
         """Process Issue Event
 
         - The process of updating UTXO data by capturing the following events
         - `Issue` event on Token contracts
 
-        :param db_session: database session
-        :param token_contract: Token contract
-        :param block_from: Block from
-        :param block_to: Block to
-        :return: Whether events have occurred or not
+        :param events: `Issue` events
+        :return: UTXO operations
         """
-        # Get "Issue" events from token contract
-        events = await AsyncContractUtils.get_event_logs(
-            contract=token_contract,
-            event="Issue",
-            block_from=block_from,
-            block_to=block_to,
-        )
-
-        # Sink
-        event_triggered = False
+        utxo_operations = []
         for event in events:
             args = event["args"]
             account = args.get("targetAddress", ZERO_ADDRESS)
@@ -442,55 +880,33 @@ class Processor:
 
             transaction_hash = event["transactionHash"].to_0x_hex()
             block_number = event["blockNumber"]
-            block_timestamp = datetime.fromtimestamp(
-                (await web3.eth.get_block(block_number))["timestamp"], UTC
-            ).replace(tzinfo=None)  # UTC
+            block_timestamp = await self.__get_block_timestamp(block_number)
 
             if amount is not None and amount <= sys.maxsize:
-                event_triggered = True
-
                 # Update UTXO
-                await self.__sink_on_utxo(
-                    db_session=db_session,
-                    spent=False,
-                    transaction_hash=transaction_hash,
-                    token_address=token_contract.address,
-                    account_address=account,
-                    amount=amount,
-                    block_number=block_number,
-                    block_timestamp=block_timestamp,
+                utxo_operations.append(
+                    {
+                        "spent": False,
+                        "transaction_hash": transaction_hash,
+                        "account_address": account,
+                        "amount": amount,
+                        "block_number": block_number,
+                        "block_timestamp": block_timestamp,
+                    }
                 )
 
-        return event_triggered
+        return utxo_operations
 
-    async def __process_redeem(
-        self,
-        db_session: AsyncSession,
-        token_contract: AsyncContractEventsView,
-        block_from: int,
-        block_to: int,
-    ):
+    async def __process_redeem(self, events: list) -> list[dict]:
         """Process Redeem Event
 
         - The process of updating UTXO data by capturing the following events
         - `Redeem` event on Token contracts
 
-        :param db_session: database session
-        :param token_contract: Token contract
-        :param block_from: Block from
-        :param block_to: Block to
-        :return: Whether events have occurred or not
+        :param events: `Redeem` events
+        :return: UTXO operations
         """
-        # Get "Redeem" events from token contract
-        events = await AsyncContractUtils.get_event_logs(
-            contract=token_contract,
-            event="Redeem",
-            block_from=block_from,
-            block_to=block_to,
-        )
-
-        # Sink
-        event_triggered = False
+        utxo_operations = []
         for event in events:
             args = event["args"]
             account = args.get("targetAddress", ZERO_ADDRESS)
@@ -498,204 +914,22 @@ class Processor:
 
             transaction_hash = event["transactionHash"].to_0x_hex()
             block_number = event["blockNumber"]
-            block_timestamp = datetime.fromtimestamp(
-                (await web3.eth.get_block(block_number))["timestamp"], UTC
-            ).replace(tzinfo=None)  # UTC
+            block_timestamp = await self.__get_block_timestamp(block_number)
 
             if amount is not None and amount <= sys.maxsize:
-                event_triggered = True
-
                 # Update UTXO
-                await self.__sink_on_utxo(
-                    db_session=db_session,
-                    spent=True,
-                    transaction_hash=transaction_hash,
-                    token_address=token_contract.address,
-                    account_address=account,
-                    amount=amount,
-                    block_number=block_number,
-                    block_timestamp=block_timestamp,
+                utxo_operations.append(
+                    {
+                        "spent": True,
+                        "transaction_hash": transaction_hash,
+                        "account_address": account,
+                        "amount": amount,
+                        "block_number": block_number,
+                        "block_timestamp": block_timestamp,
+                    }
                 )
 
-        return event_triggered
-
-    @staticmethod
-    async def __sink_on_utxo(
-        db_session: AsyncSession,
-        spent: bool,
-        transaction_hash: str,
-        account_address: str,
-        token_address: str,
-        amount: int,
-        block_number: int,
-        block_timestamp: datetime,
-        reallocation_from: str | None = None,
-    ):
-        """Sink UTXO data
-
-        :param db_session: database session
-        :param spent: Whether the UTXO is spent or not
-        :param transaction_hash: Transaction hash
-        :param account_address: Account address
-        :param token_address: Token address
-        :param amount: Amount of the token
-        :param block_number: Block number
-        :param block_timestamp: Block timestamp
-        :param reallocation_from: Source address of reallocation (Set when UTXOs are reallocated)
-        """
-        if not spent:
-            if reallocation_from is None:
-                # Create a new UTXO record of the new holder address
-                _utxo: UTXO | None = (
-                    await db_session.scalars(
-                        select(UTXO)
-                        .where(
-                            and_(
-                                UTXO.transaction_hash == transaction_hash,
-                                UTXO.account_address == account_address,
-                            )
-                        )
-                        .limit(1)
-                    )
-                ).first()
-                if _utxo is None:
-                    # Create new UTXO
-                    _utxo = UTXO()
-                    _utxo.transaction_hash = transaction_hash
-                    _utxo.account_address = account_address
-                    _utxo.token_address = token_address
-                    _utxo.amount = amount
-                    _utxo.block_number = block_number
-                    _utxo.block_timestamp = block_timestamp
-                    db_session.add(_utxo)
-                else:
-                    # Update existing UTXO
-                    utxo_amount = _utxo.amount
-                    _utxo.amount = utxo_amount + amount
-                    await db_session.merge(_utxo)
-            else:
-                # Reallocation
-                # - Replace UTXOs of the source address with the new holder address
-                _source_utxo_list: Sequence[UTXO] = (
-                    await db_session.scalars(
-                        select(UTXO)
-                        .where(
-                            and_(
-                                UTXO.account_address == reallocation_from,
-                                UTXO.token_address == token_address,
-                                UTXO.amount > 0,
-                            )
-                        )
-                        .order_by(UTXO.block_timestamp)
-                    )
-                ).all()
-                remaining = amount
-                for _source_utxo in _source_utxo_list:
-                    _reallocation_utxo: UTXO | None = (
-                        await db_session.scalars(
-                            select(UTXO)
-                            .where(
-                                and_(
-                                    UTXO.transaction_hash
-                                    == _source_utxo.transaction_hash,
-                                    UTXO.account_address
-                                    == account_address,  # New holder address
-                                )
-                            )
-                            .limit(1)
-                        )
-                    ).first()
-                    if remaining <= 0:
-                        # If the remaining amount is less than or equal to 0, break the loop.
-                        break
-                    elif _source_utxo.amount <= remaining:
-                        # If the source UTXO amount is less than or equal to the reallocation amount,
-                        # create or update a UTXO from the source UTXO.
-                        if _reallocation_utxo is not None:
-                            # If the UTXO already exists, update the amount
-                            _reallocation_utxo.amount = (
-                                _reallocation_utxo.amount + _source_utxo.amount
-                            )
-                            await db_session.merge(_reallocation_utxo)
-                        else:
-                            # If the UTXO does not exist, create a new UTXO
-                            _reallocation_utxo = UTXO()
-                            _reallocation_utxo.transaction_hash = (
-                                _source_utxo.transaction_hash
-                            )
-                            _reallocation_utxo.account_address = (
-                                account_address  # New holder address
-                            )
-                            _reallocation_utxo.token_address = (
-                                _source_utxo.token_address
-                            )
-                            _reallocation_utxo.amount = _source_utxo.amount
-                            _reallocation_utxo.block_number = _source_utxo.block_number
-                            _reallocation_utxo.block_timestamp = (
-                                _source_utxo.block_timestamp
-                            )
-                            db_session.add(_reallocation_utxo)
-                        remaining = remaining - _source_utxo.amount
-                    else:
-                        # If the source UTXO amount is greater than the reallocation amount,
-                        # create or update a new UTXO with the remaining amount.
-                        if _reallocation_utxo is not None:
-                            # If the UTXO already exists, update the amount
-                            _reallocation_utxo.amount = (
-                                _reallocation_utxo.amount + remaining
-                            )
-                            await db_session.merge(_reallocation_utxo)
-                        else:
-                            # If the UTXO does not exist, create a new UTXO
-                            _reallocation_utxo = UTXO()
-                            _reallocation_utxo.transaction_hash = (
-                                _source_utxo.transaction_hash
-                            )
-                            _reallocation_utxo.account_address = (
-                                account_address  # New holder address
-                            )
-                            _reallocation_utxo.token_address = (
-                                _source_utxo.token_address
-                            )
-                            _reallocation_utxo.amount = remaining
-                            _reallocation_utxo.block_number = _source_utxo.block_number
-                            _reallocation_utxo.block_timestamp = (
-                                _source_utxo.block_timestamp
-                            )
-                            db_session.add(_reallocation_utxo)
-                        remaining = 0
-        else:
-            _utxo_list: Sequence[UTXO] = (
-                await db_session.scalars(
-                    select(UTXO)
-                    .where(
-                        and_(
-                            UTXO.account_address == account_address,
-                            UTXO.token_address == token_address,
-                            UTXO.amount > 0,
-                        )
-                    )
-                    .order_by(UTXO.block_timestamp)
-                )
-            ).all()
-            remaining = amount
-            for _utxo in _utxo_list:
-                utxo_amount = _utxo.amount
-                if remaining <= 0:
-                    # If the remaining amount is less than or equal to 0, break the loop.
-                    break
-                elif _utxo.amount <= remaining:
-                    # If the UTXO amount is less than or equal to the spent amount,
-                    # set the UTXO amount to 0 and update the remaining amount.
-                    _utxo.amount = 0
-                    remaining = remaining - utxo_amount
-                    await db_session.merge(_utxo)
-                else:
-                    # If the UTXO amount is greater than the spent amount,
-                    # update the UTXO amount and set the remaining amount to 0.
-                    _utxo.amount = utxo_amount - remaining
-                    remaining = 0
-                    await db_session.merge(_utxo)
+        return utxo_operations
 
 
 async def main():
@@ -22,15 +22,18 @@ import json
 import secrets
 import sys
 import uuid
-from typing import Literal, Sequence
+from typing import Any, Literal, Sequence
 
 import uvloop
 from eth_keyfile import decode_keyfile_json
+from eth_utils import encode_hex, event_abi_to_log_topic, to_checksum_address
 from pydantic import BaseModel
 from pydantic_core import ValidationError
 from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from web3 import AsyncWeb3
+from web3.exceptions import ABIEventNotFound, MismatchedABI
 
 from app.database import BatchAsyncSessionLocal
 from app.model.db import (
@@ -50,6 +53,7 @@ from app.model.db import (
     Token,
 )
 from app.model.eth import IbetWST, IbetWSTDigestHelper
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.e2ee_utils import E2EEUtils
 from app.utils.eth_contract_utils import (
     EthAsyncContractEventsView,
@@ -66,6 +70,7 @@ from batch.utils import batch_log
 from config import (
     IBET_WST_BRIDGE_BLOCK_LOT_MAX_SIZE,
     IBET_WST_BRIDGE_INTERVAL,
+    IBET_WST_BRIDGE_MAX_CONCURRENCY,
     ZERO_ADDRESS,
 )
 from eth_config import ETH_MASTER_ACCOUNT_ADDRESS
@@ -87,6 +92,7 @@ class BridgeEventViewer:
 
     issuer_address: str
     ibet_token_address: str
+    wst_address: str
     ibet_event_view: AsyncContractEventsView
     wst_event_view: EthAsyncContractEventsView
 
@@ -97,6 +103,9 @@ class BridgeEventViewer:
         # Initialize ibet token address
         self.ibet_token_address = token.token_address
 
+        # Initialize IbetWST address
+        self.wst_address = token.ibet_wst_address
+
         # Initialize ibet token event view
         ibet_token_contract = IbetWeb3.eth.contract(
             address=token.token_address, abi=token.abi
@@ -113,26 +122,101 @@ class BridgeEventViewer:
             address=token.ibet_wst_address, contract_events=wst_contract.events
         )
 
+    @staticmethod
     async def get_ibet_event_logs(
-        self, event_name: str, block_from: int, block_to: int
-    ) -> Sequence[dict]:
-        logs = await AsyncContractUtils.get_event_logs(
-            contract=self.ibet_event_view,
-            event=event_name,
-            block_from=block_from,
-            block_to=block_to,
+        viewers: Sequence["BridgeEventViewer"],
+        event_name: str,
+        block_from: int,
+        block_to: int,
+    ) -> dict[str, list[dict]]:
+        """
+        Get event logs of the ibet tokens with a single address-list request.
+
+        :return: Event logs grouped by IbetWST address
+        """
+        events = {}
+        for viewer in viewers:
+            try:
+                event = getattr(viewer.ibet_event_view.events, event_name)
+            except ABIEventNotFound:
+                continue
+            events[to_checksum_address(viewer.ibet_token_address)] = (
+                viewer.wst_address,
+                event,
+            )
+        return await BridgeEventViewer.__get_event_logs(
+            web3=IbetWeb3, events=events, block_from=block_from, block_to=block_to
         )
-        return logs
 
+    @staticmethod
     async def get_wst_event_logs(
-        self, event_name: str, block_from: int, block_to: int
-    ) -> Sequence[dict]:
-        logs = await EthAsyncContractUtils.get_event_logs(
-            contract=self.wst_event_view,
-            event=event_name,
+        viewers: Sequence["BridgeEventViewer"],
+        event_name: str,
+        block_from: int,
+        block_to: int,
+    ) -> dict[str, list[dict]]:
+        """
+        Get event logs of the IbetWST tokens with a single address-list request.
+
+        :return: Event logs grouped by IbetWST address
+        """
+        events = {}
+        for viewer in viewers:
+            try:
+                event = getattr(viewer.wst_event_view.events, event_name)
+            except ABIEventNotFound:
+                continue
+            events[to_checksum_address(viewer.wst_address)] = (
+                viewer.wst_address,
+                event,
+            )
+        return await BridgeEventViewer.__get_event_logs(
+            web3=EthWeb3, events=events, block_from=block_from, block_to=block_to
+        )
+
+    @staticmethod
+    async def __get_event_logs(
+        web3: AsyncWeb3,
+        events: dict[str, tuple[str, Any]],
+        block_from: int,
+        block_to: int,
+    ) -> dict[str, list[dict]]:
+        """
+        Get event logs of multiple contracts and decode them per contract.
+
+        :param web3: AsyncWeb3 instance of the network
+        :param events: Key: contract address, Value: (IbetWST address, contract event)
+        :return: Event logs grouped by IbetWST address
+        """
+        if not events:
+            return {}
+
+        topics = list(
+            {
+                encode_hex(event_abi_to_log_topic(event.abi))
+                for _, event in events.values()
+            }
+        )
+        raw_logs = await AsyncContractUtils.get_logs(
+            web3=web3,
+            address_list=list(events.keys()),
+            event_topics=topics,
             block_from=block_from,
             block_to=block_to,
+            max_range_size=IBET_WST_BRIDGE_BLOCK_LOT_MAX_SIZE,
         )
+
+        logs: dict[str, list[dict]] = {}
+        for raw_log in raw_logs:
+            target = events.get(to_checksum_address(raw_log["address"]))
+            if target is None:
+                continue
+            wst_address, event = target
+            try:
+                log = event.process_log(raw_log)
+            except MismatchedABI:
+                continue
+            logs.setdefault(wst_address, []).append(log)
         return logs
 
 
@@ -176,10 +260,15 @@ class WSTBridgeMonitoringProcessor:
         """
         # Load the latest list of WST tokens
         await self.load_wst_list()
-        # Process bridge events from ibetfin to ethereum
-        await self.ibet_to_eth()
-        # Process bridge events from ethereum to ibetfin
-        await self.eth_to_ibet()
+        # Process bridge events in both directions concurrently
+        # - ibetfin to ethereum
+        # - ethereum to ibetfin
+        results = await asyncio.gather(
+            self.ibet_to_eth(), self.eth_to_ibet(), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def load_wst_list(self):
         """
@@ -388,90 +477,145 @@ class WSTBridgeMonitoringProcessor:
         """
         Process mint events from ibet token and issue mintWithAuthorization transactions for IbetWST.
         """
-        for wst_address, bridge_event_viewer in self.wst_list.items():
-            # Get Lock events from ibet token
-            lock_events = await bridge_event_viewer.get_ibet_event_logs(
-                event_name="Lock", block_from=block_from, block_to=block_to
-            )
-            for lock_event in lock_events:
-                # Filter out events that do not match the issuer address
-                args = lock_event["args"]
-                if args["lockAddress"] != bridge_event_viewer.issuer_address:
-                    # Skip if the lockAddress does not match the issuer address
-                    continue
-                try:
-                    # Skip if the data is not a valid BridgeMessage
-                    bridge_message_mint = BridgeMessageMint(**json.loads(args["data"]))
-                except (json.JSONDecodeError, ValidationError, TypeError):
-                    continue
+        if not self.wst_list:
+            return
 
-                # Retrieve the issuer's private key
-                issuer: Account | None = (
-                    await db_session.scalars(
-                        select(Account)
-                        .where(
-                            Account.issuer_address == bridge_event_viewer.issuer_address
-                        )
-                        .limit(1)
-                    )
-                ).first()
-                if issuer is None:
-                    LOG.warning(
-                        f"Cannot find issuer for IbetWST address: {wst_address}"
+        # Get Lock events from all ibet tokens
+        lock_events = await BridgeEventViewer.get_ibet_event_logs(
+            viewers=list(self.wst_list.values()),
+            event_name="Lock",
+            block_from=block_from,
+            block_to=block_to,
+        )
+        if not lock_events:
+            return
+
+        # Retrieve the issuers of the IbetWST tokens
+        issuer_address_list = {
+            self.wst_list[wst_address].issuer_address for wst_address in lock_events
+        }
+        issuers: dict[str, Account] = {
+            issuer.issuer_address: issuer
+            for issuer in (
+                await db_session.scalars(
+                    select(Account).where(
+                        Account.issuer_address.in_(issuer_address_list)
                     )
-                    continue
-                issuer_pk = decode_keyfile_json(
-                    raw_keyfile_json=issuer.keyfile,
-                    password=E2EEUtils.decrypt(issuer.eoa_password).encode("utf-8"),
                 )
+            ).all()
+        }
+
+        # Sign authorizations for each IbetWST concurrently
+        tasks = await SemaphoreTaskGroup.run(
+            *[
+                self.__sign_mint(
+                    wst_address=wst_address,
+                    bridge_event_viewer=self.wst_list[wst_address],
+                    issuer=issuers.get(self.wst_list[wst_address].issuer_address),
+                    lock_events=events,
+                )
+                for wst_address, events in lock_events.items()
+            ],
+            max_concurrency=IBET_WST_BRIDGE_MAX_CONCURRENCY,
+        )
+        for task in tasks:
+            for wst_tx in task.result():
+                db_session.add(wst_tx)
 
-                # Issue mintWithAuthorization transaction for IbetWST
-                try:
-                    # Get the IbetWST contract
-                    wst_contract = IbetWST(wst_address)
-                    # Generate nonce
-                    nonce = secrets.token_bytes(32)
-                    # Get domain separator
-                    domain_separator = await wst_contract.domain_separator()
-                    # Generate digest
-                    digest = IbetWSTDigestHelper.generate_mint_digest(
-                        domain_separator=domain_separator,
-                        to_address=args["accountAddress"],
-                        value=args["value"],
-                        nonce=nonce,
-                    )
-                    # Sign the digest from the authorizer's private key
-                    signature = EthWeb3.eth.account.unsafe_sign_hash(digest, issuer_pk)
-
-                    # Insert transaction record
-                    tx_id = str(uuid.uuid4())
-                    if bridge_message_mint.network == "ethereum":
-                        wst_tx = EthIbetWSTTx()
-                        wst_tx.tx_id = tx_id
-                        wst_tx.tx_type = IbetWSTTxType.MINT
-                        wst_tx.version = IbetWSTVersion.V_1
-                        wst_tx.status = IbetWSTTxStatus.PENDING
-                        wst_tx.ibet_wst_address = wst_address
-                        wst_tx.tx_params = IbetWSTTxParamsMint(
-                            to_address=args["accountAddress"],
-                            value=args["value"],
-                        )
-                        wst_tx.tx_sender = ETH_MASTER_ACCOUNT_ADDRESS
-                        wst_tx.authorizer = issuer.issuer_address
-                        wst_tx.authorization = IbetWSTAuthorization(
-                            nonce=nonce.hex(),
-                            v=signature.v,
-                            r=signature.r.to_bytes(32).hex(),
-                            s=signature.s.to_bytes(32).hex(),
-                        )
-                        db_session.add(wst_tx)
+    @staticmethod
+    async def __sign_mint(
+        wst_address: str,
+        bridge_event_viewer: BridgeEventViewer,
+        issuer: Account | None,
+        lock_events: list[dict],
+    ) -> list[EthIbetWSTTx]:
+        """
+        Generate mintWithAuthorization transactions for one IbetWST.
+        """
+        mint_requests: list[tuple[str, int, BridgeMessageMint]] = []
+        for lock_event in lock_events:
+            # Filter out events that do not match the issuer address
+            args = lock_event["args"]
+            if args["lockAddress"] != bridge_event_viewer.issuer_address:
+                # Skip if the lockAddress does not match the issuer address
+                continue
+            try:
+                # Skip if the data is not a valid BridgeMessage
+                bridge_message_mint = BridgeMessageMint(**json.loads(args["data"]))
+            except (json.JSONDecodeError, ValidationError, TypeError):
+                continue
+            mint_requests.append(
+                (args["accountAddress"], args["value"], bridge_message_mint)
+            )
+        if len(mint_requests) == 0:
+            return []
+
+        # Retrieve the issuer's private key
+        if issuer is None:
+            LOG.warning(f"Cannot find issuer for IbetWST address: {wst_address}")
+            return []
+        issuer_pk = await asyncio.to_thread(
+            decode_keyfile_json,
+            raw_keyfile_json=issuer.keyfile,
+            password=E2EEUtils.decrypt(issuer.eoa_password).encode("utf-8"),
+        )
 
-                    LOG.info(
-                        f"Minting IbetWST: {wst_address}, to={args['accountAddress']}, value={args['value']}, tx_id={tx_id}"
-                    )
-                except Exception as e:
-                    LOG.error(f"Failed to mint WST: {wst_address}, error: {e}")
-                    continue
+        # Issue mintWithAuthorization transactions for IbetWST
+        try:
+            # Get the IbetWST contract
+            wst_contract = IbetWST(wst_address)
+            # Get domain separator
+            domain_separator = await wst_contract.domain_separator()
+            # Generate nonces and digests
+            nonces = [secrets.token_bytes(32) for _ in mint_requests]
+            digests = [
+                IbetWSTDigestHelper.generate_mint_digest(
+                    domain_separator=domain_separator,
+                    to_address=to_address,
+                    value=value,
+                    nonce=nonce,
+                )
+                for (to_address, value, _), nonce in zip(mint_requests, nonces)
+            ]
+            # Sign the digests from the authorizer's private key
+            signatures = await IbetWSTDigestHelper.sign_digests(
+                digests=digests, private_key=issuer_pk
+            )
+        except Exception as e:
+            LOG.error(f"Failed to mint WST: {wst_address}, error: {e}")
+            return []
+
+        wst_tx_list = []
+        for (to_address, value, bridge_message_mint), nonce, signature in zip(
+            mint_requests, nonces, signatures
+        ):
+            # Generate transaction record
+            tx_id = str(uuid.uuid4())
+            if bridge_message_mint.network == "ethereum":
+                wst_tx = EthIbetWSTTx()
+                wst_tx.tx_id = tx_id
+                wst_tx.tx_type = IbetWSTTxType.MINT
+                wst_tx.version = IbetWSTVersion.V_1
+                wst_tx.status = IbetWSTTxStatus.PENDING
+                wst_tx.ibet_wst_address = wst_address
+                wst_tx.tx_params = IbetWSTTxParamsMint(
+                    to_address=to_address,
+                    value=value,
+                )
+                wst_tx.tx_sender = ETH_MASTER_ACCOUNT_ADDRESS
+                wst_tx.authorizer = issuer.issuer_address
+                wst_tx.authorization = IbetWSTAuthorization(
+                    nonce=nonce.hex(),
+                    v=signature.v,
+                    r=signature.r.to_bytes(32).hex(),
+                    s=signature.s.to_bytes(32).hex(),
+                )
+                wst_tx_list.append(wst_tx)
+
+            LOG.info(
+                f"Minting IbetWST: {wst_address}, to={to_address}, value={value}, tx_id={tx_id}"
+            )
+        return wst_tx_list
 
     async def __process_burn(
         self, db_session: AsyncSession, block_from: int, block_to: int
@@ -479,12 +623,19 @@ class WSTBridgeMonitoringProcessor:
         """
         Process burn events from IbetWST and issue unlock transactions for ibet tokens.
         """
-        for wst_address, bridge_event_viewer in self.wst_list.items():
-            # Get Burn events from IbetWST
-            burn_events = await bridge_event_viewer.get_wst_event_logs(
-                event_name="Burn", block_from=block_from, block_to=block_to
-            )
-            for burn_event in burn_events:
+        if not self.wst_list:
+            return
+
+        # Get Burn events from all IbetWST tokens
+        burn_events = await BridgeEventViewer.get_wst_event_logs(
+            viewers=list(self.wst_list.values()),
+            event_name="Burn",
+            block_from=block_from,
+            block_to=block_to,
+        )
+        for wst_address, events in burn_events.items():
+            bridge_event_viewer = self.wst_list[wst_address]
+            for burn_event in events:
                 args = burn_event["args"]
                 # Issue unlock transaction for ibet token
                 tx_id = str(uuid.uuid4())
@@ -509,13 +660,20 @@ class WSTBridgeMonitoringProcessor:
         """
         Process transfer events from IbetWST and issue forceChangeLockedAccount transactions for ibet tokens.
         """
-        for wst_address, bridge_event_viewer in self.wst_list.items():
-            # Get Transfer events from IbetWST
-            burn_events = await bridge_event_viewer.get_wst_event_logs(
-                event_name="Transfer", block_from=block_from, block_to=block_to
-            )
-            for burn_event in burn_events:
-                args = burn_event["args"]
+        if not self.wst_list:
+            return
+
+        # Get Transfer events from all IbetWST tokens
+        transfer_events = await BridgeEventViewer.get_wst_event_logs(
+            viewers=list(self.wst_list.values()),
+            event_name="Transfer",
+            block_from=block_from,
+            block_to=block_to,
+        )
+        for wst_address, events in transfer_events.items():
+            bridge_event_viewer = self.wst_list[wst_address]
+            for transfer_event in events:
+                args = transfer_event["args"]
                 if args["from"] == ZERO_ADDRESS or args["to"] == ZERO_ADDRESS:
                     # Skip if the transfer is from or to the zero address
                     continue
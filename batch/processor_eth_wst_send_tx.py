@@ -24,12 +24,12 @@ from typing import Sequence
 import uvloop
 from eth_keyfile import decode_keyfile_json
 from pydantic import BaseModel
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from web3.types import Nonce
 
-from app.database import BatchAsyncSessionLocal
+from app.database import BatchAsyncSessionLocal, batch_async_engine
 from app.model.db import (
     Account,
     EthIbetWSTTx,
@@ -48,10 +48,12 @@ from app.model.db import (
     IbetWSTTxType,
 )
 from app.model.eth import IbetWST, IbetWSTAuthorization
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.e2ee_utils import E2EEUtils
 from app.utils.eth_contract_utils import EthAsyncContractUtils
 from batch import free_malloc
 from batch.utils import batch_log
+from config import IBET_WST_SEND_TX_MAX_CONCURRENCY
 from eth_config import ETH_MASTER_ACCOUNT_ADDRESS, ETH_MASTER_PRIVATE_KEY
 
 """
@@ -67,6 +69,10 @@ LOG = batch_log.get_logger(process_name=process_name)
 class ProcessorEthWSTSendTx:
     """
     Processor for sending transactions related to IbetWST on Ethereum.
+
+    Pending transactions are grouped by transaction sender, and each sender is
+    processed in its own concurrent lane. Within a lane, transactions are sent
+    in creation order while the nonce is managed locally.
     """
 
     async def run(self):
@@ -75,27 +81,112 @@ class ProcessorEthWSTSendTx:
         """
         db_session: AsyncSession = BatchAsyncSessionLocal()
         try:
-            # Extract unprocessed transactions
-            wst_tx_list: Sequence[EthIbetWSTTx] = (
+            # Extract senders with unprocessed transactions
+            tx_sender_list: Sequence[str] = (
+                await db_session.scalars(
+                    select(EthIbetWSTTx.tx_sender)
+                    .where(
+                        and_(
+                            EthIbetWSTTx.status == IbetWSTTxStatus.PENDING,
+                            EthIbetWSTTx.tx_hash.is_(None),
+                        )
+                    )
+                    .distinct()
+                )
+            ).all()
+        finally:
+            # Close the session
+            await db_session.close()
+
+        if len(tx_sender_list) == 0:
+            return
+
+        await SemaphoreTaskGroup.run(
+            *[self.__process_sender_lane(tx_sender) for tx_sender in tx_sender_list],
+            max_concurrency=IBET_WST_SEND_TX_MAX_CONCURRENCY,
+        )
+
+    async def __process_sender_lane(self, tx_sender: str):
+        """
+        Send unprocessed transactions of a single transaction sender.
+        """
+        # NOTE: The lane uses a single connection for both the lock and the
+        #       transactions, so a lane never holds more than one pooled connection.
+        async with batch_async_engine.connect() as lane_conn:
+            # Exclusive control per transaction sender
+            # NOTE: Other processes skip the sender while the lock is held,
+            #       so the locally managed nonce does not collide.
+            #       The lock is session-level, so it survives the commits below.
+            is_locked = await lane_conn.scalar(
+                select(func.pg_try_advisory_lock(func.hashtext(tx_sender)))
+            )
+            # End the implicit transaction so the connection is not left idle in transaction
+            await lane_conn.commit()
+            if not is_locked:
+                return
+            try:
+                await self.__send_sender_transactions(lane_conn, tx_sender)
+            except Exception:
+                LOG.exception(f"Failed to process transaction sender: {tx_sender}")
+            finally:
+                await lane_conn.scalar(
+                    select(func.pg_advisory_unlock(func.hashtext(tx_sender)))
+                )
+                await lane_conn.commit()
+
+    async def __send_sender_transactions(
+        self, lane_conn: AsyncConnection, tx_sender: str
+    ):
+        db_session: AsyncSession = BatchAsyncSessionLocal(bind=lane_conn)
+        try:
+            tx_id_list: Sequence[str] = (
                 await db_session.scalars(
-                    select(EthIbetWSTTx).where(
+                    select(EthIbetWSTTx.tx_id)
+                    .where(
                         and_(
+                            EthIbetWSTTx.tx_sender == tx_sender,
                             EthIbetWSTTx.status == IbetWSTTxStatus.PENDING,
                             EthIbetWSTTx.tx_hash.is_(None),
                         )
                     )
+                    .order_by(EthIbetWSTTx.created)
                 )
             ).all()
-            for wst_tx in wst_tx_list:
+
+            # Get account information
+            tx_sender_account = await get_tx_sender_account(
+                db_session=db_session,
+                tx_sender=tx_sender,
+            )
+
+            # Nonce to be used for the next transaction
+            # NOTE: If None, it is fetched from the node when sending.
+            next_nonce: Nonce | None = None
+
+            for tx_id in tx_id_list:
+                # Claim the transaction
+                wst_tx: EthIbetWSTTx | None = (
+                    await db_session.scalars(
+                        select(EthIbetWSTTx)
+                        .where(
+                            and_(
+                                EthIbetWSTTx.tx_id == tx_id,
+                                EthIbetWSTTx.status == IbetWSTTxStatus.PENDING,
+                                EthIbetWSTTx.tx_hash.is_(None),
+                            )
+                        )
+                        .with_for_update(skip_locked=True)
+                    )
+                ).first()
+                if wst_tx is None:
+                    # Already processed or claimed by another process
+                    await db_session.rollback()
+                    continue
+
                 LOG.info(
                     f"Processing transaction: id={wst_tx.tx_id}, type={wst_tx.tx_type}"
                 )
 
-                # Get account information
-                tx_sender_account = await get_tx_sender_account(
-                    db_session=db_session,
-                    tx_sender=wst_tx.tx_sender,
-                )
                 if not tx_sender_account:
                     # If the account is not found, output an error log and set the status to FAILED
                     LOG.error(
@@ -107,64 +198,13 @@ class ProcessorEthWSTSendTx:
                     continue
 
                 try:
-                    # Branch processing by transaction type
-                    if wst_tx.tx_type == IbetWSTTxType.DEPLOY:
-                        # Send deployment transaction
-                        tx_hash, nonce = await send_deploy_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.ADD_WHITELIST:
-                        # Send add whitelist transaction
-                        tx_hash, nonce = await send_add_whitelist_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.DELETE_WHITELIST:
-                        # Send delete whitelist transaction
-                        tx_hash, nonce = await send_delete_whitelist_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.TRANSFER:
-                        # Send transfer transaction
-                        tx_hash, nonce = await send_transfer_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.MINT:
-                        # Send mint transaction
-                        tx_hash, nonce = await send_mint_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.BURN:
-                        # Send burn transaction
-                        tx_hash, nonce = await send_burn_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.FORCE_BURN:
-                        # Send force burn transaction
-                        tx_hash, nonce = await send_force_burn_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.REQUEST_TRADE:
-                        # Send request trade transaction
-                        tx_hash, nonce = await send_request_trade_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.CANCEL_TRADE:
-                        # Send cancel trade transaction
-                        tx_hash, nonce = await cancel_trade_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.ACCEPT_TRADE:
-                        # Send accept trade transaction
-                        tx_hash, nonce = await accept_trade_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    elif wst_tx.tx_type == IbetWSTTxType.REJECT_TRADE:
-                        # Send reject trade transaction
-                        tx_hash, nonce = await reject_trade_transaction(
-                            wst_tx, tx_sender_account
-                        )
-                    else:
+                    result = await send_transaction(
+                        wst_tx, tx_sender_account, next_nonce
+                    )
+                    if result is None:
+                        await db_session.rollback()
                         continue
+                    tx_hash, nonce = result
 
                     # If successful, update the status
                     wst_tx.status = IbetWSTTxStatus.SENT
@@ -172,10 +212,14 @@ class ProcessorEthWSTSendTx:
                     wst_tx.tx_hash = tx_hash
                     await db_session.merge(wst_tx)
                     await db_session.commit()
+                    next_nonce = Nonce(nonce + 1)
                     LOG.info(f"Transaction sent successfully: id={wst_tx.tx_id}")
                 except Exception:
                     # If sending fails, output an error log and skip processing
                     LOG.exception(f"Failed to send transaction: id={wst_tx.tx_id}")
+                    await db_session.rollback()
+                    # Re-sync the nonce with the node on the next transaction
+                    next_nonce = None
                     continue
         finally:
             # Close the session
@@ -209,7 +253,9 @@ async def get_tx_sender_account(
             )
         ).first()
         if tx_sender_account is not None:
-            private_key = decode_keyfile_json(
+            # NOTE: Decoding the keyfile is CPU-bound (scrypt), so it is offloaded from the event loop.
+            private_key = await asyncio.to_thread(
+                decode_keyfile_json,
                 raw_keyfile_json=tx_sender_account.keyfile,
                 password=E2EEUtils.decrypt(tx_sender_account.eoa_password).encode(
                     "utf-8"
@@ -223,9 +269,60 @@ async def get_tx_sender_account(
             return None
 
 
+async def send_transaction(
+    wst_tx: EthIbetWSTTx,
+    tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
+) -> tuple[str, Nonce] | None:
+    """
+    Send a transaction according to its transaction type.
+
+    :return: Transaction hash and nonce (None if the transaction type is not supported)
+    """
+    # Branch processing by transaction type
+    if wst_tx.tx_type == IbetWSTTxType.DEPLOY:
+        # Send deployment transaction
+        return await send_deploy_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.ADD_WHITELIST:
+        # Send add whitelist transaction
+        return await send_add_whitelist_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.DELETE_WHITELIST:
+        # Send delete whitelist transaction
+        return await send_delete_whitelist_transaction(
+            wst_tx, tx_sender_account, tx_nonce
+        )
+    elif wst_tx.tx_type == IbetWSTTxType.TRANSFER:
+        # Send transfer transaction
+        return await send_transfer_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.MINT:
+        # Send mint transaction
+        return await send_mint_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.BURN:
+        # Send burn transaction
+        return await send_burn_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.FORCE_BURN:
+        # Send force burn transaction
+        return await send_force_burn_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.REQUEST_TRADE:
+        # Send request trade transaction
+        return await send_request_trade_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.CANCEL_TRADE:
+        # Send cancel trade transaction
+        return await cancel_trade_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.ACCEPT_TRADE:
+        # Send accept trade transaction
+        return await accept_trade_transaction(wst_tx, tx_sender_account, tx_nonce)
+    elif wst_tx.tx_type == IbetWSTTxType.REJECT_TRADE:
+        # Send reject trade transaction
+        return await reject_trade_transaction(wst_tx, tx_sender_account, tx_nonce)
+    else:
+        return None
+
+
 async def send_deploy_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a deployment transaction for the IbetWST contract.
@@ -239,6 +336,7 @@ async def send_deploy_transaction(
         ],
         deployer=tx_sender_account.address,
         private_key=tx_sender_account.private_key,
+        nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -246,6 +344,7 @@ async def send_deploy_transaction(
 async def send_add_whitelist_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to add an account to the IbetWST whitelist.
@@ -264,6 +363,7 @@ async def send_add_whitelist_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -271,6 +371,7 @@ async def send_add_whitelist_transaction(
 async def send_delete_whitelist_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to delete an account from the IbetWST whitelist.
@@ -287,6 +388,7 @@ async def send_delete_whitelist_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -294,6 +396,7 @@ async def send_delete_whitelist_transaction(
 async def send_transfer_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to transfer IbetWST tokens.
@@ -314,6 +417,7 @@ async def send_transfer_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -321,6 +425,7 @@ async def send_transfer_transaction(
 async def send_mint_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to mint IbetWST tokens.
@@ -338,6 +443,7 @@ async def send_mint_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -345,6 +451,7 @@ async def send_mint_transaction(
 async def send_burn_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to burn IbetWST tokens.
@@ -362,6 +469,7 @@ async def send_burn_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -369,6 +477,7 @@ async def send_burn_transaction(
 async def send_force_burn_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to force burn IbetWST tokens.
@@ -386,6 +495,7 @@ async def send_force_burn_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -393,6 +503,7 @@ async def send_force_burn_transaction(
 async def send_request_trade_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to request a trade for the IbetWST.
@@ -414,6 +525,7 @@ async def send_request_trade_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -421,6 +533,7 @@ async def send_request_trade_transaction(
 async def cancel_trade_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to cancel a trade for the IbetWST.
@@ -437,6 +550,7 @@ async def cancel_trade_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -444,6 +558,7 @@ async def cancel_trade_transaction(
 async def accept_trade_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to accept a trade for the IbetWST.
@@ -460,6 +575,7 @@ async def accept_trade_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -467,6 +583,7 @@ async def accept_trade_transaction(
 async def reject_trade_transaction(
     wst_tx: EthIbetWSTTx,
     tx_sender_account: TxSenderAccount,
+    tx_nonce: Nonce | None = None,
 ) -> tuple[str, Nonce]:
     """
     Send a transaction to reject a trade for the IbetWST.
@@ -483,6 +600,7 @@ async def reject_trade_transaction(
         ),
         tx_sender=tx_sender_account.address,
         tx_sender_key=tx_sender_account.private_key,
+        tx_nonce=tx_nonce,
     )
     return tx_hash, nonce
 
@@ -18,16 +18,17 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import asyncio
+import math
 import sys
 import time
 import uuid
 from asyncio import Event
 from datetime import UTC, datetime
-from typing import List, Optional, Sequence, Set
+from typing import List
 
 import uvloop
 from eth_keyfile import decode_keyfile_json
-from sqlalchemy import and_, select, update
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -47,6 +48,7 @@ from app.model.db import (
     TokenUpdateOperationCategory,
     TokenUpdateOperationLog,
 )
+from app.model.db.base import naive_utcnow
 from app.model.ibet import IbetShareContract, IbetStraightBondContract
 from app.model.ibet.tx_params.ibet_share import (
     UpdateParams as IbetShareUpdateParams,
@@ -58,13 +60,23 @@ from app.utils.e2ee_utils import E2EEUtils
 from app.utils.ibet_web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc
 from batch.utils import batch_log
+from batch.utils.lease import Lease
 from batch.utils.signal_handler import setup_signal_handler
-from config import SCHEDULED_EVENTS_INTERVAL, SCHEDULED_EVENTS_WORKER_COUNT
+from config import (
+    SCHEDULED_EVENTS_INTERVAL,
+    SCHEDULED_EVENTS_LEASE_DURATION,
+    SCHEDULED_EVENTS_WORKER_COUNT,
+)
 
 """
 [PROCESSOR-Scheduled-Events]
 
 Processor for scheduled token update events
+
+- Due events are claimed per issuer with a lease (claimed_by, lease_expires),
+  so that any number of processes can share them.
+- Workers wait until the next event is due instead of polling at every
+  SCHEDULED_EVENTS_INTERVAL.
 """
 
 process_name = "PROCESSOR-Scheduled-Events"
@@ -77,9 +89,14 @@ class Processor:
     def __init__(self, worker_num: int, is_shutdown: Event):
         self.worker_num = worker_num
         self.is_shutdown = is_shutdown
+        self.lease = Lease(
+            model=ScheduledEvents, duration=SCHEDULED_EVENTS_LEASE_DURATION
+        )
+        self.worker_id = self.lease.worker_id
 
     async def process(self):
         db_session: AsyncSession = BatchAsyncSessionLocal()
+        events_list: list[ScheduledEvents] = []
         try:
             process_start_time = datetime.now(UTC).replace(tzinfo=None)
             while not self.is_shutdown.is_set():
@@ -93,113 +110,160 @@ class Processor:
                     await self.__process(db_session=db_session, events_list=events_list)
                 except Exception as ex:
                     LOG.error(ex)
+                    await db_session.rollback()
                 finally:
-                    await self.__release_processing_issuer(
-                        events_list[0].issuer_address
-                    )
+                    await self.lease.release(db_session=db_session)
+                    await db_session.commit()
         finally:
             await db_session.close()
 
-    @staticmethod
     async def __get_events_of_one_issuer(
-        db_session: AsyncSession, filter_time: datetime
-    ):
-        async with lock:
-            event: Optional[ScheduledEvents] = (
+        self, db_session: AsyncSession, filter_time: datetime
+    ) -> list[ScheduledEvents]:
+        # NOTE:
+        # - Only one issuer can be processed in the same worker.
+        # - An issuer is processed by only one worker at a time, so that its events
+        #   are processed in order of scheduled_datetime.
+        # - Events are claimed with a lease (see batch.utils.lease).
+        now = naive_utcnow()
+        claimable = and_(
+            self.lease.claimable(now),
+            ScheduledEvents.scheduled_datetime <= filter_time,
+            ScheduledEvents.is_soft_deleted != True,
+        )
+
+        # Retrieve the issuer of the earliest due event
+        # NOTE: Issuers being claimed by other workers are skipped.
+        skipped_issuers: list[str] = []
+        while True:
+            issuer_address: str | None = (
                 await db_session.scalars(
-                    select(ScheduledEvents)
+                    select(ScheduledEvents.issuer_address)
                     .where(
                         and_(
-                            ScheduledEvents.status == 0,
-                            ScheduledEvents.scheduled_datetime <= filter_time,
-                            ScheduledEvents.issuer_address.notin_(processing_issuers),
-                            ScheduledEvents.is_soft_deleted != True,
+                            claimable,
+                            self.lease.issuer_not_leased(now),
+                            ScheduledEvents.issuer_address.notin_(skipped_issuers),
                         )
                     )
                     .order_by(ScheduledEvents.scheduled_datetime, ScheduledEvents.id)
                     .limit(1)
                 )
             ).first()
-            if event is None:
+            if issuer_address is None:
+                await db_session.rollback()
                 return []
-            issuer_address = event.issuer_address
-            processing_issuers.add(issuer_address)
+            if await self.lease.lock_issuer(
+                db_session=db_session, issuer_address=issuer_address, now=now
+            ):
+                break
+            skipped_issuers.append(issuer_address)
 
-        events_list: Sequence[ScheduledEvents] = (
-            await db_session.scalars(
-                select(ScheduledEvents)
-                .where(
+        # Retrieve all due events of the issuer
+        events_list: list[ScheduledEvents] = list(
+            (
+                await db_session.scalars(
+                    select(ScheduledEvents)
+                    .where(
+                        and_(
+                            claimable,
+                            ScheduledEvents.issuer_address == issuer_address,
+                        )
+                    )
+                    .order_by(ScheduledEvents.scheduled_datetime, ScheduledEvents.id)
+                    .with_for_update()
+                )
+            ).all()
+        )
+        if len(events_list) < 1:
+            await db_session.rollback()
+            return []
+
+        # Claim the events
+        await self.lease.claim(
+            db_session=db_session,
+            id_column=ScheduledEvents.id,
+            id_list=[_event.id for _event in events_list],
+            now=now,
+        )
+        return events_list
+
+    @staticmethod
+    async def get_next_due_datetime() -> datetime | None:
+        """Get the datetime of the next pending event that is not yet due"""
+        db_session: AsyncSession = BatchAsyncSessionLocal()
+        try:
+            return await db_session.scalar(
+                select(func.min(ScheduledEvents.scheduled_datetime)).where(
                     and_(
                         ScheduledEvents.status == 0,
-                        ScheduledEvents.scheduled_datetime <= filter_time,
-                        ScheduledEvents.issuer_address == issuer_address,
+                        ScheduledEvents.scheduled_datetime > naive_utcnow(),
                         ScheduledEvents.is_soft_deleted != True,
                     )
                 )
-                .order_by(ScheduledEvents.scheduled_datetime, ScheduledEvents.id)
             )
-        ).all()
-        return events_list
+        finally:
+            await db_session.close()
 
     @staticmethod
-    async def __release_processing_issuer(issuer_address: str):
-        async with lock:
-            processing_issuers.remove(issuer_address)
+    async def __get_private_key(
+        db_session: AsyncSession, issuer_address: str
+    ) -> tuple[bytes | None, int | None]:
+        """Get the issuer's private key
+
+        :return: (private key, error code)
+            - error code 0: issuer does not exist
+            - error code 1: could not get the private key
+        """
+        try:
+            _account: Account | None = (
+                await db_session.scalars(
+                    select(Account)
+                    .where(Account.issuer_address == issuer_address)
+                    .limit(1)
+                )
+            ).first()
+            if _account is None:
+                LOG.warning(f"Issuer does not exist: {issuer_address}")
+                return None, 0
+            keyfile_json = _account.keyfile
+            decrypt_password = E2EEUtils.decrypt(_account.eoa_password)
+            private_key = decode_keyfile_json(
+                raw_keyfile_json=keyfile_json,
+                password=decrypt_password.encode("utf-8"),
+            )
+            return private_key, None
+        except Exception:
+            LOG.exception(
+                f"Could not get the private key of the issuer: {issuer_address}"
+            )
+            return None, 1
 
     async def __process(
         self, db_session: AsyncSession, events_list: List[ScheduledEvents]
     ):
+        # Get issuer's private key
+        # NOTE: All events in the list belong to the same issuer,
+        #       so the key is decrypted only once per batch.
+        private_key, key_error_code = await self.__get_private_key(
+            db_session=db_session, issuer_address=events_list[0].issuer_address
+        )
+
         for _event in events_list:
             if self.is_shutdown.is_set():
                 return
 
             LOG.info(f"<{self.worker_num}> Process start: upload_id={_event.id}")
 
-            _upload_status = 1
-
-            # Get issuer's private key
-            try:
-                _account: Account | None = (
-                    await db_session.scalars(
-                        select(Account)
-                        .where(Account.issuer_address == _event.issuer_address)
-                        .limit(1)
-                    )
-                ).first()
-                if (
-                    _account is None
-                ):  # If issuer does not exist, update the status of the upload to ERROR
-                    LOG.warning(f"Issuer of the event_id:{_event.id} does not exist")
-                    await self.__sink_on_finish_event_process(
-                        db_session=db_session, record_id=_event.id, status=2
-                    )
-                    await self.__sink_on_error_notification(
-                        db_session=db_session,
-                        issuer_address=_event.issuer_address,
-                        code=0,
-                        scheduled_event_id=_event.event_id,
-                        token_type=_event.token_type,
-                        token_address=_event.token_address,
-                    )
-                    await db_session.commit()
-                    continue
-                keyfile_json = _account.keyfile
-                decrypt_password = E2EEUtils.decrypt(_account.eoa_password)
-                private_key = decode_keyfile_json(
-                    raw_keyfile_json=keyfile_json,
-                    password=decrypt_password.encode("utf-8"),
-                )
-            except Exception:
-                LOG.exception(
-                    f"Could not get the private key of the issuer of id:{_event.id}"
-                )
+            if private_key is None:
+                # If the private key cannot be obtained, update the status of the event to ERROR
                 await self.__sink_on_finish_event_process(
                     db_session=db_session, record_id=_event.id, status=2
                 )
                 await self.__sink_on_error_notification(
                     db_session=db_session,
                     issuer_address=_event.issuer_address,
-                    code=1,
+                    code=key_error_code,
                     scheduled_event_id=_event.event_id,
                     token_type=_event.token_type,
                     token_address=_event.token_address,
@@ -280,6 +344,7 @@ class Processor:
                     token_type=_event.token_type,
                     token_address=_event.token_address,
                 )
+            await self.lease.renew(db_session=db_session)
             await db_session.commit()
 
             LOG.info(f"<{self.worker_num}> Process end: upload_id={_event.id}")
@@ -291,7 +356,7 @@ class Processor:
         await db_session.execute(
             update(ScheduledEvents)
             .where(ScheduledEvents.id == record_id)
-            .values(status=status)
+            .values(status=status, lease_expires=None)
         )
 
     @staticmethod
@@ -335,12 +400,6 @@ class Processor:
         db_session.add(operation_log)
 
 
-# Lock object for exclusion control
-lock = asyncio.Lock()
-# Issuer being processed in workers
-processing_issuers: Set[str] = set()
-
-
 class Worker:
     def __init__(self, worker_num: int, is_shutdown: Event):
         processor = Processor(worker_num=worker_num, is_shutdown=is_shutdown)
@@ -350,8 +409,10 @@ class Worker:
     async def run(self):
         while not self.is_shutdown.is_set():
             started_at = time.time()
+            next_due_datetime = None
             try:
                 await self.processor.process()
+                next_due_datetime = await self.processor.get_next_due_datetime()
             except ServiceUnavailableError:
                 LOG.warning("An external service was unavailable")
             except SQLAlchemyError as sa_err:
@@ -359,9 +420,15 @@ class Worker:
                     f"A database error has occurred: code={sa_err.code}\n{sa_err}"
                 )
 
-            for _ in range(
-                max(0, int(SCHEDULED_EVENTS_INTERVAL - (time.time() - started_at)))
-            ):
+            # Wait until the next event is due
+            # NOTE: The wait time does not exceed SCHEDULED_EVENTS_INTERVAL.
+            wait_time = SCHEDULED_EVENTS_INTERVAL - (time.time() - started_at)
+            if next_due_datetime is not None:
+                wait_time = min(
+                    wait_time,
+                    (next_due_datetime - naive_utcnow()).total_seconds(),
+                )
+            for _ in range(max(0, math.ceil(wait_time))):
                 if self.is_shutdown.is_set():
                     break
                 await asyncio.sleep(1)
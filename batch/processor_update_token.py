@@ -40,6 +40,7 @@ from app.model.db import (
     UTXO,
     Account,
     IDXPosition,
+    IDXPositionSummary,
     Notification,
     NotificationType,
     Token,
@@ -201,6 +202,17 @@ class Processor:
                         _position.pending_transfer = 0
                         db_session.add(_position)
 
+                        # Insert initial position summary
+                        _position_summary = IDXPositionSummary()
+                        _position_summary.token_address = _update_token.token_address
+                        _position_summary.holder_count = 1 if _position.balance else 0
+                        _position_summary.total_balance = _position.balance or 0
+                        _position_summary.total_exchange_balance = 0
+                        _position_summary.total_exchange_commitment = 0
+                        _position_summary.total_pending_transfer = 0
+                        _position_summary.total_locked = 0
+                        db_session.add(_position_summary)
+
                         # Insert issuer's UTXO data
                         _token: Token = (
                             await db_session.scalars(
@@ -0,0 +1,162 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, and_, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.model.db.base import naive_utcnow
+
+
+class Lease:
+    """Claim pending rows of a table for a worker with a lease
+
+    Rows are claimed with a lease (claimed_by, lease_expires) so that
+    multiple processes can share them. Claims of the same issuer are
+    serialized with a transaction-level advisory lock (see lock_issuer).
+    If the lease expires (e.g. the process crashed), the rows can be claimed
+    by other workers.
+
+    The table must have `status` (0: pending), `issuer_address`,
+    `claimed_by` and `lease_expires` columns.
+    """
+
+    def __init__(self, model: Any, duration: int):
+        """
+        :param model: ORM model of the table
+        :param duration: lease duration (sec)
+        """
+        self.model = model
+        self.duration = duration
+        # NOTE: Unique across processes
+        self.worker_id: str = str(uuid.uuid4())
+        # NOTE: Whether this worker may hold claimed rows that need to be released
+        self.has_claims: bool = False
+
+    def claimable(self, now: datetime) -> ColumnElement[bool]:
+        """Condition for pending rows that are not leased"""
+        return and_(
+            self.model.status == 0,
+            or_(
+                self.model.lease_expires == None,
+                self.model.lease_expires < now,
+            ),
+        )
+
+    def issuer_not_leased(self, now: datetime) -> ColumnElement[bool]:
+        """Condition for rows whose issuer is not being processed by other workers"""
+        leased = aliased(self.model)
+        return ~exists().where(
+            and_(
+                leased.issuer_address == self.model.issuer_address,
+                leased.status == 0,
+                leased.lease_expires >= now,
+            )
+        )
+
+    async def lock_issuer(
+        self, db_session: AsyncSession, issuer_address: str, now: datetime
+    ) -> bool:
+        """Lock the issuer until the end of the transaction
+
+        Returns False if another worker is claiming the issuer's rows
+        or has already claimed them.
+        """
+        # NOTE: The two-key form does not collide with the single-key locks
+        #       taken by other processors (e.g. per tx sender).
+        is_locked = await db_session.scalar(
+            select(
+                func.pg_try_advisory_xact_lock(
+                    func.hashtext(self.model.__tablename__),
+                    func.hashtext(issuer_address),
+                )
+            )
+        )
+        if not is_locked:
+            return False
+
+        # NOTE: Check again under the lock, because another worker may have
+        #       committed its claim after the candidate was selected.
+        leased = aliased(self.model)
+        return not await db_session.scalar(
+            select(
+                exists().where(
+                    and_(
+                        leased.issuer_address == issuer_address,
+                        leased.status == 0,
+                        leased.lease_expires >= now,
+                    )
+                )
+            )
+        )
+
+    async def claim(
+        self,
+        db_session: AsyncSession,
+        id_column: Any,
+        id_list: Sequence[Any],
+        now: datetime,
+    ):
+        """Claim the rows and commit (the issuer lock is released)"""
+        await db_session.execute(
+            update(self.model)
+            .where(id_column.in_(id_list))
+            .values(
+                claimed_by=self.worker_id,
+                lease_expires=now + timedelta(seconds=self.duration),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        await db_session.commit()
+        self.has_claims = True
+
+    async def renew(self, db_session: AsyncSession):
+        """Extend the lease of the rows claimed by this worker"""
+        await db_session.execute(
+            update(self.model)
+            .where(
+                and_(
+                    self.model.claimed_by == self.worker_id,
+                    self.model.status == 0,
+                )
+            )
+            .values(lease_expires=naive_utcnow() + timedelta(seconds=self.duration))
+        )
+
+    async def release(self, db_session: AsyncSession):
+        """Release the rows claimed by this worker
+
+        Rows are released by claimed_by, so that rows claimed before
+        an error are released as well.
+        """
+        await db_session.execute(
+            update(self.model)
+            .where(
+                and_(
+                    self.model.claimed_by == self.worker_id,
+                    self.model.status == 0,
+                )
+            )
+            .values(claimed_by=None, lease_expires=None)
+        )
+        self.has_claims = False
@@ -33,6 +33,7 @@ fi
 
 if [[ $IBET_WST_FEATURE_ENABLED = 1 ]]; then
   PROC_LIST="${PROC_LIST} batch/indexer_eth_wst_trades.py"
+  PROC_LIST="${PROC_LIST} batch/indexer_eth_wst_balances.py"
 fi
 
 if [[ $BC_EXPLORER_ENABLED = 1 ]]; then
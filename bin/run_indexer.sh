@@ -37,6 +37,7 @@ fi
 
 if [[ $IBET_WST_FEATURE_ENABLED = 1 ]]; then
   python batch/indexer_eth_wst_trades.py &
+  python batch/indexer_eth_wst_balances.py &
 fi
 
 if [[ $BC_EXPLORER_ENABLED = 1 ]]; then
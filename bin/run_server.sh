@@ -36,6 +36,13 @@ function start () {
   # Use Shared Memory
   export SHARED_MEMORY_USE_LOCK=1
 
+  # Aggregate metrics across gunicorn workers
+  if [[ ${METRICS_ENABLED} == "1" ]]; then
+    export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/ibet_prime_metrics}
+    rm -rf ${PROMETHEUS_MULTIPROC_DIR}
+    mkdir -p ${PROMETHEUS_MULTIPROC_DIR}
+  fi
+
   # gunicorn parameters
   WORKER_COUNT=${WORKER_COUNT:-2}
   WORKER_TIMEOUT=${WORKER_TIMEOUT:-30}
@@ -43,7 +50,8 @@ function start () {
   WORKER_MAX_REQUESTS_JITTER=${WORKER_MAX_REQUESTS_JITTER:-200}
   KEEP_ALIVE=${KEEP_ALIVE:-2}
 
-  python run.py --worker-class server.AppUvicornWorker \
+  python run.py --config python:server \
+                --worker-class server.AppUvicornWorker \
                 --workers ${WORKER_COUNT} \
                 --bind :5000 \
                 --timeout ${WORKER_TIMEOUT} \
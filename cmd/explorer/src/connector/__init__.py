@@ -32,6 +32,11 @@ from app.model.schema import (
     TxDataListResponse,
 )
 
+# Maximum number of cached responses
+# NOTE: List pages are large, so fewer pages are kept than detail responses.
+LIST_CACHE_MAX_SIZE = 64
+DETAIL_CACHE_MAX_SIZE = 1024
+
 
 class ApiNotEnabledException(Exception):
     pass
@@ -42,7 +47,7 @@ async def health_check(url: str, session: ClientSession) -> None:
         await resp.json()
 
 
-@AsyncTTL(time_to_live=10, skip_args=1)
+@AsyncTTL(time_to_live=10, maxsize=1, skip_args=1)
 async def get_block_number(session: ClientSession, url: str) -> BlockNumberResponse:
     async with session.get(url=f"{url}/block_number") as resp:
         data = await resp.json()
@@ -53,13 +58,13 @@ def dict_factory(x: list[tuple[str, Any]]):
     return {k: v for (k, v) in x if v is not None}
 
 
-@AsyncTTL(time_to_live=3600, skip_args=1)
+@AsyncTTL(time_to_live=3600, maxsize=LIST_CACHE_MAX_SIZE, skip_args=1)
 async def list_block_data(
     session: ClientSession, url: str, query: ListBlockDataQuery
 ) -> BlockDataListResponse:
     async with session.get(
         url=f"{url}/blockchain_explorer/block_data",
-        params=query.model_dump_json(),
+        params=query.model_dump(mode="json", exclude_none=True),
     ) as resp:
         data = await resp.json()
         if resp.status == 404:
@@ -67,7 +72,7 @@ async def list_block_data(
         return BlockDataListResponse.model_validate(data)
 
 
-@AsyncTTL(time_to_live=3600, skip_args=1)
+@AsyncTTL(time_to_live=3600, maxsize=DETAIL_CACHE_MAX_SIZE, skip_args=1)
 async def get_block_data(
     session: ClientSession, url: str, block_number: int
 ) -> BlockDataDetail:
@@ -78,19 +83,19 @@ async def get_block_data(
         return BlockDataDetail.model_validate(data)
 
 
-@AsyncTTL(time_to_live=3600, skip_args=1)
+@AsyncTTL(time_to_live=3600, maxsize=LIST_CACHE_MAX_SIZE, skip_args=1)
 async def list_tx_data(
     session: ClientSession, url: str, query: ListTxDataQuery
 ) -> TxDataListResponse:
     async with session.get(
         url=f"{url}/blockchain_explorer/tx_data",
-        params=query.model_dump_json(),
+        params=query.model_dump(mode="json", exclude_none=True),
     ) as resp:
         data = await resp.json()
         return TxDataListResponse.model_validate(data)
 
 
-@AsyncTTL(time_to_live=3600, skip_args=1)
+@AsyncTTL(time_to_live=3600, maxsize=DETAIL_CACHE_MAX_SIZE, skip_args=1)
 async def get_tx_data(session: ClientSession, url: str, tx_hash: str) -> TxDataDetail:
     async with session.get(url=f"{url}/blockchain_explorer/tx_data/{tx_hash}") as resp:
         data = await resp.json()
@@ -27,6 +27,7 @@ from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from gui.consts import ID
 from gui.error import Error
 from gui.screen.base import TuiScreen
+from gui.widget.base import PagedDataTable
 from gui.widget.block_detail_view import BlockDetailView
 from gui.widget.block_list_table import BlockListTable
 from gui.widget.block_list_view import (
@@ -68,6 +69,7 @@ class BlockScreen(TuiScreen):
         self.base_url = self.tui.url
         self.refresh_rate = 5.0
         self.block_detail_header_widget = BlockDetailView(classes="column")
+        self.prefetch_tasks: set[asyncio.Task] = set()
 
     def compose(self) -> ComposeResult:
         yield Horizontal(
@@ -165,6 +167,27 @@ class BlockScreen(TuiScreen):
         self.add_class("menu")
         self.query(BlockListTable)[0].can_focus = False
 
+    async def on_paged_data_table_page_boundary(
+        self, event: PagedDataTable.PageBoundary
+    ) -> None:
+        """
+        Occurs when the cursor is moved beyond the first or last row of BlockListTable
+        """
+        event.stop()
+        event.prevent_default()
+        if self.tui.state.block_list_query is None:
+            return
+        query = self.shift_block_list_query(
+            self.tui.state.block_list_query, event.direction
+        )
+        if query is None:
+            return
+
+        self.tui.state.block_list_query = query
+        self.query_one(BlockListQueryPanel).block_list_query = query
+        # NOTE: Adjacent pages are prefetched, so the rows are usually replaced without waiting.
+        await self.fetch_block_list(select_row=0 if event.direction > 0 else -1)
+
     def reload_block(self) -> None:
         if (
             self.tui.state.current_block_number is None
@@ -230,12 +253,12 @@ class BlockScreen(TuiScreen):
 
                 self.tui.state.current_block_number = block_number
 
-    async def fetch_block_list(self) -> None:
+    async def fetch_block_list(self, select_row: int | None = None) -> None:
         if self.tui.state.current_block_number == 0:
             return
+        query = self.tui.state.block_list_query
         try:
             self.query_one(BlockListSummaryPanel).loading = True
-            await asyncio.sleep(5)
             async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
                 async with ClientSession(
                     connector=tcp_connector, timeout=ClientTimeout(30)
@@ -243,7 +266,7 @@ class BlockScreen(TuiScreen):
                     try:
                         block_data_list: BlockDataListResponse = (
                             await connector.list_block_data(
-                                session, self.base_url, self.tui.state.block_list_query
+                                session, self.base_url, query
                             )
                         )
                     except Exception as e:
@@ -251,13 +274,64 @@ class BlockScreen(TuiScreen):
                             self.emit_no_wait(Error(e, self))
                         return
                     self.query_one(BlockListTable).update_rows(
-                        block_data_list.block_data
+                        block_data_list.block_data, select_row=select_row
                     )
                     self.query_one(BlockListSummaryPanel).loaded_time = datetime.now()
-
         finally:
             self.query_one(BlockListSummaryPanel).loading = False
 
+        self.prefetch_block_list(query)
+
+    def prefetch_block_list(self, query: ListBlockDataQuery) -> None:
+        """Fetch the next and previous pages in the background to warm the cache"""
+        for pages in (1, -1):
+            adjacent_query = self.shift_block_list_query(query, pages)
+            if adjacent_query is None:
+                continue
+            task = asyncio.create_task(self._prefetch_block_list(adjacent_query))
+            # NOTE: Keep a reference so that the task is not garbage collected.
+            self.prefetch_tasks.add(task)
+            task.add_done_callback(self.prefetch_tasks.discard)
+
+    async def _prefetch_block_list(self, query: ListBlockDataQuery) -> None:
+        async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
+            async with ClientSession(
+                connector=tcp_connector, timeout=ClientTimeout(30)
+            ) as session:
+                try:
+                    await connector.list_block_data(session, self.base_url, query)
+                except Exception:
+                    # NOTE: The page is fetched again when it is displayed.
+                    pass
+
+    def shift_block_list_query(
+        self, query: ListBlockDataQuery, pages: int
+    ) -> ListBlockDataQuery | None:
+        """
+        Get the query of the page `pages` away from `query` in the display order.
+        Returns None if the page is out of the block range.
+        """
+        if query.from_block_number is None or query.to_block_number is None:
+            return None
+        latest_block_number = self.tui.state.current_block_number
+        if latest_block_number is None:
+            return None
+
+        width = query.to_block_number - query.from_block_number + 1
+        # NOTE: In descending order, the next page has older blocks.
+        offset = pages * width if query.sort_order == SortOrder.ASC else -pages * width
+        from_block_number = query.from_block_number + offset
+        to_block_number = query.to_block_number + offset
+        if to_block_number < 0 or from_block_number > latest_block_number:
+            return None
+
+        return query.model_copy(
+            update={
+                "from_block_number": max(from_block_number, 0),
+                "to_block_number": to_block_number,
+            }
+        )
+
     async def fetch_block_detail(self, block_number: int):
         async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
             async with ClientSession(
@@ -17,10 +17,13 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import asyncio
+
 import connector
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from gui.consts import ID
 from gui.screen.base import TuiScreen
+from gui.widget.base import PagedDataTable
 from gui.widget.block_list_table import BlockListTable
 from gui.widget.tx_detail_view import TxDetailView
 from gui.widget.tx_list_table import TxListTable
@@ -31,12 +34,23 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.widgets import DataTable, Footer, Label
 
+from app.model.schema import ListTxDataQuery
 from app.model.schema.bc_explorer import TxDataDetail
 
 
 class TransactionScreen(TuiScreen):
     BINDINGS = [Binding("q", "quit", "Close", priority=True)]
 
+    def __init__(
+        self, name: str | None = None, id: str | None = None, classes: str | None = None
+    ):
+        super().__init__(name=name, id=id, classes=classes)
+        # Keyset cursor (block_number, transaction_index) of each page shown.
+        # The last element is the cursor of the current page (None for the first page).
+        self.page_cursors: list[tuple[int, int] | None] = [None]
+        self.page_row_count = 0
+        self.prefetch_tasks: set[asyncio.Task] = set()
+
     def compose(self) -> ComposeResult:
         yield Horizontal(
             Vertical(
@@ -86,6 +100,28 @@ class TransactionScreen(TuiScreen):
                 )
                 self.query_one(TxDetailView).tx_detail = tx_detail
 
+    async def on_paged_data_table_page_boundary(
+        self, event: PagedDataTable.PageBoundary
+    ) -> None:
+        """
+        Occurs when the cursor is moved beyond the first or last row of TxListTable
+        """
+        event.stop()
+        event.prevent_default()
+        if event.direction > 0:
+            last_row = self.query_one(TxListTable).raw_data[-1:]
+            if self.page_row_count < self.tui.lot_size or len(last_row) == 0:
+                return  # Last page
+            self.page_cursors.append(
+                (last_row[0].block_number, last_row[0].transaction_index)
+            )
+            await self.fetch_tx_list(select_row=0)
+        else:
+            if len(self.page_cursors) == 1:
+                return  # First page
+            self.page_cursors.pop()
+            await self.fetch_tx_list(select_row=-1)
+
     async def on_screen_suspend(self):
         """
         Occurs when Self is suspended
@@ -97,19 +133,61 @@ class TransactionScreen(TuiScreen):
         Occurs when Self is resumed
         """
         if self.tui.state.tx_list_query is not None:
-            async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
-                async with ClientSession(
-                    connector=tcp_connector, timeout=ClientTimeout(30)
-                ) as session:
-                    tx_list = await connector.list_tx_data(
-                        session=session,
-                        url=self.tui.url,
-                        query=self.tui.state.tx_list_query,
-                    )
-                    self.query_one(TxListTable).update_rows(tx_list.tx_data)
-                    self.query_one(f"#{ID.TX_SELECTED_BLOCK_NUMBER}", Label).update(
-                        f"Selected block: {self.tui.state.tx_list_query.block_number}"
-                    )
+            self.page_cursors = [None]
+            await self.fetch_tx_list()
+            self.query_one(f"#{ID.TX_SELECTED_BLOCK_NUMBER}", Label).update(
+                f"Selected block: {self.tui.state.tx_list_query.block_number}"
+            )
+
+    ##################################################
+    # Fetch data
+    ##################################################
+
+    def page_query(self, cursor: tuple[int, int] | None) -> ListTxDataQuery:
+        """Get the keyset pagination query of the page starting after `cursor`"""
+        return self.tui.state.tx_list_query.model_copy(
+            update={
+                "limit": self.tui.lot_size,
+                "cursor_block_number": cursor[0] if cursor is not None else None,
+                "cursor_transaction_index": cursor[1] if cursor is not None else None,
+            }
+        )
+
+    async def fetch_tx_list(self, select_row: int | None = None) -> None:
+        async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
+            async with ClientSession(
+                connector=tcp_connector, timeout=ClientTimeout(30)
+            ) as session:
+                # NOTE: `session` is passed positionally so that it is excluded from the cache key.
+                tx_list = await connector.list_tx_data(
+                    session, self.tui.url, self.page_query(self.page_cursors[-1])
+                )
+        self.page_row_count = len(tx_list.tx_data)
+        self.query_one(TxListTable).update_rows(tx_list.tx_data, select_row=select_row)
+
+        # Prefetch the next page in the background
+        # NOTE: The previous page has already been fetched and cached.
+        if self.page_row_count == self.tui.lot_size:
+            last_row = tx_list.tx_data[-1]
+            task = asyncio.create_task(
+                self._prefetch_tx_list(
+                    self.page_query((last_row.block_number, last_row.transaction_index))
+                )
+            )
+            # NOTE: Keep a reference so that the task is not garbage collected.
+            self.prefetch_tasks.add(task)
+            task.add_done_callback(self.prefetch_tasks.discard)
+
+    async def _prefetch_tx_list(self, query: ListTxDataQuery) -> None:
+        async with TCPConnector(limit=1, keepalive_timeout=0) as tcp_connector:
+            async with ClientSession(
+                connector=tcp_connector, timeout=ClientTimeout(30)
+            ) as session:
+                try:
+                    await connector.list_tx_data(session, self.tui.url, query)
+                except Exception:
+                    # NOTE: The page is fetched again when it is displayed.
+                    pass
 
     ##################################################
     # Key binding
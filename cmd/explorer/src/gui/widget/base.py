@@ -19,8 +19,9 @@ SPDX-License-Identifier: Apache-2.0
 
 from typing import TYPE_CHECKING, cast
 
+from textual.message import Message
 from textual.widget import Widget
-from textual.widgets import Static
+from textual.widgets import DataTable, Static
 
 if TYPE_CHECKING:
     from gui.explorer import ExplorerApp
@@ -36,3 +37,32 @@ class TuiStatic(Static):
     @property
     def tui(self) -> "ExplorerApp":
         return cast("ExplorerApp", self.app)
+
+
+class PagedDataTable(DataTable):
+    """DataTable which holds a single page of a long result set
+
+    Only the current page is materialized as rows.
+    When the cursor is moved beyond the first or last row, `PageBoundary` is posted
+    so that the screen can replace the rows with the adjacent page.
+    """
+
+    class PageBoundary(Message):
+        """Posted when the cursor is moved beyond the first or last row"""
+
+        def __init__(self, direction: int) -> None:
+            # 1: Beyond the last row, -1: Beyond the first row
+            self.direction = direction
+            super().__init__()
+
+    def action_cursor_down(self) -> None:
+        if self.row_count > 0 and self.cursor_row >= self.row_count - 1:
+            self.post_message(self.PageBoundary(direction=1))
+            return
+        super().action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        if self.row_count > 0 and self.cursor_row <= 0:
+            self.post_message(self.PageBoundary(direction=-1))
+            return
+        super().action_cursor_up()
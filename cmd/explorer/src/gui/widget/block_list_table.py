@@ -20,17 +20,17 @@ SPDX-License-Identifier: Apache-2.0
 import time
 from typing import Iterable
 
+from gui.widget.base import PagedDataTable
 from rich.progress_bar import ProgressBar
 from textual.binding import Binding
 from textual.coordinate import Coordinate
 from textual.reactive import reactive
-from textual.widgets import DataTable
 from utils.time import human_time
 
 from app.model.schema.bc_explorer import BlockData
 
 
-class BlockListTable(DataTable):
+class BlockListTable(PagedDataTable):
     BINDINGS = [
         Binding("ctrl+n", "cursor_down", "Down", show=False),
         Binding("ctrl+p", "cursor_up", "Up", show=False),
@@ -59,10 +59,16 @@ class BlockListTable(DataTable):
         self.update_rows(self.raw_data)
         return self.only_include_tx
 
-    def update_rows(self, data: Iterable[BlockData]):
+    def update_rows(self, data: Iterable[BlockData], select_row: int | None = None):
+        """
+        Replace rows with data
+        - If `select_row` is specified, the cursor is moved to the row
+          (negative value counts from the last row).
+          Otherwise, the currently selected block is kept selected.
+        """
         self.raw_data = data
         selected_row = self.cursor_row
-        if len(self._data) > 0:
+        if len(self._data) > 0 and select_row is None:
             selected_block_number = list(self._data.keys())[selected_row]
         else:
             selected_block_number = None
@@ -83,10 +89,15 @@ class BlockListTable(DataTable):
         ]
         if self.only_include_tx:
             rows = list(filter(lambda r: r[2] != "0", rows))
-        self.add_rows(rows)
+        for row in rows:
+            self.add_row(*row, key=row[0])
 
         # Keep current selected position
-        if selected_block_number is not None:
+        if select_row is not None and len(rows) > 0:
+            row_to_be_selected = select_row % len(rows)
+            self.cursor_cell = Coordinate(row_to_be_selected, 0)
+            self.hover_cell = Coordinate(row_to_be_selected, 0)
+        elif selected_block_number is not None:
             row_to_be_selected = next(
                 (i for i, row in enumerate(rows) if row[0] == selected_block_number),
                 len(rows) - 1 if len(rows) > 0 else 0,
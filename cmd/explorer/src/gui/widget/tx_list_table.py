@@ -19,14 +19,15 @@ SPDX-License-Identifier: Apache-2.0
 
 from typing import Iterable
 
+from gui.widget.base import PagedDataTable
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
-from textual.widgets import DataTable
 
 from app.model.schema.bc_explorer import TxData
 
 
-class TxListTable(DataTable):
+class TxListTable(PagedDataTable):
     BINDINGS = [
         Binding("ctrl+n", "cursor_down", "Down", show=False),
         Binding("ctrl+p", "cursor_up", "Up", show=False),
@@ -47,11 +48,21 @@ class TxListTable(DataTable):
         """
         self.add_columns(*self.column_labels)
 
-    def update_rows(self, data: Iterable[TxData]):
+    def update_rows(self, data: Iterable[TxData], select_row: int | None = None):
+        """
+        Replace rows with data
+        - If `select_row` is specified, the cursor is moved to the row
+          (negative value counts from the last row).
+        """
+        self.raw_data = data
         if self.complete_refresh:
             self.clear()
         rows = [[d.hash, str(d.block_number)] for d in data]
         self.add_rows(rows)
+        if select_row is not None and len(rows) > 0:
+            self.cursor_cell = Coordinate(select_row % len(rows), 0)
+            self.hover_cell = Coordinate(select_row % len(rows), 0)
+            self._scroll_cursor_into_view(animate=False)
         self.refresh()
 
     def action_select_cursor(self) -> None:
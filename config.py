@@ -72,6 +72,19 @@ RUN_MODE = os.environ.get("RUN_MODE")
 # Profiling mode
 PROFILING_MODE = True if os.environ.get("PROFILING_MODE") == "1" else False
 
+# Metrics
+# - Disabled unless explicitly enabled with "1"
+#   NOTE: "/metrics" is not authenticated. Do not expose it outside the internal network.
+METRICS_ENABLED = True if os.environ.get("METRICS_ENABLED") == "1" else False
+# - Directory where batch processes write their metrics in the Prometheus textfile format
+METRICS_BATCH_TEXTFILE_DIR = os.environ.get("METRICS_BATCH_TEXTFILE_DIR")
+# - Interval (sec) at which batch processes write their metrics
+METRICS_BATCH_WRITE_INTERVAL = (
+    int(os.environ.get("METRICS_BATCH_WRITE_INTERVAL"))
+    if os.environ.get("METRICS_BATCH_WRITE_INTERVAL")
+    else 15
+)
+
 ####################################################
 # Server settings
 ####################################################
@@ -98,6 +111,20 @@ LOG_LEVEL = CONFIG["logging"]["level"]
 AUTH_LOGFILE = os.environ.get("AUTH_LOGFILE") or "/dev/stdout"
 ACCESS_LOGFILE = os.environ.get("ACCESS_LOGFILE") or "/dev/stdout"
 
+# Cache backend
+# - "lru": In-process LRU cache
+# - "shared_memory": Shared memory cache between API worker processes
+# - "redis": Redis-compatible cache server shared between API and batch processes
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND") or "lru"
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL") or "redis://localhost:6379/0"
+CACHE_KEY_PREFIX = os.environ.get("CACHE_KEY_PREFIX") or "ibet-prime"
+# Maximum number of entries per namespace (lru, shared_memory)
+CACHE_MAX_ENTRIES = (
+    int(os.environ.get("CACHE_MAX_ENTRIES"))
+    if os.environ.get("CACHE_MAX_ENTRIES")
+    else 10000
+)
+
 
 ####################################################
 # Blockchain monitoring settings (ibet network)
@@ -188,6 +215,27 @@ TOKEN_CACHE_TTL_JITTER = (
     if os.environ.get("TOKEN_CACHE_TTL_JITTER")
     else 21600
 )
+# - Seconds before expiration at which INDEXER-Token-Cache refreshes the cache
+TOKEN_CACHE_REFRESH_MARGIN = (
+    int(os.environ.get("TOKEN_CACHE_REFRESH_MARGIN"))
+    if os.environ.get("TOKEN_CACHE_REFRESH_MARGIN")
+    else 600
+)
+# - Maximum number of tokens refreshed concurrently by INDEXER-Token-Cache
+TOKEN_CACHE_REFRESH_MAX_CONCURRENCY = (
+    int(os.environ.get("TOKEN_CACHE_REFRESH_MAX_CONCURRENCY"))
+    if os.environ.get("TOKEN_CACHE_REFRESH_MAX_CONCURRENCY")
+    else 5
+)
+
+# Ledger
+# - Maximum number of concurrent calls to the PersonalInfo contract
+#   when retrieving the latest personal information
+LEDGER_PERSONAL_INFO_MAX_CONCURRENCY = (
+    int(os.environ.get("LEDGER_PERSONAL_INFO_MAX_CONCURRENCY"))
+    if os.environ.get("LEDGER_PERSONAL_INFO_MAX_CONCURRENCY")
+    else 10
+)
 
 ####################################################
 # Batch settings
@@ -202,6 +250,28 @@ INDEXER_BLOCK_LOT_MAX_SIZE = (
     if os.environ.get("INDEXER_BLOCK_LOT_MAX_SIZE")
     else 1000000
 )
+# - Target number of event logs per eth_getLogs request
+#   NOTE: The block range of each request is adjusted for each contract event
+#         so that the number of logs stays around this value.
+INDEXER_EVENT_LOG_TARGET_COUNT = (
+    int(os.environ.get("INDEXER_EVENT_LOG_TARGET_COUNT"))
+    if os.environ.get("INDEXER_EVENT_LOG_TARGET_COUNT")
+    else 5000
+)
+# - Number of blocks stored in each block_data/tx_data range partition
+INDEXER_BLOCK_TX_DATA_PARTITION_SIZE = (
+    int(os.environ.get("INDEXER_BLOCK_TX_DATA_PARTITION_SIZE"))
+    if os.environ.get("INDEXER_BLOCK_TX_DATA_PARTITION_SIZE")
+    else 1000000
+)
+# - Number of most recent blocks to retain in block_data/tx_data
+#   NOTE: Partitions that fall entirely outside this range are dropped.
+#         0 means all blocks are retained.
+INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS = (
+    int(os.environ.get("INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS"))
+    if os.environ.get("INDEXER_BLOCK_TX_DATA_RETENTION_BLOCKS")
+    else 0
+)
 
 # =============================
 # Processor
@@ -230,6 +300,13 @@ BULK_TRANSFER_WORKER_LOT_SIZE = (
     if os.environ.get("BULK_TRANSFER_WORKER_LOT_SIZE")
     else 5
 )
+# - Lease duration (sec) of claimed uploads
+#   NOTE: Uploads whose lease has expired can be claimed by other workers.
+BULK_TRANSFER_LEASE_DURATION = (
+    int(os.environ.get("BULK_TRANSFER_LEASE_DURATION"))
+    if os.environ.get("BULK_TRANSFER_LEASE_DURATION")
+    else 300
+)
 
 # Batch Register Personal Info
 BATCH_REGISTER_PERSONAL_INFO_INTERVAL = (
@@ -259,6 +336,13 @@ SCHEDULED_EVENTS_WORKER_COUNT = (
     if os.environ.get("SCHEDULED_EVENTS_WORKER_COUNT")
     else 5
 )
+# - Lease duration (sec) of claimed events
+#   NOTE: Events whose lease has expired can be claimed by other workers.
+SCHEDULED_EVENTS_LEASE_DURATION = (
+    int(os.environ.get("SCHEDULED_EVENTS_LEASE_DURATION"))
+    if os.environ.get("SCHEDULED_EVENTS_LEASE_DURATION")
+    else 300
+)
 
 # Update Token
 UPDATE_TOKEN_INTERVAL = (
@@ -267,17 +351,35 @@ UPDATE_TOKEN_INTERVAL = (
     else 10
 )
 
+# Create Ledger
+# - Maximum number of ledger creation requests processed concurrently
+CREATE_LEDGER_MAX_CONCURRENCY = (
+    int(os.environ.get("CREATE_LEDGER_MAX_CONCURRENCY"))
+    if os.environ.get("CREATE_LEDGER_MAX_CONCURRENCY")
+    else 5
+)
+
 # Create UTXO
 CREATE_UTXO_INTERVAL = (
     int(os.environ.get("CREATE_UTXO_INTERVAL"))
     if os.environ.get("CREATE_UTXO_INTERVAL")
-    else 600
+    else 60
 )
 CREATE_UTXO_BLOCK_LOT_MAX_SIZE = (
     int(os.environ.get("CREATE_UTXO_BLOCK_LOT_MAX_SIZE"))
     if os.environ.get("CREATE_UTXO_BLOCK_LOT_MAX_SIZE")
     else 10000
 )
+CREATE_UTXO_MAX_CONCURRENCY = (
+    int(os.environ.get("CREATE_UTXO_MAX_CONCURRENCY"))
+    if os.environ.get("CREATE_UTXO_MAX_CONCURRENCY")
+    else 10
+)
+CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL = (
+    int(os.environ.get("CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL"))
+    if os.environ.get("CREATE_UTXO_EXCHANGE_ADDRESS_CACHE_TTL")
+    else 600
+)
 
 # Rotate E2E Messaging RSA Key
 ROTATE_E2E_MESSAGING_RSA_KEY_INTERVAL = (
@@ -376,6 +478,12 @@ DEDICATED_DVP_AGENT_ID = os.environ.get("DEDICATED_DVP_AGENT_ID")
 # Settings for the "BlockchainExplorer"
 ####################################################
 BC_EXPLORER_ENABLED = True if os.environ.get("BC_EXPLORER_ENABLED") == "1" else False
+# Maximum number of rendered block/tx data responses cached in each API process
+BC_EXPLORER_RESPONSE_CACHE_MAX_ENTRIES = (
+    int(os.environ.get("BC_EXPLORER_RESPONSE_CACHE_MAX_ENTRIES"))
+    if os.environ.get("BC_EXPLORER_RESPONSE_CACHE_MAX_ENTRIES")
+    else 10000
+)
 
 
 ####################################################
@@ -418,6 +526,30 @@ IBET_WST_BRIDGE_BLOCK_LOT_MAX_SIZE = (
     if os.environ.get("IBET_WST_BRIDGE_BLOCK_LOT_MAX_SIZE")
     else 10000
 )
+# - Maximum number of IbetWST tokens processed concurrently
+IBET_WST_BRIDGE_MAX_CONCURRENCY = (
+    int(os.environ.get("IBET_WST_BRIDGE_MAX_CONCURRENCY"))
+    if os.environ.get("IBET_WST_BRIDGE_MAX_CONCURRENCY")
+    else 10
+)
+
+# IbetWST Send Transaction
+# - Maximum number of transaction senders processed concurrently
+#   Each sender holds one DB connection, so keep this below the batch
+#   connection pool size (pool_size 5 + max_overflow 10).
+IBET_WST_SEND_TX_MAX_CONCURRENCY = (
+    int(os.environ.get("IBET_WST_SEND_TX_MAX_CONCURRENCY"))
+    if os.environ.get("IBET_WST_SEND_TX_MAX_CONCURRENCY")
+    else 10
+)
+
+# IbetWST Signing
+# - Maximum number of workers used to sign authorizations in a batch
+IBET_WST_SIGN_MAX_WORKERS = (
+    int(os.environ.get("IBET_WST_SIGN_MAX_WORKERS"))
+    if os.environ.get("IBET_WST_SIGN_MAX_WORKERS")
+    else 4
+)
 
 ######################################################
 # O11y Settings
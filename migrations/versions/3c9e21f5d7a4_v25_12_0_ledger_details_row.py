@@ -0,0 +1,119 @@
+"""v25_12_0_ledger_details_row
+
+Revision ID: 3c9e21f5d7a4
+Revises: 694187491837
+Create Date: 2026-10-19 13:41:07.215384
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "3c9e21f5d7a4"
+down_revision = "694187491837"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ledger_details_row",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("ledger_id", sa.Integer(), nullable=False),
+        sa.Column("detail_index", sa.Integer(), nullable=False),
+        sa.Column("account_address", sa.String(length=42), nullable=True),
+        sa.Column("name", sa.String(length=200), nullable=True),
+        sa.Column("address", sa.String(length=200), nullable=True),
+        sa.Column("amount", sa.BigInteger(), nullable=True),
+        sa.Column("price", sa.BigInteger(), nullable=True),
+        sa.Column("balance", sa.BigInteger(), nullable=True),
+        sa.Column("acquisition_date", sa.String(length=10), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "ledger_details_row_ledger_detail",
+        "ledger_details_row",
+        ["ledger_id", "detail_index", "id"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    # NOTE: Write the rows back into Ledger.ledger["details"][*]["data"] before dropping the table,
+    #       because the previous version reads the details data from the JSON.
+    schema = get_db_schema()
+    ledger_table = sa.table(
+        "ledger",
+        sa.column("id", sa.Integer),
+        sa.column("ledger", sa.JSON),
+        schema=schema,
+    )
+    row_table = sa.table(
+        "ledger_details_row",
+        sa.column("id", sa.BigInteger),
+        sa.column("ledger_id", sa.Integer),
+        sa.column("detail_index", sa.Integer),
+        sa.column("account_address", sa.String),
+        sa.column("name", sa.String),
+        sa.column("address", sa.String),
+        sa.column("amount", sa.BigInteger),
+        sa.column("price", sa.BigInteger),
+        sa.column("balance", sa.BigInteger),
+        sa.column("acquisition_date", sa.String),
+        schema=schema,
+    )
+
+    connection = op.get_bind()
+    ledger_id_list = (
+        connection.execute(sa.select(ledger_table.c.id).order_by(ledger_table.c.id))
+        .scalars()
+        .all()
+    )
+    for ledger_id in ledger_id_list:
+        ledger = connection.execute(
+            sa.select(ledger_table.c.ledger).where(ledger_table.c.id == ledger_id)
+        ).scalar_one()
+        if all("data" in details for details in ledger["details"]):
+            continue
+        for detail_index, details in enumerate(ledger["details"]):
+            if "data" in details:
+                continue
+            rows = connection.execute(
+                sa.select(
+                    row_table.c.account_address,
+                    row_table.c.name,
+                    row_table.c.address,
+                    row_table.c.amount,
+                    row_table.c.price,
+                    row_table.c.balance,
+                    row_table.c.acquisition_date,
+                )
+                .where(
+                    sa.and_(
+                        row_table.c.ledger_id == ledger_id,
+                        row_table.c.detail_index == detail_index,
+                    )
+                )
+                .order_by(row_table.c.id)
+            ).mappings()
+            details["data"] = [dict(row) for row in rows]
+        connection.execute(
+            sa.update(ledger_table)
+            .where(ledger_table.c.id == ledger_id)
+            .values(ledger=ledger)
+        )
+
+    op.drop_index(
+        "ledger_details_row_ledger_detail",
+        table_name="ledger_details_row",
+        schema=get_db_schema(),
+    )
+    op.drop_table("ledger_details_row", schema=get_db_schema())
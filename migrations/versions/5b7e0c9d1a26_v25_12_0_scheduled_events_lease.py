@@ -0,0 +1,49 @@
+"""v25_12_0_scheduled_events_lease
+
+Revision ID: 5b7e0c9d1a26
+Revises: 8f1d6b2a4c37
+Create Date: 2026-10-19 16:21:08.274519
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "5b7e0c9d1a26"
+down_revision = "8f1d6b2a4c37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "scheduled_events",
+        sa.Column("claimed_by", sa.String(length=36), nullable=True),
+        schema=get_db_schema(),
+    )
+    op.add_column(
+        "scheduled_events",
+        sa.Column("lease_expires", sa.DateTime(), nullable=True),
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "scheduled_events_status_datetime",
+        "scheduled_events",
+        ["status", "scheduled_datetime"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "scheduled_events_status_datetime",
+        table_name="scheduled_events",
+        schema=get_db_schema(),
+    )
+    op.drop_column("scheduled_events", "lease_expires", schema=get_db_schema())
+    op.drop_column("scheduled_events", "claimed_by", schema=get_db_schema())
@@ -0,0 +1,35 @@
+"""v25_12_0_utxo_token_block_number
+
+Revision ID: 694187491837
+Revises: 2057c79e5849
+Create Date: 2026-10-19 10:12:31.482913
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "694187491837"
+down_revision = "2057c79e5849"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "utxo_token_block_number",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("latest_block_number", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address"),
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    op.drop_table("utxo_token_block_number", schema=get_db_schema())
@@ -0,0 +1,100 @@
+"""v25_12_0_idx_position_summary
+
+Revision ID: 7a3f2c8e9b14
+Revises: d4a81f6e2b95
+Create Date: 2026-10-19 19:12:37.518204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "7a3f2c8e9b14"
+down_revision = "d4a81f6e2b95"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "idx_position_summary",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("holder_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_balance", sa.BigInteger(), nullable=False),
+        sa.Column("total_exchange_balance", sa.BigInteger(), nullable=False),
+        sa.Column("total_exchange_commitment", sa.BigInteger(), nullable=False),
+        sa.Column("total_pending_transfer", sa.BigInteger(), nullable=False),
+        sa.Column("total_locked", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address"),
+        schema=get_db_schema(),
+    )
+
+    # Backfill the summary from the existing positions
+    schema = f"{get_db_schema()}." if get_db_schema() else ""
+    op.execute(
+        f"""
+        INSERT INTO {schema}idx_position_summary (
+            token_address,
+            holder_count,
+            total_balance,
+            total_exchange_balance,
+            total_exchange_commitment,
+            total_pending_transfer,
+            total_locked,
+            created,
+            modified
+        )
+        SELECT
+            t.token_address,
+            COALESCE(p.holder_count, 0),
+            COALESCE(p.total_balance, 0),
+            COALESCE(p.total_exchange_balance, 0),
+            COALESCE(p.total_exchange_commitment, 0),
+            COALESCE(p.total_pending_transfer, 0),
+            COALESCE(l.total_locked, 0),
+            NOW() AT TIME ZONE 'UTC',
+            NOW() AT TIME ZONE 'UTC'
+        FROM (
+            SELECT token_address FROM {schema}idx_position
+            UNION
+            SELECT token_address FROM {schema}idx_locked_position
+        ) t
+        LEFT JOIN (
+            SELECT
+                pos.token_address,
+                COUNT(*) FILTER (
+                    WHERE pos.balance <> 0
+                    OR pos.exchange_balance <> 0
+                    OR pos.pending_transfer <> 0
+                    OR pos.exchange_commitment <> 0
+                    OR EXISTS (
+                        SELECT 1 FROM {schema}idx_locked_position lp
+                        WHERE lp.token_address = pos.token_address
+                        AND lp.account_address = pos.account_address
+                        AND lp.value <> 0
+                    )
+                ) AS holder_count,
+                SUM(COALESCE(pos.balance, 0)) AS total_balance,
+                SUM(COALESCE(pos.exchange_balance, 0)) AS total_exchange_balance,
+                SUM(COALESCE(pos.exchange_commitment, 0)) AS total_exchange_commitment,
+                SUM(COALESCE(pos.pending_transfer, 0)) AS total_pending_transfer
+            FROM {schema}idx_position pos
+            GROUP BY pos.token_address
+        ) p ON p.token_address = t.token_address
+        LEFT JOIN (
+            SELECT token_address, SUM(value) AS total_locked
+            FROM {schema}idx_locked_position
+            GROUP BY token_address
+        ) l ON l.token_address = t.token_address
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("idx_position_summary", schema=get_db_schema())
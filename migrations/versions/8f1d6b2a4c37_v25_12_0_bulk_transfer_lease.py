@@ -0,0 +1,37 @@
+"""v25_12_0_bulk_transfer_lease
+
+Revision ID: 8f1d6b2a4c37
+Revises: 3c9e21f5d7a4
+Create Date: 2026-10-19 15:02:44.630118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "8f1d6b2a4c37"
+down_revision = "3c9e21f5d7a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "bulk_transfer_upload",
+        sa.Column("claimed_by", sa.String(length=36), nullable=True),
+        schema=get_db_schema(),
+    )
+    op.add_column(
+        "bulk_transfer_upload",
+        sa.Column("lease_expires", sa.DateTime(), nullable=True),
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    op.drop_column("bulk_transfer_upload", "lease_expires", schema=get_db_schema())
+    op.drop_column("bulk_transfer_upload", "claimed_by", schema=get_db_schema())
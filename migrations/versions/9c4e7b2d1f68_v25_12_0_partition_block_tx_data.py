@@ -0,0 +1,244 @@
+"""v25_12_0_partition_block_tx_data
+
+Revision ID: 9c4e7b2d1f68
+Revises: e5c8a1d3f7b2
+Create Date: 2026-10-19 21:14:08.376512
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+from config import INDEXER_BLOCK_TX_DATA_PARTITION_SIZE
+
+# revision identifiers, used by Alembic.
+revision = "9c4e7b2d1f68"
+down_revision = "e5c8a1d3f7b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema = f"{get_db_schema()}." if get_db_schema() else ""
+
+    # block_data
+    op.rename_table("block_data", "block_data_legacy", schema=get_db_schema())
+    op.execute(f"ALTER INDEX {schema}block_data_pkey RENAME TO block_data_legacy_pkey")
+    op.execute(
+        f"ALTER INDEX {schema}ix_block_data_hash RENAME TO ix_block_data_legacy_hash"
+    )
+    op.drop_index(
+        "ix_block_data_timestamp",
+        table_name="block_data_legacy",
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "block_data",
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.Column("number", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("parent_hash", sa.String(length=66), nullable=False),
+        sa.Column("sha3_uncles", sa.String(length=66), nullable=True),
+        sa.Column("miner", sa.String(length=42), nullable=True),
+        sa.Column("state_root", sa.String(length=66), nullable=True),
+        sa.Column("transactions_root", sa.String(length=66), nullable=True),
+        sa.Column("receipts_root", sa.String(length=66), nullable=True),
+        sa.Column("logs_bloom", sa.String(length=514), nullable=True),
+        sa.Column("difficulty", sa.BigInteger(), nullable=True),
+        sa.Column("gas_limit", sa.Integer(), nullable=True),
+        sa.Column("gas_used", sa.Integer(), nullable=True),
+        sa.Column("timestamp", sa.Integer(), nullable=False),
+        sa.Column("proof_of_authority_data", sa.Text(), nullable=True),
+        sa.Column("mix_hash", sa.String(length=66), nullable=True),
+        sa.Column("nonce", sa.String(length=18), nullable=True),
+        sa.Column("hash", sa.String(length=66), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=True),
+        sa.Column("transactions", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("number"),
+        schema=get_db_schema(),
+        postgresql_partition_by="RANGE (number)",
+    )
+    op.create_index(
+        "ix_block_data_hash",
+        "block_data",
+        ["hash"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "block_data_timestamp_brin",
+        "block_data",
+        ["timestamp"],
+        unique=False,
+        schema=get_db_schema(),
+        postgresql_using="brin",
+    )
+    _attach_legacy_table("block_data", "number")
+
+    # tx_data
+    op.rename_table("tx_data", "tx_data_legacy", schema=get_db_schema())
+    op.execute(f"ALTER INDEX {schema}tx_data_pkey RENAME TO tx_data_legacy_pkey")
+    op.execute(
+        f"ALTER INDEX {schema}ix_tx_data_from_address "
+        f"RENAME TO ix_tx_data_legacy_from_address"
+    )
+    op.execute(
+        f"ALTER INDEX {schema}ix_tx_data_to_address "
+        f"RENAME TO ix_tx_data_legacy_to_address"
+    )
+    op.drop_index(
+        "ix_tx_data_block_number",
+        table_name="tx_data_legacy",
+        schema=get_db_schema(),
+    )
+    op.alter_column(
+        "tx_data_legacy",
+        "block_number",
+        existing_type=sa.BigInteger(),
+        nullable=False,
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "tx_data",
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.Column("hash", sa.String(length=66), nullable=False),
+        sa.Column("block_hash", sa.String(length=66), nullable=True),
+        sa.Column("block_number", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("transaction_index", sa.Integer(), nullable=True),
+        sa.Column("from_address", sa.String(length=42), nullable=True),
+        sa.Column("to_address", sa.String(length=42), nullable=True),
+        sa.Column("input", sa.Text(), nullable=True),
+        sa.Column("gas", sa.Integer(), nullable=True),
+        sa.Column("gas_price", sa.BigInteger(), nullable=True),
+        sa.Column("value", sa.BigInteger(), nullable=True),
+        sa.Column("nonce", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("hash", "block_number"),
+        schema=get_db_schema(),
+        postgresql_partition_by="RANGE (block_number)",
+    )
+    op.create_index(
+        "tx_data_block_number_transaction_index",
+        "tx_data",
+        ["block_number", "transaction_index"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "ix_tx_data_from_address",
+        "tx_data",
+        ["from_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "ix_tx_data_to_address",
+        "tx_data",
+        ["to_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    # NOTE: The primary key of the partitioned table includes the partition key,
+    #       so the legacy primary key is replaced when the table is attached.
+    op.execute(
+        f"ALTER TABLE {schema}tx_data_legacy DROP CONSTRAINT tx_data_legacy_pkey"
+    )
+    _attach_legacy_table("tx_data", "block_number")
+
+
+def _attach_legacy_table(table_name: str, partition_key: str):
+    """Attach existing rows as the first partition, then create the default partition"""
+    schema = f"{get_db_schema()}." if get_db_schema() else ""
+    max_block_number = (
+        op.get_bind()
+        .execute(
+            sa.text(f"SELECT MAX({partition_key}) FROM {schema}{table_name}_legacy")
+        )
+        .scalar()
+    )
+    if max_block_number is None:
+        op.drop_table(f"{table_name}_legacy", schema=get_db_schema())
+    else:
+        # Align the upper bound to the partition size
+        # so that the partitions created by the indexer continue from it.
+        upper_bound = (
+            max_block_number // INDEXER_BLOCK_TX_DATA_PARTITION_SIZE + 1
+        ) * INDEXER_BLOCK_TX_DATA_PARTITION_SIZE
+        op.execute(
+            f"ALTER TABLE {schema}{table_name} "
+            f"ATTACH PARTITION {schema}{table_name}_legacy "
+            f"FOR VALUES FROM (MINVALUE) TO ({upper_bound})"
+        )
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS {schema}{table_name}_default "
+        f"PARTITION OF {schema}{table_name} DEFAULT"
+    )
+
+
+def downgrade():
+    schema = f"{get_db_schema()}." if get_db_schema() else ""
+
+    # tx_data
+    op.execute(
+        f"CREATE TABLE {schema}tx_data_tmp (LIKE {schema}tx_data INCLUDING DEFAULTS)"
+    )
+    op.execute(f"INSERT INTO {schema}tx_data_tmp SELECT * FROM {schema}tx_data")
+    op.drop_table("tx_data", schema=get_db_schema())
+    op.rename_table("tx_data_tmp", "tx_data", schema=get_db_schema())
+    op.alter_column(
+        "tx_data",
+        "block_number",
+        existing_type=sa.BigInteger(),
+        nullable=True,
+        schema=get_db_schema(),
+    )
+    op.create_primary_key("tx_data_pkey", "tx_data", ["hash"], schema=get_db_schema())
+    op.create_index(
+        op.f("ix_tx_data_block_number"),
+        "tx_data",
+        ["block_number"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        op.f("ix_tx_data_from_address"),
+        "tx_data",
+        ["from_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        op.f("ix_tx_data_to_address"),
+        "tx_data",
+        ["to_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+
+    # block_data
+    op.execute(
+        f"CREATE TABLE {schema}block_data_tmp "
+        f"(LIKE {schema}block_data INCLUDING DEFAULTS)"
+    )
+    op.execute(f"INSERT INTO {schema}block_data_tmp SELECT * FROM {schema}block_data")
+    op.drop_table("block_data", schema=get_db_schema())
+    op.rename_table("block_data_tmp", "block_data", schema=get_db_schema())
+    op.create_primary_key(
+        "block_data_pkey", "block_data", ["number"], schema=get_db_schema()
+    )
+    op.create_index(
+        op.f("ix_block_data_hash"),
+        "block_data",
+        ["hash"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        op.f("ix_block_data_timestamp"),
+        "block_data",
+        ["timestamp"],
+        unique=False,
+        schema=get_db_schema(),
+    )
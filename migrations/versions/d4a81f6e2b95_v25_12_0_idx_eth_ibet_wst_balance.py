@@ -0,0 +1,47 @@
+"""v25_12_0_idx_eth_ibet_wst_balance
+
+Revision ID: d4a81f6e2b95
+Revises: 5b7e0c9d1a26
+Create Date: 2026-10-19 17:48:12.905327
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "d4a81f6e2b95"
+down_revision = "5b7e0c9d1a26"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "idx_eth_ibet_wst_balance",
+        sa.Column("ibet_wst_address", sa.String(length=42), nullable=False),
+        sa.Column("account_address", sa.String(length=42), nullable=False),
+        sa.Column("finalized_balance", sa.BigInteger(), nullable=False),
+        sa.Column("balance", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("ibet_wst_address", "account_address"),
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "idx_eth_ibet_wst_balance_block_number",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("latest_block_number", sa.BigInteger(), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    op.drop_table("idx_eth_ibet_wst_balance_block_number", schema=get_db_schema())
+    op.drop_table("idx_eth_ibet_wst_balance", schema=get_db_schema())
@@ -0,0 +1,91 @@
+"""v25_12_0_trgm_search_index
+
+Revision ID: e5c8a1d3f7b2
+Revises: 7a3f2c8e9b14
+Create Date: 2026-10-19 20:03:51.204719
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "e5c8a1d3f7b2"
+down_revision = "7a3f2c8e9b14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "idx_personal_info",
+        sa.Column(
+            "name",
+            sa.String(),
+            sa.Computed("personal_info ->> 'name'", persisted=True),
+            nullable=True,
+        ),
+        schema=get_db_schema(),
+    )
+    op.add_column(
+        "idx_personal_info",
+        sa.Column(
+            "key_manager",
+            sa.String(),
+            sa.Computed("personal_info ->> 'key_manager'", persisted=True),
+            nullable=True,
+        ),
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "idx_personal_info_name_trgm",
+        "idx_personal_info",
+        ["name"],
+        unique=False,
+        schema=get_db_schema(),
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_personal_info_key_manager_trgm",
+        "idx_personal_info",
+        ["key_manager"],
+        unique=False,
+        schema=get_db_schema(),
+        postgresql_using="gin",
+        postgresql_ops={"key_manager": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_position_account_address_trgm",
+        "idx_position",
+        ["account_address"],
+        unique=False,
+        schema=get_db_schema(),
+        postgresql_using="gin",
+        postgresql_ops={"account_address": "gin_trgm_ops"},
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "idx_position_account_address_trgm",
+        table_name="idx_position",
+        schema=get_db_schema(),
+    )
+    op.drop_index(
+        "idx_personal_info_key_manager_trgm",
+        table_name="idx_personal_info",
+        schema=get_db_schema(),
+    )
+    op.drop_index(
+        "idx_personal_info_name_trgm",
+        table_name="idx_personal_info",
+        schema=get_db_schema(),
+    )
+    op.drop_column("idx_personal_info", "key_manager", schema=get_db_schema())
+    op.drop_column("idx_personal_info", "name", schema=get_db_schema())
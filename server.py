@@ -42,3 +42,14 @@ class AppUvicornWorker(UvicornWorker):
         # NOTE: gunicorn don't support '--worker-connections' to uvicorn
         "limit_concurrency": WORKER_CONNECTIONS,
     }
+
+
+# gunicorn server hook (loaded with "--config python:server")
+def child_exit(server, worker):
+    # NOTE:
+    # Clean up the live metrics of the exited worker.
+    # Counters and histograms written by the worker are still aggregated.
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -18,8 +18,11 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import secrets
+from unittest import mock
+from unittest.mock import AsyncMock
 
 import pytest
+from eth_utils import to_checksum_address
 
 from app.model.eth import (
     IbetWST,
@@ -28,6 +31,7 @@ from app.model.eth import (
 )
 from app.utils.eth_contract_utils import EthAsyncContractUtils, EthWeb3
 from config import ZERO_ADDRESS
+from eth_config import ETH_CHAIN_ID
 from tests.account_config import default_eth_account
 
 
@@ -295,6 +299,98 @@ class TestDeploy:
         assert contract_address is not None
 
 
+@pytest.mark.asyncio
+class TestDomainSeparator:
+    """
+    Test cases for the domain_separator function of the AuthIbetWST contract.
+    """
+
+    deployer = default_eth_account("user1")
+    owner = default_eth_account("user2")
+
+    #################################################################
+    # Normal
+    #################################################################
+
+    # Normal_1
+    # - The domain separator is cached per contract address.
+    async def test_normal_1(self):
+        # Deploy contract
+        contract_address = await deploy_wst_token(
+            "Test Token", self.deployer, self.owner
+        )
+
+        # Get domain separator
+        domain_separator = await IbetWST(contract_address).domain_separator()
+
+        # Assert that the cached value is returned without calling the contract
+        with mock.patch.object(
+            EthAsyncContractUtils, "call_function", AsyncMock()
+        ) as call_function_mock:
+            cached_domain_separator = await IbetWST(contract_address).domain_separator()
+        assert cached_domain_separator == domain_separator
+        call_function_mock.assert_not_called()
+
+        # Assert that a redeployed contract gets its own domain separator
+        redeployed_address = await deploy_wst_token(
+            "Test Token", self.deployer, self.owner
+        )
+        redeployed_domain_separator = await IbetWST(
+            redeployed_address
+        ).domain_separator()
+        assert redeployed_domain_separator != domain_separator
+
+    # Normal_2
+    # - The domain separator is not cached if the token name cannot be read.
+    async def test_normal_2(self):
+        contract_address = "0x" + secrets.token_hex(20)
+
+        await IbetWST(contract_address).domain_separator()
+
+        assert (
+            ETH_CHAIN_ID,
+            to_checksum_address(contract_address),
+        ) not in IbetWST.domain_separator_cache
+
+
+@pytest.mark.asyncio
+class TestSignDigests:
+    """
+    Test cases for IbetWSTDigestHelper.sign_digests.
+    """
+
+    owner = default_eth_account("user2")
+
+    #################################################################
+    # Normal
+    #################################################################
+
+    # Normal_1
+    # - Signatures are returned in the same order as the digests.
+    async def test_normal_1(self):
+        private_key = bytes.fromhex(self.owner["private_key"])
+        digests = [secrets.token_bytes(32) for _ in range(10)]
+
+        signatures = await IbetWSTDigestHelper.sign_digests(
+            digests=digests, private_key=private_key, max_workers=3
+        )
+
+        assert len(signatures) == 10
+        for digest, signature in zip(digests, signatures):
+            expected = EthWeb3.eth.account.unsafe_sign_hash(digest, private_key)
+            assert signature.v == expected.v
+            assert signature.r == expected.r
+            assert signature.s == expected.s
+
+    # Normal_2
+    # - An empty list is returned when there are no digests.
+    async def test_normal_2(self):
+        signatures = await IbetWSTDigestHelper.sign_digests(
+            digests=[], private_key=bytes.fromhex(self.owner["private_key"])
+        )
+        assert signatures == []
+
+
 @pytest.mark.asyncio
 class TestAccountWhitelist:
     """
@@ -20,8 +20,17 @@ SPDX-License-Identifier: Apache-2.0
 from unittest import mock
 
 import pytest
+from sqlalchemy import delete
 
 from app.model.db import IDXBlockData
+from app.routers.misc import bc_explorer
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_response_cache():
+    yield
+    bc_explorer.response_cache.clear("block_data")
+    bc_explorer.response_cache.clear("tx_data")
 
 
 class TestGetBlockData:
@@ -133,6 +142,53 @@ class TestGetBlockData:
         assert resp.status_code == 200
         assert resp.json() == self.block_1
 
+    # Normal_2
+    # ETag and Cache-Control
+    @pytest.mark.asyncio
+    async def test_normal_2(self, async_client, async_db):
+        await self.insert_block_data(async_db, self.block_1)
+
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.utils.fastapi_utils.RESPONSE_VALIDATION_MODE", False),
+        ):
+            resp_1 = await async_client.get(self.apiurl.format(1))
+            resp_2 = await async_client.get(
+                self.apiurl.format(1),
+                headers={"If-None-Match": resp_1.headers["ETag"]},
+            )
+
+        # Assertion
+        assert resp_1.status_code == 200
+        assert resp_1.json() == self.block_1
+        assert resp_1.headers["ETag"].startswith('"')
+        assert resp_1.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+        assert resp_2.status_code == 304
+        assert resp_2.content == b""
+        assert resp_2.headers["ETag"] == resp_1.headers["ETag"]
+
+    # Normal_3
+    # Rendered response is served from the in-process cache
+    @pytest.mark.asyncio
+    async def test_normal_3(self, async_client, async_db):
+        await self.insert_block_data(async_db, self.block_1)
+
+        # Request target API
+        with mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True):
+            resp_1 = await async_client.get(self.apiurl.format(1))
+
+            await async_db.execute(delete(IDXBlockData))
+            await async_db.commit()
+
+            resp_2 = await async_client.get(self.apiurl.format(1))
+
+        # Assertion
+        assert resp_1.status_code == 200
+        assert resp_2.status_code == 200
+        assert resp_2.json() == self.block_1
+
     ###########################################################################
     # Error
     ###########################################################################
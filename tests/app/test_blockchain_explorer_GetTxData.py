@@ -23,6 +23,14 @@ import pytest
 from eth_utils import to_checksum_address
 
 from app.model.db import IDXTxData, Token, TokenVersion
+from app.routers.misc import bc_explorer
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_response_cache():
+    yield
+    bc_explorer.response_cache.clear("block_data")
+    bc_explorer.response_cache.clear("tx_data")
 
 
 class TestGetTxData:
@@ -147,6 +155,38 @@ class TestGetTxData:
             "nonce": 199601,
         }
 
+    # Normal_3
+    # ETag and Cache-Control
+    @pytest.mark.asyncio
+    async def test_normal_3(self, async_client, async_db):
+        await self.insert_tx_data(async_db, self.tx_data)
+
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.utils.fastapi_utils.RESPONSE_VALIDATION_MODE", False),
+        ):
+            resp_1 = await async_client.get(
+                self.apiurl.format(
+                    "0x403f9cea4db07aecf71a440c45ae415569cb218bb1a7f4d3a2d83004e29d1644"
+                )
+            )
+            resp_2 = await async_client.get(
+                self.apiurl.format(
+                    "0x403f9cea4db07aecf71a440c45ae415569cb218bb1a7f4d3a2d83004e29d1644"
+                ),
+                headers={"If-None-Match": f'W/{resp_1.headers["ETag"]}, "other"'},
+            )
+
+        # Assertion
+        assert resp_1.status_code == 200
+        assert resp_1.json()["nonce"] == 199601
+        assert resp_1.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+        assert resp_2.status_code == 304
+        assert resp_2.content == b""
+        assert resp_2.headers["ETag"] == resp_1.headers["ETag"]
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -336,6 +336,96 @@ class TestListBlockData:
             self.filter_response_item(self.block_0),
         ]
 
+    # Normal_5_1
+    # Keyset pagination: cursor (ASC)
+    @pytest.mark.asyncio
+    async def test_normal_5_1(self, async_client, async_db):
+        await self.insert_block_data(async_db, self.block_0)
+        await self.insert_block_data(async_db, self.block_1)
+        await self.insert_block_data(async_db, self.block_2)
+
+        await self.insert_block_data_block_number(async_db, latest_block_number=2)
+
+        # Request target API
+        with mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True):
+            params = {"cursor": 0, "limit": 1}
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 200
+
+        response_data = resp.json()
+        assert response_data["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": 1,
+            "total": 3,
+        }
+        assert response_data["block_data"] == [self.filter_response_item(self.block_1)]
+
+    # Normal_5_2
+    # Keyset pagination: cursor (DESC)
+    @pytest.mark.asyncio
+    async def test_normal_5_2(self, async_client, async_db):
+        await self.insert_block_data(async_db, self.block_0)
+        await self.insert_block_data(async_db, self.block_1)
+        await self.insert_block_data(async_db, self.block_2)
+
+        await self.insert_block_data_block_number(async_db, latest_block_number=2)
+
+        # Request target API
+        with mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True):
+            params = {"cursor": 2, "sort_order": 1}
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 200
+
+        response_data = resp.json()
+        assert response_data["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": None,
+            "total": 3,
+        }
+        assert response_data["block_data"] == [
+            self.filter_response_item(self.block_1),
+            self.filter_response_item(self.block_0),
+        ]
+
+    # Normal_5_3
+    # Keyset pagination: the total number of blocks is not limited
+    @pytest.mark.asyncio
+    async def test_normal_5_3(self, async_client, async_db):
+        await self.insert_block_data(async_db, self.block_0)
+        await self.insert_block_data(async_db, self.block_1)
+        await self.insert_block_data(async_db, self.block_2)
+
+        await self.insert_block_data_block_number(async_db, latest_block_number=2)
+
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.routers.misc.bc_explorer.BLOCK_RESPONSE_LIMIT", 2),
+        ):
+            params = {"cursor": 0}
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 200
+
+        response_data = resp.json()
+        assert response_data["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": None,
+            "total": 3,
+        }
+        assert response_data["block_data"] == [
+            self.filter_response_item(self.block_1),
+            self.filter_response_item(self.block_2),
+        ]
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -428,3 +518,24 @@ class TestListBlockData:
             "meta": {"code": 4, "title": "ResponseLimitExceededError"},
             "detail": "Search results exceed the limit",
         }
+
+    # Error_4
+    # ResponseLimitExceededError: keyset pagination
+    @pytest.mark.asyncio
+    async def test_error_4(self, async_client, async_db):
+        await self.insert_block_data_block_number(async_db, latest_block_number=2)
+
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.routers.misc.bc_explorer.BLOCK_RESPONSE_LIMIT", 2),
+        ):
+            params = {"cursor": 0, "limit": 3}
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 400
+        assert resp.json() == {
+            "meta": {"code": 4, "title": "ResponseLimitExceededError"},
+            "detail": "Search results exceed the limit",
+        }
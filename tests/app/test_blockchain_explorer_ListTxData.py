@@ -259,6 +259,67 @@ class TestListTxData:
         }
         assert response_data["tx_data"] == [self.filter_response_item(self.B_tx_1)]
 
+    # Normal_4_1
+    # Keyset pagination: cursor
+    @pytest.mark.asyncio
+    async def test_normal_4_1(self, async_client, async_db):
+        await self.insert_tx_data(async_db, self.A_tx_1)
+        await self.insert_tx_data(async_db, self.A_tx_2)
+        await self.insert_tx_data(async_db, self.B_tx_1)
+
+        # Request target API
+        with mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True):
+            params = {
+                "cursor_block_number": 10407084,
+                "cursor_transaction_index": 0,
+                "limit": 1,
+            }
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 200
+
+        response_data = resp.json()
+        assert response_data["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": 1,
+            "total": None,
+        }
+        assert response_data["tx_data"] == [self.filter_response_item(self.A_tx_2)]
+
+    # Normal_4_2
+    # Keyset pagination: cursor with search filter
+    @pytest.mark.asyncio
+    async def test_normal_4_2(self, async_client, async_db):
+        await self.insert_tx_data(async_db, self.A_tx_1)
+        await self.insert_tx_data(async_db, self.A_tx_2)
+        await self.insert_tx_data(async_db, self.B_tx_1)
+
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.routers.misc.bc_explorer.TX_RESPONSE_LIMIT", 2),
+        ):
+            params = {
+                "from_address": "0x30406cd5f18dd87367b782b9d63b4d79f7f5ebb8",
+                "cursor_block_number": 6791871,
+                "cursor_transaction_index": 0,
+            }
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 200
+
+        response_data = resp.json()
+        assert response_data["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": None,
+            "total": None,
+        }
+        assert response_data["tx_data"] == [self.filter_response_item(self.A_tx_1)]
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -347,6 +408,30 @@ class TestListTxData:
             ],
         }
 
+    # Error_2_3
+    # Invalid Parameter: cursor_transaction_index is missing
+    @pytest.mark.asyncio
+    async def test_error_2_3(self, async_client, async_db):
+        # Request target API
+        with mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True):
+            params = {"cursor_block_number": 10407084}
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 422
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "RequestValidationError"},
+            "detail": [
+                {
+                    "type": "value_error",
+                    "loc": ["query"],
+                    "msg": "Value error, cursor_block_number and cursor_transaction_index must be specified together",
+                    "input": {"cursor_block_number": "10407084"},
+                    "ctx": {"error": {}},
+                }
+            ],
+        }
+
     # Error_3
     # ResponseLimitExceededError
     @pytest.mark.asyncio
@@ -368,3 +453,26 @@ class TestListTxData:
             "meta": {"code": 4, "title": "ResponseLimitExceededError"},
             "detail": "Search results exceed the limit",
         }
+
+    # Error_4
+    # ResponseLimitExceededError: keyset pagination
+    @pytest.mark.asyncio
+    async def test_error_4(self, async_client, async_db):
+        # Request target API
+        with (
+            mock.patch("app.routers.misc.bc_explorer.BC_EXPLORER_ENABLED", True),
+            mock.patch("app.routers.misc.bc_explorer.TX_RESPONSE_LIMIT", 2),
+        ):
+            params = {
+                "cursor_block_number": 10407084,
+                "cursor_transaction_index": 0,
+                "limit": 3,
+            }
+            resp = await async_client.get(self.apiurl, params=params)
+
+        # Assertion
+        assert resp.status_code == 400
+        assert resp.json() == {
+            "meta": {"code": 4, "title": "ResponseLimitExceededError"},
+            "detail": "Search results exceed the limit",
+        }
@@ -23,6 +23,7 @@ from app.model.db import (
     Account,
     IDXLockedPosition,
     IDXPosition,
+    IDXPositionSummary,
     Token,
     TokenType,
     TokenVersion,
@@ -326,6 +327,61 @@ class TestCountBondTokenHolders:
         assert resp.status_code == 200
         assert resp.json() == {"count": 3}
 
+    # <Normal_3>
+    # Position summary exists
+    # - The holder count is read from the summary
+    @pytest.mark.asyncio
+    async def test_normal_3(self, async_client, async_db):
+        user = default_eth_account("user1")
+        _issuer_address = user["address"]
+        _token_address = "0x82b1c9374aB625380bd498a3d9dF4033B8A0E3Bb"
+        _account_address_1 = "0xb75c7545b9230FEe99b7af370D38eBd3DAD929f7"
+
+        # prepare data
+        account = Account()
+        account.issuer_address = _issuer_address
+        async_db.add(account)
+
+        token = Token()
+        token.type = TokenType.IBET_STRAIGHT_BOND
+        token.tx_hash = ""
+        token.issuer_address = _issuer_address
+        token.token_address = _token_address
+        token.abi = {}
+        token.version = TokenVersion.V_25_09
+        async_db.add(token)
+
+        idx_position_1 = IDXPosition()
+        idx_position_1.token_address = _token_address
+        idx_position_1.account_address = _account_address_1
+        idx_position_1.balance = 10
+        idx_position_1.exchange_balance = 0
+        idx_position_1.exchange_commitment = 0
+        idx_position_1.pending_transfer = 0
+        async_db.add(idx_position_1)
+
+        summary = IDXPositionSummary()
+        summary.token_address = _token_address
+        summary.holder_count = 5
+        summary.total_balance = 50
+        summary.total_exchange_balance = 0
+        summary.total_exchange_commitment = 0
+        summary.total_pending_transfer = 0
+        summary.total_locked = 0
+        async_db.add(summary)
+
+        await async_db.commit()
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(_token_address),
+            headers={"issuer-address": _issuer_address},
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {"count": 5}
+
     ###########################################################################
     # Error Case
     ###########################################################################
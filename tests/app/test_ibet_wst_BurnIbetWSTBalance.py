@@ -19,7 +19,6 @@ SPDX-License-Identifier: Apache-2.0
 
 import secrets
 from unittest import mock
-from unittest.mock import AsyncMock
 
 import pytest
 from eth_utils import to_checksum_address
@@ -30,6 +29,7 @@ from app.model.db import (
     IbetWSTTxStatus,
     IbetWSTTxType,
     IbetWSTVersion,
+    IDXEthIbetWSTBalance,
     Token,
     TokenType,
     TokenVersion,
@@ -56,9 +56,6 @@ class TestBurnIbetWSTBalance:
 
     # <Normal_1>
     # Burn WST balance
-    @mock.patch(
-        "app.routers.misc.ibet_wst.IbetWST.balance_of", AsyncMock(return_value=1000)
-    )
     @mock.patch(
         "app.routers.misc.ibet_wst.ETH_MASTER_ACCOUNT_ADDRESS",
         relayer["address"],
@@ -75,6 +72,14 @@ class TestBurnIbetWSTBalance:
         token.ibet_wst_deployed = True
         token.ibet_wst_address = self.ibet_wst_address
         async_db.add(token)
+
+        # Prepare data: IDXEthIbetWSTBalance
+        idx_balance = IDXEthIbetWSTBalance()
+        idx_balance.ibet_wst_address = self.ibet_wst_address
+        idx_balance.account_address = self.user1["address"]
+        idx_balance.finalized_balance = 1000
+        idx_balance.balance = 1000
+        async_db.add(idx_balance)
         await async_db.commit()
 
         # Generate nonce
@@ -276,9 +281,6 @@ class TestBurnIbetWSTBalance:
 
     # <Error_4>
     # Insufficient WST balance
-    @mock.patch(
-        "app.routers.misc.ibet_wst.IbetWST.balance_of", AsyncMock(return_value=999)
-    )
     async def test_error_4(self, async_db, async_client):
         # Prepare data: Token
         token = Token()
@@ -291,6 +293,14 @@ class TestBurnIbetWSTBalance:
         token.ibet_wst_deployed = True
         token.ibet_wst_address = self.ibet_wst_address
         async_db.add(token)
+
+        # Prepare data: IDXEthIbetWSTBalance
+        idx_balance = IDXEthIbetWSTBalance()
+        idx_balance.ibet_wst_address = self.ibet_wst_address
+        idx_balance.account_address = self.user1["address"]
+        idx_balance.finalized_balance = 999
+        idx_balance.balance = 999
+        async_db.add(idx_balance)
         await async_db.commit()
 
         # Generate nonce
@@ -23,7 +23,7 @@ from unittest.mock import AsyncMock
 import pytest
 from eth_utils import to_checksum_address
 
-from app.model.db import Token, TokenType, TokenVersion
+from app.model.db import IDXEthIbetWSTBalance, Token, TokenType, TokenVersion
 
 
 @pytest.mark.asyncio
@@ -36,11 +36,89 @@ class TestGetIbetWSTBalance:
     ###########################################################################
 
     # <Normal_1>
-    # Return balance of account
+    # Return indexed balance of account
+    async def test_normal_1(self, async_client, async_db):
+        # Define parameters
+        issuer_address = "0x1234567890abcdef1234567890abcdef12345678"
+        account_address = "0x234567890abcdef1234567890abcdef123456789"
+        ibet_token_address = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+        ibet_wst_address = "0xbcdefabcdefabcdefabcdefabcdefabcdefabcde"
+
+        # Prepare data: Token
+        token = Token()
+        token.token_address = to_checksum_address(ibet_token_address)
+        token.issuer_address = issuer_address
+        token.type = TokenType.IBET_STRAIGHT_BOND
+        token.tx_hash = ""
+        token.abi = {}
+        token.version = TokenVersion.V_25_09
+        token.ibet_wst_deployed = True
+        token.ibet_wst_address = to_checksum_address(ibet_wst_address)
+        async_db.add(token)
+
+        # Prepare data: IDXEthIbetWSTBalance
+        idx_balance = IDXEthIbetWSTBalance()
+        idx_balance.ibet_wst_address = to_checksum_address(ibet_wst_address)
+        idx_balance.account_address = to_checksum_address(account_address)
+        idx_balance.finalized_balance = 900
+        idx_balance.balance = 1000
+        async_db.add(idx_balance)
+        await async_db.commit()
+
+        # Send request
+        resp = await async_client.get(
+            self.api_url.format(
+                account_address=account_address,
+                ibet_wst_address=ibet_wst_address,
+            )
+        )
+
+        # Check response status code
+        assert resp.status_code == 200
+        assert resp.json() == {"balance": 1000, "finalized_balance": 900}
+
+    # <Normal_2>
+    # Account has not been indexed
+    # - Return zero balance
+    async def test_normal_2(self, async_client, async_db):
+        # Define parameters
+        issuer_address = "0x1234567890abcdef1234567890abcdef12345678"
+        account_address = "0x234567890abcdef1234567890abcdef123456789"
+        ibet_token_address = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+        ibet_wst_address = "0xbcdefabcdefabcdefabcdefabcdefabcdefabcde"
+
+        # Prepare data: Token
+        token = Token()
+        token.token_address = to_checksum_address(ibet_token_address)
+        token.issuer_address = issuer_address
+        token.type = TokenType.IBET_STRAIGHT_BOND
+        token.tx_hash = ""
+        token.abi = {}
+        token.version = TokenVersion.V_25_09
+        token.ibet_wst_deployed = True
+        token.ibet_wst_address = to_checksum_address(ibet_wst_address)
+        async_db.add(token)
+        await async_db.commit()
+
+        # Send request
+        resp = await async_client.get(
+            self.api_url.format(
+                account_address=account_address,
+                ibet_wst_address=ibet_wst_address,
+            )
+        )
+
+        # Check response status code
+        assert resp.status_code == 200
+        assert resp.json() == {"balance": 0, "finalized_balance": 0}
+
+    # <Normal_3>
+    # from_chain=True
+    # - Return balance from the Ethereum node
     @mock.patch(
         "app.routers.misc.ibet_wst.IbetWST.balance_of", AsyncMock(return_value=1000)
     )
-    async def test_normal_1(self, async_client, async_db):
+    async def test_normal_3(self, async_client, async_db):
         # Define parameters
         issuer_address = "0x1234567890abcdef1234567890abcdef12345678"
         account_address = "0x234567890abcdef1234567890abcdef123456789"
@@ -65,12 +143,13 @@ class TestGetIbetWSTBalance:
             self.api_url.format(
                 account_address=account_address,
                 ibet_wst_address=ibet_wst_address,
-            )
+            ),
+            params={"from_chain": True},
         )
 
         # Check response status code
         assert resp.status_code == 200
-        assert resp.json() == {"balance": 1000}
+        assert resp.json() == {"balance": 1000, "finalized_balance": None}
 
     ###########################################################################
     # Error
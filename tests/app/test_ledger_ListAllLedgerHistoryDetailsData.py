@@ -0,0 +1,366 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from app.model.db import (
+    IDXPersonalInfo,
+    Ledger,
+    LedgerDataType,
+    LedgerDetailsRow,
+    LedgerDetailsTemplate,
+    PersonalInfoDataSource,
+    Token,
+    TokenType,
+    TokenVersion,
+)
+from app.model.ibet import IbetStraightBondContract
+from tests.account_config import default_eth_account
+
+
+class TestListAllLedgerHistoryDetailsData:
+    # target API endpoint
+    base_url = "/ledger/{token_address}/history/{ledger_id}/details/{detail_index}/data"
+
+    token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+    account_address_list = [
+        "0xABCdeF1234567890abCDeF123456789000000001",
+        "0xaBcdEF1234567890aBCDEF123456789000000002",
+        "0xaBcdEF1234567890aBCDEF123456789000000003",
+    ]
+
+    @staticmethod
+    def data(account_address: str, amount: int, name: str | None = "name_test"):
+        return {
+            "account_address": account_address,
+            "name": name,
+            "address": None if name is None else "address_test",
+            "amount": amount,
+            "price": 20,
+            "balance": amount * 20,
+            "acquisition_date": "2022/12/02",
+        }
+
+    async def prepare_ledger(self, async_db, issuer_address: str, legacy: bool):
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = self.token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
+
+        data_list = [
+            self.data(account_address, (i + 1) * 10)
+            for i, account_address in enumerate(self.account_address_list)
+        ]
+
+        _ledger = Ledger()
+        _ledger.token_address = self.token_address
+        _ledger.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                }
+            ],
+            "footers": [],
+        }
+        if legacy:
+            _ledger.ledger["details"][0]["data"] = data_list
+        _ledger.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )
+        async_db.add(_ledger)
+        await async_db.flush()
+
+        if not legacy:
+            for data in data_list:
+                _row = LedgerDetailsRow()
+                _row.ledger_id = _ledger.id
+                _row.detail_index = 0
+                _row.account_address = data["account_address"]
+                _row.name = data["name"]
+                _row.address = data["address"]
+                _row.amount = data["amount"]
+                _row.price = data["price"]
+                _row.balance = data["balance"]
+                _row.acquisition_date = data["acquisition_date"]
+                async_db.add(_row)
+
+        await async_db.commit()
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # <Normal_1>
+    # Details data is stored in LedgerDetailsRow
+    # - No pagination
+    @pytest.mark.asyncio
+    async def test_normal_1(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=False)
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=1, detail_index=0
+            ),
+            headers={
+                "issuer-address": issuer_address,
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "result_set": {
+                "count": 3,
+                "offset": None,
+                "limit": None,
+                "total": 3,
+            },
+            "data": [
+                self.data(self.account_address_list[0], 10),
+                self.data(self.account_address_list[1], 20),
+                self.data(self.account_address_list[2], 30),
+            ],
+        }
+
+    # <Normal_2>
+    # Details data is stored in LedgerDetailsRow
+    # - Pagination
+    @pytest.mark.asyncio
+    async def test_normal_2(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=False)
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=1, detail_index=0
+            ),
+            params={
+                "offset": 1,
+                "limit": 1,
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "result_set": {
+                "count": 3,
+                "offset": 1,
+                "limit": 1,
+                "total": 3,
+            },
+            "data": [
+                self.data(self.account_address_list[1], 20),
+            ],
+        }
+
+    # <Normal_3>
+    # Details data is stored in Ledger.ledger (backward compatibility)
+    # - Pagination
+    @pytest.mark.asyncio
+    async def test_normal_3(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=True)
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=1, detail_index=0
+            ),
+            params={
+                "offset": 1,
+                "limit": 5,
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "result_set": {
+                "count": 3,
+                "offset": 1,
+                "limit": 5,
+                "total": 3,
+            },
+            "data": [
+                self.data(self.account_address_list[1], 20),
+                self.data(self.account_address_list[2], 30),
+            ],
+        }
+
+    # <Normal_4>
+    # latest_flg = 1
+    @pytest.mark.asyncio
+    async def test_normal_4(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=False)
+
+        _idx_personal_info = IDXPersonalInfo()
+        _idx_personal_info.account_address = self.account_address_list[0]
+        _idx_personal_info.issuer_address = issuer_address
+        _idx_personal_info.personal_info = {
+            "name": "name_db_1",
+            "address": "address_db_1",
+        }
+        _idx_personal_info.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(_idx_personal_info)
+
+        _details = LedgerDetailsTemplate()
+        _details.token_address = self.token_address
+        _details.token_detail_type = "権利_test_1"
+        _details.headers = []
+        _details.footers = []
+        _details.data_type = LedgerDataType.IBET_FIN.value
+        _details.data_source = self.token_address
+        async_db.add(_details)
+
+        await async_db.commit()
+
+        # Mock
+        token = IbetStraightBondContract()
+        token.issuer_address = issuer_address
+        token.require_personal_info_registered = False
+        token_get_mock = mock.patch(
+            "app.model.ibet.IbetStraightBondContract.get", return_value=token
+        )
+
+        # request target API
+        with token_get_mock:
+            resp = await async_client.get(
+                self.base_url.format(
+                    token_address=self.token_address, ledger_id=1, detail_index=0
+                ),
+                params={
+                    "latest_flg": 1,
+                    "limit": 2,
+                },
+            )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "result_set": {
+                "count": 3,
+                "offset": None,
+                "limit": 2,
+                "total": 3,
+            },
+            "data": [
+                {
+                    **self.data(self.account_address_list[0], 10),
+                    "name": "name_db_1",
+                    "address": "address_db_1",
+                },
+                self.data(self.account_address_list[1], 20, name=None),
+            ],
+        }
+
+    ###########################################################################
+    # Error Case
+    ###########################################################################
+
+    # <Error_1>
+    # Not Found: token
+    @pytest.mark.asyncio
+    async def test_error_1(self, async_client, async_db):
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=1, detail_index=0
+            ),
+        )
+
+        # assertion
+        assert resp.status_code == 404
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "NotFound"},
+            "detail": "token does not exist",
+        }
+
+    # <Error_2>
+    # Not Found: ledger
+    @pytest.mark.asyncio
+    async def test_error_2(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=False)
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=2, detail_index=0
+            ),
+        )
+
+        # assertion
+        assert resp.status_code == 404
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "NotFound"},
+            "detail": "ledger does not exist",
+        }
+
+    # <Error_3>
+    # Not Found: ledger details
+    @pytest.mark.asyncio
+    async def test_error_3(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_ledger(async_db, issuer_address, legacy=False)
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(
+                token_address=self.token_address, ledger_id=1, detail_index=1
+            ),
+        )
+
+        # assertion
+        assert resp.status_code == 404
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "NotFound"},
+            "detail": "ledger details does not exist",
+        }
@@ -27,6 +27,7 @@ from app.model.db import (
     IDXPersonalInfo,
     Ledger,
     LedgerDataType,
+    LedgerDetailsRow,
     LedgerDetailsTemplate,
     PersonalInfoDataSource,
     Token,
@@ -2160,6 +2161,201 @@ class TestRetrieveLedgerHistory:
             ],
         }
 
+    # <Normal_3_6>
+    # latest_flg = 1 (Get the latest personal info)
+    #   - The same account appears in multiple details
+    #   - Personal info is retrieved from the contract only once per account
+    # token.require_personal_info_registered = True
+    @pytest.mark.asyncio
+    async def test_normal_3_6(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        account_address_1 = "0xABCdeF1234567890abCDeF123456789000000001"
+        account_address_2 = "0xaBcdEF1234567890aBCDEF123456789000000002"
+        personal_info_contract_address = "0xabcDEF1234567890AbcDEf123456789000000003"
+
+        # prepare data
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
+
+        _ledger_1 = Ledger()
+        _ledger_1.token_address = token_address
+        _ledger_1.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger_1.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "data": [
+                        {
+                            "account_address": account_address_1,
+                            "name": "name_test_1",
+                            "address": "address_test_1",
+                            "amount": 10,
+                            "price": 20,
+                            "balance": 30,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": "name_test_2",
+                            "address": "address_test_2",
+                            "amount": 100,
+                            "price": 200,
+                            "balance": 300,
+                            "acquisition_date": "2022/12/03",
+                        },
+                    ],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
+                {
+                    "token_detail_type": "権利_test_2",
+                    "headers": [],
+                    "data": [
+                        {
+                            "account_address": account_address_2,
+                            "name": "name_test_2",
+                            "address": "address_test_2",
+                            "amount": 200,
+                            "price": 200,
+                            "balance": 400,
+                            "acquisition_date": "2022/12/04",
+                        },
+                    ],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
+            ],
+            "footers": [],
+        }
+        _ledger_1.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )  # JST 2022/01/02
+        async_db.add(_ledger_1)
+
+        _idx_personal_info_1 = (
+            IDXPersonalInfo()
+        )  # Note: account_address_1 has personal information in DB
+        _idx_personal_info_1.account_address = account_address_1
+        _idx_personal_info_1.issuer_address = issuer_address
+        _idx_personal_info_1.personal_info = {
+            "name": "name_db_1",
+            "address": "address_db_1",
+        }
+        _idx_personal_info_1.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(_idx_personal_info_1)
+
+        for token_detail_type in ["権利_test_1", "権利_test_2"]:
+            _details = LedgerDetailsTemplate()
+            _details.token_address = token_address
+            _details.token_detail_type = token_detail_type
+            _details.headers = []
+            _details.footers = []
+            _details.data_type = LedgerDataType.IBET_FIN.value
+            _details.data_source = token_address
+            async_db.add(_details)
+
+        await async_db.commit()
+
+        # Mock
+        token = IbetStraightBondContract()
+        token.personal_info_contract_address = personal_info_contract_address
+        token.issuer_address = issuer_address
+        token.require_personal_info_registered = True
+        token_get_mock = mock.patch(
+            "app.model.ibet.IbetStraightBondContract.get", return_value=token
+        )
+        personal_get_info_mock = mock.patch(
+            "app.model.ibet.PersonalInfoContract.get_info"
+        )
+
+        # request target API
+        with (
+            token_get_mock as token_get_mock_patch,
+            personal_get_info_mock as personal_get_info_mock_patch,
+        ):
+            personal_get_info_mock_patch.side_effect = [
+                {
+                    "name": "name_contract_2",
+                    "address": "address_contract_2",
+                }
+            ]
+
+            resp = await async_client.get(
+                self.base_url.format(token_address=token_address, ledger_id=1),
+                params={
+                    "latest_flg": 1,
+                },
+                headers={
+                    "issuer-address": issuer_address,
+                },
+            )
+            # assertion
+            assert token_get_mock_patch.call_count == 1
+            personal_get_info_mock_patch.assert_called_once_with(
+                account_address=account_address_2, default_value=None
+            )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json()["details"] == [
+            {
+                "token_detail_type": "権利_test_1",
+                "headers": [],
+                "data": [
+                    {
+                        "account_address": account_address_1,
+                        "name": "name_db_1",
+                        "address": "address_db_1",
+                        "amount": 10,
+                        "price": 20,
+                        "balance": 30,
+                        "acquisition_date": "2022/12/02",
+                    },
+                    {
+                        "account_address": account_address_2,
+                        "name": "name_contract_2",
+                        "address": "address_contract_2",
+                        "amount": 100,
+                        "price": 200,
+                        "balance": 300,
+                        "acquisition_date": "2022/12/03",
+                    },
+                ],
+                "footers": [],
+                "some_personal_info_not_registered": False,
+            },
+            {
+                "token_detail_type": "権利_test_2",
+                "headers": [],
+                "data": [
+                    {
+                        "account_address": account_address_2,
+                        "name": "name_contract_2",
+                        "address": "address_contract_2",
+                        "amount": 200,
+                        "price": 200,
+                        "balance": 400,
+                        "acquisition_date": "2022/12/04",
+                    },
+                ],
+                "footers": [],
+                "some_personal_info_not_registered": False,
+            },
+        ]
+
     # <Normal_4>
     # Test `currency` backward compatibility
     @pytest.mark.asyncio
@@ -2926,54 +3122,81 @@ class TestRetrieveLedgerHistory:
             ],
         }
 
-    ###########################################################################
-    # Error Case
-    ###########################################################################
-
-    # <Error_1>
-    # Parameter Error(issuer-address)
+    # <Normal_6_1>
+    # Details data is stored in LedgerDetailsRow
+    # latest_flg = 0
     @pytest.mark.asyncio
-    async def test_error_1(self, async_client, async_db):
+    @mock.patch("app.routers.issuer.ledger.LEDGER_HISTORY_DATA_CHUNK_SIZE", 1)
+    async def test_normal_6_1(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
         token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        account_address_1 = "0xABCdeF1234567890abCDeF123456789000000001"
+        account_address_2 = "0xaBcdEF1234567890aBCDEF123456789000000002"
 
-        # request target API
-        resp = await async_client.get(
-            self.base_url.format(token_address=token_address, ledger_id=1),
-            params={
-                "latest_flg": 1,
-            },
-            headers={
-                "issuer-address": "test",
-            },
-        )
+        # prepare data
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
 
-        # assertion
-        assert resp.status_code == 422
-        assert resp.json() == {
-            "meta": {"code": 1, "title": "RequestValidationError"},
-            "detail": [
+        _ledger_1 = Ledger()
+        _ledger_1.token_address = token_address
+        _ledger_1.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger_1.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [{"hoge": "aaaa"}],
+            "details": [
                 {
-                    "input": "test",
-                    "loc": ["header", "issuer-address"],
-                    "msg": "issuer-address is not a valid address",
-                    "type": "value_error",
-                }
+                    "token_detail_type": "権利_test_1",
+                    "headers": [{"test1": "a"}],
+                    "footers": [{"f-test1": "a"}],
+                    "some_personal_info_not_registered": True,
+                },
+                {
+                    "token_detail_type": "権利_test_2",
+                    "headers": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
             ],
+            "footers": [{"f-hoge": "aaaa"}],
         }
+        _ledger_1.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )  # JST 2022/01/02
+        async_db.add(_ledger_1)
+        await async_db.flush()
+
+        for account_address, amount in [
+            (account_address_1, 10),
+            (account_address_2, 100),
+        ]:
+            _row = LedgerDetailsRow()
+            _row.ledger_id = _ledger_1.id
+            _row.detail_index = 0
+            _row.account_address = account_address
+            _row.name = f"name_{amount}"
+            _row.address = f"address_{amount}"
+            _row.amount = amount
+            _row.price = 20
+            _row.balance = amount * 20
+            _row.acquisition_date = "2022/12/02"
+            async_db.add(_row)
 
-    # <Error_2>
-    # Parameter Error(latest_flg less)
-    @pytest.mark.asyncio
-    async def test_error_2(self, async_client, async_db):
-        user_1 = default_eth_account("user1")
-        issuer_address = user_1["address"]
-        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        await async_db.commit()
 
         # request target API
         resp = await async_client.get(
             self.base_url.format(token_address=token_address, ledger_id=1),
             params={
-                "latest_flg": -1,
+                "latest_flg": 0,
             },
             headers={
                 "issuer-address": issuer_address,
@@ -2981,36 +3204,478 @@ class TestRetrieveLedgerHistory:
         )
 
         # assertion
-        assert resp.status_code == 422
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
         assert resp.json() == {
-            "meta": {"code": 1, "title": "RequestValidationError"},
-            "detail": [
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [{"hoge": "aaaa"}],
+            "details": [
                 {
-                    "ctx": {"ge": 0},
-                    "input": "-1",
-                    "loc": ["query", "latest_flg"],
-                    "msg": "Input should be greater than or equal to 0",
-                    "type": "greater_than_equal",
-                }
+                    "token_detail_type": "権利_test_1",
+                    "headers": [{"test1": "a"}],
+                    "data": [
+                        {
+                            "account_address": account_address_1,
+                            "name": "name_10",
+                            "address": "address_10",
+                            "amount": 10,
+                            "price": 20,
+                            "balance": 200,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": "name_100",
+                            "address": "address_100",
+                            "amount": 100,
+                            "price": 20,
+                            "balance": 2000,
+                            "acquisition_date": "2022/12/02",
+                        },
+                    ],
+                    "footers": [{"f-test1": "a"}],
+                    "some_personal_info_not_registered": True,
+                },
+                {
+                    "token_detail_type": "権利_test_2",
+                    "headers": [],
+                    "data": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
             ],
+            "footers": [{"f-hoge": "aaaa"}],
         }
 
-    # <Error_3>
-    # Parameter Error(latest_flg greater)
+    # <Normal_6_2>
+    # Details data is stored in LedgerDetailsRow
+    # latest_flg = 1
     @pytest.mark.asyncio
-    async def test_error_3(self, async_client, async_db):
+    @mock.patch("app.routers.issuer.ledger.LEDGER_HISTORY_DATA_CHUNK_SIZE", 1)
+    async def test_normal_6_2(self, async_client, async_db):
         user_1 = default_eth_account("user1")
         issuer_address = user_1["address"]
         token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        account_address_1 = "0xABCdeF1234567890abCDeF123456789000000001"
+        account_address_2 = "0xaBcdEF1234567890aBCDEF123456789000000002"
+        personal_info_contract_address = "0xabcDEF1234567890AbcDEf123456789000000003"
 
-        # request target API
-        resp = await async_client.get(
-            self.base_url.format(token_address=token_address, ledger_id=1),
-            params={
-                "latest_flg": 2,
-            },
-            headers={
-                "issuer-address": issuer_address,
+        # prepare data
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
+
+        _ledger_1 = Ledger()
+        _ledger_1.token_address = token_address
+        _ledger_1.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger_1.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
+            ],
+            "footers": [],
+        }
+        _ledger_1.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )  # JST 2022/01/02
+        async_db.add(_ledger_1)
+        await async_db.flush()
+
+        for account_address, amount in [
+            (account_address_1, 10),
+            (account_address_2, 100),
+            (account_address_2, 200),
+        ]:
+            _row = LedgerDetailsRow()
+            _row.ledger_id = _ledger_1.id
+            _row.detail_index = 0
+            _row.account_address = account_address
+            _row.name = "name_test"
+            _row.address = "address_test"
+            _row.amount = amount
+            _row.price = 20
+            _row.balance = amount * 20
+            _row.acquisition_date = "2022/12/02"
+            async_db.add(_row)
+
+        _idx_personal_info_1 = (
+            IDXPersonalInfo()
+        )  # Note: account_address_1 has personal information in DB
+        _idx_personal_info_1.account_address = account_address_1
+        _idx_personal_info_1.issuer_address = issuer_address
+        _idx_personal_info_1.personal_info = {
+            "name": "name_db_1",
+            "address": "address_db_1",
+        }
+        _idx_personal_info_1.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(_idx_personal_info_1)
+
+        _details_1 = LedgerDetailsTemplate()
+        _details_1.token_address = token_address
+        _details_1.token_detail_type = "権利_test_1"
+        _details_1.headers = []
+        _details_1.footers = []
+        _details_1.data_type = LedgerDataType.IBET_FIN.value
+        _details_1.data_source = token_address
+        async_db.add(_details_1)
+
+        await async_db.commit()
+
+        # Mock
+        token = IbetStraightBondContract()
+        token.personal_info_contract_address = personal_info_contract_address
+        token.issuer_address = issuer_address
+        token.require_personal_info_registered = True
+        token_get_mock = mock.patch(
+            "app.model.ibet.IbetStraightBondContract.get", return_value=token
+        )
+        personal_get_info_mock = mock.patch(
+            "app.model.ibet.PersonalInfoContract.get_info"
+        )
+
+        # request target API
+        with (
+            token_get_mock,
+            personal_get_info_mock as personal_get_info_mock_patch,
+        ):
+            # Note:
+            # account_address_2 is not registered
+            personal_get_info_mock_patch.side_effect = [
+                {
+                    "name": None,
+                    "address": None,
+                }
+            ]
+
+            resp = await async_client.get(
+                self.base_url.format(token_address=token_address, ledger_id=1),
+                params={
+                    "latest_flg": 1,
+                },
+                headers={
+                    "issuer-address": issuer_address,
+                },
+            )
+            # assertion
+            personal_get_info_mock_patch.assert_called_once_with(
+                account_address=account_address_2, default_value=None
+            )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "data": [
+                        {
+                            "account_address": account_address_1,
+                            "name": "name_db_1",
+                            "address": "address_db_1",
+                            "amount": 10,
+                            "price": 20,
+                            "balance": 200,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": None,
+                            "address": None,
+                            "amount": 100,
+                            "price": 20,
+                            "balance": 2000,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": None,
+                            "address": None,
+                            "amount": 200,
+                            "price": 20,
+                            "balance": 4000,
+                            "acquisition_date": "2022/12/02",
+                        },
+                    ],
+                    "footers": [],
+                    "some_personal_info_not_registered": True,
+                },
+            ],
+            "footers": [],
+        }
+
+    # <Normal_6_3>
+    # Details data is stored in LedgerDetailsRow
+    # latest_flg = 1
+    # - Failing to get the latest personal info after streaming has started
+    #   falls back to the stored name and address,
+    #   and some_personal_info_not_registered is set.
+    @pytest.mark.asyncio
+    @mock.patch("app.routers.issuer.ledger.LEDGER_HISTORY_DATA_CHUNK_SIZE", 1)
+    async def test_normal_6_3(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        account_address_1 = "0xABCdeF1234567890abCDeF123456789000000001"
+        account_address_2 = "0xaBcdEF1234567890aBCDEF123456789000000002"
+        personal_info_contract_address = "0xabcDEF1234567890AbcDEf123456789000000003"
+
+        # prepare data
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
+
+        _ledger_1 = Ledger()
+        _ledger_1.token_address = token_address
+        _ledger_1.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger_1.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
+            ],
+            "footers": [],
+        }
+        _ledger_1.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )  # JST 2022/01/02
+        async_db.add(_ledger_1)
+        await async_db.flush()
+
+        for account_address, amount in [
+            (account_address_1, 10),
+            (account_address_2, 100),
+            (account_address_2, 200),
+        ]:
+            _row = LedgerDetailsRow()
+            _row.ledger_id = _ledger_1.id
+            _row.detail_index = 0
+            _row.account_address = account_address
+            _row.name = "name_test"
+            _row.address = "address_test"
+            _row.amount = amount
+            _row.price = 20
+            _row.balance = amount * 20
+            _row.acquisition_date = "2022/12/02"
+            async_db.add(_row)
+
+        _idx_personal_info_1 = (
+            IDXPersonalInfo()
+        )  # Note: account_address_1 has personal information in DB
+        _idx_personal_info_1.account_address = account_address_1
+        _idx_personal_info_1.issuer_address = issuer_address
+        _idx_personal_info_1.personal_info = {
+            "name": "name_db_1",
+            "address": "address_db_1",
+        }
+        _idx_personal_info_1.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(_idx_personal_info_1)
+
+        _details_1 = LedgerDetailsTemplate()
+        _details_1.token_address = token_address
+        _details_1.token_detail_type = "権利_test_1"
+        _details_1.headers = []
+        _details_1.footers = []
+        _details_1.data_type = LedgerDataType.IBET_FIN.value
+        _details_1.data_source = token_address
+        async_db.add(_details_1)
+
+        await async_db.commit()
+
+        # Mock
+        token = IbetStraightBondContract()
+        token.personal_info_contract_address = personal_info_contract_address
+        token.issuer_address = issuer_address
+        token.require_personal_info_registered = True
+        token_get_mock = mock.patch(
+            "app.model.ibet.IbetStraightBondContract.get", return_value=token
+        )
+        personal_get_info_mock = mock.patch(
+            "app.model.ibet.PersonalInfoContract.get_info"
+        )
+
+        # request target API
+        with (
+            token_get_mock,
+            personal_get_info_mock as personal_get_info_mock_patch,
+        ):
+            personal_get_info_mock_patch.side_effect = Exception()
+
+            resp = await async_client.get(
+                self.base_url.format(token_address=token_address, ledger_id=1),
+                params={
+                    "latest_flg": 1,
+                },
+                headers={
+                    "issuer-address": issuer_address,
+                },
+            )
+            # assertion
+            assert personal_get_info_mock_patch.call_count == 2
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "data": [
+                        {
+                            "account_address": account_address_1,
+                            "name": "name_db_1",
+                            "address": "address_db_1",
+                            "amount": 10,
+                            "price": 20,
+                            "balance": 200,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": "name_test",
+                            "address": "address_test",
+                            "amount": 100,
+                            "price": 20,
+                            "balance": 2000,
+                            "acquisition_date": "2022/12/02",
+                        },
+                        {
+                            "account_address": account_address_2,
+                            "name": "name_test",
+                            "address": "address_test",
+                            "amount": 200,
+                            "price": 20,
+                            "balance": 4000,
+                            "acquisition_date": "2022/12/02",
+                        },
+                    ],
+                    "footers": [],
+                    "some_personal_info_not_registered": True,
+                },
+            ],
+            "footers": [],
+        }
+
+    ###########################################################################
+    # Error Case
+    ###########################################################################
+
+    # <Error_1>
+    # Parameter Error(issuer-address)
+    @pytest.mark.asyncio
+    async def test_error_1(self, async_client, async_db):
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(token_address=token_address, ledger_id=1),
+            params={
+                "latest_flg": 1,
+            },
+            headers={
+                "issuer-address": "test",
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 422
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "RequestValidationError"},
+            "detail": [
+                {
+                    "input": "test",
+                    "loc": ["header", "issuer-address"],
+                    "msg": "issuer-address is not a valid address",
+                    "type": "value_error",
+                }
+            ],
+        }
+
+    # <Error_2>
+    # Parameter Error(latest_flg less)
+    @pytest.mark.asyncio
+    async def test_error_2(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(token_address=token_address, ledger_id=1),
+            params={
+                "latest_flg": -1,
+            },
+            headers={
+                "issuer-address": issuer_address,
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 422
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "RequestValidationError"},
+            "detail": [
+                {
+                    "ctx": {"ge": 0},
+                    "input": "-1",
+                    "loc": ["query", "latest_flg"],
+                    "msg": "Input should be greater than or equal to 0",
+                    "type": "greater_than_equal",
+                }
+            ],
+        }
+
+    # <Error_3>
+    # Parameter Error(latest_flg greater)
+    @pytest.mark.asyncio
+    async def test_error_3(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(token_address=token_address, ledger_id=1),
+            params={
+                "latest_flg": 2,
+            },
+            headers={
+                "issuer-address": issuer_address,
             },
         )
 
@@ -3281,3 +3946,126 @@ class TestRetrieveLedgerHistory:
             "meta": {"code": 5, "title": "Integer64bitLimitExceededError"},
             "detail": "Response data includes integer which exceeds 64-bit range",
         }
+
+    # <Error_8>
+    # Details data is stored in LedgerDetailsRow
+    # - Failing to get the latest personal info before streaming returns an error.
+    @pytest.mark.asyncio
+    @mock.patch("app.routers.issuer.ledger.LEDGER_HISTORY_DATA_CHUNK_SIZE", 1)
+    async def test_error_8(self, async_client, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        token_address = "0xABCdeF1234567890abcdEf123456789000000000"
+        account_address_1 = "0xABCdeF1234567890abCDeF123456789000000001"
+        account_address_2 = "0xaBcdEF1234567890aBCDEF123456789000000002"
+        personal_info_contract_address = "0xabcDEF1234567890AbcDEf123456789000000003"
+
+        # prepare data
+        _token = Token()
+        _token.type = TokenType.IBET_STRAIGHT_BOND
+        _token.tx_hash = ""
+        _token.issuer_address = issuer_address
+        _token.token_address = token_address
+        _token.abi = {}
+        _token.version = TokenVersion.V_25_09
+        async_db.add(_token)
+
+        _ledger_1 = Ledger()
+        _ledger_1.token_address = token_address
+        _ledger_1.token_type = TokenType.IBET_STRAIGHT_BOND
+        _ledger_1.ledger = {
+            "created": "2022/12/01",
+            "token_name": "テスト原簿",
+            "currency": "JPY",
+            "headers": [],
+            "details": [
+                {
+                    "token_detail_type": "権利_test_1",
+                    "headers": [],
+                    "footers": [],
+                    "some_personal_info_not_registered": False,
+                },
+            ],
+            "footers": [],
+        }
+        _ledger_1.ledger_created = datetime.strptime(
+            "2022/01/01 15:20:30", "%Y/%m/%d %H:%M:%S"
+        )  # JST 2022/01/02
+        async_db.add(_ledger_1)
+        await async_db.flush()
+
+        for account_address, amount in [
+            (account_address_2, 100),
+            (account_address_1, 10),
+            (account_address_2, 200),
+        ]:
+            _row = LedgerDetailsRow()
+            _row.ledger_id = _ledger_1.id
+            _row.detail_index = 0
+            _row.account_address = account_address
+            _row.name = "name_test"
+            _row.address = "address_test"
+            _row.amount = amount
+            _row.price = 20
+            _row.balance = amount * 20
+            _row.acquisition_date = "2022/12/02"
+            async_db.add(_row)
+
+        _idx_personal_info_1 = (
+            IDXPersonalInfo()
+        )  # Note: account_address_1 has personal information in DB
+        _idx_personal_info_1.account_address = account_address_1
+        _idx_personal_info_1.issuer_address = issuer_address
+        _idx_personal_info_1.personal_info = {
+            "name": "name_db_1",
+            "address": "address_db_1",
+        }
+        _idx_personal_info_1.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(_idx_personal_info_1)
+
+        _details_1 = LedgerDetailsTemplate()
+        _details_1.token_address = token_address
+        _details_1.token_detail_type = "権利_test_1"
+        _details_1.headers = []
+        _details_1.footers = []
+        _details_1.data_type = LedgerDataType.IBET_FIN.value
+        _details_1.data_source = token_address
+        async_db.add(_details_1)
+
+        await async_db.commit()
+
+        # Mock
+        token = IbetStraightBondContract()
+        token.personal_info_contract_address = personal_info_contract_address
+        token.issuer_address = issuer_address
+        token.require_personal_info_registered = True
+        token_get_mock = mock.patch(
+            "app.model.ibet.IbetStraightBondContract.get", return_value=token
+        )
+        personal_get_info_mock = mock.patch(
+            "app.model.ibet.PersonalInfoContract.get_info"
+        )
+
+        # request target API
+        with (
+            token_get_mock,
+            personal_get_info_mock as personal_get_info_mock_patch,
+        ):
+            personal_get_info_mock_patch.side_effect = Exception()
+
+            resp = await async_client.get(
+                self.base_url.format(token_address=token_address, ledger_id=1),
+                params={
+                    "latest_flg": 1,
+                },
+                headers={
+                    "issuer-address": issuer_address,
+                },
+            )
+
+        # assertion
+        assert resp.status_code == 503
+        assert resp.json()["meta"] == {
+            "code": 1,
+            "title": "ServiceUnavailableError",
+        }
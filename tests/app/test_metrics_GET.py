@@ -0,0 +1,47 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+
+from app.utils import metrics_utils
+
+
+class TestMetrics:
+    # target API endpoint
+    apiurl = "/metrics"
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # <Normal_1>
+    # Per-route metrics are exposed in the Prometheus text format
+    @pytest.mark.asyncio
+    async def test_normal_1(self, async_client, async_db):
+        await async_client.get("/healthcheck")
+
+        resp = await async_client.get(self.apiurl)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == metrics_utils.CONTENT_TYPE
+        assert "# TYPE ibet_prime_http_request_duration_seconds histogram" in resp.text
+        assert (
+            'ibet_prime_http_request_duration_seconds_count{method="GET",route="/healthcheck"'
+            in resp.text
+        )
@@ -0,0 +1,363 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from app.model.db import (
+    IDXPersonalInfo,
+    IDXPosition,
+    PersonalInfoDataSource,
+    Token,
+    TokenStatus,
+    TokenType,
+    TokenVersion,
+)
+from tests.account_config import default_eth_account
+
+
+class TestExportTokenHoldersPersonalInfo:
+    # target API endpoint
+    base_url = "/token/holders/{}/personal_info/export"
+
+    token_address = "0x82b1c9374aB625380bd498a3d9dF4033B8A0E3Bb"
+    account_address_1 = "0xb75c7545b9230FEe99b7af370D38eBd3DAD929f7"
+    account_address_2 = "0x3F198534Bbe3B2a197d3B317d41392F348EAC707"
+
+    @staticmethod
+    async def prepare_data(
+        async_db, issuer_address, token_address, token_status=TokenStatus.SUCCEEDED
+    ):
+        token = Token()
+        token.type = TokenType.IBET_SHARE
+        token.tx_hash = ""
+        token.issuer_address = issuer_address
+        token.token_address = token_address
+        token.abi = {}
+        token.token_status = token_status
+        token.version = TokenVersion.V_25_09
+        async_db.add(token)
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # <Normal_1>
+    # CSV format
+    # - Holders without personal information are exported with empty columns
+    # - Former holders are excluded
+    @pytest.mark.freeze_time("2024-05-13 12:34:56")
+    @pytest.mark.asyncio
+    async def test_normal_1(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_data(async_db, issuer_address, self.token_address)
+
+        idx_position_1 = IDXPosition()
+        idx_position_1.token_address = self.token_address
+        idx_position_1.account_address = self.account_address_1
+        idx_position_1.balance = 10
+        idx_position_1.exchange_balance = 11
+        idx_position_1.exchange_commitment = 12
+        idx_position_1.pending_transfer = 5
+        async_db.add(idx_position_1)
+
+        idx_position_2 = IDXPosition()
+        idx_position_2.token_address = self.token_address
+        idx_position_2.account_address = self.account_address_2
+        idx_position_2.balance = 20
+        idx_position_2.exchange_balance = 0
+        idx_position_2.exchange_commitment = 0
+        idx_position_2.pending_transfer = 0
+        async_db.add(idx_position_2)
+
+        idx_position_3 = IDXPosition()  # former holder
+        idx_position_3.token_address = self.token_address
+        idx_position_3.account_address = "0x0000000000000000000000000000000000000003"
+        idx_position_3.balance = 0
+        idx_position_3.exchange_balance = 0
+        idx_position_3.exchange_commitment = 0
+        idx_position_3.pending_transfer = 0
+        async_db.add(idx_position_3)
+
+        personal_info_1 = IDXPersonalInfo()
+        personal_info_1.issuer_address = issuer_address
+        personal_info_1.account_address = self.account_address_1
+        personal_info_1.personal_info = {
+            "key_manager": "key_manager_test1",
+            "name": "name_test1",
+            "postal_code": "postal_code_test1",
+            "address": "address_test1",
+            "email": "email_test1",
+            "birth": "birth_test1",
+            "is_corporate": False,
+            "tax_category": 10,
+        }
+        personal_info_1.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(personal_info_1)
+
+        await async_db.commit()
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={"issuer-address": issuer_address},
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert resp.headers["last-modified"] == "Mon, 13 May 2024 12:34:56 GMT"
+        assert resp.text.splitlines() == [
+            "account_address,key_manager,name,postal_code,address,email,birth,is_corporate,tax_category,balance,exchange_balance,exchange_commitment,pending_transfer,modified",
+            f"{self.account_address_2},,,,,,,,,20,0,0,0,2024-05-13T21:34:56+09:00",
+            f"{self.account_address_1},key_manager_test1,name_test1,postal_code_test1,address_test1,email_test1,birth_test1,False,10,10,11,12,5,2024-05-13T21:34:56+09:00",
+        ]
+
+    # <Normal_2>
+    # NDJSON format
+    # - include_former_holder = True
+    @pytest.mark.freeze_time("2024-05-13 12:34:56")
+    @pytest.mark.asyncio
+    async def test_normal_2(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_data(async_db, issuer_address, self.token_address)
+
+        idx_position_1 = IDXPosition()  # former holder
+        idx_position_1.token_address = self.token_address
+        idx_position_1.account_address = self.account_address_1
+        idx_position_1.balance = 0
+        idx_position_1.exchange_balance = 0
+        idx_position_1.exchange_commitment = 0
+        idx_position_1.pending_transfer = 0
+        async_db.add(idx_position_1)
+
+        await async_db.commit()
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={"issuer-address": issuer_address},
+            params={"format": "ndjson", "include_former_holder": "true"},
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        assert [orjson.loads(line) for line in resp.text.splitlines()] == [
+            {
+                "account_address": self.account_address_1,
+                "key_manager": None,
+                "name": None,
+                "postal_code": None,
+                "address": None,
+                "email": None,
+                "birth": None,
+                "is_corporate": None,
+                "tax_category": None,
+                "balance": 0,
+                "exchange_balance": 0,
+                "exchange_commitment": 0,
+                "pending_transfer": 0,
+                "modified": "2024-05-13T21:34:56+09:00",
+            }
+        ]
+
+    # <Normal_3>
+    # Incremental export with If-Modified-Since
+    @pytest.mark.asyncio
+    async def test_normal_3(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_data(async_db, issuer_address, self.token_address)
+
+        idx_position_1 = IDXPosition()
+        idx_position_1.token_address = self.token_address
+        idx_position_1.account_address = self.account_address_1
+        idx_position_1.balance = 10
+        idx_position_1.exchange_balance = 0
+        idx_position_1.exchange_commitment = 0
+        idx_position_1.pending_transfer = 0
+        idx_position_1.modified = datetime(2024, 5, 13, 12, 0, 0)
+        async_db.add(idx_position_1)
+
+        idx_position_2 = IDXPosition()
+        idx_position_2.token_address = self.token_address
+        idx_position_2.account_address = self.account_address_2
+        idx_position_2.balance = 20
+        idx_position_2.exchange_balance = 0
+        idx_position_2.exchange_commitment = 0
+        idx_position_2.pending_transfer = 0
+        idx_position_2.modified = datetime(2024, 5, 13, 12, 0, 0)
+        async_db.add(idx_position_2)
+
+        personal_info_2 = IDXPersonalInfo()  # modified after If-Modified-Since
+        personal_info_2.issuer_address = issuer_address
+        personal_info_2.account_address = self.account_address_2
+        personal_info_2.personal_info = {
+            "key_manager": "key_manager_test2",
+            "name": "name_test2",
+            "postal_code": "postal_code_test2",
+            "address": "address_test2",
+            "email": "email_test2",
+            "birth": "birth_test2",
+            "is_corporate": True,
+            "tax_category": 20,
+        }
+        personal_info_2.data_source = PersonalInfoDataSource.OFF_CHAIN
+        personal_info_2.modified = datetime(2024, 5, 13, 13, 0, 0)
+        async_db.add(personal_info_2)
+
+        await async_db.commit()
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={
+                "issuer-address": issuer_address,
+                "if-modified-since": "Mon, 13 May 2024 12:30:00 GMT",
+            },
+            params={"format": "ndjson"},
+        )
+
+        # assertion
+        assert resp.status_code == 200
+        assert [orjson.loads(line) for line in resp.text.splitlines()] == [
+            {
+                "account_address": self.account_address_2,
+                "key_manager": "key_manager_test2",
+                "name": "name_test2",
+                "postal_code": "postal_code_test2",
+                "address": "address_test2",
+                "email": "email_test2",
+                "birth": "birth_test2",
+                "is_corporate": True,
+                "tax_category": 20,
+                "balance": 20,
+                "exchange_balance": 0,
+                "exchange_commitment": 0,
+                "pending_transfer": 0,
+                "modified": "2024-05-13T22:00:00+09:00",
+            }
+        ]
+
+    ###########################################################################
+    # Error Case
+    ###########################################################################
+
+    # <Error_1>
+    # RequestValidationError: format
+    @pytest.mark.asyncio
+    async def test_error_1(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={"issuer-address": issuer_address},
+            params={"format": "xml"},
+        )
+
+        # assertion
+        assert resp.status_code == 422
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "RequestValidationError"},
+            "detail": [
+                {
+                    "type": "enum",
+                    "loc": ["query", "format"],
+                    "msg": "Input should be 'csv' or 'ndjson'",
+                    "input": "xml",
+                    "ctx": {"expected": "'csv' or 'ndjson'"},
+                }
+            ],
+        }
+
+    # <Error_2>
+    # InvalidParameterError: If-Modified-Since
+    @pytest.mark.asyncio
+    async def test_error_2(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={
+                "issuer-address": issuer_address,
+                "if-modified-since": "invalid_date",
+            },
+        )
+
+        # assertion
+        assert resp.status_code == 400
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "InvalidParameterError"},
+            "detail": "If-Modified-Since must be an HTTP-date",
+        }
+
+    # <Error_3>
+    # NotFound: token
+    @pytest.mark.asyncio
+    async def test_error_3(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={"issuer-address": issuer_address},
+        )
+
+        # assertion
+        assert resp.status_code == 404
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "NotFound"},
+            "detail": "token not found",
+        }
+
+    # <Error_4>
+    # InvalidParameterError
+    # this token is temporarily unavailable
+    @pytest.mark.asyncio
+    async def test_error_4(self, async_client, async_db):
+        issuer_address = default_eth_account("user1")["address"]
+
+        # prepare data
+        await self.prepare_data(
+            async_db, issuer_address, self.token_address, TokenStatus.PENDING
+        )
+        await async_db.commit()
+
+        # request target API
+        resp = await async_client.get(
+            self.base_url.format(self.token_address),
+            headers={"issuer-address": issuer_address},
+        )
+
+        # assertion
+        assert resp.status_code == 400
+        assert resp.json() == {
+            "meta": {"code": 1, "title": "InvalidParameterError"},
+            "detail": "this token is temporarily unavailable",
+        }
@@ -0,0 +1,398 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import multiprocessing
+import socketserver
+import threading
+import time
+import uuid
+from fnmatch import fnmatchcase
+from unittest import mock
+
+import pytest
+from shared_memory_dict import SharedMemoryDict
+
+from app.utils import cache_utils
+from app.utils.cache_utils import (
+    LRUCacheBackend,
+    RedisCacheBackend,
+    SharedMemoryCacheBackend,
+    VersionedSharedMemoryDict,
+)
+
+
+class TestLRUCacheBackend:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Set and get values by namespace
+    def test_normal_1(self):
+        cache = LRUCacheBackend(max_entries=10)
+        cache.set("ns1", "key", "value1")
+        cache.set("ns2", "key", "value2")
+
+        assert cache.get("ns1", "key") == "value1"
+        assert cache.get("ns2", "key") == "value2"
+        assert cache.get("ns1", "unknown", "default") == "default"
+
+        cache.delete("ns1", "key")
+        assert cache.get("ns1", "key") is None
+
+        cache.clear("ns2")
+        assert cache.get("ns2", "key") is None
+
+    # Normal_2
+    # Expired values are not returned
+    def test_normal_2(self):
+        cache = LRUCacheBackend(max_entries=10)
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1000):
+            cache.set("ns", "key", "value", ttl=10)
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1009):
+            assert cache.get("ns", "key") == "value"
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1010):
+            assert cache.get("ns", "key") is None
+
+    # Normal_3
+    # The least recently used value is evicted
+    def test_normal_3(self):
+        cache = LRUCacheBackend(max_entries=2)
+        cache.set("ns", "key1", 1)
+        cache.set("ns", "key2", 2)
+        assert cache.get("ns", "key1") == 1
+
+        cache.set("ns", "key3", 3)
+        assert cache.get("ns", "key1") == 1
+        assert cache.get("ns", "key2") is None
+        assert cache.get("ns", "key3") == 3
+
+
+class TestSharedMemoryCacheBackend:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Set and get values by namespace
+    def test_normal_1(self):
+        cache = SharedMemoryCacheBackend(max_entries=10)
+        cache.set("ns1", "key", {"value": 1})
+        cache.set("ns2", "key", {"value": 2})
+
+        assert cache.get("ns1", "key") == {"value": 1}
+        assert cache.get("ns2", "key") == {"value": 2}
+
+        cache.delete("ns1", "key")
+        assert cache.get("ns1", "key") is None
+
+        cache.clear("ns2")
+        assert cache.get("ns2", "key") is None
+
+    # Normal_2
+    # Expired values are not returned
+    def test_normal_2(self):
+        cache = SharedMemoryCacheBackend(max_entries=10)
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1000):
+            cache.set("ns", "key", "value", ttl=10)
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1010):
+            assert cache.get("ns", "key") is None
+
+    # Normal_3
+    # Values closest to expiration are evicted first
+    def test_normal_3(self):
+        cache = SharedMemoryCacheBackend(max_entries=2)
+        cache.clear("ns")
+        with mock.patch("app.utils.cache_utils.time.time", return_value=1000):
+            cache.set("ns", "key1", 1)
+            cache.set("ns", "key2", 2, ttl=10)
+            cache.set("ns", "key3", 3, ttl=20)
+
+            assert cache.get("ns", "key1") == 1
+            assert cache.get("ns", "key2") is None
+            assert cache.get("ns", "key3") == 3
+
+
+class TestRedisCacheBackend:
+    @pytest.fixture
+    def redis_server(self):
+        server = RESPStandInServer(("127.0.0.1", 0), RESPStandInHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"redis://:password@127.0.0.1:{server.server_address[1]}/1"
+        server.shutdown()
+        server.server_close()
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Set and get values by namespace
+    def test_normal_1(self, redis_server):
+        cache = RedisCacheBackend(url=redis_server, key_prefix="test")
+        cache.set("ns1", "key", {"value": 1})
+        cache.set("ns2", "key", {"value": 2})
+
+        assert cache.get("ns1", "key") == {"value": 1}
+        assert cache.get("ns2", "key") == {"value": 2}
+        assert cache.get("ns1", "unknown", "default") == "default"
+
+        cache.delete("ns1", "key")
+        assert cache.get("ns1", "key") is None
+
+        cache.clear("ns2")
+        assert cache.get("ns2", "key") is None
+
+    # Normal_2
+    # TTL is passed to the server
+    def test_normal_2(self, redis_server):
+        cache = RedisCacheBackend(url=redis_server, key_prefix="test")
+        cache.set("ns", "key", "value", ttl=10)
+
+        assert cache.get("ns", "key") == "value"
+        assert RESPStandInHandler.expirations["test:ns:key"] == 10
+
+    # Normal_3
+    # Values set by another client are visible
+    def test_normal_3(self, redis_server):
+        writer = RedisCacheBackend(url=redis_server, key_prefix="test")
+        reader = RedisCacheBackend(url=redis_server, key_prefix="test")
+        writer.set("ns", "key", "value")
+
+        assert reader.get("ns", "key") == "value"
+
+    # Normal_4
+    # Reconnect once when the connection is closed
+    def test_normal_4(self, redis_server):
+        cache = RedisCacheBackend(url=redis_server, key_prefix="test")
+        cache.set("ns", "key", "value")
+        cache._sock.close()
+
+        assert cache.get("ns", "key") == "value"
+
+    ###########################################################################
+    # Error Case
+    ###########################################################################
+
+    # Error_1
+    # Server errors are raised
+    def test_error_1(self, redis_server):
+        cache = RedisCacheBackend(url=redis_server, key_prefix="test")
+
+        with pytest.raises(ValueError, match="ERR unknown command"):
+            cache._execute("UNKNOWN")
+
+
+class TestGetCacheBackend:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # The backend is selected by CACHE_BACKEND
+    @pytest.mark.parametrize(
+        "cache_backend, expected",
+        [
+            ("lru", LRUCacheBackend),
+            ("shared_memory", SharedMemoryCacheBackend),
+            ("redis", RedisCacheBackend),
+        ],
+    )
+    def test_normal_1(self, cache_backend, expected):
+        with (
+            mock.patch("app.utils.cache_utils.CACHE_BACKEND", cache_backend),
+            mock.patch("app.utils.cache_utils._cache_backend", None),
+        ):
+            backend = cache_utils.get_cache_backend()
+
+            assert isinstance(backend, expected)
+            assert cache_utils.get_cache_backend() is backend
+
+
+class TestVersionedSharedMemoryDict:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Updates by another process are visible without re-opening
+    def test_normal_1(self):
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        shm_dict = VersionedSharedMemoryDict(name=name, size=4096)
+        try:
+            shm_dict["key"] = "value1"
+            assert shm_dict.get("key") == "value1"
+
+            ctx = multiprocessing.get_context("fork")
+            process = ctx.Process(target=_update_shm_dict, args=(name, "value2"))
+            process.start()
+            process.join()
+
+            assert shm_dict.get("key") == "value2"
+        finally:
+            shm_dict.shm.unlink()
+
+    # Normal_2
+    # The latest snapshot is reused while the sequence number does not change
+    def test_normal_2(self):
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        shm_dict = VersionedSharedMemoryDict(name=name, size=4096)
+        try:
+            shm_dict["key"] = "value"
+            assert shm_dict.get("key") == "value"
+
+            with mock.patch.object(
+                shm_dict._serializer, "loads", side_effect=Exception
+            ):
+                assert shm_dict.get("key") == "value"
+        finally:
+            shm_dict.shm.unlink()
+
+    # Normal_3
+    # Readers re-open the object re-created with a larger size
+    def test_normal_3(self):
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        writer = VersionedSharedMemoryDict(name=name, size=4096)
+        reader = VersionedSharedMemoryDict(name=name, size=4096)
+        try:
+            writer["key"] = "value1"
+            assert reader.get("key") == "value1"
+
+            data = dict(writer.snapshot())
+            data["large"] = "x" * 8192
+            writer.recreate(size=16384, db=data)
+
+            assert reader.get("large") == "x" * 8192
+            assert reader.shm.size >= 16384
+        finally:
+            writer.shm.unlink()
+
+
+class RESPStandInServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RESPStandInHandler(socketserver.StreamRequestHandler):
+    """Local stand-in for a Redis-compatible server"""
+
+    data: dict[bytes, bytes] = {}
+    expirations: dict[str, int] = {}
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:-2])):
+                length = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(length + 2)[:-2])
+            self.wfile.write(self.execute(args[0].decode().upper(), args[1:]))
+
+    def execute(self, command: str, args: list[bytes]) -> bytes:
+        if command in ("AUTH", "SELECT"):
+            return b"+OK\r\n"
+        elif command == "GET":
+            value = self.data.get(args[0])
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        elif command == "SET":
+            self.data[args[0]] = args[1]
+            if len(args) == 4 and args[2].upper() == b"EX":
+                self.expirations[args[0].decode()] = int(args[3])
+            return b"+OK\r\n"
+        elif command == "DEL":
+            count = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % count
+        elif command == "SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [key for key in self.data if fnmatchcase(key.decode(), pattern)]
+            reply = b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys)
+            for key in keys:
+                reply += b"$%d\r\n%s\r\n" % (len(key), key)
+            return reply
+        return b"-ERR unknown command\r\n"
+
+
+def _update_shm_dict(name: str, value: str):
+    shm_dict = VersionedSharedMemoryDict(name=name, size=4096)
+    shm_dict["key"] = value
+
+
+def _read_legacy(name: str, lock, count: int, result):
+    shm_dict = SharedMemoryDict(name=name, size=65536)
+    start = time.perf_counter()
+    for i in range(count):
+        # NOTE: Same as the previous read path: take the global lock and deserialize the whole object.
+        with lock:
+            shm_dict.get(f"key{i % 100}")
+    result.put(time.perf_counter() - start)
+
+
+def _read_versioned(name: str, lock, count: int, result):
+    shm_dict = VersionedSharedMemoryDict(name=name, size=65536)
+    start = time.perf_counter()
+    for i in range(count):
+        shm_dict.get(f"key{i % 100}")
+    result.put(time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+class TestSharedMemoryDictBenchmark:
+    READ_COUNT = 20000
+
+    @pytest.mark.parametrize("worker_count", [1, 4, 8])
+    def test_read(self, worker_count: int):
+        ctx = multiprocessing.get_context("fork")
+        lock = ctx.Lock()
+        data = {f"key{i}": "x" * 256 for i in range(100)}
+
+        elapsed = {}
+        for label, target, shm_class in [
+            ("legacy", _read_legacy, SharedMemoryDict),
+            ("versioned", _read_versioned, VersionedSharedMemoryDict),
+        ]:
+            name = f"bench_{uuid.uuid4().hex[:8]}"
+            shm_dict = shm_class(name=name, size=65536)
+            shm_dict.update(data)
+            try:
+                result = ctx.Queue()
+                processes = [
+                    ctx.Process(
+                        target=target, args=(name, lock, self.READ_COUNT, result)
+                    )
+                    for _ in range(worker_count)
+                ]
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    process.join()
+                elapsed[label] = max(result.get() for _ in processes)
+            finally:
+                shm_dict.shm.unlink()
+
+        for label, sec in elapsed.items():
+            print(
+                f"{label}: workers={worker_count}, "
+                f"reads/sec={self.READ_COUNT * worker_count / sec:,.0f}"
+            )
+        assert elapsed["versioned"] < elapsed["legacy"]
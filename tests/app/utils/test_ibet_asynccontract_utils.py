@@ -18,7 +18,8 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import json
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from eth_keyfile import decode_keyfile_json
@@ -29,7 +30,7 @@ from web3.middleware import ExtraDataToPOAMiddleware
 
 from app.exceptions import ContractRevertError, SendTransactionError
 from app.model.db import TransactionLock
-from app.utils.ibet_contract_utils import AsyncContractUtils
+from app.utils.ibet_contract_utils import AsyncContractEventsView, AsyncContractUtils
 from config import CHAIN_ID, TX_GAS_LIMIT, WEB3_HTTP_PROVIDER
 from tests.account_config import default_eth_account
 
@@ -631,3 +632,171 @@ class TestGetBlockByTransactionHash:
     ###########################################################################
     # Error Case
     ###########################################################################
+
+
+class TestGetEventLogs:
+    class StubEvent:
+        """Event stub that returns one log per block"""
+
+        def __init__(self, max_range: int | None = None):
+            self.max_range = max_range
+            self.call_args_list = []
+
+        async def get_logs(self, from_block, to_block, argument_filters=None):
+            self.call_args_list.append((from_block, to_block))
+            if (
+                self.max_range is not None
+                and to_block - from_block + 1 > self.max_range
+            ):
+                raise TimeoutError()
+            return [{"blockNumber": n} for n in range(from_block, to_block + 1)]
+
+    @staticmethod
+    def get_contract(address: str, event: StubEvent):
+        return AsyncContractEventsView(
+            address=address, contract_events=SimpleNamespace(Transfer=event)
+        )
+
+    @pytest.fixture(autouse=True)
+    def clear_block_range(self):
+        AsyncContractUtils.event_log_block_range.clear()
+        yield
+        AsyncContractUtils.event_log_block_range.clear()
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # <Normal_1>
+    # The range is bisected when the request times out
+    @patch("app.utils.ibet_contract_utils.INDEXER_BLOCK_LOT_MAX_SIZE", 100)
+    @patch("app.utils.ibet_contract_utils.INDEXER_EVENT_LOG_TARGET_COUNT", 1000)
+    @pytest.mark.asyncio
+    async def test_normal_1(self):
+        event = self.StubEvent(max_range=30)
+        contract = self.get_contract(address="0x01", event=event)
+
+        logs = await AsyncContractUtils.get_event_logs(
+            contract=contract, event="Transfer", block_from=1, block_to=100
+        )
+
+        assert [log["blockNumber"] for log in logs] == list(range(1, 101))
+        assert event.call_args_list == [
+            (1, 100),  # timeout
+            (1, 50),  # timeout
+            (1, 25),
+            (26, 50),
+            (51, 75),
+            (76, 100),
+        ]
+        # The tuned size is remembered for the contract event
+        assert AsyncContractUtils.event_log_block_range[("0x01", "Transfer")] == 25
+
+        # The next call starts with the tuned size
+        event.call_args_list.clear()
+        await AsyncContractUtils.get_event_logs(
+            contract=contract, event="Transfer", block_from=101, block_to=110
+        )
+        assert event.call_args_list == [(101, 110)]
+
+    # <Normal_2>
+    # The range is shrunk when the logs are dense and grown when sparse
+    @patch("app.utils.ibet_contract_utils.INDEXER_BLOCK_LOT_MAX_SIZE", 100)
+    @patch("app.utils.ibet_contract_utils.INDEXER_EVENT_LOG_TARGET_COUNT", 20)
+    @pytest.mark.asyncio
+    async def test_normal_2(self):
+        event = self.StubEvent()
+        contract = self.get_contract(address="0x01", event=event)
+        AsyncContractUtils.event_log_block_range[("0x01", "Transfer")] = 4
+
+        logs = await AsyncContractUtils.get_event_logs(
+            contract=contract, event="Transfer", block_from=1, block_to=70
+        )
+
+        assert [log["blockNumber"] for log in logs] == list(range(1, 71))
+        assert event.call_args_list == [
+            (1, 4),  # 4 logs: sparse
+            (5, 12),  # 8 logs: sparse
+            (13, 28),  # 16 logs
+            (29, 44),  # 16 logs
+            (45, 60),  # 16 logs
+            (61, 70),  # 10 logs
+        ]
+        assert AsyncContractUtils.event_log_block_range[("0x01", "Transfer")] == 16
+
+    # <Normal_3>
+    # Block range is not specified
+    @pytest.mark.asyncio
+    async def test_normal_3(self):
+        event = self.StubEvent()
+        event.get_logs = AsyncMock(return_value=[])
+        contract = self.get_contract(address="0x01", event=event)
+
+        logs = await AsyncContractUtils.get_event_logs(
+            contract=contract, event="Transfer", block_from=1, block_to="latest"
+        )
+
+        assert logs == []
+        event.get_logs.assert_awaited_once_with(
+            from_block=1, to_block="latest", argument_filters=None
+        )
+        assert AsyncContractUtils.event_log_block_range == {}
+
+    # <Normal_4>
+    # Logs of multiple contracts are split in the same way
+    @patch("app.utils.ibet_contract_utils.INDEXER_EVENT_LOG_TARGET_COUNT", 1000)
+    @pytest.mark.asyncio
+    async def test_normal_4(self):
+        call_args_list = []
+
+        async def get_logs(filter_params):
+            call_args_list.append(filter_params)
+            if filter_params["toBlock"] - filter_params["fromBlock"] + 1 > 30:
+                raise TimeoutError()
+            return [
+                {"blockNumber": n}
+                for n in range(filter_params["fromBlock"], filter_params["toBlock"] + 1)
+            ]
+
+        web3 = SimpleNamespace(eth=SimpleNamespace(get_logs=get_logs))
+
+        logs = await AsyncContractUtils.get_logs(
+            web3=web3,
+            address_list=["0x01", "0x02"],
+            event_topics=["0xaa"],
+            block_from=1,
+            block_to=100,
+            max_range_size=50,
+        )
+
+        assert [log["blockNumber"] for log in logs] == list(range(1, 101))
+        assert [
+            (params["fromBlock"], params["toBlock"]) for params in call_args_list
+        ] == [
+            (1, 50),  # timeout
+            (1, 25),
+            (26, 50),
+            (51, 75),
+            (76, 100),
+        ]
+        assert call_args_list[0]["address"] == ["0x01", "0x02"]
+        assert call_args_list[0]["topics"] == [["0xaa"]]
+        assert AsyncContractUtils.event_log_block_range[("*", "0xaa")] == 25
+
+    ###########################################################################
+    # Error Case
+    ###########################################################################
+
+    # <Error_1>
+    # The request times out even for a single block
+    @patch("app.utils.ibet_contract_utils.INDEXER_BLOCK_LOT_MAX_SIZE", 4)
+    @pytest.mark.asyncio
+    async def test_error_1(self):
+        event = self.StubEvent(max_range=0)
+        contract = self.get_contract(address="0x01", event=event)
+
+        with pytest.raises(TimeoutError):
+            await AsyncContractUtils.get_event_logs(
+                contract=contract, event="Transfer", block_from=1, block_to=4
+            )
+        assert event.call_args_list == [(1, 4), (1, 2), (1, 1)]
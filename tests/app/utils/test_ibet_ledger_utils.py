@@ -35,6 +35,7 @@ from app.model.db import (
     LedgerCreationStatus,
     LedgerDataType,
     LedgerDetailsData,
+    LedgerDetailsRow,
     LedgerDetailsTemplate,
     LedgerTemplate,
     Notification,
@@ -1306,6 +1307,108 @@ class TestSyncRequestWithRegisteredPersonalInfo:
         assert ledger_req_data.name == "name_test1"
         assert ledger_req_data.address == "address_test1"
 
+    # <Normal_4>
+    # Multiple request data
+    # - Registered personal information is set
+    # - Personal information with no valid values is treated as unregistered
+    # - Issuer address and data already set are excluded
+    async def test_normal_4(self, async_db):
+        request_id = "test_req_id"
+        issuer_address = "test_issuer_address"
+        user_address_1 = "test_address_1"
+        user_address_2 = "test_address_2"
+        user_address_3 = "test_address_3"
+
+        # Prepare data: LedgerCreationRequestData
+        for account_address, name in [
+            (user_address_1, None),
+            (user_address_2, None),
+            (user_address_3, "name_already_set"),
+            (issuer_address, None),
+        ]:
+            ledger_req_data = LedgerCreationRequestData()
+            ledger_req_data.request_id = request_id
+            ledger_req_data.data_type = LedgerDataType.IBET_FIN
+            ledger_req_data.account_address = account_address
+            ledger_req_data.acquisition_date = "2024/11/09"
+            ledger_req_data.name = name
+            ledger_req_data.amount = 10
+            ledger_req_data.price = 20
+            ledger_req_data.balance = 200
+            async_db.add(ledger_req_data)
+
+        # Prepare data: IDXPersonalInfo
+        idx_personal_info = IDXPersonalInfo()
+        idx_personal_info.account_address = user_address_1
+        idx_personal_info.issuer_address = issuer_address
+        idx_personal_info.personal_info = {
+            "key_manager": "key_manager_test1",
+            "name": "name_test1",
+            "address": "address_test1",
+        }
+        idx_personal_info.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(idx_personal_info)
+
+        idx_personal_info = IDXPersonalInfo()
+        idx_personal_info.account_address = user_address_2
+        idx_personal_info.issuer_address = issuer_address
+        idx_personal_info.personal_info = {
+            "key_manager": "",
+            "name": "",
+            "postal_code": "",
+            "address": "",
+            "email": "",
+            "birth": "",
+            "is_corporate": False,
+            "tax_category": 0,
+        }
+        idx_personal_info.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(idx_personal_info)
+
+        idx_personal_info = IDXPersonalInfo()
+        idx_personal_info.account_address = user_address_3
+        idx_personal_info.issuer_address = issuer_address
+        idx_personal_info.personal_info = {
+            "name": "name_test3",
+            "address": "address_test3",
+        }
+        idx_personal_info.data_source = PersonalInfoDataSource.ON_CHAIN
+        async_db.add(idx_personal_info)
+
+        await async_db.commit()
+
+        # Execute
+        (
+            initial_unset_count,
+            final_set_count,
+        ) = await ibet_ledger_utils.sync_request_with_registered_personal_info(
+            async_db,
+            request_id=request_id,
+            issuer_address=issuer_address,
+        )
+        await async_db.commit()
+
+        # Assertion
+        assert initial_unset_count == 2
+        assert final_set_count == 1
+
+        ledger_req_data_list = (
+            await async_db.scalars(
+                select(LedgerCreationRequestData).order_by(
+                    LedgerCreationRequestData.account_address
+                )
+            )
+        ).all()
+        assert [
+            (_data.account_address, _data.name, _data.address)
+            for _data in ledger_req_data_list
+        ] == [
+            (user_address_1, "name_test1", "address_test1"),
+            (user_address_2, None, None),
+            (user_address_3, "name_already_set", None),
+            (issuer_address, None, None),
+        ]
+
 
 @pytest.mark.asyncio
 class TestFinalizeLedger:
@@ -1669,26 +1772,6 @@ class TestFinalizeLedger:
                 {
                     "token_detail_type": "劣後受益権",
                     "headers": [],
-                    "data": [
-                        {
-                            "account_address": user_address_1,
-                            "name": "test_investor_name_1",
-                            "address": "test_investor_address_1",
-                            "amount": 10,
-                            "price": 20,
-                            "balance": 200,
-                            "acquisition_date": "2024/11/08",
-                        },
-                        {
-                            "account_address": user_address_1,
-                            "name": "test_investor_name_2",
-                            "address": "test_investor_address_2",
-                            "amount": 30,
-                            "price": 40,
-                            "balance": 1200,
-                            "acquisition_date": "2024/11/09",
-                        },
-                    ],
                     "footers": [],
                     "some_personal_info_not_registered": False,
                 },
@@ -1706,26 +1789,6 @@ class TestFinalizeLedger:
                             },
                         },
                     ],
-                    "data": [
-                        {
-                            "account_address": user_address_1,
-                            "name": "test_investor_name_3",
-                            "address": "test_investor_address_3",
-                            "amount": 10,
-                            "price": 20,
-                            "balance": 200,
-                            "acquisition_date": "2024/11/08",
-                        },
-                        {
-                            "account_address": user_address_1,
-                            "name": None,
-                            "address": None,
-                            "amount": 30,
-                            "price": 40,
-                            "balance": 1200,
-                            "acquisition_date": "2024/11/09",
-                        },
-                    ],
                     "footers": [
                         {
                             "key": "aaa",
@@ -1744,6 +1807,66 @@ class TestFinalizeLedger:
             "footers": _template.footers,
         }
 
+        _rows = (
+            await async_db.scalars(
+                select(LedgerDetailsRow).order_by(LedgerDetailsRow.id)
+            )
+        ).all()
+        assert [(_row.ledger_id, _row.detail_index, _row.json()) for _row in _rows] == [
+            (
+                1,
+                0,
+                {
+                    "account_address": user_address_1,
+                    "name": "test_investor_name_1",
+                    "address": "test_investor_address_1",
+                    "amount": 10,
+                    "price": 20,
+                    "balance": 200,
+                    "acquisition_date": "2024/11/08",
+                },
+            ),
+            (
+                1,
+                0,
+                {
+                    "account_address": user_address_1,
+                    "name": "test_investor_name_2",
+                    "address": "test_investor_address_2",
+                    "amount": 30,
+                    "price": 40,
+                    "balance": 1200,
+                    "acquisition_date": "2024/11/09",
+                },
+            ),
+            (
+                1,
+                1,
+                {
+                    "account_address": user_address_1,
+                    "name": "test_investor_name_3",
+                    "address": "test_investor_address_3",
+                    "amount": 10,
+                    "price": 20,
+                    "balance": 200,
+                    "acquisition_date": "2024/11/08",
+                },
+            ),
+            (
+                1,
+                1,
+                {
+                    "account_address": user_address_1,
+                    "name": None,
+                    "address": None,
+                    "amount": 30,
+                    "price": 40,
+                    "balance": 1200,
+                    "acquisition_date": "2024/11/09",
+                },
+            ),
+        ]
+
         ledger_req_data = (
             await async_db.scalars(select(LedgerCreationRequestData))
         ).all()
@@ -1896,34 +2019,12 @@ class TestFinalizeLedger:
                 {
                     "token_detail_type": "劣後受益権1",
                     "headers": [],
-                    "data": [
-                        {
-                            "account_address": user_address_1,
-                            "name": "test_investor_name_1",
-                            "address": "test_investor_address_1",
-                            "amount": 10,
-                            "price": 20,
-                            "balance": 200,
-                            "acquisition_date": "2024/11/08",
-                        },
-                    ],
                     "footers": [],
                     "some_personal_info_not_registered": False,
                 },
                 {
                     "token_detail_type": "劣後受益権2",
                     "headers": [],
-                    "data": [
-                        {
-                            "account_address": user_address_1,
-                            "name": "test_investor_name_2",
-                            "address": "test_investor_address_2",
-                            "amount": 30,
-                            "price": 40,
-                            "balance": 1200,
-                            "acquisition_date": "2024/11/09",
-                        },
-                    ],
                     "footers": [],
                     "some_personal_info_not_registered": False,
                 },
@@ -1931,6 +2032,40 @@ class TestFinalizeLedger:
             "footers": _template.footers,
         }
 
+        _rows = (
+            await async_db.scalars(
+                select(LedgerDetailsRow).order_by(LedgerDetailsRow.id)
+            )
+        ).all()
+        assert [(_row.ledger_id, _row.detail_index, _row.json()) for _row in _rows] == [
+            (
+                1,
+                0,
+                {
+                    "account_address": user_address_1,
+                    "name": "test_investor_name_1",
+                    "address": "test_investor_address_1",
+                    "amount": 10,
+                    "price": 20,
+                    "balance": 200,
+                    "acquisition_date": "2024/11/08",
+                },
+            ),
+            (
+                1,
+                1,
+                {
+                    "account_address": user_address_1,
+                    "name": "test_investor_name_2",
+                    "address": "test_investor_address_2",
+                    "amount": 30,
+                    "price": 40,
+                    "balance": 1200,
+                    "acquisition_date": "2024/11/09",
+                },
+            ),
+        ]
+
         ledger_req_data = (
             await async_db.scalars(select(LedgerCreationRequestData))
         ).all()
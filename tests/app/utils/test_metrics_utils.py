@@ -0,0 +1,178 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest import mock
+
+import pytest
+from prometheus_client import REGISTRY
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from app.utils import metrics_utils
+
+
+def get_sample_value(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture(scope="function", autouse=True)
+def enable_metrics():
+    with mock.patch("app.utils.metrics_utils.METRICS_ENABLED", True):
+        yield
+
+
+class TestRequestMetrics:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Counts recorded during a request are flushed with the route label
+    def test_normal_1(self):
+        route = "/test/normal_1/{token_address}"
+
+        request_metrics = metrics_utils.start_request()
+        metrics_utils.record_db_query(0.1)
+        metrics_utils.record_db_query(0.2)
+        metrics_utils.record_web3_request("ibet", "eth_call", 0.3)
+        metrics_utils.record_web3_request("ibet", "eth_call", 0.4)
+        metrics_utils.record_token_cache(hit=True)
+        metrics_utils.record_token_cache(hit=False)
+        metrics_utils.record_e2ee_decrypt()
+
+        # Not flushed until the request finishes
+        assert get_sample_value("ibet_prime_db_queries_total", {"route": route}) == 0
+
+        metrics_utils.finish_request(
+            request_metrics,
+            method="GET",
+            route=route,
+            status_code=200,
+        )
+
+        assert (
+            get_sample_value(
+                "ibet_prime_http_request_duration_seconds_count",
+                {"method": "GET", "route": route, "status": "200"},
+            )
+            == 1
+        )
+        assert get_sample_value("ibet_prime_db_queries_total", {"route": route}) == 2
+        assert get_sample_value(
+            "ibet_prime_db_query_duration_seconds_total", {"route": route}
+        ) == pytest.approx(0.3)
+        assert (
+            get_sample_value(
+                "ibet_prime_web3_requests_total",
+                {"route": route, "network": "ibet", "method": "eth_call"},
+            )
+            == 2
+        )
+        assert get_sample_value(
+            "ibet_prime_web3_request_duration_seconds_total",
+            {"route": route, "network": "ibet", "method": "eth_call"},
+        ) == pytest.approx(0.7)
+        assert (
+            get_sample_value(
+                "ibet_prime_token_cache_requests_total",
+                {"route": route, "result": "hit"},
+            )
+            == 1
+        )
+        assert (
+            get_sample_value(
+                "ibet_prime_token_cache_requests_total",
+                {"route": route, "result": "miss"},
+            )
+            == 1
+        )
+        assert get_sample_value("ibet_prime_e2ee_decrypt_total", {"route": route}) == 1
+
+    # Normal_2
+    # Counts recorded outside a request are recorded with an empty route label
+    def test_normal_2(self):
+        labels = {"route": "", "network": "ethereum", "method": "eth_blockNumber"}
+        before = get_sample_value("ibet_prime_web3_requests_total", labels)
+
+        metrics_utils.record_web3_request("ethereum", "eth_blockNumber", 0.2)
+
+        assert get_sample_value("ibet_prime_web3_requests_total", labels) == before + 1
+
+    # Normal_3
+    # Nothing is recorded when metrics are disabled
+    @mock.patch("app.utils.metrics_utils.METRICS_ENABLED", False)
+    def test_normal_3(self):
+        route = "/test/normal_3"
+
+        request_metrics = metrics_utils.start_request()
+        metrics_utils.record_db_query(0.1)
+        metrics_utils.finish_request(
+            request_metrics, method="GET", route=route, status_code=200
+        )
+
+        assert request_metrics is None
+        assert (
+            get_sample_value(
+                "ibet_prime_http_request_duration_seconds_count",
+                {"method": "GET", "route": route, "status": "200"},
+            )
+            == 0
+        )
+
+
+class TestRender:
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # Normal_1
+    # Metrics of the process are rendered in the Prometheus text format
+    def test_normal_1(self):
+        metrics_utils.finish_request(
+            metrics_utils.start_request(),
+            method="GET",
+            route="/test/render/normal_1",
+            status_code=200,
+        )
+
+        text = metrics_utils.render().decode()
+
+        assert "# TYPE ibet_prime_http_request_duration_seconds histogram" in text
+        assert 'route="/test/render/normal_1"' in text
+
+    # Normal_2
+    # Metrics written by all workers are aggregated in multiprocess mode
+    def test_normal_2(self, tmp_path):
+        # Values written by two workers
+        key = mmap_key(
+            "ibet_prime_db_queries",
+            "ibet_prime_db_queries_total",
+            ("route",),
+            ("/test/render/normal_2",),
+            "Number of executed DB queries",
+        )
+        for pid in (1, 2):
+            mmap_dict = MmapedDict(os.path.join(tmp_path, f"counter_{pid}.db"))
+            mmap_dict.write_value(key, 3.0, 0)
+            mmap_dict.close()
+
+        with mock.patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}):
+            text = metrics_utils.render().decode()
+
+        assert 'ibet_prime_db_queries_total{route="/test/render/normal_2"} 6.0' in text
@@ -23,7 +23,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from eth_keyfile import decode_keyfile_json
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import Web3
@@ -275,6 +275,45 @@ class TestProcessor:
         assert tx_data[1].from_address == deployer["address"]
         assert tx_data[1].to_address == token_contract.address
 
+    # Normal_4
+    # Range partitions covering the synchronized blocks are created
+    @pytest.mark.asyncio
+    async def test_normal_4(self, processor, async_db, caplog):
+        before_block_number = web3.eth.block_number
+        await self.set_block_number(async_db, before_block_number)
+
+        # Generate empty block
+        web3.provider.make_request(RPCEndpoint("evm_mine"), [])
+
+        # Execute batch processing
+        await processor.process()
+        after_block_number = web3.eth.block_number
+
+        # Assertion
+        for table_name in ("block_data", "tx_data"):
+            partition_bounds = (
+                await async_db.scalars(
+                    text(
+                        "SELECT pg_get_expr(c.relpartbound, c.oid) "
+                        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                        "WHERE i.inhparent = CAST(:parent AS regclass)"
+                    ),
+                    {"parent": table_name},
+                )
+            ).all()
+            assert "DEFAULT" in partition_bounds
+            ranges = []
+            for bound in partition_bounds:
+                matched = indexer_block_tx_data.PARTITION_BOUND_PATTERN.search(bound)
+                if matched is not None:
+                    ranges.append(
+                        (int(matched[1].strip("'")), int(matched[2].strip("'")))
+                    )
+            assert any(lower <= after_block_number < upper for lower, upper in ranges)
+
+        block_data = (await async_db.scalars(select(IDXBlockData))).all()
+        assert len(block_data) == 1
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -0,0 +1,228 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import logging
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+
+from app.model.db import (
+    Account,
+    IDXEthIbetWSTBalance,
+    IDXEthIbetWSTBalanceBlockNumber,
+    Token,
+    TokenType,
+    TokenVersion,
+)
+from batch.indexer_eth_wst_balances import Processor
+from config import ZERO_ADDRESS
+
+
+@pytest.fixture(scope="function")
+def processor(async_db, caplog: pytest.LogCaptureFixture):
+    LOG = logging.getLogger("background")
+    default_log_level = LOG.level
+    LOG.setLevel(logging.DEBUG)
+    LOG.propagate = True
+    yield Processor()
+    LOG.propagate = False
+    LOG.setLevel(default_log_level)
+
+
+@pytest.mark.asyncio
+class TestProcessor:
+    # Test IbetWST and token addresses
+    ibet_wst_address_1 = "0x1234567890123456789012345678900000000001"
+
+    # Test ibet token addresses
+    ibet_token_address_1 = "0x1234567890123456789012345678900000000010"
+
+    # Test issuer addresses
+    issuer_address_1 = "0x1234567890123456789012345678900000000100"
+
+    # Test user addresses
+    user_address_1 = "0x1234567890123456789012345678900000001000"
+    user_address_2 = "0x1234567890123456789012345678900000002000"
+
+    async def prepare_token(self, async_db):
+        token = Token()
+        token.token_address = self.ibet_token_address_1
+        token.issuer_address = self.issuer_address_1
+        token.type = TokenType.IBET_STRAIGHT_BOND
+        token.tx_hash = ""
+        token.abi = {}
+        token.version = TokenVersion.V_25_09
+        token.ibet_wst_deployed = True
+        token.ibet_wst_address = self.ibet_wst_address_1
+        async_db.add(token)
+
+        account = Account()
+        account.issuer_address = self.issuer_address_1
+        account.is_deleted = False
+        async_db.add(account)
+
+    async def get_balances(self, async_db) -> dict[str, tuple[int, int]]:
+        idx_balance_list = (
+            await async_db.scalars(
+                select(IDXEthIbetWSTBalance).where(
+                    IDXEthIbetWSTBalance.ibet_wst_address == self.ibet_wst_address_1
+                )
+            )
+        ).all()
+        return {
+            _balance.account_address: (_balance.finalized_balance, _balance.balance)
+            for _balance in idx_balance_list
+        }
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Transfer events exist in finalized and unfinalized blocks
+    # - finalized_balance is updated from finalized blocks only.
+    # - balance includes unfinalized blocks.
+    @mock.patch(
+        "batch.indexer_eth_wst_balances.Processor.get_finalized_block_number",
+        AsyncMock(return_value=100),
+    )
+    @mock.patch(
+        "batch.indexer_eth_wst_balances.Processor.get_latest_block_number",
+        AsyncMock(return_value=110),
+    )
+    async def test_normal_1(self, processor, async_db, caplog):
+        # Prepare test data
+        await self.prepare_token(async_db)
+        await async_db.commit()
+
+        # Run target process
+        get_event_logs = AsyncMock(
+            side_effect=[
+                # Finalized blocks
+                [
+                    {  # Mint
+                        "args": {
+                            "from": ZERO_ADDRESS,
+                            "to": self.user_address_1,
+                            "value": 1000,
+                        }
+                    },
+                    {  # Transfer
+                        "args": {
+                            "from": self.user_address_1,
+                            "to": self.user_address_2,
+                            "value": 300,
+                        }
+                    },
+                ],
+                # Unfinalized blocks
+                [
+                    {  # Transfer
+                        "args": {
+                            "from": self.user_address_2,
+                            "to": self.user_address_1,
+                            "value": 100,
+                        }
+                    },
+                    {  # Burn
+                        "args": {
+                            "from": self.user_address_1,
+                            "to": ZERO_ADDRESS,
+                            "value": 50,
+                        }
+                    },
+                ],
+            ]
+        )
+        with mock.patch(
+            "batch.indexer_eth_wst_balances.EthAsyncContractUtils.get_event_logs",
+            get_event_logs,
+        ):
+            await processor.sync_events()
+        async_db.expire_all()
+
+        # Check event log requests
+        assert [
+            (_call.kwargs["block_from"], _call.kwargs["block_to"])
+            for _call in get_event_logs.call_args_list
+        ] == [(1, 100), (101, 110)]
+
+        # Check IDXEthIbetWSTBalance
+        assert await self.get_balances(async_db) == {
+            self.user_address_1: (700, 750),
+            self.user_address_2: (300, 200),
+        }
+
+        # Check IDXEthIbetWSTBalanceBlockNumber
+        synced_block_number = (
+            await async_db.scalars(select(IDXEthIbetWSTBalanceBlockNumber).limit(1))
+        ).first()
+        assert synced_block_number.latest_block_number == 100
+
+        # Check log
+        assert caplog.messages == [
+            "Syncing IbetWST balances from=1, to=100",
+            "Sync completed successfully",
+        ]
+
+    # <Normal_2>
+    # No new finalized blocks and unfinalized events have been dropped (reorg)
+    # - balance is reset to finalized_balance.
+    @mock.patch(
+        "batch.indexer_eth_wst_balances.Processor.get_finalized_block_number",
+        AsyncMock(return_value=100),
+    )
+    @mock.patch(
+        "batch.indexer_eth_wst_balances.Processor.get_latest_block_number",
+        AsyncMock(return_value=105),
+    )
+    @mock.patch(
+        "batch.indexer_eth_wst_balances.EthAsyncContractUtils.get_event_logs",
+        AsyncMock(return_value=[]),
+    )
+    async def test_normal_2(self, processor, async_db, caplog):
+        # Prepare test data
+        await self.prepare_token(async_db)
+
+        idx_balance = IDXEthIbetWSTBalance()
+        idx_balance.ibet_wst_address = self.ibet_wst_address_1
+        idx_balance.account_address = self.user_address_1
+        idx_balance.finalized_balance = 700
+        idx_balance.balance = 800
+        async_db.add(idx_balance)
+
+        synced_block_number = IDXEthIbetWSTBalanceBlockNumber()
+        synced_block_number.latest_block_number = 100
+        async_db.add(synced_block_number)
+
+        await async_db.commit()
+
+        # Run target process
+        await processor.sync_events()
+        async_db.expire_all()
+
+        # Check IDXEthIbetWSTBalance
+        assert await self.get_balances(async_db) == {
+            self.user_address_1: (700, 700),
+        }
+
+        # Check log
+        assert caplog.messages == ["Sync completed successfully"]
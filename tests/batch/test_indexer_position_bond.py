@@ -36,6 +36,7 @@ from app.model.db import (
     IDXLockedPosition,
     IDXPosition,
     IDXPositionBondBlockNumber,
+    IDXPositionSummary,
     IDXUnlock,
     Notification,
     NotificationType,
@@ -951,6 +952,20 @@ class TestProcessor:
         assert _locked_position.account_address == issuer_address
         assert _locked_position.value == 60
 
+        _position_summary = (
+            await async_db.scalars(
+                select(IDXPositionSummary)
+                .where(IDXPositionSummary.token_address == token_address_1)
+                .limit(1)
+            )
+        ).first()
+        assert _position_summary.holder_count == 1
+        assert _position_summary.total_balance == 100 - 60
+        assert _position_summary.total_exchange_balance == 0
+        assert _position_summary.total_exchange_commitment == 0
+        assert _position_summary.total_pending_transfer == 0
+        assert _position_summary.total_locked == 60
+
         _lock_list = (
             await async_db.scalars(select(IDXLock).order_by(IDXLock.id))
         ).all()
@@ -18,7 +18,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest import mock
 from unittest.mock import AsyncMock, patch
 
@@ -31,7 +31,14 @@ from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from app.exceptions import ServiceUnavailableError
-from app.model.db import Account, Token, TokenCache, TokenType, TokenVersion
+from app.model.db import (
+    Account,
+    Token,
+    TokenAttrUpdate,
+    TokenCache,
+    TokenType,
+    TokenVersion,
+)
 from app.model.ibet import IbetShareContract, IbetStraightBondContract
 from app.model.ibet.tx_params.ibet_share import (
     UpdateParams as IbetShareUpdateParams,
@@ -324,6 +331,75 @@ class TestProcessor:
             "transferable": True,
         }
 
+    # <Normal_2>
+    # Refresh order
+    # - Tokens whose attributes have been updated are refreshed immediately
+    # - Tokens whose cache expires within TOKEN_CACHE_REFRESH_MARGIN are refreshed
+    # - Other tokens are not refreshed
+    @pytest.mark.asyncio
+    async def test_normal_2(self, processor, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+
+        # Prepare data : Account
+        account = Account()
+        account.issuer_address = issuer_address
+        account.keyfile = user_1["keyfile_json"]
+        account.eoa_password = E2EEUtils.encrypt("password")
+        async_db.add(account)
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        for i in range(4):
+            # Prepare data : Token
+            token = Token()
+            token.type = TokenType.IBET_STRAIGHT_BOND
+            token.token_address = f"token_address_{i}"
+            token.issuer_address = issuer_address
+            token.abi = {}
+            token.tx_hash = "tx_hash"
+            token.version = TokenVersion.V_25_09
+            async_db.add(token)
+
+        # Prepare data : TokenCache
+        # - token_address_0: cache is fresh
+        # - token_address_1: cache is fresh, but attributes have been updated
+        # - token_address_2: cache expires within the margin
+        # - token_address_3: no cache
+        for i, expiration_datetime in enumerate(
+            [
+                now + timedelta(hours=1),
+                now + timedelta(hours=1),
+                now + timedelta(seconds=60),
+            ]
+        ):
+            token_cache = TokenCache()
+            token_cache.token_address = f"token_address_{i}"
+            token_cache.attributes = {}
+            token_cache.cached_datetime = now - timedelta(minutes=1)
+            token_cache.expiration_datetime = expiration_datetime
+            async_db.add(token_cache)
+
+        # Prepare data : TokenAttrUpdate
+        token_attr_update = TokenAttrUpdate()
+        token_attr_update.token_address = "token_address_1"
+        token_attr_update.updated_datetime = now
+        async_db.add(token_attr_update)
+
+        await async_db.commit()
+
+        # Run target process
+        with patch.object(
+            IbetStraightBondContract, "get", autospec=True
+        ) as token_get_mock:
+            await processor.process()
+
+        # Assertion
+        assert sorted(
+            _call.args[0].token_address for _call in token_get_mock.call_args_list
+        ) == ["token_address_1", "token_address_2", "token_address_3"]
+        for _call in token_get_mock.call_args_list:
+            assert _call.kwargs == {"refresh_cache": True}
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -18,11 +18,13 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import ANY, patch
 
 import pytest
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 
+from app.database import BatchAsyncSessionLocal
 from app.exceptions import ContractRevertError, SendTransactionError
 from app.model.db import (
     Account,
@@ -450,7 +452,7 @@ class TestProcessor:
             assert _bulk_transfer.status == 1
 
     # <Normal_3>
-    # Skip other thread processed issuer
+    # Skip other worker processed issuer
     @patch("batch.processor_bulk_transfer.BULK_TRANSFER_WORKER_LOT_SIZE", 2)
     @pytest.mark.asyncio
     async def test_normal_3(self, processor, async_db):
@@ -458,6 +460,7 @@ class TestProcessor:
         _from_address = self.account_list[1]
         _to_address = self.account_list[2]
         _other_issuer_address_1 = "0x1234567890123456789012345678901234567890"
+        _other_worker_id = "4f1a2b3c-0000-4000-8000-000000000001"
 
         # Prepare data : Account
         account = Account()
@@ -469,22 +472,30 @@ class TestProcessor:
         # Prepare data : BulkTransferUpload
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = (
-            _other_issuer_address_1  # other thread processed issuer
+            _other_issuer_address_1  # other worker processed issuer
         )
         bulk_transfer_upload.upload_id = self.upload_id_list[0]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[0]
         bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = datetime.now(UTC).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
         async_db.add(bulk_transfer_upload)
 
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = (
-            _other_issuer_address_1  # other thread processed issuer
+            _other_issuer_address_1  # other worker processed issuer
         )
         bulk_transfer_upload.upload_id = self.upload_id_list[1]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[1]
         bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = datetime.now(UTC).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
         async_db.add(bulk_transfer_upload)
 
         bulk_transfer_upload = BulkTransferUpload()
@@ -543,17 +554,8 @@ class TestProcessor:
             target="app.model.ibet.token.IbetStraightBondContract.forced_transfer",
             return_value=None,
         )
-        processing_issuer = patch(
-            "batch.processor_bulk_transfer.processing_issuer",
-            {
-                1: {
-                    self.upload_id_list[0]: _other_issuer_address_1,
-                    self.upload_id_list[1]: _other_issuer_address_1,
-                }
-            },
-        )
 
-        with IbetStraightBondContract_transfer, processing_issuer:
+        with IbetStraightBondContract_transfer:
             # Execute batch
             await processor.process()
             async_db.expire_all()
@@ -596,13 +598,14 @@ class TestProcessor:
             assert _bulk_transfer.status == 1
 
     # <Normal_4>
-    # Other thread processed issuer(all same issuer)
+    # Other worker processed issuer(all same issuer)
     @patch("batch.processor_bulk_transfer.BULK_TRANSFER_WORKER_LOT_SIZE", 2)
     @pytest.mark.asyncio
     async def test_normal_4(self, processor, async_db):
         _account = self.account_list[0]
         _from_address = self.account_list[1]
         _to_address = self.account_list[2]
+        _other_worker_id = "4f1a2b3c-0000-4000-8000-000000000001"
 
         # Prepare data : Account
         account = Account()
@@ -615,27 +618,35 @@ class TestProcessor:
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = _account[
             "address"
-        ]  # other thread processed issuer
+        ]  # other worker processed issuer
         bulk_transfer_upload.upload_id = self.upload_id_list[0]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[0]
         bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = datetime.now(UTC).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
         async_db.add(bulk_transfer_upload)
 
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = _account[
             "address"
-        ]  # other thread processed issuer
+        ]  # other worker processed issuer
         bulk_transfer_upload.upload_id = self.upload_id_list[1]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[1]
         bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = datetime.now(UTC).replace(
+            tzinfo=None
+        ) + timedelta(hours=1)
         async_db.add(bulk_transfer_upload)
 
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = _account[
             "address"
-        ]  # other thread same issuer
+        ]  # other worker same issuer
         bulk_transfer_upload.upload_id = self.upload_id_list[2]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[2]
@@ -645,7 +656,7 @@ class TestProcessor:
         bulk_transfer_upload = BulkTransferUpload()
         bulk_transfer_upload.issuer_address = _account[
             "address"
-        ]  # other thread same issuer
+        ]  # other worker same issuer
         bulk_transfer_upload.upload_id = self.upload_id_list[3]
         bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
         bulk_transfer_upload.token_address = self.bulk_transfer_token[3]
@@ -684,17 +695,8 @@ class TestProcessor:
             target="app.model.ibet.token.IbetStraightBondContract.forced_transfer",
             return_value=None,
         )
-        processing_issuer = patch(
-            "batch.processor_bulk_transfer.processing_issuer",
-            {
-                1: {
-                    self.upload_id_list[0]: _account["address"],
-                    self.upload_id_list[1]: _account["address"],
-                }
-            },
-        )
 
-        with IbetStraightBondContract_transfer, processing_issuer:
+        with IbetStraightBondContract_transfer:
             # Execute batch
             await processor.process()
             async_db.expire_all()
@@ -734,6 +736,211 @@ class TestProcessor:
             _bulk_transfer = _bulk_transfer_list[0]
             assert _bulk_transfer.status == 1
 
+    # <Normal_5>
+    # Lease handling
+    # - Upload whose lease has expired is claimed again (crash recovery)
+    # - Upload whose lease is active is skipped
+    @pytest.mark.asyncio
+    async def test_normal_5(self, processor, async_db):
+        _account = self.account_list[0]
+        _from_address = self.account_list[1]
+        _to_address = self.account_list[2]
+        _other_worker_id = "4f1a2b3c-0000-4000-8000-000000000001"
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        # Prepare data : Account
+        account = Account()
+        account.issuer_address = _account["address"]
+        account.eoa_password = E2EEUtils.encrypt("password")
+        account.keyfile = _account["keyfile"]
+        async_db.add(account)
+
+        # Prepare data : BulkTransferUpload
+        bulk_transfer_upload = BulkTransferUpload()
+        bulk_transfer_upload.issuer_address = _account["address"]
+        bulk_transfer_upload.upload_id = self.upload_id_list[0]
+        bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
+        bulk_transfer_upload.token_address = self.bulk_transfer_token[0]
+        bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = now - timedelta(seconds=1)  # expired
+        async_db.add(bulk_transfer_upload)
+
+        bulk_transfer_upload = BulkTransferUpload()
+        bulk_transfer_upload.issuer_address = _account["address"]
+        bulk_transfer_upload.upload_id = self.upload_id_list[1]
+        bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
+        bulk_transfer_upload.token_address = self.bulk_transfer_token[1]
+        bulk_transfer_upload.status = 0
+        bulk_transfer_upload.claimed_by = _other_worker_id
+        bulk_transfer_upload.lease_expires = now + timedelta(hours=1)  # active
+        async_db.add(bulk_transfer_upload)
+
+        # Prepare data : BulkTransfer
+        for i in range(0, 2):
+            bulk_transfer = BulkTransfer()
+            bulk_transfer.issuer_address = _account["address"]
+            bulk_transfer.upload_id = self.upload_id_list[i]
+            bulk_transfer.token_type = TokenType.IBET_STRAIGHT_BOND
+            bulk_transfer.token_address = self.bulk_transfer_token[i]
+            bulk_transfer.from_address = _from_address["address"]
+            bulk_transfer.to_address = _to_address["address"]
+            bulk_transfer.amount = 1
+            bulk_transfer.status = 0
+            async_db.add(bulk_transfer)
+
+        await async_db.commit()
+
+        # Execute batch
+        with patch(
+            target="app.model.ibet.token.IbetStraightBondContract.forced_transfer",
+            return_value=None,
+        ):
+            await processor.process()
+            async_db.expire_all()
+
+        # Assertion
+        _bulk_transfer_upload_list = (
+            await async_db.scalars(
+                select(BulkTransferUpload).order_by(BulkTransferUpload.created)
+            )
+        ).all()
+        _bulk_transfer_upload = _bulk_transfer_upload_list[0]
+        assert _bulk_transfer_upload.status == 1
+        assert _bulk_transfer_upload.claimed_by == processor.worker_id
+        assert _bulk_transfer_upload.lease_expires is None
+        _bulk_transfer_upload = _bulk_transfer_upload_list[1]
+        assert _bulk_transfer_upload.status == 0
+        assert _bulk_transfer_upload.claimed_by == _other_worker_id
+
+        _bulk_transfer_list = (
+            await async_db.scalars(select(BulkTransfer).order_by(BulkTransfer.id))
+        ).all()
+        assert _bulk_transfer_list[0].status == 1
+        assert _bulk_transfer_list[1].status == 0
+
+    # <Normal_6>
+    # Graceful shutdown
+    # - The claimed uploads are released
+    @patch("batch.processor_bulk_transfer.BULK_TX_LOT_SIZE", 1)
+    @pytest.mark.asyncio
+    async def test_normal_6(self, processor, async_db):
+        _account = self.account_list[0]
+        _from_address = self.account_list[1]
+        _to_address = self.account_list[2]
+
+        # Prepare data : Account
+        account = Account()
+        account.issuer_address = _account["address"]
+        account.eoa_password = E2EEUtils.encrypt("password")
+        account.keyfile = _account["keyfile"]
+        async_db.add(account)
+
+        # Prepare data : Token
+        token = Token()
+        token.type = TokenType.IBET_STRAIGHT_BOND
+        token.tx_hash = ""
+        token.issuer_address = _account["address"]
+        token.token_address = self.bulk_transfer_token[0]
+        token.abi = {}
+        token.version = TokenVersion.V_24_09
+        async_db.add(token)
+
+        # Prepare data : BulkTransferUpload
+        bulk_transfer_upload = BulkTransferUpload()
+        bulk_transfer_upload.issuer_address = _account["address"]
+        bulk_transfer_upload.upload_id = self.upload_id_list[0]
+        bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
+        bulk_transfer_upload.token_address = self.bulk_transfer_token[0]
+        bulk_transfer_upload.status = 0
+        async_db.add(bulk_transfer_upload)
+
+        # Prepare data : BulkTransfer
+        for _ in range(0, 2):
+            bulk_transfer = BulkTransfer()
+            bulk_transfer.issuer_address = _account["address"]
+            bulk_transfer.upload_id = self.upload_id_list[0]
+            bulk_transfer.token_type = TokenType.IBET_STRAIGHT_BOND
+            bulk_transfer.token_address = self.bulk_transfer_token[0]
+            bulk_transfer.from_address = _from_address["address"]
+            bulk_transfer.to_address = _to_address["address"]
+            bulk_transfer.amount = 1
+            bulk_transfer.status = 0
+            async_db.add(bulk_transfer)
+
+        await async_db.commit()
+
+        # Execute batch
+        # NOTE: Shutdown is requested after the first transaction
+        async def bulk_forced_transfer(*args, **kwargs):
+            processor.is_shutdown.set()
+
+        with patch(
+            target="app.model.ibet.token.IbetStraightBondContract.bulk_forced_transfer",
+            side_effect=bulk_forced_transfer,
+        ):
+            await processor.process()
+            async_db.expire_all()
+
+        # Assertion
+        _bulk_transfer_upload = (
+            await async_db.scalars(select(BulkTransferUpload).limit(1))
+        ).first()
+        assert _bulk_transfer_upload.status == 0
+        assert _bulk_transfer_upload.claimed_by is None
+        assert _bulk_transfer_upload.lease_expires is None
+
+        _bulk_transfer_list = (
+            await async_db.scalars(select(BulkTransfer).order_by(BulkTransfer.id))
+        ).all()
+        assert _bulk_transfer_list[0].status == 1
+        assert _bulk_transfer_list[1].status == 0
+
+    # <Normal_7>
+    # Issuer being claimed by another worker (claim not yet committed)
+    # - Uploads of other issuers are claimed first
+    @pytest.mark.asyncio
+    async def test_normal_7(self, processor, async_db):
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        # Prepare data : BulkTransferUpload
+        for i in range(0, 2):
+            bulk_transfer_upload = BulkTransferUpload()
+            bulk_transfer_upload.issuer_address = self.account_list[i]["address"]
+            bulk_transfer_upload.upload_id = self.upload_id_list[i]
+            bulk_transfer_upload.token_type = TokenType.IBET_STRAIGHT_BOND
+            bulk_transfer_upload.token_address = self.bulk_transfer_token[i]
+            bulk_transfer_upload.status = 0
+            bulk_transfer_upload.created = now + timedelta(seconds=i)
+            async_db.add(bulk_transfer_upload)
+
+        await async_db.commit()
+
+        # Another worker holds the issuer lock of user1
+        other_db_session = BatchAsyncSessionLocal()
+        db_session = BatchAsyncSessionLocal()
+        try:
+            await other_db_session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        func.hashtext(BulkTransferUpload.__tablename__),
+                        func.hashtext(self.account_list[0]["address"]),
+                    )
+                )
+            )
+
+            # Execute batch
+            upload_list = await processor._Processor__get_uploads(db_session=db_session)
+        finally:
+            await other_db_session.rollback()
+            await other_db_session.close()
+            await db_session.close()
+
+        # Assertion
+        assert [_upload.upload_id for _upload, _ in upload_list] == [
+            self.upload_id_list[1]
+        ]
+
     ###########################################################################
     # Error Case
     ###########################################################################
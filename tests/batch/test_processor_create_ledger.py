@@ -19,6 +19,7 @@ SPDX-License-Identifier: Apache-2.0
 
 import asyncio
 import logging
+import re
 from datetime import datetime
 from unittest import mock
 from unittest.mock import AsyncMock
@@ -34,6 +35,10 @@ from app.model.ibet import (
 from batch.processor_create_ledger import LOG, Processor
 
 
+def mask_elapsed_time(messages: list[str]) -> list[str]:
+    return [re.sub(r"\d+\.\d{3}s", "*s", message) for message in messages]
+
+
 @pytest.fixture(scope="function")
 def processor(async_db):
     log = logging.getLogger("background")
@@ -96,9 +101,10 @@ class TestProcessor:
         async_db.expire_all()
 
         # Assertion
-        assert caplog.messages == [
+        assert mask_elapsed_time(caplog.messages) == [
             "Process Start",
             f"Personal information fields have been updated: {request_id} 0/1",
+            f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)",
             "Process End",
         ]
 
@@ -143,10 +149,11 @@ class TestProcessor:
         ).first()
         assert ledger_req.status == LedgerCreationStatus.COMPLETED
 
-        assert caplog.messages == [
+        assert mask_elapsed_time(caplog.messages) == [
             "Process Start",
             f"Personal information fields have been updated: {request_id} 1/1",
             f"The ledger has been created: {request_id} {token_address}",
+            f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)",
             "Process End",
         ]
 
@@ -192,10 +199,11 @@ class TestProcessor:
         ).first()
         assert ledger_req.status == LedgerCreationStatus.COMPLETED
 
-        assert caplog.messages == [
+        assert mask_elapsed_time(caplog.messages) == [
             "Process Start",
             f"Personal information fields have been updated: {request_id} 1/1",
             f"The ledger has been created: {request_id} {token_address}",
+            f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)",
             "Process End",
         ]
 
@@ -242,10 +250,11 @@ class TestProcessor:
         ).first()
         assert ledger_req.status == LedgerCreationStatus.COMPLETED
 
-        assert caplog.messages == [
+        assert mask_elapsed_time(caplog.messages) == [
             "Process Start",
             f"Personal information fields have been updated: {request_id} 0/1",
             f"The ledger has been created (time limit exceeded): {request_id} {token_address}",
+            f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)",
             "Process End",
         ]
 
@@ -293,9 +302,102 @@ class TestProcessor:
         ).first()
         assert ledger_req.status == LedgerCreationStatus.COMPLETED
 
-        assert caplog.messages == [
+        assert mask_elapsed_time(caplog.messages) == [
             "Process Start",
             f"Personal information fields have been updated: {request_id} 0/1",
             f"The ledger has been created (time limit exceeded): {request_id} {token_address}",
+            f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)",
             "Process End",
         ]
+
+    # <Normal_5>
+    # Multiple ledger creation requests
+    # -> All requests are processed
+    @mock.patch("app.model.ibet.token.IbetShareContract.get")
+    @mock.patch(
+        "batch.processor_create_ledger.sync_request_with_registered_personal_info",
+        AsyncMock(return_value=(1, 1)),
+    )
+    @mock.patch(
+        "batch.processor_create_ledger.finalize_ledger", AsyncMock(return_value=None)
+    )
+    async def test_normal_5(self, token_mock, processor, async_db, caplog):
+        request_id_list = [f"test_request_id_{i}" for i in range(3)]
+        token_address = "test_token_address"
+        issuer_address = "test_issuer_address"
+
+        # Prepare data: LedgerCreationRequest
+        for request_id in request_id_list:
+            ledger_req = LedgerCreationRequest()
+            ledger_req.request_id = request_id
+            ledger_req.token_type = TokenType.IBET_SHARE
+            ledger_req.token_address = token_address
+            ledger_req.status = LedgerCreationStatus.PROCESSING
+            async_db.add(ledger_req)
+        await async_db.commit()
+
+        # Mock: IbetShareContract.get
+        mock_token = IbetShareContract()
+        mock_token.issuer_address = issuer_address
+        mock_token.token_address = token_address
+        token_mock.return_value = mock_token
+
+        # Execute batch
+        await processor.process()
+        async_db.expire_all()
+
+        # Assertion
+        ledger_req_list = (await async_db.scalars(select(LedgerCreationRequest))).all()
+        assert len(ledger_req_list) == 3
+        for ledger_req in ledger_req_list:
+            assert ledger_req.status == LedgerCreationStatus.COMPLETED
+
+        assert token_mock.call_count == 3
+        assert caplog.messages[0] == "Process Start"
+        assert caplog.messages[-1] == "Process End"
+        messages = mask_elapsed_time(caplog.messages)
+        for request_id in request_id_list:
+            assert (
+                f"The ledger has been created: {request_id} {token_address}" in messages
+            )
+            assert (
+                f"Ledger creation request processed: {request_id} elapsed=*s (token=*s, sync=*s, finalize=*s)"
+                in messages
+            )
+
+    # <Normal_6>
+    # The ledger creation request is claimed by another process
+    # -> skip
+    @mock.patch("app.model.ibet.token.IbetShareContract.get")
+    async def test_normal_6(self, token_mock, processor, async_db, caplog):
+        request_id = "test_request_id"
+        token_address = "test_token_address"
+
+        # Prepare data: LedgerCreationRequest
+        ledger_req = LedgerCreationRequest()
+        ledger_req.request_id = request_id
+        ledger_req.token_type = TokenType.IBET_SHARE
+        ledger_req.token_address = token_address
+        ledger_req.status = LedgerCreationStatus.PROCESSING
+        async_db.add(ledger_req)
+        await async_db.commit()
+
+        # Lock the request
+        await async_db.scalars(
+            select(LedgerCreationRequest)
+            .where(LedgerCreationRequest.request_id == request_id)
+            .with_for_update()
+        )
+
+        # Execute batch
+        await processor.process()
+        await async_db.rollback()
+
+        # Assertion
+        ledger_req = (
+            await async_db.scalars(select(LedgerCreationRequest).limit(1))
+        ).first()
+        assert ledger_req.status == LedgerCreationStatus.PROCESSING
+
+        token_mock.assert_not_called()
+        assert caplog.messages == ["Process Start", "Process End"]
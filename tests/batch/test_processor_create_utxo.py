@@ -19,13 +19,14 @@ SPDX-License-Identifier: Apache-2.0
 
 import datetime
 import json
+import random
 import time
 from unittest import mock
 from unittest.mock import ANY, MagicMock, call
 
 import pytest
 from eth_keyfile import decode_keyfile_json
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 
@@ -41,6 +42,7 @@ from app.model.db import (
     TokenType,
     TokenVersion,
     UTXOBlockNumber,
+    UTXOTokenBlockNumber,
 )
 from app.model.ibet import IbetShareContract, IbetStraightBondContract
 from app.model.ibet.tx_params.ibet_share import (
@@ -62,7 +64,7 @@ from app.model.ibet.tx_params.ibet_straight_bond import (
 )
 from app.utils.e2ee_utils import E2EEUtils
 from app.utils.ibet_contract_utils import AsyncContractUtils, ContractUtils
-from batch.processor_create_utxo import Processor
+from batch.processor_create_utxo import Processor, UTXOBook
 from config import CHAIN_ID, TX_GAS_LIMIT, WEB3_HTTP_PROVIDER
 from tests.account_config import default_eth_account
 from tests.contract_utils import (
@@ -2177,6 +2179,118 @@ class TestProcessor:
             ]
         )
 
+    # <Normal_12>
+    # Per-token UTXO cursor
+    # - Token with its own cursor is synchronized from that cursor
+    # - Token without its own cursor is synchronized from the overall cursor
+    @mock.patch("batch.processor_create_utxo.request_ledger_creation")
+    async def test_normal_12(self, mock_func, processor, async_db):
+        user_1 = default_eth_account("user1")
+        issuer_address = user_1["address"]
+        issuer_private_key = decode_keyfile_json(
+            raw_keyfile_json=user_1["keyfile_json"], password="password".encode("utf-8")
+        )
+        user_2 = default_eth_account("user2")
+        user_address_1 = user_2["address"]
+
+        # prepare data
+        token_address_1 = await deploy_bond_token_contract(
+            issuer_address, issuer_private_key
+        )
+        _token_1 = Token()
+        _token_1.type = TokenType.IBET_STRAIGHT_BOND
+        _token_1.tx_hash = ""
+        _token_1.issuer_address = issuer_address
+        _token_1.token_address = token_address_1
+        _token_1.abi = {}
+        _token_1.version = TokenVersion.V_25_09
+        async_db.add(_token_1)
+
+        token_address_2 = await deploy_share_token_contract(
+            issuer_address, issuer_private_key
+        )
+        _token_2 = Token()
+        _token_2.type = TokenType.IBET_SHARE
+        _token_2.tx_hash = ""
+        _token_2.issuer_address = issuer_address
+        _token_2.token_address = token_address_2
+        _token_2.abi = {}
+        _token_2.version = TokenVersion.V_25_09
+        async_db.add(_token_2)
+
+        account = Account()
+        account.issuer_address = issuer_address
+        account.keyfile = user_1["keyfile_json"]
+        account.eoa_password = E2EEUtils.encrypt("password")
+        async_db.add(account)
+
+        # Bond:issuer -> user1 (before the cursor of token_1)
+        _transfer_1 = IbetStraightBondTransferParams(
+            from_address=issuer_address, to_address=user_address_1, amount=40
+        )
+        await IbetStraightBondContract(token_address_1).forced_transfer(
+            _transfer_1, issuer_address, issuer_private_key
+        )
+        block_number_1 = web3.eth.block_number
+
+        _utxo_block_number = UTXOBlockNumber()
+        _utxo_block_number.latest_block_number = block_number_1 - 1
+        async_db.add(_utxo_block_number)
+
+        _utxo_token_block_number = UTXOTokenBlockNumber()
+        _utxo_token_block_number.token_address = token_address_1
+        _utxo_token_block_number.latest_block_number = block_number_1
+        async_db.add(_utxo_token_block_number)
+
+        await async_db.commit()
+
+        # Share:issuer -> user1
+        _transfer_2 = IbetShareTransferParams(
+            from_address=issuer_address, to_address=user_address_1, amount=70
+        )
+        await IbetShareContract(token_address_2).forced_transfer(
+            _transfer_2, issuer_address, issuer_private_key
+        )
+        latest_block = web3.eth.block_number
+
+        # Execute batch
+        await processor.process()
+        async_db.expire_all()
+
+        # assertion
+        _utxo_list = (await async_db.scalars(select(UTXO).order_by(UTXO.created))).all()
+        assert len(_utxo_list) == 1
+        _utxo = _utxo_list[0]
+        assert _utxo.account_address == user_address_1
+        assert _utxo.token_address == token_address_2
+        assert _utxo.amount == 70
+        assert _utxo.block_number == latest_block
+
+        _utxo_token_block_numbers = (
+            await async_db.scalars(
+                select(UTXOTokenBlockNumber).order_by(
+                    UTXOTokenBlockNumber.token_address
+                )
+            )
+        ).all()
+        assert {
+            _block_number.token_address: _block_number.latest_block_number
+            for _block_number in _utxo_token_block_numbers
+        } == {
+            token_address_1: latest_block,
+            token_address_2: latest_block,
+        }
+        _utxo_block_number = (
+            await async_db.scalars(select(UTXOBlockNumber).limit(1))
+        ).first()
+        assert _utxo_block_number.latest_block_number == latest_block
+
+        mock_func.assert_has_calls(
+            [
+                call(token_address=token_address_2, db=ANY),
+            ]
+        )
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -2355,3 +2469,241 @@ class TestProcessor:
             await async_db.scalars(select(UTXOBlockNumber).limit(1))
         ).first()
         assert _utxo_block_number.latest_block_number == latest_block
+
+
+async def legacy_sink_on_utxo(
+    db_session,
+    spent: bool,
+    transaction_hash: str,
+    account_address: str,
+    token_address: str,
+    amount: int,
+    block_number: int,
+    block_timestamp: datetime.datetime,
+    reallocation_from: str | None = None,
+):
+    """UTXO sink logic before UTXOBook was introduced (reference implementation)"""
+    if not spent:
+        if reallocation_from is None:
+            _utxo = (
+                await db_session.scalars(
+                    select(UTXO)
+                    .where(
+                        UTXO.transaction_hash == transaction_hash,
+                        UTXO.account_address == account_address,
+                    )
+                    .limit(1)
+                )
+            ).first()
+            if _utxo is None:
+                _utxo = UTXO()
+                _utxo.transaction_hash = transaction_hash
+                _utxo.account_address = account_address
+                _utxo.token_address = token_address
+                _utxo.amount = amount
+                _utxo.block_number = block_number
+                _utxo.block_timestamp = block_timestamp
+                db_session.add(_utxo)
+            else:
+                _utxo.amount = _utxo.amount + amount
+        else:
+            _source_utxo_list = (
+                await db_session.scalars(
+                    select(UTXO)
+                    .where(
+                        UTXO.account_address == reallocation_from,
+                        UTXO.token_address == token_address,
+                        UTXO.amount > 0,
+                    )
+                    .order_by(UTXO.block_timestamp)
+                )
+            ).all()
+            remaining = amount
+            for _source_utxo in _source_utxo_list:
+                if remaining <= 0:
+                    break
+                _reallocation_amount = min(_source_utxo.amount, remaining)
+                _reallocation_utxo = (
+                    await db_session.scalars(
+                        select(UTXO)
+                        .where(
+                            UTXO.transaction_hash == _source_utxo.transaction_hash,
+                            UTXO.account_address == account_address,
+                        )
+                        .limit(1)
+                    )
+                ).first()
+                if _reallocation_utxo is not None:
+                    _reallocation_utxo.amount = (
+                        _reallocation_utxo.amount + _reallocation_amount
+                    )
+                else:
+                    _reallocation_utxo = UTXO()
+                    _reallocation_utxo.transaction_hash = _source_utxo.transaction_hash
+                    _reallocation_utxo.account_address = account_address
+                    _reallocation_utxo.token_address = _source_utxo.token_address
+                    _reallocation_utxo.amount = _reallocation_amount
+                    _reallocation_utxo.block_number = _source_utxo.block_number
+                    _reallocation_utxo.block_timestamp = _source_utxo.block_timestamp
+                    db_session.add(_reallocation_utxo)
+                remaining = remaining - _reallocation_amount
+    else:
+        _utxo_list = (
+            await db_session.scalars(
+                select(UTXO)
+                .where(
+                    UTXO.account_address == account_address,
+                    UTXO.token_address == token_address,
+                    UTXO.amount > 0,
+                )
+                .order_by(UTXO.block_timestamp)
+            )
+        ).all()
+        remaining = amount
+        for _utxo in _utxo_list:
+            if remaining <= 0:
+                break
+            elif _utxo.amount <= remaining:
+                remaining = remaining - _utxo.amount
+                _utxo.amount = 0
+            else:
+                _utxo.amount = _utxo.amount - remaining
+                remaining = 0
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+class TestUTXOBook:
+    token_address = "0x82b1c9374aB625380bd498a3d9dF4033B8A0E3Bb"
+    other_token_address = "0x3F198534Bbe3B2a197d3B317d41392F348EAC707"
+    accounts = [
+        "0xb75c7545b9230FEe99b7af370D38eBd3DAD929f7",
+        "0x1234567890123456789012345678900000000001",
+        "0x1234567890123456789012345678900000000002",
+        "0x1234567890123456789012345678900000000003",
+    ]
+
+    def generate_data(self, seed: int):
+        """Generate initial UTXOs and UTXO operations at random"""
+        rnd = random.Random(seed)
+        base_timestamp = datetime.datetime(2025, 1, 1)
+
+        tx_count = 0
+        initial_utxos = []
+        for _ in range(rnd.randint(0, 15)):
+            tx_count += 1
+            initial_utxos.append(
+                {
+                    "transaction_hash": f"0x{tx_count:064x}",
+                    "account_address": rnd.choice(self.accounts),
+                    "token_address": rnd.choice(
+                        [self.token_address] * 3 + [self.other_token_address]
+                    ),
+                    "amount": rnd.randint(0, 20),
+                    "block_number": tx_count,
+                    "block_timestamp": base_timestamp
+                    + datetime.timedelta(seconds=tx_count),
+                }
+            )
+
+        utxo_operations = []
+        for _ in range(rnd.randint(1, 40)):
+            tx_count += 1
+            block_timestamp = base_timestamp + datetime.timedelta(seconds=tx_count)
+            if rnd.random() < 0.2:
+                # Issue
+                utxo_operations.append(
+                    {
+                        "spent": False,
+                        "transaction_hash": f"0x{tx_count:064x}",
+                        "account_address": rnd.choice(self.accounts),
+                        "amount": rnd.randint(1, 30),
+                        "block_number": tx_count,
+                        "block_timestamp": block_timestamp,
+                    }
+                )
+            else:
+                # Transfer or Reallocation
+                from_address, to_address = rnd.sample(self.accounts, 2)
+                amount = rnd.randint(1, 40)
+                utxo_operations.append(
+                    {
+                        "spent": False,
+                        "transaction_hash": f"0x{tx_count:064x}",
+                        "account_address": to_address,
+                        "amount": amount,
+                        "block_number": tx_count,
+                        "block_timestamp": block_timestamp,
+                        "reallocation_from": (
+                            from_address if rnd.random() < 0.3 else None
+                        ),
+                    }
+                )
+                utxo_operations.append(
+                    {
+                        "spent": True,
+                        "transaction_hash": f"0x{tx_count:064x}",
+                        "account_address": from_address,
+                        "amount": amount,
+                        "block_number": tx_count,
+                        "block_timestamp": block_timestamp,
+                    }
+                )
+        return initial_utxos, utxo_operations, rnd.randint(0, len(utxo_operations))
+
+    @staticmethod
+    async def reset_utxos(async_db, initial_utxos: list[dict]):
+        await async_db.execute(delete(UTXO))
+        for initial_utxo in initial_utxos:
+            async_db.add(UTXO(**initial_utxo))
+        await async_db.commit()
+
+    @staticmethod
+    async def snapshot_utxos(async_db):
+        async_db.expire_all()
+        return {
+            (_utxo.transaction_hash, _utxo.account_address): (
+                _utxo.token_address,
+                _utxo.amount,
+                _utxo.block_number,
+                _utxo.block_timestamp,
+            )
+            for _utxo in (await async_db.scalars(select(UTXO))).all()
+        }
+
+    ###########################################################################
+    # Normal Case
+    ###########################################################################
+
+    # <Normal_1>
+    # Differential test: UTXOBook produces the same UTXOs as the legacy logic
+    @pytest.mark.parametrize("seed", range(20))
+    async def test_normal_1(self, async_db, seed):
+        initial_utxos, utxo_operations, lot_boundary = self.generate_data(seed)
+
+        # Legacy logic
+        await self.reset_utxos(async_db, initial_utxos)
+        for utxo_operation in utxo_operations:
+            await legacy_sink_on_utxo(
+                db_session=async_db,
+                token_address=self.token_address,
+                **utxo_operation,
+            )
+        await async_db.commit()
+        expected = await self.snapshot_utxos(async_db)
+
+        # UTXOBook (Operations are split into two block lots)
+        await self.reset_utxos(async_db, initial_utxos)
+        for lot in [
+            utxo_operations[:lot_boundary],
+            utxo_operations[lot_boundary:],
+        ]:
+            utxo_book = UTXOBook(token_address=self.token_address)
+            await utxo_book.load(db_session=async_db, utxo_operations=lot)
+            for utxo_operation in lot:
+                await utxo_book.apply(db_session=async_db, **utxo_operation)
+            await utxo_book.flush(db_session=async_db)
+            await async_db.commit()
+        actual = await self.snapshot_utxos(async_db)
+
+        assert actual == expected
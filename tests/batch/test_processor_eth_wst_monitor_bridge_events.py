@@ -138,16 +138,18 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [
-                    {
-                        "args": {
-                            "accountAddress": user1["address"],
-                            "lockAddress": issuer["address"],
-                            "value": 1000,
-                            "data": '{"message": "ibet_wst_bridge"}',
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 1000,
+                                "data": '{"message": "ibet_wst_bridge"}',
+                            }
                         }
-                    }
-                ],  # __process_mint
+                    ]
+                },  # __process_mint
             ]
         ),
     )
@@ -155,8 +157,8 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_burn
-                [],  # __process_transfer
+                {},  # __process_burn
+                {},  # __process_transfer
             ]
         ),
     )
@@ -283,16 +285,18 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [
-                    {
-                        "args": {
-                            "accountAddress": user1["address"],
-                            "lockAddress": issuer["address"],
-                            "value": 1000,
-                            "data": '{"message": "ibet_wst_bridge", "network": "ethereum"}',
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 1000,
+                                "data": '{"message": "ibet_wst_bridge", "network": "ethereum"}',
+                            }
                         }
-                    }
-                ],  # __process_mint
+                    ]
+                },  # __process_mint
             ]
         ),
     )
@@ -300,8 +304,8 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_burn
-                [],  # __process_transfer
+                {},  # __process_burn
+                {},  # __process_transfer
             ]
         ),
     )
@@ -400,16 +404,18 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [
-                    {
-                        "args": {
-                            "accountAddress": user1["address"],
-                            "lockAddress": issuer["address"],
-                            "value": 1000,
-                            "data": '{"message": "ibet_wst_bridge"}',  # network not specified
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 1000,
+                                "data": '{"message": "ibet_wst_bridge"}',  # network not specified
+                            }
                         }
-                    }
-                ],  # __process_mint
+                    ]
+                },  # __process_mint
             ]
         ),
     )
@@ -417,8 +423,8 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_burn
-                [],  # __process_transfer
+                {},  # __process_burn
+                {},  # __process_transfer
             ]
         ),
     )
@@ -517,16 +523,18 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [
-                    {
-                        "args": {
-                            "accountAddress": user1["address"],
-                            "lockAddress": issuer["address"],
-                            "value": 1000,
-                            "data": '{"message": "invalid_message"}',
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 1000,
+                                "data": '{"message": "invalid_message"}',
+                            }
                         }
-                    }
-                ],  # __process_mint
+                    ]
+                },  # __process_mint
             ]
         ),
     )
@@ -534,8 +542,8 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_burn
-                [],  # __process_transfer
+                {},  # __process_burn
+                {},  # __process_transfer
             ]
         ),
     )
@@ -605,6 +613,120 @@ class TestProcessor:
         ).all()
         assert len(ibet_tx_list) == 0
 
+    # Normal_3_3
+    # ibet -> eth bridge events of multiple IbetWST tokens are detected
+    # - Check if the mint transaction records are registered for each token
+    @mock.patch(
+        "batch.processor_eth_wst_monitor_bridge_events.ETH_MASTER_ACCOUNT_ADDRESS",
+        relayer["address"],
+    )
+    @mock.patch(
+        "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
+        AsyncMock(
+            side_effect=[
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 1000,
+                                "data": '{"message": "ibet_wst_bridge"}',
+                            }
+                        }
+                    ],
+                    ibet_wst_address_2: [
+                        {
+                            "args": {
+                                "accountAddress": user2["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 2000,
+                                "data": '{"message": "ibet_wst_bridge"}',
+                            }
+                        },
+                        {
+                            "args": {
+                                "accountAddress": user1["address"],
+                                "lockAddress": issuer["address"],
+                                "value": 3000,
+                                "data": '{"message": "ibet_wst_bridge"}',
+                            }
+                        },
+                    ],
+                },  # __process_mint
+            ]
+        ),
+    )
+    @mock.patch(
+        "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
+        AsyncMock(
+            side_effect=[
+                {},  # __process_burn
+                {},  # __process_transfer
+            ]
+        ),
+    )
+    async def test_normal_3_3(self, processor, async_db, caplog):
+        # Generate empty block
+        ibet_web3.provider.make_request(RPCEndpoint("evm_mine"), [])
+        eth_web3.provider.make_request(RPCEndpoint("evm_mine"), [])
+
+        # Prepare test data
+        account = Account()
+        account.issuer_address = self.issuer["address"]
+        account.keyfile = self.issuer["keyfile_json"]
+        account.eoa_password = E2EEUtils.encrypt("password")
+        async_db.add(account)
+
+        for token_address, wst_address in [
+            (self.ibet_token_address_1, self.ibet_wst_address_1),
+            (self.ibet_token_address_2, self.ibet_wst_address_2),
+        ]:
+            token = Token()
+            token.token_address = token_address
+            token.issuer_address = self.issuer["address"]
+            token.type = TokenType.IBET_STRAIGHT_BOND
+            token.tx_hash = ""
+            token.abi = self.ibet_token_abi
+            token.version = TokenVersion.V_25_09
+            token.ibet_wst_deployed = True
+            token.ibet_wst_address = wst_address
+            async_db.add(token)
+
+        await async_db.commit()
+
+        # Execute batch
+        await processor.run()
+        async_db.expire_all()
+
+        # Check EthIbetWSTTx
+        eth_tx_list: Sequence[EthIbetWSTTx] = (
+            await async_db.scalars(
+                select(EthIbetWSTTx).where(
+                    EthIbetWSTTx.status == IbetWSTTxStatus.PENDING
+                )
+            )
+        ).all()
+        assert len(eth_tx_list) == 3
+        assert sorted(
+            [
+                (
+                    eth_tx.ibet_wst_address,
+                    eth_tx.tx_params["to_address"],
+                    eth_tx.tx_params["value"],
+                )
+                for eth_tx in eth_tx_list
+            ],
+            key=lambda x: x[2],
+        ) == [
+            (self.ibet_wst_address_1, self.user1["address"], 1000),
+            (self.ibet_wst_address_2, self.user2["address"], 2000),
+            (self.ibet_wst_address_2, self.user1["address"], 3000),
+        ]
+        for eth_tx in eth_tx_list:
+            assert eth_tx.tx_type == IbetWSTTxType.MINT
+            assert eth_tx.authorizer == self.issuer["address"]
+
     # Normal_4_1
     # eth -> ibet bridge event is detected
     # - Burn event is detected
@@ -616,7 +738,7 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_mint
+                {},  # __process_mint
             ]
         ),
     )
@@ -624,15 +746,17 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [
-                    {
-                        "args": {
-                            "from": user1["address"],
-                            "value": 1000,
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "from": user1["address"],
+                                "value": 1000,
+                            }
                         }
-                    }
-                ],  # __process_burn
-                [],  # __process_transfer
+                    ]
+                },  # __process_burn
+                {},  # __process_transfer
             ]
         ),
     )
@@ -725,7 +849,7 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_ibet_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_mint
+                {},  # __process_mint
             ]
         ),
     )
@@ -733,16 +857,18 @@ class TestProcessor:
         "batch.processor_eth_wst_monitor_bridge_events.BridgeEventViewer.get_wst_event_logs",
         AsyncMock(
             side_effect=[
-                [],  # __process_burn
-                [
-                    {
-                        "args": {
-                            "from": user1["address"],
-                            "to": user2["address"],
-                            "value": 1000,
+                {},  # __process_burn
+                {
+                    ibet_wst_address_1: [
+                        {
+                            "args": {
+                                "from": user1["address"],
+                                "to": user2["address"],
+                                "value": 1000,
+                            }
                         }
-                    }
-                ],  # __process_transfer
+                    ]
+                },  # __process_transfer
             ]
         ),
     )
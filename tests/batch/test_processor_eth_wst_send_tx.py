@@ -20,6 +20,7 @@ SPDX-License-Identifier: Apache-2.0
 import logging
 import secrets
 import uuid
+from datetime import datetime
 from unittest import mock
 from unittest.mock import AsyncMock
 
@@ -831,6 +832,93 @@ class TestProcessor:
             f"Transaction sent successfully: id={tx_id}",
         ]
 
+    # Normal_3
+    # - Confirm that transactions from the same sender are sent in creation order
+    #   using a locally managed nonce
+    @mock.patch(
+        "batch.processor_eth_wst_send_tx.ETH_MASTER_ACCOUNT_ADDRESS",
+        eth_master["address"],
+    )
+    @mock.patch(
+        "batch.processor_eth_wst_send_tx.ETH_MASTER_PRIVATE_KEY",
+        eth_master["private_key"],
+    )
+    async def test_normal_3(self, processor, async_db, caplog):
+        tx_id_1 = str(uuid.uuid4())
+        tx_id_2 = str(uuid.uuid4())
+
+        # Prepare test data
+        for tx_id, created in [
+            (tx_id_2, datetime(2025, 1, 1, 0, 0, 1)),
+            (tx_id_1, datetime(2025, 1, 1, 0, 0, 0)),
+        ]:
+            wst_tx = EthIbetWSTTx()
+            wst_tx.tx_id = tx_id
+            wst_tx.tx_type = IbetWSTTxType.MINT
+            wst_tx.version = IbetWSTVersion.V_1
+            wst_tx.status = IbetWSTTxStatus.PENDING
+            wst_tx.ibet_wst_address = to_checksum_address(
+                "0x1234567890abcdef1234567890abcdef12345678"
+            )
+            wst_tx.tx_params = IbetWSTTxParamsMint(
+                to_address=self.user1["address"],
+                value=1000,
+            )
+            wst_tx.authorizer = self.issuer["address"]
+            wst_tx.authorization = IbetWSTAuthorization(
+                nonce=secrets.token_bytes(32).hex(),
+                v=27,
+                r=secrets.token_bytes(32).hex(),
+                s=secrets.token_bytes(32).hex(),
+            )
+            wst_tx.tx_sender = self.eth_master["address"]
+            wst_tx.created = created
+            async_db.add(wst_tx)
+        await async_db.commit()
+
+        # Execute batch
+        async def _mint(*args, tx_nonce=None, **kwargs):
+            _nonce = 10 if tx_nonce is None else tx_nonce
+            return f"test_tx_hash_{_nonce}", _nonce
+
+        mint_mock = AsyncMock(side_effect=_mint)
+        with mock.patch("app.model.eth.wst.IbetWST.mint_with_authorization", mint_mock):
+            await processor.run()
+        async_db.expire_all()
+
+        # Check if the nonce was managed locally
+        assert [call.kwargs["tx_nonce"] for call in mint_mock.call_args_list] == [
+            None,
+            11,
+        ]
+
+        # Check if the transactions were processed
+        wst_tx_1_af = (
+            await async_db.scalars(
+                select(EthIbetWSTTx).where(EthIbetWSTTx.tx_id == tx_id_1).limit(1)
+            )
+        ).first()
+        assert wst_tx_1_af.status == IbetWSTTxStatus.SENT
+        assert wst_tx_1_af.tx_nonce == 10
+        assert wst_tx_1_af.tx_hash == "test_tx_hash_10"
+
+        wst_tx_2_af = (
+            await async_db.scalars(
+                select(EthIbetWSTTx).where(EthIbetWSTTx.tx_id == tx_id_2).limit(1)
+            )
+        ).first()
+        assert wst_tx_2_af.status == IbetWSTTxStatus.SENT
+        assert wst_tx_2_af.tx_nonce == 11
+        assert wst_tx_2_af.tx_hash == "test_tx_hash_11"
+
+        # Check if the log was recorded
+        assert caplog.messages == [
+            f"Processing transaction: id={tx_id_1}, type=mint",
+            f"Transaction sent successfully: id={tx_id_1}",
+            f"Processing transaction: id={tx_id_2}, type=mint",
+            f"Transaction sent successfully: id={tx_id_2}",
+        ]
+
     #############################################################
     # Error
     #############################################################
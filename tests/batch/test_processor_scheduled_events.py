@@ -23,9 +23,10 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
 from web3.datastructures import AttributeDict
 
+from app.database import BatchAsyncSessionLocal
 from app.exceptions import ContractRevertError, SendTransactionError
 from app.model.db import (
     Account,
@@ -38,6 +39,7 @@ from app.model.db import (
     TokenUpdateOperationLog,
 )
 from app.utils.e2ee_utils import E2EEUtils
+from batch import processor_scheduled_events
 from batch.processor_scheduled_events import LOG, Processor
 from tests.account_config import default_eth_account
 
@@ -434,6 +436,265 @@ class TestProcessor:
         ).first()
         assert _operation_log is None
 
+    # <Normal_4>
+    # Lease handling
+    # - Event whose lease has expired is claimed again (crash recovery)
+    # - Events of the issuer being processed by other workers are skipped
+    @pytest.mark.asyncio
+    async def test_normal_4(self, processor, async_db):
+        test_account_1 = default_eth_account("user1")
+        test_account_2 = default_eth_account("user2")
+        _token_address_1 = "token_address_test1"
+        _token_address_2 = "token_address_test2"
+        _other_worker_id = "4f1a2b3c-0000-4000-8000-000000000001"
+
+        # Prepare data : Account
+        for test_account in [test_account_1, test_account_2]:
+            account = Account()
+            account.issuer_address = test_account["address"]
+            account.eoa_password = E2EEUtils.encrypt("password")
+            account.keyfile = test_account["keyfile_json"]
+            async_db.add(account)
+
+        # prepare data : ScheduledEvents
+        datetime_now_utc = datetime.now(UTC).replace(tzinfo=None)
+
+        # Lease has expired: status will be "1: Succeeded"
+        token_event = ScheduledEvents()
+        token_event.issuer_address = test_account_1["address"]
+        token_event.token_address = _token_address_1
+        token_event.token_type = TokenType.IBET_STRAIGHT_BOND
+        token_event.event_type = ScheduledEventType.UPDATE
+        token_event.scheduled_datetime = datetime_now_utc
+        token_event.status = 0
+        token_event.data = {"face_value": 10000}
+        token_event.claimed_by = _other_worker_id
+        token_event.lease_expires = datetime_now_utc - timedelta(seconds=1)
+        async_db.add(token_event)
+
+        # Lease is active: status will be "0: Pending"
+        token_event = ScheduledEvents()
+        token_event.issuer_address = test_account_2["address"]
+        token_event.token_address = _token_address_2
+        token_event.token_type = TokenType.IBET_STRAIGHT_BOND
+        token_event.event_type = ScheduledEventType.UPDATE
+        token_event.scheduled_datetime = datetime_now_utc
+        token_event.status = 0
+        token_event.data = {"face_value": 10000}
+        token_event.claimed_by = _other_worker_id
+        token_event.lease_expires = datetime_now_utc + timedelta(hours=1)
+        async_db.add(token_event)
+
+        await async_db.commit()
+
+        # mock
+        IbetStraightBondContract_update = patch(
+            target="app.model.ibet.token.IbetStraightBondContract.update",
+            return_value=None,
+        )
+        IbetStraightBondContract_get = patch(
+            target="app.model.ibet.token.IbetStraightBondContract.get",
+            return_value=AttributeDict({}),
+        )
+
+        with IbetStraightBondContract_update, IbetStraightBondContract_get:
+            # Execute batch
+            await processor.process()
+            async_db.expire_all()
+
+        # Assertion
+        _scheduled_event = (
+            await async_db.scalars(
+                select(ScheduledEvents)
+                .where(ScheduledEvents.token_address == _token_address_1)
+                .limit(1)
+            )
+        ).first()
+        assert _scheduled_event.status == 1
+        assert _scheduled_event.claimed_by == processor.worker_id
+        assert _scheduled_event.lease_expires is None
+        _scheduled_event = (
+            await async_db.scalars(
+                select(ScheduledEvents)
+                .where(ScheduledEvents.token_address == _token_address_2)
+                .limit(1)
+            )
+        ).first()
+        assert _scheduled_event.status == 0
+        assert _scheduled_event.claimed_by == _other_worker_id
+
+    # <Normal_5>
+    # Multiple events of the same issuer
+    # - The issuer's private key is decrypted only once
+    @pytest.mark.asyncio
+    async def test_normal_5(self, processor, async_db):
+        test_account = default_eth_account("user1")
+        _issuer_address = test_account["address"]
+        _keyfile = test_account["keyfile_json"]
+
+        # Prepare data : Account
+        account = Account()
+        account.issuer_address = _issuer_address
+        account.eoa_password = E2EEUtils.encrypt("password")
+        account.keyfile = _keyfile
+        async_db.add(account)
+
+        # prepare data : ScheduledEvents
+        datetime_now_utc = datetime.now(UTC).replace(tzinfo=None)
+        for i in range(3):
+            token_event = ScheduledEvents()
+            token_event.issuer_address = _issuer_address
+            token_event.token_address = f"token_address_test{i}"
+            token_event.token_type = TokenType.IBET_STRAIGHT_BOND
+            token_event.event_type = ScheduledEventType.UPDATE
+            token_event.scheduled_datetime = datetime_now_utc
+            token_event.status = 0
+            token_event.data = {"face_value": 10000}
+            async_db.add(token_event)
+
+        await async_db.commit()
+
+        # mock
+        IbetStraightBondContract_update = patch(
+            target="app.model.ibet.token.IbetStraightBondContract.update",
+            return_value=None,
+        )
+        IbetStraightBondContract_get = patch(
+            target="app.model.ibet.token.IbetStraightBondContract.get",
+            return_value=AttributeDict({}),
+        )
+        decode_keyfile_json = patch(
+            target="batch.processor_scheduled_events.decode_keyfile_json",
+            wraps=processor_scheduled_events.decode_keyfile_json,
+        )
+
+        with (
+            IbetStraightBondContract_update,
+            IbetStraightBondContract_get,
+            decode_keyfile_json as decode_keyfile_json_mock,
+        ):
+            # Execute batch
+            await processor.process()
+            async_db.expire_all()
+
+        # Assertion
+        assert decode_keyfile_json_mock.call_count == 1
+        _scheduled_event_list = (
+            await async_db.scalars(select(ScheduledEvents).order_by(ScheduledEvents.id))
+        ).all()
+        assert [_event.status for _event in _scheduled_event_list] == [1, 1, 1]
+        assert [_event.lease_expires for _event in _scheduled_event_list] == [
+            None,
+            None,
+            None,
+        ]
+
+    # <Normal_6>
+    # Concurrent claimers
+    # - Each issuer is claimed by only one worker
+    @pytest.mark.asyncio
+    async def test_normal_6(self, processor, async_db):
+        test_account_1 = default_eth_account("user1")
+        test_account_2 = default_eth_account("user2")
+
+        # prepare data : ScheduledEvents
+        datetime_now_utc = datetime.now(UTC).replace(tzinfo=None)
+        for i, test_account in enumerate(
+            [test_account_1, test_account_1, test_account_2, test_account_2]
+        ):
+            token_event = ScheduledEvents()
+            token_event.issuer_address = test_account["address"]
+            token_event.token_address = f"token_address_test{i}"
+            token_event.token_type = TokenType.IBET_STRAIGHT_BOND
+            token_event.event_type = ScheduledEventType.UPDATE
+            token_event.scheduled_datetime = datetime_now_utc + timedelta(seconds=i)
+            token_event.status = 0
+            token_event.data = {"face_value": 10000}
+            async_db.add(token_event)
+
+        await async_db.commit()
+
+        # Execute batch
+        processor_2 = Processor(worker_num=1, is_shutdown=asyncio.Event())
+        db_session_1 = BatchAsyncSessionLocal()
+        db_session_2 = BatchAsyncSessionLocal()
+        try:
+            events_list_1, events_list_2 = await asyncio.gather(
+                processor._Processor__get_events_of_one_issuer(
+                    db_session=db_session_1, filter_time=datetime_now_utc + timedelta(1)
+                ),
+                processor_2._Processor__get_events_of_one_issuer(
+                    db_session=db_session_2, filter_time=datetime_now_utc + timedelta(1)
+                ),
+            )
+        finally:
+            await db_session_1.close()
+            await db_session_2.close()
+
+        # Assertion
+        assert sorted(
+            [
+                {_event.issuer_address for _event in events_list_1},
+                {_event.issuer_address for _event in events_list_2},
+            ],
+            key=lambda issuers: sorted(issuers),
+        ) == sorted(
+            [{test_account_1["address"]}, {test_account_2["address"]}],
+            key=lambda issuers: sorted(issuers),
+        )
+        assert len(events_list_1) == 2
+        assert len(events_list_2) == 2
+
+    # <Normal_7>
+    # Issuer being claimed by another worker (claim not yet committed)
+    # - The issuer is skipped even though it has no committed lease
+    @pytest.mark.asyncio
+    async def test_normal_7(self, processor, async_db):
+        test_account_1 = default_eth_account("user1")
+        test_account_2 = default_eth_account("user2")
+
+        # prepare data : ScheduledEvents
+        datetime_now_utc = datetime.now(UTC).replace(tzinfo=None)
+        for i, test_account in enumerate([test_account_1, test_account_2]):
+            token_event = ScheduledEvents()
+            token_event.issuer_address = test_account["address"]
+            token_event.token_address = f"token_address_test{i}"
+            token_event.token_type = TokenType.IBET_STRAIGHT_BOND
+            token_event.event_type = ScheduledEventType.UPDATE
+            token_event.scheduled_datetime = datetime_now_utc + timedelta(seconds=i)
+            token_event.status = 0
+            token_event.data = {"face_value": 10000}
+            async_db.add(token_event)
+
+        await async_db.commit()
+
+        # Another worker holds the issuer lock of user1
+        other_db_session = BatchAsyncSessionLocal()
+        db_session = BatchAsyncSessionLocal()
+        try:
+            await other_db_session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        func.hashtext(ScheduledEvents.__tablename__),
+                        func.hashtext(test_account_1["address"]),
+                    )
+                )
+            )
+
+            # Execute batch
+            events_list = await processor._Processor__get_events_of_one_issuer(
+                db_session=db_session, filter_time=datetime_now_utc + timedelta(1)
+            )
+        finally:
+            await other_db_session.rollback()
+            await other_db_session.close()
+            await db_session.close()
+
+        # Assertion
+        assert [_event.issuer_address for _event in events_list] == [
+            test_account_2["address"]
+        ]
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -69,6 +69,7 @@ async def async_client() -> AsyncGenerator[AsyncClient, Any]:
 @pytest_asyncio.fixture(scope="session")
 async def async_db_engine():
     async with async_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     yield async_engine